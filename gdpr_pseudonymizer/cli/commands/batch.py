@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import sys
 import time
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from multiprocessing import Pool, cpu_count
 from pathlib import Path
@@ -37,9 +38,12 @@ from gdpr_pseudonymizer.cli.progress import ETAColumn, ProgressTracker
 from gdpr_pseudonymizer.cli.validators import (
     ensure_database,
     parse_entity_type_filter,
+    validate_detection_profile_or_exit,
     validate_theme_or_exit,
 )
 from gdpr_pseudonymizer.core.document_processor import DocumentProcessor
+from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
+from gdpr_pseudonymizer.nlp.spacy_detector import DEFAULT_DETECTION_PROFILE
 from gdpr_pseudonymizer.utils.logger import configure_logging, get_logger
 
 # Configure logging
@@ -65,10 +69,12 @@ class BatchResult:
     reused_entities: int = 0
     total_time_seconds: float = 0.0
     errors: list[str] = field(default_factory=list)
+    paragraphs_reused: int = 0
+    paragraphs_detected: int = 0
 
 
 def _process_single_document_worker(
-    args: tuple[str, str, str, str, str, str, Optional[str]],
+    args: tuple[str, str, str, str, str, str, str, bool, bool, bool, Optional[str]],
 ) -> dict[str, Any]:
     """Worker function for parallel batch processing.
 
@@ -77,8 +83,10 @@ def _process_single_document_worker(
 
     Args:
         args: Tuple of (input_path, output_path, db_path, passphrase, theme, model,
-              entity_types_csv). entity_types_csv is a comma-separated string of
-              entity types to filter, or None for all types.
+              detection_profile, detection_cache, paragraph_cache,
+              keyed_pseudonyms, entity_types_csv). entity_types_csv is a
+              comma-separated string of entity types to filter, or None for
+              all types.
 
     Returns:
         Dictionary with processing results:
@@ -88,9 +96,22 @@ def _process_single_document_worker(
         - entities_new: int (if success)
         - entities_reused: int (if success)
         - processing_time: float (if success)
+        - paragraphs_reused / paragraphs_detected: int (paragraph mode)
         - error: str (if failure)
     """
-    input_path, output_path, db_path, passphrase, theme, model, entity_types_csv = args
+    (
+        input_path,
+        output_path,
+        db_path,
+        passphrase,
+        theme,
+        model,
+        detection_profile,
+        detection_cache,
+        paragraph_cache,
+        keyed_pseudonyms,
+        entity_types_csv,
+    ) = args
 
     # Reconstruct entity_type_filter from CSV string (sets aren't picklable for multiprocessing)
     entity_type_filter: set[str] | None = None
@@ -104,8 +125,15 @@ def _process_single_document_worker(
             passphrase=passphrase,
             theme=theme,
             model_name=model,
+            detection_profile=detection_profile,
+            detection_cache=detection_cache,
+            paragraph_cache=paragraph_cache,
+            keyed_pseudonyms=keyed_pseudonyms,
             notifier=rich_notifier,
         )
+        paragraphs_before = (
+            processor.paragraph_cache_stats() if paragraph_cache else None
+        )
 
         # Process document with validation SKIPPED (parallel mode has no stdin)
         result = processor.process_document(
@@ -115,7 +143,7 @@ def _process_single_document_worker(
             entity_type_filter=entity_type_filter,
         )
 
-        return {
+        worker_result = {
             "success": result.success,
             "file": input_path,
             "entities_detected": result.entities_detected,
@@ -124,6 +152,14 @@ def _process_single_document_worker(
             "processing_time": result.processing_time_seconds,
             "error": result.error_message if not result.success else None,
         }
+        paragraphs_after = (
+            processor.paragraph_cache_stats() if paragraph_cache else None
+        )
+        if paragraphs_before is not None and paragraphs_after is not None:
+            paragraph_stats = paragraphs_after - paragraphs_before
+            worker_result["paragraphs_reused"] = paragraph_stats.hits
+            worker_result["paragraphs_detected"] = paragraph_stats.misses
+        return worker_result
     except Exception as e:
         return {
             "success": False,
@@ -145,6 +181,10 @@ def _process_batch_parallel(
     model: str,
     num_workers: int,
     entity_type_filter: Optional[set[str]] = None,
+    detection_profile: str = DEFAULT_DETECTION_PROFILE,
+    detection_cache: bool = False,
+    paragraph_cache: bool = False,
+    keyed_pseudonyms: bool = False,
 ) -> BatchResult:
     """Process documents in parallel using multiprocessing pool.
 
@@ -157,6 +197,11 @@ def _process_batch_parallel(
         model: NLP model name
         num_workers: Number of worker processes
         entity_type_filter: Optional set of entity types to keep
+        detection_profile: spaCy detection profile
+        detection_cache: Reuse cached detection results for unchanged documents
+        paragraph_cache: Reuse entities of paragraphs seen before in a worker
+        keyed_pseudonyms: Derive new name pseudonyms from the database key so
+            workers assign the same pseudonym to a new name
 
     Returns:
         BatchResult with processing statistics
@@ -181,7 +226,9 @@ def _process_batch_parallel(
     if entity_type_filter is not None:
         entity_types_csv = ",".join(sorted(entity_type_filter))
 
-    args_list: list[tuple[str, str, str, str, str, str, Optional[str]]] = []
+    args_list: list[
+        tuple[str, str, str, str, str, str, str, bool, bool, bool, Optional[str]]
+    ] = []
     for file_path in files:
         # PDF/DOCX produce plaintext output, so default to .txt
         out_suffix = file_path.suffix
@@ -199,6 +246,10 @@ def _process_batch_parallel(
                 passphrase,
                 theme,
                 model,
+                detection_profile,
+                detection_cache,
+                paragraph_cache,
+                keyed_pseudonyms,
                 entity_types_csv,
             )
         )
@@ -243,6 +294,10 @@ def _process_batch_parallel(
                     batch_result.total_entities += result["entities_detected"]
                     batch_result.new_entities += result["entities_new"]
                     batch_result.reused_entities += result["entities_reused"]
+                    batch_result.paragraphs_reused += result.get("paragraphs_reused", 0)
+                    batch_result.paragraphs_detected += result.get(
+                        "paragraphs_detected", 0
+                    )
                 else:
                     batch_result.failed_files += 1
                     error_msg = result.get("error", "Unknown error")
@@ -279,6 +334,37 @@ def _process_batch_parallel(
     return batch_result
 
 
+def _next_detection(
+    detections: Iterator[tuple[str, tuple[str, list[DetectedEntity]] | None]],
+    file_path: Path,
+) -> tuple[str, list[DetectedEntity]] | None:
+    """Take the next precomputed detection from the batch detection stream.
+
+    If the stream fails (e.g. NLP error on one document) it is abandoned and
+    remaining files fall back to per-document detection in process_document,
+    which reports the error for the affected file.
+
+    Args:
+        detections: Iterator from DocumentProcessor.detect_entities_batch()
+        file_path: File about to be processed (must match the stream order)
+
+    Returns:
+        (document_text, detected_entities), or None to detect per document
+    """
+    try:
+        input_path, detection = next(detections, (str(file_path), None))
+    except Exception as e:
+        logger.warning(
+            "batch_detection_stream_failed",
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        return None
+    if input_path != str(file_path):
+        return None
+    return detection
+
+
 def collect_files(input_path: Path, recursive: bool = False) -> list[Path]:
     """Collect files to process from directory or file list.
 
@@ -336,6 +422,26 @@ def batch_command(
         "-m",
         help="NLP model name (spacy). Default from config.",
     ),
+    detection_profile: Optional[str] = typer.Option(
+        None,
+        "--detection-profile",
+        help="spaCy detection profile (accurate/balanced/fast). Default from config.",
+    ),
+    detection_cache: Optional[bool] = typer.Option(
+        None,
+        "--detection-cache/--no-detection-cache",
+        help="Reuse cached entity detection for unchanged documents. Default from config.",
+    ),
+    paragraph_cache: Optional[bool] = typer.Option(
+        None,
+        "--paragraph-cache/--no-paragraph-cache",
+        help="Reuse entities of paragraphs already seen in this batch (templated documents). Default from config.",
+    ),
+    keyed_pseudonyms: Optional[bool] = typer.Option(
+        None,
+        "--keyed-pseudonyms/--no-keyed-pseudonyms",
+        help="Derive new name pseudonyms from the database key so parallel runs agree without coordination. Default from config.",
+    ),
     db_path: Optional[str] = typer.Option(
         None,
         "--db",
@@ -413,6 +519,26 @@ def batch_command(
         # Apply config defaults where CLI flags not specified
         effective_theme = theme if theme is not None else config.pseudonymization.theme
         effective_model = model if model is not None else config.pseudonymization.model
+        effective_profile = (
+            detection_profile
+            if detection_profile is not None
+            else config.pseudonymization.detection_profile
+        )
+        effective_detection_cache = (
+            detection_cache
+            if detection_cache is not None
+            else config.pseudonymization.detection_cache
+        )
+        effective_paragraph_cache = (
+            paragraph_cache
+            if paragraph_cache is not None
+            else config.pseudonymization.paragraph_cache
+        )
+        effective_keyed_pseudonyms = (
+            keyed_pseudonyms
+            if keyed_pseudonyms is not None
+            else config.pseudonymization.keyed_pseudonyms
+        )
         effective_db_path = db_path if db_path is not None else config.database.path
         effective_workers = workers if workers is not None else config.batch.workers
         effective_output_dir = (
@@ -438,6 +564,7 @@ def batch_command(
 
         # Validate theme
         validate_theme_or_exit(effective_theme)
+        validate_detection_profile_or_exit(effective_profile)
 
         # Get passphrase
         resolved_passphrase = resolve_passphrase(
@@ -479,6 +606,10 @@ def batch_command(
                 model=effective_model,
                 num_workers=effective_workers,
                 entity_type_filter=entity_type_filter,
+                detection_profile=effective_profile,
+                detection_cache=effective_detection_cache,
+                paragraph_cache=effective_paragraph_cache,
+                keyed_pseudonyms=effective_keyed_pseudonyms,
             )
         else:
             # SEQUENTIAL MODE: With interactive validation
@@ -500,6 +631,10 @@ def batch_command(
                         passphrase=resolved_passphrase,
                         theme=effective_theme,
                         model_name=effective_model,
+                        detection_profile=effective_profile,
+                        detection_cache=effective_detection_cache,
+                        paragraph_cache=effective_paragraph_cache,
+                        keyed_pseudonyms=effective_keyed_pseudonyms,
                         notifier=rich_notifier,
                     )
                     init_progress.update(
@@ -518,6 +653,9 @@ def batch_command(
 
             # Process files with progress bar
             batch_result = BatchResult(total_files=len(files))
+            paragraphs_before = (
+                processor.paragraph_cache_stats() if effective_paragraph_cache else None
+            )
             progress_tracker = ProgressTracker(total_files=len(files))
             start_time = time.time()
 
@@ -551,11 +689,18 @@ def batch_command(
                     stats_text,
                 )
 
+            # Stream NLP detection for all files through one spaCy pipeline;
+            # results are consumed one file at a time as validation proceeds
+            detections = processor.detect_entities_batch(
+                [str(f) for f in files], entity_type_filter=entity_type_filter
+            )
+
             with Live(
                 make_progress_group(), console=console, refresh_per_second=10
             ) as live:
                 for file_path in files:
                     file_start_time = time.time()
+                    detection = _next_detection(detections, file_path)
 
                     # Update current file being processed
                     progress_tracker.set_current_file(file_path.name)
@@ -595,6 +740,7 @@ def batch_command(
                             input_path=str(file_path),
                             output_path=str(output_file),
                             entity_type_filter=entity_type_filter,
+                            detection=detection,
                         )
 
                         # Restart live display for progress updates
@@ -680,6 +826,13 @@ def batch_command(
                 live.update(make_progress_group())
 
             batch_result.total_time_seconds = time.time() - start_time
+            paragraphs_after = (
+                processor.paragraph_cache_stats() if effective_paragraph_cache else None
+            )
+            if paragraphs_before is not None and paragraphs_after is not None:
+                paragraph_stats = paragraphs_after - paragraphs_before
+                batch_result.paragraphs_reused = paragraph_stats.hits
+                batch_result.paragraphs_detected = paragraph_stats.misses
 
         # Display summary report
         _display_batch_summary(batch_result)
@@ -691,6 +844,8 @@ def batch_command(
             failed=batch_result.failed_files,
             total_entities=batch_result.total_entities,
             processing_time=batch_result.total_time_seconds,
+            paragraphs_reused=batch_result.paragraphs_reused,
+            paragraphs_detected=batch_result.paragraphs_detected,
         )
 
         # Exit with error code if any files failed
@@ -733,6 +888,13 @@ def _display_batch_summary(result: BatchResult) -> None:
     table.add_row("Total entities", str(result.total_entities))
     table.add_row("New entities", str(result.new_entities))
     table.add_row("Reused entities", str(result.reused_entities))
+    paragraphs_total = result.paragraphs_reused + result.paragraphs_detected
+    if paragraphs_total > 0:
+        table.add_row(
+            "Paragraph cache hits",
+            f"{result.paragraphs_reused / paragraphs_total:.0%} "
+            f"({result.paragraphs_reused:,}/{paragraphs_total:,})",
+        )
     table.add_row("", "")
     table.add_row("Processing time", f"{result.total_time_seconds:.2f}s")
 
@@ -0,0 +1,287 @@
+"""Db-maintain command for database housekeeping.
+
+This command checkpoints the WAL, refreshes planner statistics, optionally
+writes a compacted copy and verifies integrity. Designed to be scheduled
+(e.g. nightly) after erasure runs and parallel batches.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from gdpr_pseudonymizer.cli.formatters import format_error_message
+from gdpr_pseudonymizer.cli.passphrase import resolve_passphrase
+from gdpr_pseudonymizer.data.database import open_database
+from gdpr_pseudonymizer.data.maintenance import (
+    MaintenanceReport,
+    WalCheckpointResult,
+    maintain_database,
+)
+from gdpr_pseudonymizer.utils.logger import configure_logging, get_logger
+
+# Configure logging
+configure_logging()
+logger = get_logger(__name__)
+
+# Rich console for output
+console = Console()
+
+
+def db_maintain_command(
+    db_path: str = typer.Option(
+        "mappings.db",
+        "--db",
+        help="Database file path",
+    ),
+    passphrase: Optional[str] = typer.Option(
+        None,
+        "--passphrase",
+        "-p",
+        help="Database passphrase (or use GDPR_PSEUDO_PASSPHRASE env var)",
+    ),
+    vacuum_into: Optional[Path] = typer.Option(
+        None,
+        "--vacuum-into",
+        help="Write a compacted copy of the database to this path",
+    ),
+    skip_analyze: bool = typer.Option(
+        False,
+        "--skip-analyze",
+        help="Do not refresh query planner statistics",
+    ),
+    skip_integrity_check: bool = typer.Option(
+        False,
+        "--skip-integrity-check",
+        help="Do not run the integrity check",
+    ),
+) -> None:
+    """Run database maintenance (WAL checkpoint, ANALYZE, VACUUM INTO, integrity).
+
+    Reports before/after sizes, page counts and index usage.
+
+    Exit codes:
+        0: Maintenance succeeded and integrity check passed
+        1: User error (missing database, wrong passphrase, bad target path)
+        2: Integrity check failed or unexpected error
+        3: Warning: WAL checkpoint busy or incomplete (another connection
+           was using the database)
+
+    Examples:
+        # Checkpoint, analyze and check integrity
+        gdpr-pseudo db-maintain
+
+        # Also write a compacted copy
+        gdpr-pseudo db-maintain --vacuum-into mappings.compact.db
+    """
+    try:
+        # Validate database exists
+        db_file = Path(db_path)
+        if not db_file.exists():
+            format_error_message(
+                "Database Not Found",
+                f"Database file not found: {db_file.absolute()}",
+                "Run 'gdpr-pseudo init' to create a new database.",
+            )
+            sys.exit(1)
+
+        # Get passphrase (verifies ownership before touching the file)
+        resolved_passphrase = resolve_passphrase(
+            cli_passphrase=passphrase,
+            prompt_message="Enter passphrase to unlock database",
+            confirm=False,
+        )
+
+        with open_database(db_path, resolved_passphrase) as db_session:
+            report = maintain_database(
+                db_session,
+                db_path,
+                vacuum_into=str(vacuum_into) if vacuum_into else None,
+                analyze=not skip_analyze,
+                integrity_check=not skip_integrity_check,
+            )
+
+        _display_report(db_file, report)
+
+        logger.info(
+            "db_maintenance_completed",
+            size_before=report.before.total_size,
+            size_after=report.after.total_size,
+            freelist_pages=report.after.freelist_count,
+            integrity_ok=report.integrity_ok,
+            checkpoint_busy=report.checkpoint.busy if report.checkpoint else None,
+            checkpoint_log_frames=(
+                report.checkpoint.log_frames if report.checkpoint else None
+            ),
+            checkpoint_checkpointed_frames=(
+                report.checkpoint.checkpointed_frames if report.checkpoint else None
+            ),
+            vacuumed=report.vacuum_path is not None,
+            duration_seconds=round(report.duration_seconds, 3),
+        )
+
+        if report.integrity_ok is False:
+            sys.exit(2)
+        if report.checkpoint is not None and not report.checkpoint.complete:
+            sys.exit(3)
+
+    except FileNotFoundError:
+        format_error_message(
+            "Database Not Found",
+            f"Database file not found: {db_path}",
+            "Run 'gdpr-pseudo init' to create a new database.",
+        )
+        sys.exit(1)
+
+    except ValueError as e:
+        if "passphrase" in str(e).lower():
+            format_error_message(
+                "Authentication Failed",
+                "Incorrect passphrase.",
+                "Check your passphrase and try again.",
+            )
+        else:
+            format_error_message(
+                "Error",
+                str(e),
+                "Check the error message and try again.",
+            )
+        sys.exit(1)
+
+    except KeyboardInterrupt:
+        console.print("\n\n[yellow]Operation cancelled by user[/yellow]")
+        sys.exit(0)
+
+    except Exception as e:
+        logger.error("db_maintain_error", error=str(e), error_type=type(e).__name__)
+        format_error_message(
+            "Unexpected Error",
+            str(e),
+            "Please report this issue if it persists.",
+        )
+        sys.exit(2)
+
+
+def _display_report(db_file: Path, report: MaintenanceReport) -> None:
+    """Render maintenance report as Rich tables.
+
+    Args:
+        db_file: Path to the maintained database
+        report: Maintenance report to display
+    """
+    console.print("\n[bold]Database Maintenance[/bold]\n")
+
+    # Sizes and pages
+    console.print("[bold cyan]Storage[/bold cyan]")
+    size_table = Table(show_header=True, box=None)
+    size_table.add_column("Metric", style="dim")
+    size_table.add_column("Before", justify="right")
+    size_table.add_column("After", justify="right")
+    before, after = report.before, report.after
+    size_table.add_row(
+        "Database file", _format_size(before.file_size), _format_size(after.file_size)
+    )
+    size_table.add_row(
+        "WAL file", _format_size(before.wal_size), _format_size(after.wal_size)
+    )
+    size_table.add_row("Pages", str(before.page_count), str(after.page_count))
+    size_table.add_row(
+        "Free pages", str(before.freelist_count), str(after.freelist_count)
+    )
+    console.print(size_table)
+    console.print()
+
+    # Steps
+    console.print("[bold cyan]Operations[/bold cyan]")
+    ops_table = Table(show_header=False, box=None)
+    ops_table.add_column("Step", style="dim")
+    ops_table.add_column("Result")
+    ops_table.add_row("Path", str(db_file.absolute()))
+    ops_table.add_row("Schema version", report.schema_version or "unknown")
+    ops_table.add_row("WAL checkpoint", _format_checkpoint(report.checkpoint))
+    ops_table.add_row(
+        "ANALYZE", "[green]done[/green]" if report.analyzed else "skipped"
+    )
+    if report.vacuum_path is not None:
+        ops_table.add_row(
+            "VACUUM INTO",
+            f"[green]{report.vacuum_path}[/green] "
+            f"({_format_size(report.vacuum_size or 0)})",
+        )
+    if report.integrity_ok is None:
+        ops_table.add_row("Integrity check", "skipped")
+    elif report.integrity_ok:
+        ops_table.add_row("Integrity check", "[green]ok[/green]")
+    else:
+        ops_table.add_row(
+            "Integrity check",
+            f"[red]FAILED ({len(report.integrity_messages)} problem(s))[/red]",
+        )
+    ops_table.add_row("Duration", f"{report.duration_seconds:.2f}s")
+    console.print(ops_table)
+    console.print()
+
+    # Index usage
+    if report.indexes:
+        console.print("[bold cyan]Index Usage[/bold cyan]")
+        idx_table = Table(show_header=True, box=None)
+        idx_table.add_column("Index", style="dim")
+        idx_table.add_column("Table")
+        idx_table.add_column("Rows", justify="right")
+        idx_table.add_column("Rows/key", justify="right")
+        idx_table.add_column("Used by")
+        for idx in report.indexes:
+            idx_table.add_row(
+                idx.name,
+                idx.table,
+                "-" if idx.rows is None else str(idx.rows),
+                "-" if idx.avg_rows_per_key is None else str(idx.avg_rows_per_key),
+                ", ".join(idx.used_by) if idx.used_by else "[yellow]unused[/yellow]",
+            )
+        console.print(idx_table)
+        console.print()
+
+    for message in report.integrity_messages[:10]:
+        console.print(f"[red]  {message}[/red]")
+
+
+def _format_checkpoint(checkpoint: WalCheckpointResult | None) -> str:
+    """Format the WAL checkpoint result.
+
+    Args:
+        checkpoint: Checkpoint result, None if it did not run
+
+    Returns:
+        Rich-formatted status with frame counts
+    """
+    if checkpoint is None:
+        return "skipped"
+    frames = f"{checkpoint.checkpointed_frames}/{checkpoint.log_frames} frames"
+    if checkpoint.complete:
+        return f"[green]done[/green] ({frames})"
+    return (
+        f"[yellow]busy/incomplete[/yellow] ({frames}, busy={checkpoint.busy}) "
+        "— another connection is using the database; run again when idle"
+    )
+
+
+def _format_size(size_bytes: int) -> str:
+    """Format file size in human-readable format.
+
+    Args:
+        size_bytes: Size in bytes
+
+    Returns:
+        Human-readable size string
+    """
+    size: float = float(size_bytes)
+    for unit in ["B", "KB", "MB", "GB"]:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
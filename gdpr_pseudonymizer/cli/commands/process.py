@@ -12,6 +12,7 @@ pseudonymization workflow with:
 from __future__ import annotations
 
 import sys
+from multiprocessing import cpu_count
 from pathlib import Path
 from typing import Optional
 
@@ -25,10 +26,12 @@ from gdpr_pseudonymizer.cli.passphrase import resolve_passphrase
 from gdpr_pseudonymizer.cli.validators import (
     ensure_database,
     parse_entity_type_filter,
+    validate_detection_profile_or_exit,
     validate_theme_or_exit,
 )
 from gdpr_pseudonymizer.core.document_processor import DocumentProcessor
 from gdpr_pseudonymizer.exceptions import FileProcessingError
+from gdpr_pseudonymizer.pseudonym.library_manager import EXHAUSTION_WARNING_THRESHOLD
 from gdpr_pseudonymizer.utils.logger import configure_logging, get_logger
 
 # Configure Windows console to handle Unicode encoding errors gracefully
@@ -85,6 +88,21 @@ def process_command(
         "-m",
         help="NLP model name (spacy). Default from config.",
     ),
+    detection_profile: Optional[str] = typer.Option(
+        None,
+        "--detection-profile",
+        help="spaCy detection profile (accurate/balanced/fast). Default from config.",
+    ),
+    detection_cache: Optional[bool] = typer.Option(
+        None,
+        "--detection-cache/--no-detection-cache",
+        help="Reuse cached entity detection for unchanged documents. Default from config.",
+    ),
+    keyed_pseudonyms: Optional[bool] = typer.Option(
+        None,
+        "--keyed-pseudonyms/--no-keyed-pseudonyms",
+        help="Derive new name pseudonyms from the database key so parallel runs agree without coordination. Default from config.",
+    ),
     db_path: Optional[str] = typer.Option(
         None,
         "--db",
@@ -101,6 +119,14 @@ def process_command(
         "--entity-types",
         help="Filter entity types to process (comma-separated). Options: PERSON, LOCATION, ORG. Default: all types.",
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-w",
+        min=1,
+        max=8,
+        help="Processes detecting a large document in parallel (it is split into windows). Default: 1.",
+    ),
 ) -> None:
     """Process a single document with complete pseudonymization workflow.
 
@@ -120,14 +146,21 @@ def process_command(
         output_file: Path to output document (optional, defaults to <input>_pseudonymized.ext)
         theme: Pseudonym library theme (neutral/star_wars/lotr)
         model: NLP model name (spacy)
+        detection_profile: spaCy detection profile (accurate/balanced/fast)
+        detection_cache: Reuse cached detection results for unchanged documents
+        keyed_pseudonyms: Derive new name pseudonyms from the database key
         db_path: Database file path (default: mappings.db)
         passphrase: Database passphrase (or use GDPR_PSEUDO_PASSPHRASE env var)
+        workers: Processes detecting the windows of a very large document
 
     Examples:
         gdpr-pseudo process input.txt
         gdpr-pseudo process input.txt -o output.txt
         gdpr-pseudo process input.txt -o output.txt --theme star_wars
         gdpr-pseudo process input.txt --db custom.db
+        gdpr-pseudo process input.txt --detection-profile balanced
+        gdpr-pseudo process input.txt --theme lotr --detection-cache
+        gdpr-pseudo process large_report.pdf --workers 8
     """
     try:
         # Load configuration (project > home > defaults)
@@ -136,6 +169,21 @@ def process_command(
         # Apply config defaults where CLI flags not specified
         effective_theme = theme if theme is not None else config.pseudonymization.theme
         effective_model = model if model is not None else config.pseudonymization.model
+        effective_profile = (
+            detection_profile
+            if detection_profile is not None
+            else config.pseudonymization.detection_profile
+        )
+        effective_detection_cache = (
+            detection_cache
+            if detection_cache is not None
+            else config.pseudonymization.detection_cache
+        )
+        effective_keyed_pseudonyms = (
+            keyed_pseudonyms
+            if keyed_pseudonyms is not None
+            else config.pseudonymization.keyed_pseudonyms
+        )
         effective_db_path = db_path if db_path is not None else config.database.path
         # Validate file extension
         allowed_extensions = [".txt", ".md", ".pdf", ".docx", ".xlsx", ".csv"]
@@ -161,6 +209,7 @@ def process_command(
 
         # Validate theme
         validate_theme_or_exit(effective_theme)
+        validate_detection_profile_or_exit(effective_profile)
 
         # Get passphrase (with warning if --passphrase flag used)
         passphrase = resolve_passphrase(cli_passphrase=passphrase)
@@ -175,6 +224,7 @@ def process_command(
             output_file=str(output_file),
             theme=effective_theme,
             model=effective_model,
+            detection_profile=effective_profile,
         )
 
         # Initialize processor with progress indicator
@@ -190,6 +240,10 @@ def process_command(
                     passphrase=passphrase,
                     theme=effective_theme,
                     model_name=effective_model,
+                    detection_profile=effective_profile,
+                    detection_cache=effective_detection_cache,
+                    workers=min(cpu_count(), workers),
+                    keyed_pseudonyms=effective_keyed_pseudonyms,
                     notifier=rich_notifier,
                 )
                 progress.update(task, description="✓ Processor initialized")
@@ -233,6 +287,14 @@ def process_command(
                     f"[cyan]ℹ  {result.entities_reused} entity mapping(s) reused from database (idempotent processing)[/cyan]\n"
                 )
 
+            # Library exhaustion warnings (per entity type)
+            for entity_type, ratio in (result.library_exhaustion or {}).items():
+                if ratio >= EXHAUSTION_WARNING_THRESHOLD:
+                    console.print(
+                        f"[yellow]⚠  {ratio:.0%} of the {entity_type} pseudonym library is in use "
+                        f"(see 'gdpr-pseudo stats')[/yellow]\n"
+                    )
+
             logger.info(
                 "processing_complete",
                 entities_detected=result.entities_detected,
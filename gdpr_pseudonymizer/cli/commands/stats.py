@@ -17,10 +17,16 @@ from rich.table import Table
 from gdpr_pseudonymizer.cli.formatters import format_error_message
 from gdpr_pseudonymizer.cli.passphrase import resolve_passphrase
 from gdpr_pseudonymizer.data.database import open_database
+from gdpr_pseudonymizer.data.models import Entity
 from gdpr_pseudonymizer.data.repositories.audit_repository import AuditRepository
 from gdpr_pseudonymizer.data.repositories.mapping_repository import (
     SQLiteMappingRepository,
 )
+from gdpr_pseudonymizer.pseudonym.library_manager import (
+    EXHAUSTION_WARNING_THRESHOLD,
+    LIBRARY_CATEGORIES,
+    LibraryBasedPseudonymManager,
+)
 from gdpr_pseudonymizer.utils.logger import configure_logging, get_logger
 
 # Configure logging
@@ -100,6 +106,9 @@ def stats_command(
                 theme = entity.theme or "unknown"
                 themes[theme] = themes.get(theme, 0) + 1
 
+            # Library exhaustion per theme and entity type
+            exhaustion = _library_exhaustion(sorted(themes), all_entities)
+
             # Operations stats
             all_operations = audit_repo.find_operations()
             successful_ops = [op for op in all_operations if op.success]
@@ -157,6 +166,20 @@ def stats_command(
             console.print(theme_table)
             console.print()
 
+        # Library exhaustion
+        if exhaustion:
+            console.print("[bold cyan]Library Exhaustion[/bold cyan]")
+            exhaustion_table = Table(box=None)
+            exhaustion_table.add_column("Theme", style="dim")
+            for entity_type in LIBRARY_CATEGORIES:
+                exhaustion_table.add_column(entity_type, justify="right")
+            for theme, ratios in exhaustion.items():
+                exhaustion_table.add_row(
+                    theme, *(_format_ratio(ratios[t]) for t in LIBRARY_CATEGORIES)
+                )
+            console.print(exhaustion_table)
+            console.print()
+
         # Operations
         console.print("[bold cyan]Processing History[/bold cyan]")
         ops_table = Table(show_header=False, box=None)
@@ -229,6 +252,46 @@ def stats_command(
         sys.exit(2)
 
 
+def _library_exhaustion(
+    themes: list[str], entities: list[Entity]
+) -> dict[str, dict[str, float]]:
+    """Compute per-type library exhaustion for each theme in the database.
+
+    Every mapping is loaded for each theme, as processing does, so
+    components shared across themes count against each library.
+
+    Args:
+        themes: Themes present in the database
+        entities: All stored entities
+
+    Returns:
+        Mapping of theme to per-type exhaustion ratios (themes without a
+        pseudonym library, such as neutral_id, are omitted)
+    """
+    exhaustion: dict[str, dict[str, float]] = {}
+    for theme in themes:
+        if theme in ("neutral_id", "unknown"):
+            continue
+        manager = LibraryBasedPseudonymManager()
+        try:
+            manager.load_library(theme)
+        except (FileNotFoundError, ValueError):
+            continue
+        manager.load_existing_mappings(entities, counters={})
+        exhaustion[theme] = manager.check_exhaustion_by_type()
+    return exhaustion
+
+
+def _format_ratio(ratio: float) -> str:
+    """Format an exhaustion ratio, highlighted from the warning threshold."""
+    text = f"{ratio:.1%}"
+    if ratio >= 1.0:
+        return f"[red]{text}[/red]"
+    if ratio >= EXHAUSTION_WARNING_THRESHOLD:
+        return f"[yellow]{text}[/yellow]"
+    return text
+
+
 def _format_size(size_bytes: int) -> str:
     """Format file size in human-readable format.
 
@@ -37,6 +37,10 @@ class PseudonymizationConfig:
 
     theme: str = "neutral"
     model: str = "spacy"
+    detection_profile: str = "accurate"
+    detection_cache: bool = False
+    paragraph_cache: bool = False
+    keyed_pseudonyms: bool = False
 
 
 @dataclass
@@ -71,6 +75,7 @@ class AppConfig:
 VALID_THEMES = ["neutral", "star_wars", "lotr", "neutral_id"]
 VALID_LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
 VALID_MODELS = ["spacy"]
+VALID_DETECTION_PROFILES = ["accurate", "balanced", "fast"]
 
 
 def get_default_config() -> AppConfig:
@@ -123,6 +128,23 @@ def validate_config_dict(config_dict: dict[str, Any], source: str = "config") ->
                 f"Valid models: {', '.join(VALID_MODELS)}"
             )
 
+        detection_profile = pseudonymization.get("detection_profile")
+        if (
+            detection_profile is not None
+            and detection_profile not in VALID_DETECTION_PROFILES
+        ):
+            raise ConfigValidationError(
+                f"Invalid detection_profile '{detection_profile}' in {source}. "
+                f"Valid profiles: {', '.join(VALID_DETECTION_PROFILES)}"
+            )
+
+        for flag in ("detection_cache", "paragraph_cache", "keyed_pseudonyms"):
+            value = pseudonymization.get(flag)
+            if value is not None and not isinstance(value, bool):
+                raise ConfigValidationError(
+                    f"Invalid {flag} '{value}' in {source} (must be true or false)"
+                )
+
     # Validate logging level
     logging_config = config_dict.get("logging", {})
     if isinstance(logging_config, dict):
@@ -225,6 +247,12 @@ def dict_to_config(config_dict: dict[str, Any]) -> AppConfig:
         pseudonymization=PseudonymizationConfig(
             theme=pseudonymization_dict.get("theme", "neutral"),
             model=pseudonymization_dict.get("model", "spacy"),
+            detection_profile=pseudonymization_dict.get(
+                "detection_profile", "accurate"
+            ),
+            detection_cache=pseudonymization_dict.get("detection_cache", False),
+            paragraph_cache=pseudonymization_dict.get("paragraph_cache", False),
+            keyed_pseudonyms=pseudonymization_dict.get("keyed_pseudonyms", False),
         ),
         logging=LoggingConfig(
             level=logging_dict.get("level", "INFO"),
@@ -264,7 +292,14 @@ def load_config(
     # Start with default config as dict
     config_dict: dict[str, Any] = {
         "database": {"path": "mappings.db"},
-        "pseudonymization": {"theme": "neutral", "model": "spacy"},
+        "pseudonymization": {
+            "theme": "neutral",
+            "model": "spacy",
+            "detection_profile": "accurate",
+            "detection_cache": False,
+            "paragraph_cache": False,
+            "keyed_pseudonyms": False,
+        },
         "logging": {"level": "INFO", "file": None},
         "batch": {"workers": 4, "output_dir": None},
     }
@@ -222,6 +222,27 @@ def _process(
         "-m",
         help=_("NLP model name (spacy). Default from config."),
     ),
+    detection_profile: Optional[str] = typer.Option(
+        None,
+        "--detection-profile",
+        help=_(
+            "spaCy detection profile (accurate/balanced/fast). Default from config."
+        ),
+    ),
+    detection_cache: Optional[bool] = typer.Option(
+        None,
+        "--detection-cache/--no-detection-cache",
+        help=_(
+            "Reuse cached entity detection for unchanged documents. Default from config."
+        ),
+    ),
+    keyed_pseudonyms: Optional[bool] = typer.Option(
+        None,
+        "--keyed-pseudonyms/--no-keyed-pseudonyms",
+        help=_(
+            "Derive new name pseudonyms from the database key so parallel runs agree without coordination. Default from config."
+        ),
+    ),
     db_path: Optional[str] = typer.Option(
         None,
         "--db",
@@ -241,6 +262,17 @@ def _process(
             "Options: PERSON, LOCATION, ORG. Default: all types."
         ),
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-w",
+        min=1,
+        max=8,
+        help=_(
+            "Processes detecting a large document in parallel "
+            "(it is split into windows). Default: 1."
+        ),
+    ),
 ) -> None:
     """Process a single document with pseudonymization."""
     from gdpr_pseudonymizer.cli.commands.process import process_command
@@ -250,9 +282,13 @@ def _process(
         output_file=output_file,
         theme=theme,
         model=model,
+        detection_profile=detection_profile,
+        detection_cache=detection_cache,
+        keyed_pseudonyms=keyed_pseudonyms,
         db_path=db_path,
         passphrase=passphrase,
         entity_types=entity_types,
+        workers=workers,
     )
 
 
@@ -289,6 +325,34 @@ def _batch(
         "-m",
         help=_("NLP model name (spacy). Default from config."),
     ),
+    detection_profile: Optional[str] = typer.Option(
+        None,
+        "--detection-profile",
+        help=_(
+            "spaCy detection profile (accurate/balanced/fast). Default from config."
+        ),
+    ),
+    detection_cache: Optional[bool] = typer.Option(
+        None,
+        "--detection-cache/--no-detection-cache",
+        help=_(
+            "Reuse cached entity detection for unchanged documents. Default from config."
+        ),
+    ),
+    paragraph_cache: Optional[bool] = typer.Option(
+        None,
+        "--paragraph-cache/--no-paragraph-cache",
+        help=_(
+            "Reuse entities of paragraphs already seen in this batch (templated documents). Default from config."
+        ),
+    ),
+    keyed_pseudonyms: Optional[bool] = typer.Option(
+        None,
+        "--keyed-pseudonyms/--no-keyed-pseudonyms",
+        help=_(
+            "Derive new name pseudonyms from the database key so parallel runs agree without coordination. Default from config."
+        ),
+    ),
     db_path: Optional[str] = typer.Option(
         None,
         "--db",
@@ -339,6 +403,10 @@ def _batch(
         output_dir=output_dir,
         theme=theme,
         model=model,
+        detection_profile=detection_profile,
+        detection_cache=detection_cache,
+        paragraph_cache=paragraph_cache,
+        keyed_pseudonyms=keyed_pseudonyms,
         db_path=db_path,
         passphrase=passphrase,
         recursive=recursive,
@@ -461,6 +529,50 @@ def _stats(
     stats_command(db_path=db_path, passphrase=passphrase)
 
 
+@app.command(
+    name="db-maintain",
+    help=_("Run database maintenance (WAL checkpoint, ANALYZE, VACUUM, integrity)"),
+)
+def _db_maintain(
+    db_path: str = typer.Option(
+        "mappings.db",
+        "--db",
+        help=_("Database file path"),
+    ),
+    passphrase: Optional[str] = typer.Option(
+        None,
+        "--passphrase",
+        "-p",
+        help=_("Database passphrase (or use GDPR_PSEUDO_PASSPHRASE env var)"),
+    ),
+    vacuum_into: Optional[Path] = typer.Option(
+        None,
+        "--vacuum-into",
+        help=_("Write a compacted copy of the database to this path"),
+    ),
+    skip_analyze: bool = typer.Option(
+        False,
+        "--skip-analyze",
+        help=_("Do not refresh query planner statistics"),
+    ),
+    skip_integrity_check: bool = typer.Option(
+        False,
+        "--skip-integrity-check",
+        help=_("Do not run the integrity check"),
+    ),
+) -> None:
+    """Run database maintenance (WAL checkpoint, ANALYZE, VACUUM, integrity)."""
+    from gdpr_pseudonymizer.cli.commands.db_maintain import db_maintain_command
+
+    db_maintain_command(
+        db_path=db_path,
+        passphrase=passphrase,
+        vacuum_into=vacuum_into,
+        skip_analyze=skip_analyze,
+        skip_integrity_check=skip_integrity_check,
+    )
+
+
 @app.command(
     name="import-mappings",
     help=_("Import mappings from another database"),
@@ -23,6 +23,9 @@ from gdpr_pseudonymizer.data.database import init_database
 # Valid pseudonym themes
 VALID_THEMES = ["neutral", "star_wars", "lotr", "neutral_id"]
 
+# Valid spaCy detection profiles
+VALID_DETECTION_PROFILES = ["accurate", "balanced", "fast"]
+
 # Valid log levels
 VALID_LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
 
@@ -302,6 +305,21 @@ def validate_theme_or_exit(theme: str) -> None:
         sys.exit(1)
 
 
+def validate_detection_profile_or_exit(profile: str) -> None:
+    """Validate detection profile and exit(1) if invalid.
+
+    Args:
+        profile: Profile name to check against VALID_DETECTION_PROFILES
+    """
+    if profile not in VALID_DETECTION_PROFILES:
+        format_error_message(
+            "Invalid Detection Profile",
+            f"Detection profile '{profile}' is not recognized.",
+            f"Valid profiles: {', '.join(VALID_DETECTION_PROFILES)}",
+        )
+        sys.exit(1)
+
+
 def ensure_database(db_path: str, passphrase: str, console: Console) -> None:
     """Initialize the database if it does not exist, with a progress spinner.
 
@@ -14,29 +14,40 @@ from __future__ import annotations
 
 import re
 import time
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
 from gdpr_pseudonymizer.data.database import DatabaseSession, open_database
 from gdpr_pseudonymizer.data.models import Entity, Operation
 from gdpr_pseudonymizer.data.repositories.audit_repository import AuditRepository
+from gdpr_pseudonymizer.data.repositories.detection_cache_repository import (
+    DetectionCacheRepository,
+)
 from gdpr_pseudonymizer.data.repositories.mapping_repository import (
     MappingRepository,
     SQLiteMappingRepository,
 )
-from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
+from gdpr_pseudonymizer.nlp.entity_detector import DEFAULT_BATCH_SIZE, DetectedEntity
+from gdpr_pseudonymizer.nlp.entity_spans import EntitySpans
 from gdpr_pseudonymizer.nlp.hybrid_detector import HybridDetector
+from gdpr_pseudonymizer.nlp.parallel_detection import detect_entities_parallel
+from gdpr_pseudonymizer.nlp.spacy_detector import DEFAULT_DETECTION_PROFILE
 from gdpr_pseudonymizer.pseudonym.assignment_engine import (
     CompositionalPseudonymEngine,
 )
 from gdpr_pseudonymizer.pseudonym.gender_detector import GenderDetector
+from gdpr_pseudonymizer.pseudonym.keyed_derivation import DERIVATION_KEY_PURPOSE
 from gdpr_pseudonymizer.pseudonym.library_manager import LibraryBasedPseudonymManager
+from gdpr_pseudonymizer.utils.cache_stats import CacheStats
 from gdpr_pseudonymizer.utils.file_handler import (
     get_file_extension,
     read_file,
     write_file,
 )
+from gdpr_pseudonymizer.utils.french_patterns import normalization_cache_stats
 from gdpr_pseudonymizer.utils.logger import get_logger
 from gdpr_pseudonymizer.utils.tabular_reader import (
     TabularDocument,
@@ -63,6 +74,8 @@ class ProcessingResult:
         processing_time_seconds: Total processing time in seconds
         error_message: Error description if processing failed
         entity_type_counts: Per-type entity counts from this document
+        library_exhaustion: Per-type pseudonym library exhaustion after
+            processing (see LibraryBasedPseudonymManager.check_exhaustion_by_type)
     """
 
     success: bool
@@ -74,6 +87,7 @@ class ProcessingResult:
     processing_time_seconds: float
     error_message: str | None = None
     entity_type_counts: dict[str, int] | None = None
+    library_exhaustion: dict[str, float] | None = None
 
 
 @dataclass
@@ -125,6 +139,11 @@ class DocumentProcessor:
         theme: str = "neutral",
         model_name: str = "spacy",
         notifier: Callable[[str], None] | None = None,
+        detection_profile: str = DEFAULT_DETECTION_PROFILE,
+        detection_cache: bool = False,
+        paragraph_cache: bool = False,
+        workers: int = 1,
+        keyed_pseudonyms: bool = False,
     ):
         """Initialize document processor with database and configuration.
 
@@ -135,6 +154,17 @@ class DocumentProcessor:
             model_name: NLP model name (spacy)
             notifier: Optional callback for user-facing messages.
                      Decouples core from CLI presentation layer.
+            detection_profile: spaCy detection profile (accurate/balanced/fast)
+            detection_cache: Reuse detection results stored in the database
+                for unchanged documents (see DetectionCacheRepository)
+            paragraph_cache: Detect paragraph by paragraph and reuse entities
+                of paragraphs already seen in this process
+            workers: Processes detecting the windows of a very large document
+                in parallel (see nlp.parallel_detection); 1 detects in-process
+            keyed_pseudonyms: Derive new first/last name pseudonyms from the
+                database key instead of drawing them at random, so parallel
+                workers agree without coordination (see
+                pseudonym.keyed_derivation)
 
         Raises:
             ValueError: If passphrase invalid or database cannot be opened
@@ -144,6 +174,11 @@ class DocumentProcessor:
         self.passphrase = passphrase
         self.theme = theme
         self.model_name = model_name
+        self.detection_profile = detection_profile
+        self.detection_cache = detection_cache
+        self.paragraph_cache = paragraph_cache
+        self.workers = workers
+        self.keyed_pseudonyms = keyed_pseudonyms
         self._notifier = notifier or (lambda msg: None)
 
         # Database session will be created per operation (context manager pattern)
@@ -162,27 +197,113 @@ class DocumentProcessor:
             OSError: If spaCy model not installed
         """
         if self._detector is None:
-            self._detector = HybridDetector()
+            self._detector = HybridDetector(
+                detection_profile=self.detection_profile,
+                paragraph_cache=self.paragraph_cache,
+            )
         return self._detector
 
+    def paragraph_cache_stats(self) -> CacheStats | None:
+        """Cumulative paragraph cache counters for this detector configuration.
+
+        Returns:
+            CacheStats, or None if paragraph mode is disabled
+        """
+        if not self.paragraph_cache:
+            return None
+        return self._get_detector().paragraph_cache_stats
+
+    @staticmethod
+    def normalization_cache_stats() -> CacheStats:
+        """Cumulative title/preposition normalization cache counters.
+
+        The cache is shared process-wide by detection, grouping and
+        pseudonym resolution; take differences between two snapshots to get
+        the counts for one document.
+
+        Returns:
+            CacheStats snapshot
+        """
+        return normalization_cache_stats()
+
+    @contextmanager
+    def _detection_cache_session(self) -> Iterator[DetectionCacheRepository | None]:
+        """Open the detection cache for the duration of a detection stream.
+
+        Yields:
+            DetectionCacheRepository, or None if the cache is disabled
+        """
+        if not self.detection_cache:
+            yield None
+            return
+        with open_database(self.db_path, self.passphrase) as db_session:
+            yield DetectionCacheRepository(db_session)
+
     def _detect_and_filter_entities(
         self,
         document_text: str,
         entity_type_filter: set[str] | None = None,
+        cache: DetectionCacheRepository | None = None,
     ) -> list[DetectedEntity]:
         """Detect entities in document text and apply optional type filter.
 
         Args:
             document_text: The document text to analyze
             entity_type_filter: Optional set of entity types to keep
+            cache: Detection cache to consult first (unfiltered results
+                are cached, so the filter can change between runs)
 
         Returns:
             List of detected (and optionally filtered) entities
         """
-        logger.info("detecting_entities", model=self.model_name)
         detector = self._get_detector()
-        detected_entities = detector.detect_entities(document_text)
+        cache_key = None
+        detected_entities = None
+        if cache is not None:
+            cache_key = cache.make_key(document_text, detector.detection_fingerprint())
+            detected_entities = cache.get(cache_key)
+
+        if detected_entities is not None:
+            logger.info("detection_cache_hit", count=len(detected_entities))
+        else:
+            logger.info("detecting_entities", model=self.model_name)
+            detected_entities = detect_entities_parallel(
+                detector, document_text, self.workers
+            )
+            if cache is not None and cache_key is not None:
+                cache.put(cache_key, detected_entities)
+        return self._filter_detected_entities(detected_entities, entity_type_filter)
 
+    def _read_and_detect(
+        self,
+        input_path: str,
+        entity_type_filter: set[str] | None = None,
+        cache: DetectionCacheRepository | None = None,
+    ) -> tuple[str, list[DetectedEntity]]:
+        """Read a text document and detect its entities.
+
+        Returns:
+            Tuple of (document_text, detected_entities)
+        """
+        document_text = read_file(input_path)
+        return document_text, self._detect_and_filter_entities(
+            document_text, entity_type_filter, cache
+        )
+
+    @staticmethod
+    def _filter_detected_entities(
+        detected_entities: list[DetectedEntity],
+        entity_type_filter: set[str] | None,
+    ) -> list[DetectedEntity]:
+        """Apply optional entity type filter and log detection counts.
+
+        Args:
+            detected_entities: Entities returned by the detector
+            entity_type_filter: Optional set of entity types to keep
+
+        Returns:
+            Filtered list of entities
+        """
         if entity_type_filter:
             pre_filter_count = len(detected_entities)
             detected_entities = [
@@ -203,6 +324,112 @@ class DocumentProcessor:
 
         return detected_entities
 
+    def detect_entities_batch(
+        self,
+        input_paths: Iterable[str],
+        entity_type_filter: set[str] | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[tuple[str, tuple[str, list[DetectedEntity]] | None]]:
+        """Stream NLP detection for many documents through one pipeline.
+
+        Text documents are read lazily (about ``batch_size`` files ahead of
+        the consumer) and detected with ``HybridDetector.detect_entities_batch``.
+        Results come back in input order and can be handed to
+        ``process_document(detection=...)``.
+
+        Files the stream cannot handle yield ``None`` instead of a detection
+        so that ``process_document`` runs its own pipeline and reports errors
+        as usual: tabular files (cell-aware pipeline), unreadable files and
+        empty documents.
+
+        With the detection cache enabled, one database session stays open
+        for the stream and cached documents bypass the detector; if every
+        document is cached the spaCy model is never loaded.
+
+        Args:
+            input_paths: Paths of documents to process, in processing order
+            entity_type_filter: Optional set of entity types to keep
+            batch_size: Number of documents per spaCy batch
+
+        Returns:
+            Iterator of (input_path, (document_text, detected_entities) or None)
+        """
+        # (input_path, document_text, cached_entities, cache_key); files with
+        # no text or cached entities are not sent through the detector
+        pending: deque[
+            tuple[str, str | None, list[DetectedEntity] | None, str | None]
+        ] = deque()
+
+        def _texts(cache: DetectionCacheRepository | None) -> Iterator[str]:
+            fingerprint = ""
+            if cache is not None:
+                fingerprint = self._get_detector().detection_fingerprint()
+            for input_path in input_paths:
+                document_text: str | None = None
+                if get_file_extension(input_path) not in (".xlsx", ".csv"):
+                    try:
+                        document_text = read_file(input_path) or None
+                    except Exception:
+                        document_text = None
+                if document_text is None or cache is None:
+                    pending.append((input_path, document_text, None, None))
+                else:
+                    cache_key = cache.make_key(document_text, fingerprint)
+                    cached = cache.get(cache_key)
+                    pending.append((input_path, document_text, cached, cache_key))
+                    if cached is not None:
+                        logger.info("detection_cache_hit", count=len(cached))
+                        continue
+                if document_text is not None:
+                    yield document_text
+
+        def _flush_undetected() -> (
+            Iterator[tuple[str, tuple[str, list[DetectedEntity]] | None]]
+        ):
+            # Yield queued files that never went through the detector
+            while pending and (pending[0][1] is None or pending[0][2] is not None):
+                input_path, document_text, cached, _ = pending.popleft()
+                if document_text is None or cached is None:
+                    yield input_path, None
+                else:
+                    yield input_path, (
+                        document_text,
+                        self._filter_detected_entities(cached, entity_type_filter),
+                    )
+
+        def _results() -> Iterator[tuple[str, tuple[str, list[DetectedEntity]] | None]]:
+            with self._detection_cache_session() as cache:
+                logger.info("detecting_entities_batch", model=self.model_name)
+                detector = self._get_detector()
+                paragraphs_before = self.paragraph_cache_stats()
+                for detected_entities in detector.detect_entities_batch(
+                    _texts(cache), batch_size=batch_size
+                ):
+                    # Flush files skipped by the stream, then pair this result
+                    yield from _flush_undetected()
+                    input_path, document_text, _, cache_key = pending.popleft()
+                    if cache is not None and cache_key is not None:
+                        cache.put(cache_key, detected_entities)
+                    yield input_path, (
+                        str(document_text),
+                        self._filter_detected_entities(
+                            detected_entities, entity_type_filter
+                        ),
+                    )
+                yield from _flush_undetected()
+
+                paragraphs_after = self.paragraph_cache_stats()
+                if paragraphs_before is not None and paragraphs_after is not None:
+                    paragraph_stats = paragraphs_after - paragraphs_before
+                    logger.info(
+                        "paragraph_cache_batch_stats",
+                        hits=paragraph_stats.hits,
+                        misses=paragraph_stats.misses,
+                        hit_rate=round(paragraph_stats.hit_rate, 3),
+                    )
+
+        return _results()
+
     @staticmethod
     def _normalize_entity_text(ctx: _ProcessingContext, entity: DetectedEntity) -> str:
         """Normalize entity text by stripping titles and prepositions.
@@ -428,24 +655,33 @@ class DocumentProcessor:
         ctx: _ProcessingContext,
         entity: DetectedEntity,
         entity_text_stripped: str,
+        genders: Mapping[str, str | None] | None = None,
     ) -> tuple[str, Entity]:
-        """Assign a new compositional pseudonym and create the Entity record."""
+        """Assign a new compositional pseudonym and create the Entity record.
+
+        PERSON genders are read from ``genders`` (see _detect_person_genders())
+        when present there, and detected individually otherwise.
+        """
+        detected_gender = None
+        gender_detector = ctx.compositional_engine.gender_detector
+        if entity.entity_type == "PERSON" and gender_detector is not None:
+            if genders is not None and entity_text_stripped in genders:
+                detected_gender = genders[entity_text_stripped]
+            else:
+                detected_gender = gender_detector.detect_gender_from_full_name(
+                    entity_text_stripped, entity.entity_type
+                )
         assignment = ctx.compositional_engine.assign_compositional_pseudonym(
             entity_text=entity_text_stripped,
             entity_type=entity.entity_type,
-            gender=None,
+            gender=detected_gender,
         )
         original_first = None
         original_last = None
-        detected_gender = None
         if entity.entity_type == "PERSON":
             original_first, original_last, _ = ctx.compositional_engine.parse_full_name(
                 entity_text_stripped
             )
-            if ctx.compositional_engine.gender_detector is not None:
-                detected_gender = ctx.compositional_engine.gender_detector.detect_gender_from_full_name(
-                    entity_text_stripped, entity.entity_type
-                )
         new_entity = Entity(
             entity_type=entity.entity_type,
             first_name=original_first,
@@ -465,6 +701,27 @@ class DocumentProcessor:
         )
         return assignment.pseudonym_full, new_entity
 
+    @staticmethod
+    def _detect_person_genders(
+        ctx: _ProcessingContext, texts: Iterable[str]
+    ) -> dict[str, str | None]:
+        """Detect the genders of a document's PERSON texts in one pass.
+
+        Args:
+            ctx: Processing context with compositional engine
+            texts: Normalized PERSON entity texts (duplicates allowed)
+
+        Returns:
+            Gender (or None) per distinct non-blank text; empty without a
+            gender detector
+        """
+        gender_detector = ctx.compositional_engine.gender_detector
+        distinct = [text for text in dict.fromkeys(texts) if text.split()]
+        if gender_detector is None or not distinct:
+            return {}
+        first_names = [text.split()[0] for text in distinct]
+        return dict(zip(distinct, gender_detector.detect_genders(first_names)))
+
     def _resolve_pseudonyms(
         self,
         ctx: _ProcessingContext,
@@ -475,6 +732,13 @@ class DocumentProcessor:
             "starting_entity_processing",
             validated_count=len(validated_entities),
         )
+        # Genders of all PERSON texts, detected in one pass once one is needed
+        person_texts = [
+            self._normalize_entity_text(ctx, entity)
+            for entity in validated_entities
+            if entity.entity_type == "PERSON"
+        ]
+        genders: dict[str, str | None] | None = None
         replacements: list[tuple[int, int, str]] = []
         new_entities: list[Entity] = []
         entity_cache: dict[str, str] = {}
@@ -515,8 +779,10 @@ class DocumentProcessor:
                         entity_cache[entity_text_stripped] = pseudonym
                         entities_reused += 1
                     else:
+                        if genders is None and entity.entity_type == "PERSON":
+                            genders = self._detect_person_genders(ctx, person_texts)
                         pseudonym, new_entity = self._assign_new_pseudonym(
-                            ctx, entity, entity_text_stripped
+                            ctx, entity, entity_text_stripped, genders
                         )
                         entity_cache[entity_text_stripped] = pseudonym
                         new_entities.append(new_entity)
@@ -528,6 +794,7 @@ class DocumentProcessor:
         if new_entities:
             try:
                 ctx.mapping_repo.save_batch(new_entities)
+                ctx.compositional_engine.record_components(new_entities)
                 logger.info("entities_saved_batch", count=len(new_entities))
             except Exception as e:
                 logger.error(
@@ -536,6 +803,7 @@ class DocumentProcessor:
                     entity_count=len(new_entities),
                 )
                 raise
+        ctx.pseudonym_manager.release_reserved_ids()
 
         return _ResolveResult(
             replacements=replacements,
@@ -552,8 +820,8 @@ class DocumentProcessor:
         """Deduplicate overlapping replacements and apply to document text.
 
         Overlapping spans are resolved by keeping the first (longest) span
-        in sorted order. Replacements are applied from end to start to
-        preserve character positions.
+        in sorted order (EntitySpans.non_overlapping()). The kept
+        replacements are then spliced into the text in a single pass.
 
         Args:
             document_text: Original document text
@@ -562,29 +830,20 @@ class DocumentProcessor:
         Returns:
             Document text with all replacements applied
         """
-        # Deduplicate overlapping replacements
-        deduplicated: list[tuple[int, int, str]] = []
-        sorted_repls = sorted(replacements, key=lambda x: (x[0], -x[1]))
-
-        for start, end, pseudo in sorted_repls:
-            overlaps = any(not (end <= ks or start >= ke) for ks, ke, _ in deduplicated)
-            if not overlaps:
-                deduplicated.append((start, end, pseudo))
+        spans = EntitySpans()
+        for start, end, _ in replacements:
+            spans.append(start, end)
+        kept = spans.non_overlapping()
 
         logger.debug(
             "replacements_deduplicated",
             original_count=len(replacements),
-            deduplicated_count=len(deduplicated),
+            deduplicated_count=len(kept),
         )
 
-        # Apply from end to start to preserve positions
-        result = document_text
-        for start_pos, end_pos, pseudonym in sorted(
-            deduplicated, key=lambda x: x[0], reverse=True
-        ):
-            result = result[:start_pos] + pseudonym + result[end_pos:]
-
-        return result
+        return spans.substitute(
+            document_text, kept, [replacements[row][2] for row in kept]
+        )
 
     def _reset_pseudonym_state(self, ctx: _ProcessingContext) -> None:
         """Reset pseudonym manager after validation preview.
@@ -598,7 +857,10 @@ class DocumentProcessor:
         """
         ctx.pseudonym_manager.reset_preview_state()
         existing_entities = ctx.mapping_repo.find_all()
-        ctx.pseudonym_manager.load_existing_mappings(existing_entities)
+        ctx.pseudonym_manager.load_existing_mappings(
+            existing_entities, counters=ctx.mapping_repo.get_counters()
+        )
+        ctx.compositional_engine.load_component_cache(existing_entities)
         logger.info(
             "pseudonym_manager_reset_after_validation",
             existing_mappings_reloaded=len(existing_entities),
@@ -621,20 +883,29 @@ class DocumentProcessor:
         mapping_repo: MappingRepository = SQLiteMappingRepository(db_session)
         audit_repo = AuditRepository(db_session.session)
 
-        pseudonym_manager = LibraryBasedPseudonymManager()
+        pseudonym_manager = LibraryBasedPseudonymManager(
+            derivation_key=(
+                db_session.encryption.derive_key(DERIVATION_KEY_PURPOSE)
+                if self.keyed_pseudonyms
+                else None
+            ),
+            counter_ranges=mapping_repo,
+        )
         pseudonym_manager.load_library(self.theme)
 
         existing_entities = mapping_repo.find_all()
-        pseudonym_manager.load_existing_mappings(existing_entities)
+        pseudonym_manager.load_existing_mappings(
+            existing_entities, counters=mapping_repo.get_counters()
+        )
 
-        gender_detector = GenderDetector()
-        gender_detector.load()
+        gender_detector = GenderDetector.shared()
 
         compositional_engine = CompositionalPseudonymEngine(
             pseudonym_manager=pseudonym_manager,
             mapping_repository=mapping_repo,
             gender_detector=gender_detector,
         )
+        compositional_engine.load_component_cache(existing_entities)
 
         return _ProcessingContext(
             mapping_repo=mapping_repo,
@@ -741,11 +1012,12 @@ class DocumentProcessor:
             FileProcessingError: If file cannot be read
             OSError: If NLP model not available
         """
-        document_text = read_file(input_path)
-        detected_entities = self._detect_and_filter_entities(
-            document_text, entity_type_filter
-        )
-        return document_text, detected_entities
+        if not self.detection_cache:
+            return self._read_and_detect(input_path, entity_type_filter)
+        with open_database(self.db_path, self.passphrase) as db_session:
+            return self._read_and_detect(
+                input_path, entity_type_filter, DetectionCacheRepository(db_session)
+            )
 
     def build_pseudonym_previews(
         self,
@@ -790,6 +1062,8 @@ class DocumentProcessor:
                 else:
                     previews[key] = base_pseudonym
 
+            # Preview identifiers are never saved
+            ctx.pseudonym_manager.release_reserved_ids()
             return previews
 
     def finalize_document(
@@ -831,6 +1105,9 @@ class DocumentProcessor:
                     entities_reused=resolve_result.entities_reused,
                     processing_time_seconds=processing_time,
                     entity_type_counts=resolve_result.entity_type_counts,
+                    library_exhaustion=(
+                        ctx.pseudonym_manager.check_exhaustion_by_type()
+                    ),
                 )
         except Exception as e:
             return self._handle_processing_error(e, "", output_path, start_time)
@@ -841,8 +1118,18 @@ class DocumentProcessor:
         output_path: str,
         skip_validation: bool = False,
         entity_type_filter: set[str] | None = None,
+        detection: tuple[str, list[DetectedEntity]] | None = None,
     ) -> ProcessingResult:
-        """Process single document with complete pseudonymization workflow."""
+        """Process single document with complete pseudonymization workflow.
+
+        Args:
+            input_path: Path to document to process
+            output_path: Path to write pseudonymized output
+            skip_validation: Skip interactive validation
+            entity_type_filter: Optional set of entity types to keep
+            detection: Precomputed (document_text, detected_entities) from
+                detect_entities_batch(); read and detect here if None
+        """
         # Route tabular files through the cell-aware pipeline
         ext = get_file_extension(input_path)
         if ext in (".xlsx", ".csv"):
@@ -852,11 +1139,16 @@ class DocumentProcessor:
 
         start_time = time.time()
         try:
-            document_text = read_file(input_path)
-            detected_entities = self._detect_and_filter_entities(
-                document_text, entity_type_filter
-            )
+            if detection is None and not self.detection_cache:
+                detection = self._read_and_detect(input_path, entity_type_filter)
             with open_database(self.db_path, self.passphrase) as db_session:
+                if detection is None:
+                    detection = self._read_and_detect(
+                        input_path,
+                        entity_type_filter,
+                        DetectionCacheRepository(db_session),
+                    )
+                document_text, detected_entities = detection
                 ctx = self._init_processing_context(db_session)
                 pseudonym_assigner = self._build_pseudonym_assigner(ctx)
                 validated_entities = self._run_validation(
@@ -886,6 +1178,9 @@ class DocumentProcessor:
                     entities_reused=resolve_result.entities_reused,
                     processing_time_seconds=processing_time,
                     entity_type_counts=resolve_result.entity_type_counts,
+                    library_exhaustion=(
+                        ctx.pseudonym_manager.check_exhaustion_by_type()
+                    ),
                 )
         except Exception as e:
             return self._handle_processing_error(e, input_path, output_path, start_time)
@@ -941,6 +1236,9 @@ class DocumentProcessor:
                     entities_reused=resolve_result.entities_reused,
                     processing_time_seconds=processing_time,
                     entity_type_counts=resolve_result.entity_type_counts,
+                    library_exhaustion=(
+                        ctx.pseudonym_manager.check_exhaustion_by_type()
+                    ),
                 )
         except Exception as e:
             return self._handle_processing_error(e, input_path, output_path, start_time)
@@ -1042,6 +1340,9 @@ class DocumentProcessor:
                     entities_reused=resolve_result.entities_reused,
                     processing_time_seconds=processing_time,
                     entity_type_counts=resolve_result.entity_type_counts,
+                    library_exhaustion=(
+                        ctx.pseudonym_manager.check_exhaustion_by_type()
+                    ),
                 )
         except Exception as e:
             return self._handle_processing_error(e, input_path, output_path, start_time)
@@ -14,8 +14,9 @@ from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from gdpr_pseudonymizer.data.encryption import EncryptionService
+from gdpr_pseudonymizer.data.migrations import BASE_SCHEMA_VERSION, run_migrations
 from gdpr_pseudonymizer.data.models import Base, Metadata
-from gdpr_pseudonymizer.exceptions import CorruptedDatabaseError
+from gdpr_pseudonymizer.exceptions import CorruptedDatabaseError, DatabaseError
 
 
 class DatabaseSession:
@@ -60,8 +61,9 @@ class DatabaseSession:
 def init_database(db_path: str, passphrase: str) -> None:
     """Initialize a new encrypted SQLite database.
 
-    Creates database schema, enables SQLite optimizations (WAL mode, foreign keys),
-    and stores encryption parameters in metadata table.
+    Creates the base database schema, enables SQLite optimizations (WAL mode,
+    foreign keys), stores encryption parameters in metadata table, then applies
+    all schema migrations so new databases start at the current schema version.
 
     Args:
         db_path: Path to database file (will be created)
@@ -145,8 +147,8 @@ def init_database(db_path: str, passphrase: str) -> None:
         session = session_local()
 
         try:
-            # Store schema version
-            session.add(Metadata(key="schema_version", value="1.0.0"))
+            # Store base schema version (migrations below bring it up to date)
+            session.add(Metadata(key="schema_version", value=BASE_SCHEMA_VERSION))
 
             # Store encryption salt (base64-encoded)
             session.add(
@@ -175,6 +177,8 @@ def init_database(db_path: str, passphrase: str) -> None:
         finally:
             session.close()
 
+        run_migrations(engine, encryption_service)
+
         engine.dispose()
 
     except Exception as e:
@@ -184,15 +188,18 @@ def init_database(db_path: str, passphrase: str) -> None:
         raise Exception(f"Database initialization failed: {e}") from e
 
 
-def open_database(db_path: str, passphrase: str) -> DatabaseSession:
+def open_database(
+    db_path: str, passphrase: str, migrate: bool = True
+) -> DatabaseSession:
     """Open existing encrypted database with passphrase validation.
 
     Loads encryption parameters from metadata, validates passphrase using canary,
-    and returns database session ready for use.
+    applies pending schema migrations, and returns database session ready for use.
 
     Args:
         db_path: Path to existing database file
         passphrase: User passphrase for decryption
+        migrate: Apply pending schema migrations (default: True)
 
     Returns:
         DatabaseSession with authenticated encryption service
@@ -201,6 +208,7 @@ def open_database(db_path: str, passphrase: str) -> DatabaseSession:
         FileNotFoundError: If database file doesn't exist
         ValueError: If passphrase incorrect
         CorruptedDatabaseError: If database metadata missing or invalid
+        DatabaseError: If a schema migration fails or the schema is too new
 
     Example:
         >>> with open_database("mapping.db", "my_passphrase") as db_session:
@@ -270,10 +278,15 @@ def open_database(db_path: str, passphrase: str) -> DatabaseSession:
                 "Incorrect passphrase. Please check your passphrase and try again."
             )
 
+        # Upgrade schema (end the metadata read transaction first)
+        if migrate:
+            session.commit()
+            run_migrations(engine, encryption_service)
+
         # Return database session with encryption service
         return DatabaseSession(engine, session, encryption_service)
 
-    except (ValueError, CorruptedDatabaseError) as e:
+    except (ValueError, DatabaseError) as e:
         # Clean up on validation errors
         session.close()
         engine.dispose()
@@ -14,6 +14,8 @@ Security Properties:
 from __future__ import annotations
 
 import base64
+import hashlib
+import hmac
 import os
 
 from cryptography.hazmat.primitives.ciphers.aead import AESSIV
@@ -79,6 +81,7 @@ class EncryptionService:
 
         # Initialize AES-256-SIV cipher
         self._cipher = AESSIV(key)
+        self._key = key
 
     def encrypt(self, plaintext: str | None) -> str | None:
         """Encrypt plaintext string using AES-256-SIV.
@@ -146,6 +149,23 @@ class EncryptionService:
 
         return plaintext_bytes.decode("utf-8")
 
+    def derive_key(self, purpose: str) -> bytes:
+        """Derive a 256-bit subkey for a purpose other than field encryption.
+
+        HMAC-SHA256 of the purpose label under the database key, so each
+        purpose gets an independent key and the encryption key itself is
+        never handed out.
+
+        Args:
+            purpose: Label of the key's use (e.g. "pseudonym-derivation")
+
+        Returns:
+            32-byte key, stable for a given passphrase, salt and purpose
+        """
+        return hmac.new(
+            self._key, b"gdpr-pseudo:" + purpose.encode("utf-8"), hashlib.sha256
+        ).digest()
+
     def encrypt_canary(self) -> str:
         """Encrypt canary value for passphrase validation.
 
@@ -0,0 +1,299 @@
+"""SQLite maintenance operations for the encrypted mapping database.
+
+Long-lived mapping databases accumulate free pages after erasure requests
+(delete-mapping) and grow their write-ahead log during parallel batches.
+This module implements the housekeeping steps run by ``gdpr-pseudo db-maintain``:
+
+- ``ANALYZE`` to refresh planner statistics (``sqlite_stat1``)
+- ``PRAGMA wal_checkpoint(TRUNCATE)`` to fold the WAL back into the main file
+- ``VACUUM INTO`` to write a compacted copy (optional, never in-place)
+- ``PRAGMA integrity_check`` to detect corruption
+
+All operations work on ciphertext only; no field is decrypted.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from gdpr_pseudonymizer.data.database import DatabaseSession
+from gdpr_pseudonymizer.data.migrations import get_schema_version
+from gdpr_pseudonymizer.exceptions import DatabaseError
+
+# Representative repository queries used to report which index serves them.
+# Parameters are placeholders: EXPLAIN QUERY PLAN does not need real values.
+INDEX_PROBE_QUERIES: dict[str, str] = {
+    "find_by_full_name": "SELECT id FROM entities WHERE full_name = 'x'",
+    "find_by_first_name": "SELECT id FROM entities WHERE first_name = 'x'",
+    "find_by_last_name": "SELECT id FROM entities WHERE last_name = 'x'",
+    "find_by_type": "SELECT id FROM entities WHERE entity_type = 'PERSON'",
+    "find_ambiguous": "SELECT id FROM entities WHERE is_ambiguous = 1",
+    "operations_by_type": (
+        "SELECT id FROM operations WHERE operation_type = 'PROCESS'"
+    ),
+    "operations_by_date": (
+        "SELECT id FROM operations WHERE timestamp >= '2026-01-01' "
+        "ORDER BY timestamp DESC"
+    ),
+}
+
+
+@dataclass
+class DatabaseFileStats:
+    """Size and page statistics for a database file.
+
+    Attributes:
+        file_size: Size of the main database file in bytes
+        wal_size: Size of the ``-wal`` file in bytes (0 if absent)
+        page_size: SQLite page size in bytes
+        page_count: Total number of pages in the database
+        freelist_count: Number of unused pages reclaimable by VACUUM
+    """
+
+    file_size: int
+    wal_size: int
+    page_size: int
+    page_count: int
+    freelist_count: int
+
+    @property
+    def total_size(self) -> int:
+        """Combined size of database and WAL files."""
+        return self.file_size + self.wal_size
+
+
+@dataclass
+class WalCheckpointResult:
+    """Result row of ``PRAGMA wal_checkpoint(TRUNCATE)``.
+
+    Attributes:
+        busy: 1 if the checkpoint could not complete (a reader or writer
+            was still using the WAL), else 0
+        log_frames: Frames in the WAL (-1 if not in WAL mode)
+        checkpointed_frames: Frames copied into the database file
+            (-1 if not in WAL mode)
+    """
+
+    busy: int
+    log_frames: int
+    checkpointed_frames: int
+
+    @property
+    def complete(self) -> bool:
+        """True if every WAL frame was checkpointed and the WAL truncated."""
+        return self.busy == 0 and self.log_frames == self.checkpointed_frames
+
+
+@dataclass
+class IndexStats:
+    """Planner statistics and observed usage for a single index.
+
+    Attributes:
+        name: Index name
+        table: Table the index belongs to
+        rows: Number of rows covered (from ``sqlite_stat1``), None if unknown
+        avg_rows_per_key: Average rows per distinct key, None if unknown
+        used_by: Probe queries whose query plan uses this index
+    """
+
+    name: str
+    table: str
+    rows: int | None = None
+    avg_rows_per_key: int | None = None
+    used_by: list[str] = field(default_factory=list)
+
+
+@dataclass
+class MaintenanceReport:
+    """Result of a maintenance run.
+
+    Attributes:
+        before: File statistics before maintenance
+        after: File statistics after maintenance
+        indexes: Per-index statistics collected after ANALYZE
+        analyzed: True if ANALYZE was run
+        checkpoint: Result of the WAL checkpoint (None if it did not run)
+        integrity_ok: Result of integrity_check (None if skipped)
+        integrity_messages: Problems reported by integrity_check
+        vacuum_path: Path of the compacted copy (None if not requested)
+        vacuum_size: Size in bytes of the compacted copy
+        duration_seconds: Wall-clock duration of the run
+        schema_version: Schema version recorded in metadata
+    """
+
+    before: DatabaseFileStats
+    after: DatabaseFileStats
+    indexes: list[IndexStats] = field(default_factory=list)
+    analyzed: bool = False
+    checkpoint: WalCheckpointResult | None = None
+    integrity_ok: bool | None = None
+    integrity_messages: list[str] = field(default_factory=list)
+    vacuum_path: str | None = None
+    vacuum_size: int | None = None
+    duration_seconds: float = 0.0
+    schema_version: str | None = None
+
+    @property
+    def unused_indexes(self) -> list[str]:
+        """Names of indexes not used by any probe query."""
+        return [idx.name for idx in self.indexes if not idx.used_by]
+
+
+def collect_file_stats(engine: Engine, db_path: str) -> DatabaseFileStats:
+    """Collect file size and page statistics for a database.
+
+    Args:
+        engine: SQLAlchemy engine bound to the database
+        db_path: Path to the database file
+
+    Returns:
+        DatabaseFileStats snapshot
+    """
+    db_file = Path(db_path)
+    wal_file = Path(f"{db_path}-wal")
+
+    with engine.connect() as conn:
+        page_size = int(conn.execute(text("PRAGMA page_size")).scalar() or 0)
+        page_count = int(conn.execute(text("PRAGMA page_count")).scalar() or 0)
+        freelist_count = int(conn.execute(text("PRAGMA freelist_count")).scalar() or 0)
+
+    return DatabaseFileStats(
+        file_size=db_file.stat().st_size if db_file.exists() else 0,
+        wal_size=wal_file.stat().st_size if wal_file.exists() else 0,
+        page_size=page_size,
+        page_count=page_count,
+        freelist_count=freelist_count,
+    )
+
+
+def collect_index_stats(conn: Connection) -> list[IndexStats]:
+    """Collect planner statistics and probe-query usage for all indexes.
+
+    Args:
+        conn: Open connection to the database
+
+    Returns:
+        List of IndexStats sorted by table and index name
+    """
+    index_rows = conn.execute(
+        text(
+            "SELECT name, tbl_name FROM sqlite_master "
+            "WHERE type = 'index' AND name NOT LIKE 'sqlite_autoindex%' "
+            "ORDER BY tbl_name, name"
+        )
+    ).fetchall()
+    indexes = {row[0]: IndexStats(name=row[0], table=row[1]) for row in index_rows}
+
+    # sqlite_stat1 only exists once ANALYZE has run at least once
+    has_stat1 = conn.execute(
+        text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+        )
+    ).first()
+    if has_stat1:
+        for idx_name, stat in conn.execute(
+            text("SELECT idx, stat FROM sqlite_stat1 WHERE idx IS NOT NULL")
+        ):
+            if idx_name not in indexes:
+                continue
+            # stat format: "<rows> <avg rows per key col 1> [...]"
+            parts = str(stat).split()
+            if parts and parts[0].isdigit():
+                indexes[idx_name].rows = int(parts[0])
+            if len(parts) > 1 and parts[1].isdigit():
+                indexes[idx_name].avg_rows_per_key = int(parts[1])
+
+    for label, query in INDEX_PROBE_QUERIES.items():
+        plan = conn.execute(text(f"EXPLAIN QUERY PLAN {query}")).fetchall()
+        details = " ".join(str(row[-1]) for row in plan)
+        for idx in indexes.values():
+            if f"INDEX {idx.name} " in f"{details} ":
+                idx.used_by.append(label)
+
+    return list(indexes.values())
+
+
+def maintain_database(
+    db_session: DatabaseSession,
+    db_path: str,
+    vacuum_into: str | None = None,
+    analyze: bool = True,
+    integrity_check: bool = True,
+) -> MaintenanceReport:
+    """Run ANALYZE, WAL checkpoint, optional VACUUM INTO and integrity check.
+
+    The database must have been opened with ``open_database()`` so that the
+    passphrase has been verified before any maintenance is performed.
+
+    Args:
+        db_session: Authenticated database session
+        db_path: Path to the database file (used for size reporting)
+        vacuum_into: Destination path for a compacted copy (must not exist)
+        analyze: Run ANALYZE to refresh query planner statistics
+        integrity_check: Run PRAGMA integrity_check
+
+    Returns:
+        MaintenanceReport with before/after statistics
+
+    Raises:
+        ValueError: If vacuum_into target already exists
+        DatabaseError: If a maintenance statement fails
+    """
+    from sqlalchemy.exc import OperationalError
+
+    if vacuum_into is not None and Path(vacuum_into).exists():
+        raise ValueError(f"VACUUM INTO target already exists: {vacuum_into}")
+
+    start_time = time.perf_counter()
+
+    # End the ORM session's implicit read transaction so the checkpoint can
+    # reset the WAL instead of stopping at the oldest active reader
+    db_session.session.commit()
+
+    engine = db_session.engine
+    before = collect_file_stats(engine, db_path)
+    report = MaintenanceReport(before=before, after=before)
+
+    try:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            if analyze:
+                conn.execute(text("ANALYZE"))
+                report.analyzed = True
+
+            # Checkpoint after ANALYZE so its sqlite_stat1 writes are folded in.
+            # A reader on another connection leaves it busy or partial.
+            busy, log_frames, checkpointed = conn.execute(
+                text("PRAGMA wal_checkpoint(TRUNCATE)")
+            ).one()
+            report.checkpoint = WalCheckpointResult(
+                busy=int(busy),
+                log_frames=int(log_frames),
+                checkpointed_frames=int(checkpointed),
+            )
+
+            if vacuum_into is not None:
+                conn.execute(text("VACUUM INTO :target"), {"target": vacuum_into})
+                report.vacuum_path = vacuum_into
+                report.vacuum_size = Path(vacuum_into).stat().st_size
+
+            if integrity_check:
+                messages = [
+                    str(row[0]) for row in conn.execute(text("PRAGMA integrity_check"))
+                ]
+                report.integrity_ok = messages == ["ok"]
+                report.integrity_messages = [] if report.integrity_ok else messages
+
+            report.indexes = collect_index_stats(conn)
+            report.schema_version = get_schema_version(conn)
+
+    except OperationalError as e:
+        raise DatabaseError(f"Database maintenance failed: {e}") from e
+
+    report.after = collect_file_stats(engine, db_path)
+    report.duration_seconds = time.perf_counter() - start_time
+    return report
@@ -0,0 +1,353 @@
+"""Schema versioning and migrations for the mapping database.
+
+``init_database()`` creates the base schema (version 1.0.0) and records it in
+``metadata.schema_version``. Every later schema change (new indexes, tables or
+columns) is expressed as a ``Migration`` appended to ``MIGRATIONS`` so that
+existing databases are upgraded in place the next time they are opened.
+
+Each migration runs inside a single ``BEGIN IMMEDIATE`` transaction together
+with the ``schema_version`` bump, so a crash leaves the database at the
+previous version. Migrations that rewrite rows of large tables use
+``iter_row_batches()`` to bound memory and report progress.
+
+Example:
+    >>> applied = run_migrations(engine, encryption_service)
+    >>> print(applied)  # ["1.1.0"]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from gdpr_pseudonymizer.data.encryption import EncryptionService
+from gdpr_pseudonymizer.exceptions import DatabaseError
+from gdpr_pseudonymizer.utils.logger import get_logger
+from gdpr_pseudonymizer.utils.pseudonym_counters import extract_counter_values
+
+logger = get_logger(__name__)
+
+# Schema version created by init_database() before any migration
+BASE_SCHEMA_VERSION = "1.0.0"
+
+# Default number of rows per batch for row-rewriting migrations
+DEFAULT_BATCH_SIZE = 1000
+
+# Progress callback signature: (migration_version, rows_done, rows_total)
+ProgressCallback = Callable[[str, int, int], None]
+
+
+@dataclass
+class MigrationContext:
+    """State passed to a migration while it runs.
+
+    Attributes:
+        conn: Connection holding the migration transaction
+        version: Version of the running migration
+        encryption: Encryption service (None if the database key is unavailable)
+        batch_size: Rows per batch for row-rewriting migrations
+        progress: Optional progress callback
+    """
+
+    conn: Connection
+    version: str
+    encryption: EncryptionService | None = None
+    batch_size: int = DEFAULT_BATCH_SIZE
+    progress: ProgressCallback | None = None
+
+    def report(self, done: int, total: int) -> None:
+        """Report batch progress to the callback and the log.
+
+        Args:
+            done: Rows processed so far
+            total: Total rows to process
+        """
+        logger.info(
+            "schema_migration_progress",
+            version=self.version,
+            rows_done=done,
+            rows_total=total,
+        )
+        if self.progress is not None:
+            self.progress(self.version, done, total)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """Single schema migration step.
+
+    Attributes:
+        version: Schema version reached after applying this migration
+        description: Short human-readable summary
+        apply: Function performing the change inside the open transaction
+    """
+
+    version: str
+    description: str
+    apply: Callable[[MigrationContext], None]
+
+
+def iter_row_batches(
+    ctx: MigrationContext, table: str, columns: Sequence[str]
+) -> Iterator[list[Any]]:
+    """Iterate over all rows of a table in rowid order, one batch at a time.
+
+    Uses keyset pagination on ``rowid`` so each batch is a cheap range scan,
+    and reports progress after every batch.
+
+    Args:
+        ctx: Migration context
+        table: Table name (trusted, from migration code only)
+        columns: Column names to select (trusted, from migration code only)
+
+    Yields:
+        Lists of rows; ``row[0]`` is the rowid, followed by ``columns``
+    """
+    total = int(ctx.conn.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar() or 0)
+    select_list = ", ".join(["rowid", *columns])
+    last_rowid = 0
+    done = 0
+
+    while True:
+        rows = ctx.conn.execute(
+            text(
+                f"SELECT {select_list} FROM {table} WHERE rowid > :last "
+                "ORDER BY rowid LIMIT :limit"
+            ),
+            {"last": last_rowid, "limit": ctx.batch_size},
+        ).fetchall()
+        if not rows:
+            break
+
+        yield list(rows)
+
+        done += len(rows)
+        last_rowid = rows[-1][0]
+        ctx.report(done, total)
+
+
+def _add_audit_composite_index(ctx: MigrationContext) -> None:
+    """Composite index for audit queries filtered by type and date range."""
+    ctx.conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS idx_operations_type_timestamp "
+            "ON operations(operation_type, timestamp)"
+        )
+    )
+
+
+def _add_pseudonym_counters(ctx: MigrationContext) -> None:
+    """Counters table, backfilled from existing counter-based pseudonyms."""
+    ctx.conn.execute(
+        text(
+            "CREATE TABLE IF NOT EXISTS pseudonym_counters ("
+            "name VARCHAR NOT NULL PRIMARY KEY, "
+            "value INTEGER NOT NULL)"
+        )
+    )
+
+    counters: dict[str, int] = {}
+    for batch in iter_row_batches(ctx, "entities", ["pseudonym_full"]):
+        if ctx.encryption is None:
+            raise DatabaseError("Counter backfill requires the database key")
+        batch_counters = extract_counter_values(
+            ctx.encryption.decrypt(row[1]) for row in batch
+        )
+        for name, value in batch_counters.items():
+            counters[name] = max(value, counters.get(name, 0))
+
+    for name, value in counters.items():
+        ctx.conn.execute(
+            text(
+                "INSERT INTO pseudonym_counters (name, value) VALUES (:name, :value) "
+                "ON CONFLICT(name) DO UPDATE SET value = max(value, excluded.value)"
+            ),
+            {"name": name, "value": value},
+        )
+
+
+def _add_detection_cache(ctx: MigrationContext) -> None:
+    """Encrypted detection cache table with its LRU eviction index."""
+    ctx.conn.execute(
+        text(
+            "CREATE TABLE IF NOT EXISTS detection_cache ("
+            "cache_key VARCHAR NOT NULL PRIMARY KEY, "
+            "entities VARCHAR NOT NULL, "
+            "size_bytes INTEGER NOT NULL, "
+            "last_used_at DATETIME NOT NULL)"
+        )
+    )
+    ctx.conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_detection_cache_last_used_at "
+            "ON detection_cache(last_used_at)"
+        )
+    )
+
+
+# Ordered list of migrations; append new entries, never edit released ones
+MIGRATIONS: list[Migration] = [
+    Migration(
+        version="1.1.0",
+        description="Composite audit index on operations(operation_type, timestamp)",
+        apply=_add_audit_composite_index,
+    ),
+    Migration(
+        version="1.2.0",
+        description="Persisted pseudonym counters (fallback and neutral_id)",
+        apply=_add_pseudonym_counters,
+    ),
+    Migration(
+        version="1.3.0",
+        description="Encrypted detection cache",
+        apply=_add_detection_cache,
+    ),
+]
+
+CURRENT_SCHEMA_VERSION = MIGRATIONS[-1].version if MIGRATIONS else BASE_SCHEMA_VERSION
+
+
+def parse_version(version: str) -> tuple[int, ...]:
+    """Parse dotted version string into comparable tuple.
+
+    Args:
+        version: Version string like "1.2.0"
+
+    Returns:
+        Tuple of integers like (1, 2, 0)
+
+    Raises:
+        DatabaseError: If version string is malformed
+    """
+    try:
+        return tuple(int(part) for part in version.split("."))
+    except ValueError as e:
+        raise DatabaseError(f"Invalid schema version: {version!r}") from e
+
+
+def get_schema_version(conn: Connection) -> str:
+    """Read schema version from metadata table.
+
+    Databases created before versioning was read are treated as 1.0.0.
+
+    Args:
+        conn: Open database connection
+
+    Returns:
+        Schema version string
+    """
+    value = conn.execute(
+        text("SELECT value FROM metadata WHERE key = 'schema_version'")
+    ).scalar()
+    return str(value) if value else BASE_SCHEMA_VERSION
+
+
+def pending_migrations(current_version: str) -> list[Migration]:
+    """List migrations not yet applied to a database.
+
+    Args:
+        current_version: Schema version recorded in the database
+
+    Returns:
+        Migrations newer than current_version, in application order
+    """
+    current = parse_version(current_version)
+    return [m for m in MIGRATIONS if parse_version(m.version) > current]
+
+
+def _set_schema_version(conn: Connection, version: str) -> None:
+    """Upsert schema_version within the current transaction."""
+    now = datetime.utcnow()
+    updated = conn.execute(
+        text(
+            "UPDATE metadata SET value = :value, updated_at = :now "
+            "WHERE key = 'schema_version'"
+        ),
+        {"value": version, "now": now},
+    )
+    if updated.rowcount == 0:
+        conn.execute(
+            text(
+                "INSERT INTO metadata (key, value, updated_at) "
+                "VALUES ('schema_version', :value, :now)"
+            ),
+            {"value": version, "now": now},
+        )
+
+
+def run_migrations(
+    engine: Engine,
+    encryption: EncryptionService | None = None,
+    progress: ProgressCallback | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> list[str]:
+    """Apply all pending migrations to a database.
+
+    Each migration and its schema_version bump run in one ``BEGIN IMMEDIATE``
+    transaction. The version is re-read after the write lock is acquired, so
+    concurrent processes opening the same database apply each migration once.
+
+    Args:
+        engine: SQLAlchemy engine bound to the database
+        encryption: Encryption service for migrations that read encrypted data
+        progress: Optional callback receiving (version, rows_done, rows_total)
+        batch_size: Rows per batch for row-rewriting migrations
+
+    Returns:
+        Versions of the migrations applied (empty if already up to date)
+
+    Raises:
+        DatabaseError: If the database schema is newer than this software,
+            or if a migration fails (the failed migration is rolled back)
+    """
+    applied: list[str] = []
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        current = get_schema_version(conn)
+        if parse_version(current) > parse_version(CURRENT_SCHEMA_VERSION):
+            raise DatabaseError(
+                f"Database schema version {current} is newer than supported "
+                f"version {CURRENT_SCHEMA_VERSION}. Upgrade gdpr-pseudonymizer."
+            )
+
+        for migration in pending_migrations(current):
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            try:
+                # Another process may have migrated while we waited for the lock
+                if parse_version(get_schema_version(conn)) >= parse_version(
+                    migration.version
+                ):
+                    conn.exec_driver_sql("COMMIT")
+                    continue
+
+                logger.info(
+                    "schema_migration_started",
+                    version=migration.version,
+                    description=migration.description,
+                )
+                migration.apply(
+                    MigrationContext(
+                        conn=conn,
+                        version=migration.version,
+                        encryption=encryption,
+                        batch_size=batch_size,
+                        progress=progress,
+                    )
+                )
+                _set_schema_version(conn, migration.version)
+                conn.exec_driver_sql("COMMIT")
+            except Exception as e:
+                conn.exec_driver_sql("ROLLBACK")
+                raise DatabaseError(
+                    f"Schema migration to {migration.version} failed: {e}"
+                ) from e
+
+            applied.append(migration.version)
+            logger.info("schema_migration_completed", version=migration.version)
+
+    return applied
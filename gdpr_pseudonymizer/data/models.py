@@ -141,3 +141,40 @@ class Metadata(Base):
         if "updated_at" not in kwargs:
             kwargs["updated_at"] = datetime.utcnow()
         super().__init__(**kwargs)
+
+
+class PseudonymCounter(Base):
+    """Persisted high-water marks for counter-based pseudonyms.
+
+    Updated in the same transaction as the entities that consume them, so
+    new sessions read a few integers instead of scanning every mapping.
+
+    Keys (see utils.pseudonym_counters):
+    - fallback:{PERSON|LOCATION|ORG}: last fallback suffix (Person-001, ...)
+    - neutral_id:{PERSON|LOCATION|ORG}: last neutral_id counter (PER-001, ...)
+    """
+
+    __tablename__ = "pseudonym_counters"
+
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    value: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class DetectionCacheEntry(Base):
+    """Cached NLP detection results, keyed by document content.
+
+    Lets re-runs over an unchanged document (after rejecting output, or
+    with a different theme) skip spaCy and regex detection entirely.
+
+    Both the key (a hash of the text and detector configuration) and the
+    entity list are encrypted with the database key, so the cache neither
+    reveals detected names nor lets anyone test whether a known document
+    was processed. See repositories.detection_cache_repository.
+    """
+
+    __tablename__ = "detection_cache"
+
+    cache_key: Mapped[str] = mapped_column(String, primary_key=True)
+    entities: Mapped[str] = mapped_column(String, nullable=False)  # encrypted JSON
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_used_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
@@ -0,0 +1,192 @@
+"""Encrypted, content-addressed cache of NLP detection results.
+
+Each entry maps one document text, under one detector configuration, to the
+``DetectedEntity`` list the hybrid detector produced for it:
+
+- The key is SHA-256(cache format, detector fingerprint, text), encrypted
+  with the database key. AES-SIV is deterministic, so the encrypted key can be
+  looked up directly, while a plain hash would let anyone holding a candidate
+  document confirm it was processed.
+- The entity list is stored as encrypted JSON (it contains real names).
+- Entries are evicted least-recently-used once their total encrypted size
+  exceeds ``max_bytes``.
+
+Cache failures never fail processing: unreadable entries are dropped and
+treated as misses, and write errors are logged and ignored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import func
+from sqlalchemy.exc import SQLAlchemyError
+
+from gdpr_pseudonymizer.data.models import DetectionCacheEntry
+from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
+from gdpr_pseudonymizer.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from gdpr_pseudonymizer.data.database import DatabaseSession
+
+logger = get_logger(__name__)
+
+# Bump when the serialized entity layout changes
+DETECTION_CACHE_VERSION = 1
+
+# Default bound on the total encrypted size of cached entries
+DEFAULT_MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class DetectionCacheRepository:
+    """Repository for cached detection results.
+
+    Example:
+        >>> cache = DetectionCacheRepository(db_session)
+        >>> key = cache.make_key(text, detector.detection_fingerprint())
+        >>> entities = cache.get(key)
+        >>> if entities is None:
+        ...     entities = detector.detect_entities(text)
+        ...     cache.put(key, entities)
+    """
+
+    def __init__(
+        self,
+        db_session: DatabaseSession,
+        max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+    ) -> None:
+        """Initialize repository with database session.
+
+        Args:
+            db_session: DatabaseSession with encryption service
+            max_bytes: Total encrypted size kept before LRU eviction
+        """
+        self._session = db_session.session
+        self._encryption = db_session.encryption
+        self._max_bytes = max_bytes
+
+    def make_key(self, text: str, fingerprint: str) -> str:
+        """Derive the encrypted cache key for a document.
+
+        Args:
+            text: Document text
+            fingerprint: Detector configuration fingerprint
+                (HybridDetector.detection_fingerprint())
+
+        Returns:
+            Encrypted, deterministic cache key
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{DETECTION_CACHE_VERSION}\0{fingerprint}\0".encode())
+        digest.update(text.encode("utf-8"))
+        key = self._encryption.encrypt(digest.hexdigest())
+        assert key is not None
+        return key
+
+    def get(self, key: str) -> list[DetectedEntity] | None:
+        """Look up cached entities and mark the entry as recently used.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Fresh DetectedEntity objects, or None on a cache miss
+        """
+        try:
+            entry = self._session.get(DetectionCacheEntry, key)
+            if entry is None:
+                # End the read transaction: a long-lived batch session must
+                # not hold a stale WAL snapshot while other sessions write
+                self._session.commit()
+                return None
+
+            try:
+                payload = self._encryption.decrypt(entry.entities) or ""
+                entities = [DetectedEntity(**item) for item in json.loads(payload)]
+            except Exception as e:
+                # Stale layout or tampered entry: drop it and detect again
+                logger.warning(
+                    "detection_cache_entry_invalid", error_type=type(e).__name__
+                )
+                self._session.delete(entry)
+                self._session.commit()
+                return None
+
+            entry.last_used_at = datetime.utcnow()
+            self._session.commit()
+            return entities
+        except SQLAlchemyError as e:
+            self._session.rollback()
+            logger.warning("detection_cache_read_failed", error_type=type(e).__name__)
+            return None
+
+    def put(self, key: str, entities: list[DetectedEntity]) -> None:
+        """Store detection results, then evict entries over the size budget.
+
+        Args:
+            key: Cache key from make_key()
+            entities: Entities returned by the detector
+        """
+        payload = json.dumps(
+            [asdict(entity) for entity in entities],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        encrypted = self._encryption.encrypt(payload)
+        assert encrypted is not None
+
+        try:
+            self._session.merge(
+                DetectionCacheEntry(
+                    cache_key=key,
+                    entities=encrypted,
+                    size_bytes=len(encrypted),
+                    last_used_at=datetime.utcnow(),
+                )
+            )
+            self._session.flush()
+            self._evict()
+            self._session.commit()
+        except SQLAlchemyError as e:
+            # E.g. a concurrent batch worker stored the same document first
+            self._session.rollback()
+            logger.warning("detection_cache_write_failed", error_type=type(e).__name__)
+
+    def _evict(self) -> None:
+        """Delete least-recently-used entries until within max_bytes."""
+        total = int(
+            self._session.query(
+                func.coalesce(func.sum(DetectionCacheEntry.size_bytes), 0)
+            ).scalar()
+        )
+        if total <= self._max_bytes:
+            return
+
+        evicted = 0
+        oldest_first = self._session.query(
+            DetectionCacheEntry.cache_key, DetectionCacheEntry.size_bytes
+        ).order_by(DetectionCacheEntry.last_used_at, DetectionCacheEntry.cache_key)
+        for cache_key, size_bytes in oldest_first.all():
+            if total <= self._max_bytes:
+                break
+            self._session.query(DetectionCacheEntry).filter_by(
+                cache_key=cache_key
+            ).delete()
+            total -= size_bytes
+            evicted += 1
+
+        logger.info("detection_cache_evicted", entries=evicted, total_bytes=total)
+
+    def clear(self) -> int:
+        """Delete every cached detection.
+
+        Returns:
+            Number of entries deleted
+        """
+        deleted = self._session.query(DetectionCacheEntry).delete()
+        self._session.commit()
+        return int(deleted)
@@ -4,8 +4,16 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
-from gdpr_pseudonymizer.data.models import Entity
+from gdpr_pseudonymizer.data.models import (
+    DetectionCacheEntry,
+    Entity,
+    PseudonymCounter,
+)
 from gdpr_pseudonymizer.exceptions import DatabaseError, DuplicateEntityError
+from gdpr_pseudonymizer.utils.pseudonym_counters import (
+    extract_counter_values,
+    reservation_key,
+)
 
 
 class MappingRepository(ABC):
@@ -40,6 +48,22 @@ class MappingRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_component_pseudonym(
+        self, component: str, component_type: str
+    ) -> str | None:
+        """Find the pseudonym component of the first entity sharing a component.
+
+        Args:
+            component: Name component to search for (e.g., "Marie")
+            component_type: Type of component ("first_name" or "last_name")
+
+        Returns:
+            pseudonym_first (or pseudonym_last) of the first match, None if no
+            entity has the component
+        """
+        pass
+
     @abstractmethod
     def save(self, entity: Entity) -> Entity:
         """Persist new entity or update existing.
@@ -64,6 +88,39 @@ class MappingRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_counters(self) -> dict[str, int]:
+        """Load persisted counter high-water marks for counter-based pseudonyms.
+
+        Returns:
+            Mapping of counter key (e.g. "fallback:PERSON") to last value used
+        """
+        pass
+
+    @abstractmethod
+    def reserve_counter_range(self, key: str, size: int) -> int:
+        """Atomically reserve a block of counter values for this caller.
+
+        Args:
+            key: Counter key (e.g. "neutral_id:PERSON")
+            size: Number of consecutive values to reserve
+
+        Returns:
+            First reserved value (the block is [first, first + size - 1])
+        """
+        pass
+
+    @abstractmethod
+    def release_counter_range(self, key: str, first: int, last: int) -> None:
+        """Give back a reserved block if no later block was reserved.
+
+        Args:
+            key: Counter key the block was reserved for
+            first: First value of the block
+            last: Last value of the block
+        """
+        pass
+
     @abstractmethod
     def find_all(
         self,
@@ -217,6 +274,54 @@ class SQLiteMappingRepository(MappingRepository):
         # Decrypt and return
         return [self._decrypt_entity(e) for e in db_entities]
 
+    def find_component_pseudonym(
+        self, component: str, component_type: str
+    ) -> str | None:
+        """Find the pseudonym component of the first matching entity.
+
+        Unlike find_by_component(), selects a single column of a single row
+        (LIMIT 1) and decrypts only that value, so a common surname does
+        not load and decrypt every entity carrying it.
+
+        Args:
+            component: Plaintext component to search for (e.g., "Dubois")
+            component_type: "first_name" or "last_name"
+
+        Returns:
+            Decrypted pseudonym_first (or pseudonym_last), None if no match
+
+        Raises:
+            ValueError: If component_type invalid
+
+        Example:
+            >>> repo.find_component_pseudonym("Dubois", "last_name")
+            'Martin'
+        """
+        if component_type not in ("first_name", "last_name"):
+            raise ValueError(
+                f"Invalid component_type: {component_type}. Must be 'first_name' or 'last_name'."
+            )
+
+        encrypted_component = self._encryption.encrypt(component)
+
+        if component_type == "first_name":
+            row = (
+                self._session.query(Entity.pseudonym_first)
+                .filter(Entity.first_name == encrypted_component)
+                .first()
+            )
+        else:  # last_name
+            row = (
+                self._session.query(Entity.pseudonym_last)
+                .filter(Entity.last_name == encrypted_component)
+                .first()
+            )
+
+        if row is None:
+            return None
+        pseudonym: str | None = self._encryption.decrypt(row[0])
+        return pseudonym
+
     def save(self, entity: Entity) -> Entity:
         """Persist entity with encrypted sensitive fields.
 
@@ -246,8 +351,9 @@ class SQLiteMappingRepository(MappingRepository):
             # Create encrypted copy for database
             encrypted_entity = self._encrypt_entity(entity)
 
-            # Add to session and commit
+            # Add to session and commit (counters in the same transaction)
             self._session.add(encrypted_entity)
+            self._stage_counter_updates([entity])
             self._session.commit()
 
             # Refresh to get generated fields (id, timestamp)
@@ -279,6 +385,9 @@ class SQLiteMappingRepository(MappingRepository):
             DatabaseError: If batch operation fails after retry attempts
 
         Note:
+            Counter-based pseudonyms (fallback names, neutral_id identifiers)
+            advance the persisted counters in the same transaction.
+
             Race condition handling: If batch insert fails due to UNIQUE constraint
             (common in parallel processing), falls back to individual saves with
             duplicate detection. Entities that already exist are looked up and
@@ -297,6 +406,8 @@ class SQLiteMappingRepository(MappingRepository):
 
             # Add all to session (better than bulk_save_objects for tracking)
             self._session.add_all(encrypted_entities)
+            # Advance persisted counters atomically with the inserted entities
+            self._stage_counter_updates(entities)
             self._session.commit()
 
             # Flush to ensure IDs are generated
@@ -335,6 +446,7 @@ class SQLiteMappingRepository(MappingRepository):
                 # Try to save individually
                 encrypted_entity = self._encrypt_entity(entity)
                 self._session.add(encrypted_entity)
+                self._stage_counter_updates([entity])
                 self._session.commit()
                 self._session.refresh(encrypted_entity)
                 saved_entities.append(self._decrypt_entity(encrypted_entity))
@@ -354,6 +466,133 @@ class SQLiteMappingRepository(MappingRepository):
 
         return saved_entities
 
+    def get_counters(self) -> dict[str, int]:
+        """Load persisted counter high-water marks.
+
+        Returns:
+            Mapping of counter key (e.g. "neutral_id:PERSON") to last value used
+
+        Example:
+            >>> repo.get_counters()
+            {'fallback:ORG': 3, 'neutral_id:PERSON': 42}
+        """
+        rows = self._session.query(PseudonymCounter).all()
+        return {row.name: row.value for row in rows}
+
+    def reserve_counter_range(self, key: str, size: int) -> int:
+        """Atomically reserve a block of counter values for this caller.
+
+        The reservation cursor (see utils.pseudonym_counters.reservation_key)
+        is advanced past both itself and the counter's persisted high-water
+        mark in a single upsert, committed on its own. SQLite serializes the
+        write, so concurrent workers always receive disjoint blocks.
+
+        Args:
+            key: Counter key (e.g. "neutral_id:PERSON")
+            size: Number of consecutive values to reserve
+
+        Returns:
+            First reserved value (the block is [first, first + size - 1])
+
+        Raises:
+            ValueError: If size is not positive
+            DatabaseError: If the reservation cannot be written
+
+        Example:
+            >>> repo.reserve_counter_range("neutral_id:PERSON", 256)
+            43
+        """
+        from sqlalchemy import func, select
+        from sqlalchemy.dialects.sqlite import insert
+        from sqlalchemy.exc import OperationalError
+        from sqlalchemy.orm import aliased
+
+        if size < 1:
+            raise ValueError(f"Reservation size must be positive, got {size}")
+
+        cursor_key = reservation_key(key)
+        high_water = aliased(PseudonymCounter)
+        issued = (
+            select(func.coalesce(func.max(high_water.value), 0))
+            .where(high_water.name == key)
+            .scalar_subquery()
+        )
+        stmt = insert(PseudonymCounter).values(name=cursor_key, value=issued + size)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PseudonymCounter.name],
+            set_={"value": func.max(PseudonymCounter.value, issued) + size},
+        )
+
+        try:
+            self._session.execute(stmt)
+            last = self._session.execute(
+                select(PseudonymCounter.value).where(
+                    PseudonymCounter.name == cursor_key
+                )
+            ).scalar_one()
+            self._session.commit()
+        except OperationalError as e:
+            self._session.rollback()
+            raise DatabaseError(f"Counter reservation failed: {e}") from e
+
+        return int(last) - size + 1
+
+    def release_counter_range(self, key: str, first: int, last: int) -> None:
+        """Give back a reserved block if no later block was reserved.
+
+        Rewinds the reservation cursor to before the block only while it
+        still ends at this block, so sequential runs number contiguously.
+        Values of the block already saved stay covered by the counter's
+        high-water mark, which the next reservation starts after.
+
+        Args:
+            key: Counter key the block was reserved for
+            first: First value of the block
+            last: Last value of the block
+        """
+        from sqlalchemy import update
+        from sqlalchemy.exc import OperationalError
+
+        try:
+            self._session.execute(
+                update(PseudonymCounter)
+                .where(
+                    PseudonymCounter.name == reservation_key(key),
+                    PseudonymCounter.value == last,
+                )
+                .values(value=first - 1)
+            )
+            self._session.commit()
+        except OperationalError as e:
+            self._session.rollback()
+            raise DatabaseError(f"Counter release failed: {e}") from e
+
+    def _stage_counter_updates(self, entities: list[Entity]) -> None:
+        """Raise persisted counters to cover counter-based pseudonyms being saved.
+
+        Executes in the session's current transaction; the caller commits.
+        Counters only ever increase (MAX upsert), so concurrent writers and
+        erased mappings never cause a counter value to be issued twice.
+
+        Args:
+            entities: Entities with plaintext pseudonym_full values
+        """
+        from sqlalchemy import func
+        from sqlalchemy.dialects.sqlite import insert
+
+        counters = extract_counter_values(e.pseudonym_full for e in entities)
+        if not counters:
+            return
+
+        stmt = insert(PseudonymCounter).values(
+            [{"name": name, "value": value} for name, value in counters.items()]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PseudonymCounter.name],
+            set_={"value": func.max(PseudonymCounter.value, stmt.excluded.value)},
+        )
+        self._session.execute(stmt)
+
     def find_all(
         self,
         entity_type: str | None = None,
@@ -388,6 +627,8 @@ class SQLiteMappingRepository(MappingRepository):
     def delete_entity_by_full_name(self, full_name: str) -> Entity | None:
         """Delete entity by encrypted full name.
 
+        Cached detection results are purged in the same transaction.
+
         Args:
             full_name: Plaintext full name of entity to delete
 
@@ -415,6 +656,7 @@ class SQLiteMappingRepository(MappingRepository):
 
         try:
             self._session.delete(db_entity)
+            self._purge_detection_cache()
             self._session.commit()
         except OperationalError as e:
             self._session.rollback()
@@ -425,6 +667,8 @@ class SQLiteMappingRepository(MappingRepository):
     def delete_entity_by_id(self, entity_id: str) -> Entity | None:
         """Delete entity by UUID.
 
+        Cached detection results are purged in the same transaction.
+
         Args:
             entity_id: UUID of entity to delete
 
@@ -445,6 +689,7 @@ class SQLiteMappingRepository(MappingRepository):
 
         try:
             self._session.delete(db_entity)
+            self._purge_detection_cache()
             self._session.commit()
         except OperationalError as e:
             self._session.rollback()
@@ -452,6 +697,15 @@ class SQLiteMappingRepository(MappingRepository):
 
         return decrypted
 
+    def _purge_detection_cache(self) -> None:
+        """Delete every cached detection, pending the caller's commit.
+
+        Cached entity lists may contain an erased name, but they are
+        encrypted blobs keyed by document hash and cannot be selected by
+        name, so the whole cache goes and documents are detected again.
+        """
+        self._session.query(DetectionCacheEntry).delete()
+
     def search_entities(
         self,
         search_term: str | None = None,
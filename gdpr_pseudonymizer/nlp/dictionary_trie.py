@@ -0,0 +1,190 @@
+"""
+Token Trie for Dictionary Phrase Matching
+
+Matches multi-word dictionary phrases (place names, first and last names)
+against text in a single left-to-right pass over word tokens. From each start
+token the trie is walked for at most as many tokens as the longest phrase, so
+scanning cost grows with the text, not with the dictionary size.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+# Word runs, whitespace runs and single punctuation characters. Dictionary
+# phrases and document text are tokenized identically, so "Val-d'Oise" and
+# "Côte d'Azur" are matched token by token.
+_TOKEN_PATTERN = re.compile(r"(?P<word>\w+)|(?P<space>\s+)|[^\w\s]", re.UNICODE)
+
+# Key of every whitespace run, so line breaks and double spaces still match
+WHITESPACE = " "
+
+# Joins the parts of a compound (Saint-Étienne, Jean-Pierre)
+HYPHEN = "-"
+
+# Trie node key marking the end of a phrase (never produced by tokenize())
+_END = ""
+
+
+@dataclass(frozen=True)
+class Token:
+    """Single token of a tokenized text.
+
+    Attributes:
+        key: Token text used for trie lookup (whitespace runs become " ")
+        start: Character offset start position in the text
+        end: Character offset end position in the text
+        is_word: Whether the token is a run of word characters
+    """
+
+    key: str
+    start: int
+    end: int
+    is_word: bool
+
+
+def tokenize(text: str) -> list[Token]:
+    """Split text into word, whitespace and punctuation tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Tokens covering the whole text, in order
+    """
+    tokens = []
+    for match in _TOKEN_PATTERN.finditer(text):
+        kind = match.lastgroup
+        tokens.append(
+            Token(
+                key=WHITESPACE if kind == "space" else match.group(0),
+                start=match.start(),
+                end=match.end(),
+                is_word=kind == "word",
+            )
+        )
+    return tokens
+
+
+def joined_before(tokens: list[Token], index: int) -> bool:
+    """Check whether the token at index continues a hyphenated compound.
+
+    Args:
+        tokens: Tokenized text
+        index: Index of the candidate start token
+
+    Returns:
+        True if the token directly follows "<word>-"
+    """
+    return index >= 2 and tokens[index - 1].key == HYPHEN and tokens[index - 2].is_word
+
+
+def joined_after(tokens: list[Token], end: int) -> bool:
+    """Check whether a match ending before index end is cut out of a compound.
+
+    Args:
+        tokens: Tokenized text
+        end: Index of the first token after the candidate match
+
+    Returns:
+        True if the match is directly followed by "-<word>"
+    """
+    return (
+        end + 1 < len(tokens) and tokens[end].key == HYPHEN and tokens[end + 1].is_word
+    )
+
+
+class TokenTrie:
+    """Trie of dictionary phrases keyed by token.
+
+    Attributes:
+        max_depth: Number of tokens in the longest phrase
+    """
+
+    def __init__(self, phrases: Iterable[str] = ()) -> None:
+        """Build the trie.
+
+        Args:
+            phrases: Dictionary phrases to insert
+        """
+        self._root: dict[str, Any] = {}
+        self._size = 0
+        self.max_depth = 0
+        for phrase in phrases:
+            self.add(phrase)
+
+    def add(self, phrase: str) -> None:
+        """Insert a phrase (no-op for empty or already present phrases).
+
+        Args:
+            phrase: Dictionary phrase
+        """
+        keys = [token.key for token in tokenize(phrase)]
+        if not keys:
+            return
+
+        node = self._root
+        for key in keys:
+            node = node.setdefault(key, {})
+        if _END not in node:
+            node[_END] = True
+            self._size += 1
+            self.max_depth = max(self.max_depth, len(keys))
+
+    def to_state(self) -> tuple[dict[str, Any], int, int]:
+        """Export the trie as plain data (see from_state()).
+
+        Returns:
+            (nodes, phrase count, max depth)
+        """
+        return self._root, self._size, self.max_depth
+
+    @classmethod
+    def from_state(cls, state: tuple[dict[str, Any], int, int]) -> TokenTrie:
+        """Rebuild a trie exported with to_state() without re-tokenizing.
+
+        Args:
+            state: (nodes, phrase count, max depth)
+
+        Returns:
+            Trie sharing the given nodes
+        """
+        trie = cls()
+        trie._root, trie._size, trie.max_depth = state
+        return trie
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, phrase: object) -> bool:
+        if not isinstance(phrase, str):
+            return False
+        tokens = tokenize(phrase)
+        return bool(tokens) and len(tokens) in self.match_ends(tokens, 0)
+
+    def match_ends(self, tokens: list[Token], start: int) -> list[int]:
+        """Find dictionary phrases starting at a token.
+
+        Args:
+            tokens: Tokenized text
+            start: Index of the first token of the candidate phrase
+
+        Returns:
+            Exclusive end token indices of every matching phrase, longest first
+        """
+        ends: list[int] = []
+        node = self._root
+        index = start
+        while index < len(tokens):
+            child = node.get(tokens[index].key)
+            if child is None:
+                break
+            node = child
+            index += 1
+            if _END in node:
+                ends.append(index)
+        ends.reverse()
+        return ends
@@ -9,13 +9,22 @@ without changing core application logic.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 
+# Default number of documents per NLP pipeline batch
+DEFAULT_BATCH_SIZE = 8
 
-@dataclass
+
+@dataclass(slots=True)
 class DetectedEntity:
     """Represents a detected named entity from NER processing.
 
+    Slotted (no per-instance ``__dict__``) and pickled as a plain tuple of
+    field values, since long documents produce many of them and batch
+    workers send them between processes. See nlp.entity_spans for a
+    columnar form used by bulk span operations.
+
     Attributes:
         text: Original entity text (e.g., "Marie Dubois")
         entity_type: Entity classification (PERSON, LOCATION, or ORG)
@@ -37,6 +46,28 @@ class DetectedEntity:
     source: str = "spacy"
     context_label: str | None = None
 
+    def __reduce__(
+        self,
+    ) -> tuple[
+        type[DetectedEntity],
+        tuple[str, str, int, int, float | None, str | None, bool, str, str | None],
+    ]:
+        """Pickle as constructor arguments instead of a per-field state dict."""
+        return (
+            DetectedEntity,
+            (
+                self.text,
+                self.entity_type,
+                self.start_pos,
+                self.end_pos,
+                self.confidence,
+                self.gender,
+                self.is_ambiguous,
+                self.source,
+                self.context_label,
+            ),
+        )
+
 
 class EntityDetector(ABC):
     """Abstract interface for named entity detection implementations.
@@ -78,6 +109,36 @@ class EntityDetector(ABC):
         """
         pass
 
+    def detect_entities_batch(
+        self,
+        texts: Iterable[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        n_process: int = 1,
+    ) -> Iterator[list[DetectedEntity]]:
+        """Detect named entities in many documents through one pipeline.
+
+        Results are streamed: one entity list per input text, in input order,
+        so callers can consume documents as they complete. ``texts`` may be a
+        lazy iterable and is only read ahead by about ``batch_size`` items.
+
+        The default implementation calls detect_entities() per text;
+        implementations backed by a batching NLP pipeline override it.
+
+        Args:
+            texts: Document texts to process
+            batch_size: Number of documents per pipeline batch
+            n_process: Number of worker processes (if the library supports it)
+
+        Returns:
+            Iterator over one list of DetectedEntity objects per text
+
+        Raises:
+            ValueError: If a text is empty or batch_size/n_process < 1
+            ModelNotLoadedError: If model loading fails
+        """
+        validate_batch_args(batch_size, n_process)
+        return (self.detect_entities(text) for text in texts)
+
     @abstractmethod
     def get_model_info(self) -> dict[str, str]:
         """Get model metadata for audit logging.
@@ -100,3 +161,37 @@ class EntityDetector(ABC):
             True if library can classify entity gender, False otherwise
         """
         pass
+
+
+def validate_batch_args(batch_size: int, n_process: int) -> None:
+    """Validate detect_entities_batch() tuning arguments.
+
+    Args:
+        batch_size: Number of documents per pipeline batch
+        n_process: Number of worker processes
+
+    Raises:
+        ValueError: If either value is below 1
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+    if n_process < 1:
+        raise ValueError(f"n_process must be >= 1, got {n_process}")
+
+
+def require_non_empty(texts: Iterable[str]) -> Iterator[str]:
+    """Lazily pass texts through, rejecting empty ones like detect_entities().
+
+    Args:
+        texts: Document texts
+
+    Yields:
+        Each text unchanged
+
+    Raises:
+        ValueError: If a text is empty or None
+    """
+    for text in texts:
+        if not text:
+            raise ValueError("Text cannot be empty or None")
+        yield text
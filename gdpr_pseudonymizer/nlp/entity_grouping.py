@@ -233,7 +233,8 @@ def _cluster_by_normalization(
     """Cluster entity keys by normalized equality.
 
     Generic clustering: two keys are merged when their text normalizes
-    to the same string.  Used for LOCATION and ORG entity types.
+    to the same string.  Used for LOCATION and ORG entity types. Keys are
+    bucketed by normalized form, so this is linear in the number of keys.
 
     Args:
         keys: List of (text, entity_type) keys
@@ -245,14 +246,14 @@ def _cluster_by_normalization(
     if len(keys) <= 1:
         return [[k] for k in keys]
 
-    normalized = {k: normalizer(k[0]) for k in keys}
-    uf = UnionFind(keys)
+    buckets: dict[str, list[K]] = defaultdict(list)
+    for key in keys:
+        buckets[normalizer(key[0])].append(key)
 
-    key_list = list(keys)
-    for i in range(len(key_list)):
-        for j in range(i + 1, len(key_list)):
-            if normalized[key_list[i]] == normalized[key_list[j]]:
-                uf.union(key_list[i], key_list[j])
+    uf = UnionFind(keys)
+    for bucket in buckets.values():
+        for key in bucket[1:]:
+            uf.union(bucket[0], key)
 
     return uf.clusters()
 
@@ -264,6 +265,13 @@ def _cluster_person_variants(keys: list[K]) -> list[list[K]]:
     multiple full names with different first names (e.g., "Olivier Durand" and
     "Alice Durand"), the surname is kept as its own group to prevent incorrect
     transitive merging via Union-Find.
+
+    Every pair accepted by _is_person_variant() shares its last word
+    (case-insensitive), so keys are bucketed by last word and only compared
+    within a bucket: full names merge by first word, single words merge
+    together, and single words join the full names of their bucket through
+    _is_person_variant() itself. The resulting clusters are the same as
+    comparing every pair of keys.
     """
     if len(keys) <= 1:
         return [[k] for k in keys]
@@ -271,41 +279,64 @@ def _cluster_person_variants(keys: list[K]) -> list[list[K]]:
     normalized = {k: _normalize_person(k[0]) for k in keys}
     key_list = list(keys)
 
-    # Pre-scan: detect ambiguous single-word names that would bridge
-    # different people via Union-Find transitivity.
+    # Bucket by last word: single-word keys and full-name keys separately
+    single_by_surname: dict[str, list[K]] = defaultdict(list)
     last_name_to_full_keys: dict[str, list[K]] = defaultdict(list)
     for key in key_list:
         parts = normalized[key].split()
-        if len(parts) >= 2:
+        if len(parts) == 1:
+            single_by_surname[parts[0].lower()].append(key)
+        elif len(parts) >= 2:
             last_name_to_full_keys[parts[-1].lower()].append(key)
 
-    ambiguous_keys: set[K] = set()
-    for key in key_list:
-        parts = normalized[key].split()
-        if len(parts) == 1:
-            surname = parts[0].lower()
-            matching_full_keys = last_name_to_full_keys.get(surname, [])
-            if len(matching_full_keys) >= 2:
-                first_names = {
-                    normalized[k].split()[0].lower() for k in matching_full_keys
-                }
-                if len(first_names) >= 2:
-                    ambiguous_keys.add(key)
-
-    if ambiguous_keys:
+    # Ambiguous single-word names would bridge different people via
+    # Union-Find transitivity: they are left ungrouped.
+    ambiguous_surnames: set[str] = set()
+    for surname in single_by_surname:
+        matching_full_keys = last_name_to_full_keys.get(surname, [])
+        if len(matching_full_keys) >= 2:
+            first_names = {normalized[k].split()[0].lower() for k in matching_full_keys}
+            if len(first_names) >= 2:
+                ambiguous_surnames.add(surname)
+
+    if ambiguous_surnames:
         logger.debug(
             "ambiguous_person_names_detected",
-            ambiguous=[k[0] for k in ambiguous_keys],
+            ambiguous=[
+                k[0]
+                for surname in ambiguous_surnames
+                for k in single_by_surname[surname]
+            ],
         )
 
     uf = UnionFind(keys)
-    for i in range(len(key_list)):
-        for j in range(i + 1, len(key_list)):
-            ka, kb = key_list[i], key_list[j]
-            if ka in ambiguous_keys or kb in ambiguous_keys:
-                continue
-            if _is_person_variant(normalized[ka], normalized[kb]):
-                uf.union(ka, kb)
+
+    # Full names with the same first and last word are the same person
+    for full_keys in last_name_to_full_keys.values():
+        by_first_name: dict[str, K] = {}
+        for key in full_keys:
+            first_name = normalized[key].split()[0].lower()
+            if first_name in by_first_name:
+                uf.union(by_first_name[first_name], key)
+            else:
+                by_first_name[first_name] = key
+
+    position = {k: i for i, k in enumerate(key_list)}
+    for surname, single_keys in single_by_surname.items():
+        if surname in ambiguous_surnames:
+            continue
+        # Single words equal up to case are variants of each other
+        for key in single_keys[1:]:
+            uf.union(single_keys[0], key)
+        # A surname joins the full names ending with it (one first name at
+        # most here, or the surname would be ambiguous); the pairwise check
+        # keeps the original length tie-break
+        for full_key in last_name_to_full_keys.get(surname, []):
+            for single_key in single_keys:
+                ka, kb = sorted((single_key, full_key), key=position.__getitem__)
+                if _is_person_variant(normalized[ka], normalized[kb]):
+                    uf.union(ka, kb)
+                    break
 
     return uf.clusters()
 
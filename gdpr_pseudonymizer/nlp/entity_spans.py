@@ -0,0 +1,194 @@
+"""Columnar storage of entity spans for bulk operations.
+
+Filtering, ordering, deduplicating and replacing spans only need offsets,
+entity types and sources. ``EntitySpans`` keeps those in parallel compact
+arrays (8-byte offsets, 1-byte type and source ids) instead of one
+``DetectedEntity`` per span, and answers bulk operations with row indexes
+that map back to whatever list the spans were built from.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+
+from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
+
+
+class EntitySpans:
+    """Parallel arrays of span start, end, type id and source id.
+
+    Row ``i`` describes the ``i``-th span appended. Types and sources are
+    interned into small per-container vocabularies.
+
+    Example:
+        >>> spans = EntitySpans.from_entities(entities)
+        >>> kept = spans.non_overlapping()
+        >>> text = spans.substitute(text, kept, [pseudonyms[i] for i in kept])
+    """
+
+    __slots__ = ("starts", "ends", "type_ids", "source_ids", "types", "sources")
+
+    def __init__(self) -> None:
+        """Initialize an empty container."""
+        self.starts = array("q")
+        self.ends = array("q")
+        self.type_ids = array("B")
+        self.source_ids = array("B")
+        self.types: list[str] = []
+        self.sources: list[str] = []
+
+    @classmethod
+    def from_entities(cls, entities: Iterable[DetectedEntity]) -> EntitySpans:
+        """Build the columnar form of detected entities.
+
+        Args:
+            entities: Entities, in the row order to use
+
+        Returns:
+            Container with one row per entity
+        """
+        spans = cls()
+        for entity in entities:
+            spans.append(
+                entity.start_pos, entity.end_pos, entity.entity_type, entity.source
+            )
+        return spans
+
+    @staticmethod
+    def _intern(vocabulary: list[str], value: str) -> int:
+        try:
+            return vocabulary.index(value)
+        except ValueError:
+            if len(vocabulary) == 256:
+                raise ValueError("EntitySpans holds at most 256 distinct values")
+            vocabulary.append(value)
+            return len(vocabulary) - 1
+
+    def append(
+        self, start: int, end: int, entity_type: str = "", source: str = ""
+    ) -> None:
+        """Add one span.
+
+        Args:
+            start: Start character offset
+            end: End character offset (not before start)
+            entity_type: Entity type (PERSON, LOCATION, ORG, ...)
+            source: Detection source
+
+        Raises:
+            ValueError: If end < start
+        """
+        if end < start:
+            raise ValueError(f"Span end {end} before start {start}")
+        self.starts.append(start)
+        self.ends.append(end)
+        self.type_ids.append(self._intern(self.types, entity_type))
+        self.source_ids.append(self._intern(self.sources, source))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def entity_type(self, row: int) -> str:
+        """Entity type of a row."""
+        return self.types[self.type_ids[row]]
+
+    def source(self, row: int) -> str:
+        """Detection source of a row."""
+        return self.sources[self.source_ids[row]]
+
+    def of_types(self, entity_types: Iterable[str]) -> list[int]:
+        """Rows whose entity type is one of the given types, in row order.
+
+        Args:
+            entity_types: Types to keep
+
+        Returns:
+            Row indexes
+        """
+        wanted_types = set(entity_types)
+        wanted = {i for i, t in enumerate(self.types) if t in wanted_types}
+        return [row for row, type_id in enumerate(self.type_ids) if type_id in wanted]
+
+    def sorted_rows(self) -> list[int]:
+        """Rows by start, longest first among equal starts (stable).
+
+        Returns:
+            Row indexes
+        """
+        starts, ends = self.starts, self.ends
+        return sorted(range(len(starts)), key=lambda row: (starts[row], -ends[row]))
+
+    def unique_rows(self) -> list[int]:
+        """First row of each distinct (start, end, type), in row order.
+
+        Returns:
+            Row indexes
+        """
+        seen: set[tuple[int, int, int]] = set()
+        rows = []
+        for row, key in enumerate(zip(self.starts, self.ends, self.type_ids)):
+            if key not in seen:
+                seen.add(key)
+                rows.append(row)
+        return rows
+
+    def non_overlapping(self) -> list[int]:
+        """Greedily keep spans that overlap no span kept before them.
+
+        Spans are visited in sorted_rows() order, so the earliest and then
+        longest span wins. Two spans overlap unless one ends at or before
+        the other starts. A single sorted sweep replaces comparing every
+        span with every kept span.
+
+        Returns:
+            Kept row indexes, in sorted_rows() order
+        """
+        kept: list[int] = []
+        max_end = -1  # Furthest end of the kept spans
+        max_end_before = -1  # Same, over kept spans starting before this one
+        previous_start = None
+        for row in self.sorted_rows():
+            start, end = self.starts[row], self.ends[row]
+            if start != previous_start:
+                max_end_before = max_end
+                previous_start = start
+            # An empty span only overlaps kept spans strictly around it
+            if start < (max_end if end > start else max_end_before):
+                continue
+            kept.append(row)
+            max_end = max(max_end, end)
+        return kept
+
+    def substitute(
+        self, text: str, rows: Sequence[int], replacements: Sequence[str]
+    ) -> str:
+        """Replace non-overlapping spans of a text in a single pass.
+
+        Builds the result from slices once instead of re-copying the text
+        for every replacement. Empty spans at the same offset are inserted
+        latest row first, as successive in-place replacements from the end
+        of the text would.
+
+        Args:
+            text: Text the offsets refer to
+            rows: Non-overlapping rows to replace (e.g. non_overlapping())
+            replacements: Replacement text for each row in ``rows``
+
+        Returns:
+            Text with every listed span replaced
+        """
+        starts, ends = self.starts, self.ends
+        order = sorted(
+            range(len(rows)),
+            key=lambda i: (starts[rows[i]], ends[rows[i]], -i),
+        )
+        pieces = []
+        position = 0
+        for i in order:
+            row = rows[i]
+            pieces.append(text[position : starts[row]])
+            pieces.append(replacements[i])
+            position = ends[row]
+        pieces.append(text[position:])
+        return "".join(pieces)
@@ -9,17 +9,49 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-
+from typing import Any
+
+from gdpr_pseudonymizer.nlp.dictionary_trie import (
+    Token,
+    TokenTrie,
+    joined_after,
+    joined_before,
+)
 from gdpr_pseudonymizer.utils.logger import get_logger
+from gdpr_pseudonymizer.utils.resource_cache import load_resource
 
 logger = get_logger(__name__)
 
+_CATEGORIES = ("cities", "regions", "departments", "countries_and_international")
+
+
+def _build_geography(source: bytes) -> dict[str, Any]:
+    """Parse french_geography.json into location sets and their trie.
+
+    Args:
+        source: Raw dictionary file content
+
+    Returns:
+        Cacheable payload (see utils.resource_cache)
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    data = json.loads(source.decode("utf-8"))
+    payload: dict[str, Any] = {
+        category: set(data.get(category, [])) for category in _CATEGORIES
+    }
+    all_locations: set[str] = set().union(*payload.values())
+    payload["trie"] = TokenTrie(all_locations).to_state()
+    return payload
+
 
 class GeographyDictionary:
     """French geography dictionary for location entity detection.
 
     Loads French cities, regions, and departments from JSON file
-    and provides O(1) set lookups for location validation.
+    and provides O(1) set lookups for location validation, plus a token
+    trie for scanning text for every known location in one pass.
 
     Attributes:
         cities: Set of French city names
@@ -40,6 +72,7 @@ class GeographyDictionary:
         self.departments: set[str] = set()
         self.countries_and_international: set[str] = set()
         self.all_locations: set[str] = set()
+        self._trie = TokenTrie()
         if dictionary_path is None:
             from gdpr_pseudonymizer.resources import FRENCH_GEOGRAPHY_PATH
 
@@ -60,21 +93,19 @@ class GeographyDictionary:
             raise FileNotFoundError(f"Geography dictionary not found: {path}")
 
         try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
-
-            self.cities = set(data.get("cities", []))
-            self.regions = set(data.get("regions", []))
-            self.departments = set(data.get("departments", []))
-            self.countries_and_international = set(
-                data.get("countries_and_international", [])
-            )
+            payload = load_resource(path, "geography", _build_geography)
+
+            self.cities = payload["cities"]
+            self.regions = payload["regions"]
+            self.departments = payload["departments"]
+            self.countries_and_international = payload["countries_and_international"]
             self.all_locations = (
                 self.cities
                 | self.regions
                 | self.departments
                 | self.countries_and_international
             )
+            self._trie = TokenTrie.from_state(payload["trie"])
 
             logger.info(
                 "geography_dictionary_loaded",
@@ -102,6 +133,40 @@ class GeographyDictionary:
         """
         return name in self.all_locations
 
+    def find_locations(self, tokens: list[Token]) -> list[tuple[int, int]]:
+        """Find known locations in tokenized text.
+
+        Matches are leftmost-longest and non-overlapping ("Provence-Alpes-Côte
+        d'Azur" wins over "Provence"). A location is never cut out of a larger
+        hyphenated compound, so "Saint-Denis" is not reported inside
+        "Seine-Saint-Denis" unless the whole compound is known.
+
+        Args:
+            tokens: Text tokenized with dictionary_trie.tokenize()
+
+        Returns:
+            (start, end) character offsets of each match, in text order
+        """
+        spans: list[tuple[int, int]] = []
+        index = 0
+        while index < len(tokens):
+            end = None
+            if tokens[index].is_word and not joined_before(tokens, index):
+                end = next(
+                    (
+                        e
+                        for e in self._trie.match_ends(tokens, index)
+                        if not joined_after(tokens, e)
+                    ),
+                    None,
+                )
+            if end is None:
+                index += 1
+                continue
+            spans.append((tokens[index].start, tokens[end - 1].end))
+            index = end
+        return spans
+
     def get_stats(self) -> dict[str, int]:
         """Get dictionary statistics.
 
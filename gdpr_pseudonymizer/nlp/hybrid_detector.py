@@ -10,14 +10,61 @@ Implements EntityDetector interface using a hybrid approach:
 
 from __future__ import annotations
 
-from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity, EntityDetector
+import hashlib
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from importlib.metadata import PackageNotFoundError, version
+from itertools import accumulate, chain, groupby, tee
+from pathlib import Path
+
+from gdpr_pseudonymizer.nlp.entity_detector import (
+    DEFAULT_BATCH_SIZE,
+    DetectedEntity,
+    EntityDetector,
+)
+from gdpr_pseudonymizer.nlp.paragraph_cache import (
+    ParagraphCache,
+    shared_paragraph_cache,
+    split_paragraphs,
+)
 from gdpr_pseudonymizer.nlp.regex_matcher import RegexMatcher
-from gdpr_pseudonymizer.nlp.spacy_detector import SpaCyDetector
+from gdpr_pseudonymizer.nlp.spacy_detector import (
+    DEFAULT_DETECTION_PROFILE,
+    SpaCyDetector,
+)
+from gdpr_pseudonymizer.utils.cache_stats import CacheStats
 from gdpr_pseudonymizer.utils.french_patterns import strip_french_titles
 from gdpr_pseudonymizer.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# spaCy model loaded when detection starts before load_model() was called
+DEFAULT_SPACY_MODEL = "fr_core_news_lg"
+
+
+def _entity_key(entity: DetectedEntity) -> tuple[object, ...]:
+    """Hashable equivalent of DetectedEntity equality."""
+    return (
+        entity.text,
+        entity.entity_type,
+        entity.start_pos,
+        entity.end_pos,
+        entity.confidence,
+        entity.gender,
+        entity.is_ambiguous,
+        entity.source,
+        entity.context_label,
+    )
+
+
+def _distribution_version(name: str) -> str:
+    """Installed version of a distribution, or "unknown"."""
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "unknown"
+
 
 class HybridDetector(EntityDetector):
     """Hybrid entity detector combining spaCy NER with regex pattern matching.
@@ -38,11 +85,25 @@ class HybridDetector(EntityDetector):
         regex_matcher: RegexMatcher instance for pattern-based detection
     """
 
-    def __init__(self) -> None:
-        """Initialize hybrid detector with spaCy and regex components."""
-        self.spacy_detector = SpaCyDetector()
+    def __init__(
+        self,
+        detection_profile: str = DEFAULT_DETECTION_PROFILE,
+        paragraph_cache: bool = False,
+    ) -> None:
+        """Initialize hybrid detector with spaCy and regex components.
+
+        Args:
+            detection_profile: spaCy detection profile (accurate/balanced/fast)
+            paragraph_cache: Detect paragraph by paragraph, reusing entities
+                of paragraphs seen before (see nlp.paragraph_cache). Entities
+                spanning a blank line are not detected in this mode.
+        """
+        self.spacy_detector = SpaCyDetector(profile=detection_profile)
         self.regex_matcher = RegexMatcher()
+        self.paragraph_cache = paragraph_cache
         self._model_loaded = False
+        self._model_name = DEFAULT_SPACY_MODEL
+        self._fingerprint: str | None = None
 
     def load_model(self, model_name: str) -> None:
         """Load spaCy model and regex patterns.
@@ -56,6 +117,8 @@ class HybridDetector(EntityDetector):
         """
         # Load spaCy model
         self.spacy_detector.load_model(model_name)
+        self._model_name = model_name
+        self._fingerprint = None
 
         # Load regex patterns
         self.regex_matcher.load_patterns()
@@ -69,6 +132,12 @@ class HybridDetector(EntityDetector):
             ],
         )
 
+    def _ensure_model_loaded(self) -> None:
+        """Lazy load the default model on first detection."""
+        if not self._model_loaded:
+            logger.warning("hybrid_detector_lazy_loading_model")
+            self.load_model(self._model_name)
+
     def detect_entities(self, text: str) -> list[DetectedEntity]:
         """Detect entities using hybrid spaCy + regex approach.
 
@@ -85,13 +154,189 @@ class HybridDetector(EntityDetector):
         if not text:
             raise ValueError("Text cannot be empty")
 
-        if not self._model_loaded:
-            # Lazy load with default model
-            logger.warning("hybrid_detector_lazy_loading_model")
-            self.load_model("fr_core_news_lg")
+        if self.paragraph_cache:
+            return self._detect_paragraphs(text)
+
+        self._ensure_model_loaded()
+
+        if self.spacy_detector.uses_windows(text):
+            return self._detect_windowed(text)
 
         # Step 1: spaCy NER
         spacy_entities = self.spacy_detector.detect_entities(text)
+
+        # Steps 2-3: regex matching and merge
+        return self._combine_with_regex(text, spacy_entities)
+
+    def detect_entities_batch(
+        self,
+        texts: Iterable[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        n_process: int = 1,
+    ) -> Iterator[list[DetectedEntity]]:
+        """Detect entities in many documents with one batched spaCy pipeline.
+
+        spaCy NER runs over all texts via ``nlp.pipe``; regex matching and
+        merging then run per document as each spaCy result is streamed back,
+        using that document's Doc for POS disambiguation. The model is loaded
+        when the first text is pulled, so an empty stream never loads it.
+
+        Args:
+            texts: Document texts to process
+            batch_size: Number of documents per spaCy batch
+            n_process: Number of spaCy worker processes
+
+        Returns:
+            Iterator over one merged entity list per text, in input order
+
+        Raises:
+            ValueError: If a text is empty or batch_size/n_process < 1
+            ModelNotLoadedError: If models not loaded
+        """
+        return self._iter_batch(iter(texts), batch_size, n_process)
+
+    def _iter_batch(
+        self, texts: Iterator[str], batch_size: int, n_process: int
+    ) -> Iterator[list[DetectedEntity]]:
+        """Generator behind detect_entities_batch()."""
+        # Don't load the model for an empty stream (e.g. all detections cached)
+        first_text = next(texts, None)
+        if first_text is None:
+            return
+
+        if self.paragraph_cache:
+            # Paragraphs, not documents, are the unit sent through spaCy
+            for text in chain([first_text], texts):
+                if not text:
+                    raise ValueError("Text cannot be empty")
+                yield self._detect_paragraphs(text)
+            return
+
+        self._ensure_model_loaded()
+
+        # Runs of regular texts share one spaCy pipe; long texts are windowed
+        for windowed, run in groupby(
+            chain([first_text], texts), key=self.spacy_detector.uses_windows
+        ):
+            if windowed:
+                for text in run:
+                    yield self._detect_windowed(text)
+                continue
+
+            # spaCy consumes one copy of the run, the regex pass the other
+            spacy_texts, regex_texts = tee(run)
+            spacy_results = self.spacy_detector.detect_entities_batch(
+                spacy_texts, batch_size=batch_size, n_process=n_process
+            )
+            for text, spacy_entities in zip(regex_texts, spacy_results):
+                yield self._combine_with_regex(text, spacy_entities)
+
+    def _detect_windowed(self, text: str) -> list[DetectedEntity]:
+        """Detect entities in a long text window by window.
+
+        Each window goes through spaCy, regex matching (with POS
+        disambiguation against the window's Doc) and merging on its own;
+        entities are then shifted into document offsets and only those
+        starting in the window's keep range are reported.
+
+        Args:
+            text: Document text longer than spacy_detector.window_chars
+
+        Returns:
+            Merged entities of all windows, in document order
+        """
+        entities: list[DetectedEntity] = []
+        for window, spacy_entities in self.spacy_detector.detect_windows(text):
+            window_text = text[window.start : window.end]
+            for entity in self._combine_with_regex(window_text, spacy_entities):
+                entity.start_pos += window.start
+                entity.end_pos += window.start
+                if window.keeps(entity):
+                    entities.append(entity)
+        return entities
+
+    def _detect_paragraphs(self, text: str) -> list[DetectedEntity]:
+        """Detect entities paragraph by paragraph through the paragraph cache.
+
+        Paragraphs seen before (in this document or earlier ones) reuse their
+        cached entities; the remaining distinct paragraphs go through one
+        spaCy batch and regex matching. The model is only loaded if needed.
+
+        Args:
+            text: Document text
+
+        Returns:
+            Entities of all paragraphs, in document order
+        """
+        cache = self._get_paragraph_cache()
+        paragraphs = split_paragraphs(text)
+        results: list[list[DetectedEntity] | None] = []
+        # Unseen paragraph text -> indexes of its occurrences in this document
+        missing: dict[str, list[int]] = {}
+        for index, (offset, paragraph) in enumerate(paragraphs):
+            if paragraph in missing:
+                missing[paragraph].append(index)
+                results.append(None)
+                continue
+            cached = cache.get(paragraph, offset)
+            if cached is None:
+                missing[paragraph] = [index]
+            results.append(cached)
+
+        if missing:
+            self._ensure_model_loaded()
+            spacy_results = self.spacy_detector.detect_entities_batch(list(missing))
+            for (paragraph, indexes), spacy_entities in zip(
+                missing.items(), spacy_results
+            ):
+                entities = self._combine_with_regex(paragraph, spacy_entities)
+                cache.put(paragraph, entities)
+
+                offset = paragraphs[indexes[0]][0]
+                for entity in entities:
+                    entity.start_pos += offset
+                    entity.end_pos += offset
+                results[indexes[0]] = entities
+                for index in indexes[1:]:
+                    results[index] = cache.get(paragraph, paragraphs[index][0])
+
+        logger.debug(
+            "paragraph_detection_complete",
+            paragraphs=len(paragraphs),
+            detected=len(missing),
+        )
+        return [entity for entities in results if entities for entity in entities]
+
+    def _get_paragraph_cache(self) -> ParagraphCache:
+        """Process-wide paragraph cache for this detector's configuration."""
+        return shared_paragraph_cache(self.detection_fingerprint())
+
+    @property
+    def paragraph_cache_stats(self) -> CacheStats | None:
+        """Cumulative paragraph cache counters (None outside paragraph mode).
+
+        The cache is shared process-wide, so take differences between two
+        snapshots to get the counts for one batch.
+        """
+        if not self.paragraph_cache:
+            return None
+        return self._get_paragraph_cache().stats
+
+    def _combine_with_regex(
+        self, text: str, spacy_entities: list[DetectedEntity]
+    ) -> list[DetectedEntity]:
+        """Run regex matching on a document and merge with its spaCy entities.
+
+        Must be called right after spaCy processed ``text`` so that
+        ``spacy_detector.last_doc`` belongs to this document.
+
+        Args:
+            text: Document text
+            spacy_entities: Entities detected by spaCy in this text
+
+        Returns:
+            Merged and deduplicated entity list
+        """
         for entity in spacy_entities:
             entity.source = "spacy"
 
@@ -131,6 +376,10 @@ class HybridDetector(EntityDetector):
             - Partial overlap → Flag regex entity as ambiguous, keep both
             - Special case: Regex ORG with "Cabinet" overlapping spaCy PERSON → Prefer ORG
 
+        Each regex entity is compared with the first spaCy entity it overlaps,
+        found through an interval sweep (see _first_overlaps), so merging stays
+        near-linear on long documents.
+
         Args:
             spacy_entities: Entities detected by spaCy
             regex_entities: Entities detected by regex patterns
@@ -141,54 +390,67 @@ class HybridDetector(EntityDetector):
         merged: list[DetectedEntity] = list(spacy_entities)
         # Track spaCy entities to remove (when regex ORG supersedes spaCy PERSON)
         entities_to_remove: list[DetectedEntity] = []
+        # Normalized spaCy texts, computed at most once per entity
+        spacy_normalized: dict[int, str] = {}
 
-        for regex_entity in regex_entities:
-            overlap_found = False
-
-            for spacy_entity in spacy_entities:
-                if self._has_overlap(spacy_entity, regex_entity):
-                    overlap_found = True
-
-                    if self._is_exact_match(spacy_entity, regex_entity):
-                        # Exact match → Skip regex entity (prefer spaCy)
-                        logger.debug(
-                            "duplicate_entity_removed",
-                            text=regex_entity.text,
-                            reason="exact_match_with_spacy",
-                        )
-                        break
-                    elif self._should_prefer_regex_org(regex_entity, spacy_entity):
-                        # Special case: Regex ORG (Cabinet pattern) supersedes spaCy PERSON
-                        # Remove spaCy PERSON and add regex ORG (not ambiguous)
-                        entities_to_remove.append(spacy_entity)
-                        merged.append(regex_entity)
-                        logger.debug(
-                            "org_supersedes_person",
-                            regex_text=regex_entity.text,
-                            spacy_text=spacy_entity.text,
-                            reason="cabinet_pattern_preferred",
-                        )
-                        break
-                    else:
-                        # Partial overlap → Flag regex entity as ambiguous, add it
-                        regex_entity.is_ambiguous = True
-                        merged.append(regex_entity)
-                        logger.debug(
-                            "ambiguous_entity_added",
-                            regex_text=regex_entity.text,
-                            spacy_text=spacy_entity.text,
-                            reason="partial_overlap",
-                        )
-                        break
-
-            if not overlap_found:
+        first_overlaps = self._first_overlaps(spacy_entities, regex_entities)
+        for regex_entity, spacy_index in zip(regex_entities, first_overlaps):
+            if spacy_index is None:
                 # No overlap → Add regex entity (new detection)
                 merged.append(regex_entity)
+                continue
 
-        # Remove superseded spaCy entities
-        for entity in entities_to_remove:
-            if entity in merged:
-                merged.remove(entity)
+            spacy_entity = spacy_entities[spacy_index]
+            if spacy_index not in spacy_normalized:
+                spacy_normalized[spacy_index] = self._normalize_entity_text(
+                    spacy_entity.text
+                )
+
+            if (
+                spacy_entity.start_pos == regex_entity.start_pos
+                and spacy_entity.end_pos == regex_entity.end_pos
+            ) or spacy_normalized[spacy_index] == self._normalize_entity_text(
+                regex_entity.text
+            ):
+                # Exact match → Skip regex entity (prefer spaCy)
+                logger.debug(
+                    "duplicate_entity_removed",
+                    text=regex_entity.text,
+                    reason="exact_match_with_spacy",
+                )
+            elif self._should_prefer_regex_org(regex_entity, spacy_entity):
+                # Special case: Regex ORG (Cabinet pattern) supersedes spaCy PERSON
+                # Remove spaCy PERSON and add regex ORG (not ambiguous)
+                entities_to_remove.append(spacy_entity)
+                merged.append(regex_entity)
+                logger.debug(
+                    "org_supersedes_person",
+                    regex_text=regex_entity.text,
+                    spacy_text=spacy_entity.text,
+                    reason="cabinet_pattern_preferred",
+                )
+            else:
+                # Partial overlap → Flag regex entity as ambiguous, add it
+                regex_entity.is_ambiguous = True
+                merged.append(regex_entity)
+                logger.debug(
+                    "ambiguous_entity_added",
+                    regex_text=regex_entity.text,
+                    spacy_text=spacy_entity.text,
+                    reason="partial_overlap",
+                )
+
+        # Remove superseded spaCy entities (first equal occurrence of each)
+        if entities_to_remove:
+            pending = Counter(_entity_key(entity) for entity in entities_to_remove)
+            kept: list[DetectedEntity] = []
+            for entity in merged:
+                key = _entity_key(entity)
+                if pending[key]:
+                    pending[key] -= 1
+                else:
+                    kept.append(entity)
+            merged = kept
 
         # Filter out title-only entities (e.g., "Maître" without a name)
         merged = self._filter_title_only_entities(merged)
@@ -201,6 +463,46 @@ class HybridDetector(EntityDetector):
 
         return merged
 
+    def _first_overlaps(
+        self,
+        spacy_entities: list[DetectedEntity],
+        regex_entities: list[DetectedEntity],
+    ) -> list[int | None]:
+        """Find the first spaCy entity (in list order) overlapping each regex entity.
+
+        spaCy spans are sorted by start with a running maximum of their ends:
+        the candidates for a regex span are the sorted spans starting before
+        it ends, walked backwards while the running maximum still reaches past
+        its start. spaCy never emits nested spans, so each lookup visits only
+        the spans that actually overlap.
+
+        Args:
+            spacy_entities: Entities detected by spaCy
+            regex_entities: Entities detected by regex patterns
+
+        Returns:
+            Index into spacy_entities for each regex entity, None if no overlap
+        """
+        order = sorted(
+            range(len(spacy_entities)), key=lambda i: spacy_entities[i].start_pos
+        )
+        starts = [spacy_entities[i].start_pos for i in order]
+        max_ends = list(accumulate((spacy_entities[i].end_pos for i in order), max))
+
+        first_overlaps: list[int | None] = []
+        for regex_entity in regex_entities:
+            first: int | None = None
+            position = bisect_left(starts, regex_entity.end_pos) - 1
+            while position >= 0 and max_ends[position] > regex_entity.start_pos:
+                index = order[position]
+                if spacy_entities[index].end_pos > regex_entity.start_pos and (
+                    first is None or index < first
+                ):
+                    first = index
+                position -= 1
+            first_overlaps.append(first)
+        return first_overlaps
+
     def _should_prefer_regex_org(
         self, regex_entity: DetectedEntity, spacy_entity: DetectedEntity
     ) -> bool:
@@ -315,18 +617,6 @@ class HybridDetector(EntityDetector):
 
         return filtered
 
-    def _has_overlap(self, e1: DetectedEntity, e2: DetectedEntity) -> bool:
-        """Check if two entities overlap in text span.
-
-        Args:
-            e1: First entity
-            e2: Second entity
-
-        Returns:
-            True if entities overlap, False otherwise
-        """
-        return not (e1.end_pos <= e2.start_pos or e2.end_pos <= e1.start_pos)
-
     def _normalize_entity_text(self, text: str) -> str:
         """Normalize entity text by stripping French titles.
 
@@ -346,30 +636,47 @@ class HybridDetector(EntityDetector):
         """
         return strip_french_titles(text)
 
-    def _is_exact_match(self, e1: DetectedEntity, e2: DetectedEntity) -> bool:
-        """Check if two entities have identical span OR normalized text.
-
-        Checks both positional exact match and normalized text match to handle
-        cases where one detector includes a title and the other doesn't
-        (e.g., "Dr. Marie Dubois" from regex vs "Marie Dubois" from spaCy).
+    def detection_fingerprint(self) -> str:
+        """Identify everything that determines this detector's output.
 
-        Args:
-            e1: First entity
-            e2: Second entity
+        Covers the package and spaCy model versions, the detection profile,
+        paragraph and window settings and the bundled pattern and dictionary
+        files. Computed without loading the spaCy model, so a detection cache
+        can be consulted before paying for it.
 
         Returns:
-            True if entities have same start/end positions OR same normalized text
+            Hex digest that changes whenever detection results may change
         """
-        # Check positional exact match
-        if e1.start_pos == e2.start_pos and e1.end_pos == e2.end_pos:
-            return True
-
-        # Check normalized text match (strips titles for comparison)
-        # This handles "Dr. Marie Dubois" == "Marie Dubois" cases
-        if self._normalize_entity_text(e1.text) == self._normalize_entity_text(e2.text):
-            return True
-
-        return False
+        if self._fingerprint is None:
+            digest = hashlib.sha256()
+            for part in (
+                _distribution_version("gdpr-pseudonymizer"),
+                self._model_name,
+                _distribution_version(self._model_name),
+                self.spacy_detector.profile,
+                "paragraphs" if self.paragraph_cache else "documents",
+                f"{self.spacy_detector.window_chars}/"
+                f"{self.spacy_detector.window_overlap}",
+            ):
+                digest.update(part.encode("utf-8"))
+                digest.update(b"\0")
+
+            from gdpr_pseudonymizer.resources import (
+                FRENCH_GEOGRAPHY_PATH,
+                FRENCH_NAMES_PATH,
+            )
+
+            for path in (
+                Path(self.regex_matcher.config_path),
+                FRENCH_NAMES_PATH,
+                FRENCH_GEOGRAPHY_PATH,
+            ):
+                try:
+                    digest.update(hashlib.sha256(path.read_bytes()).digest())
+                except OSError:
+                    digest.update(b"missing")
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
 
     def get_model_info(self) -> dict[str, str]:
         """Get model metadata for audit logging.
@@ -387,6 +694,7 @@ class HybridDetector(EntityDetector):
             "language": "fr",
             "spacy_model": spacy_info.get("name", "unknown"),
             "spacy_version": spacy_info.get("version", "unknown"),
+            "detection_profile": spacy_info.get("profile", "unknown"),
             "regex_patterns_count": str(regex_stats.get("total_patterns", 0)),
         }
 
@@ -9,17 +9,49 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-
+from typing import Any
+
+from gdpr_pseudonymizer.nlp.dictionary_trie import (
+    WHITESPACE,
+    Token,
+    TokenTrie,
+    joined_before,
+)
 from gdpr_pseudonymizer.utils.logger import get_logger
+from gdpr_pseudonymizer.utils.resource_cache import load_resource
 
 logger = get_logger(__name__)
 
 
+def _build_names(source: bytes) -> dict[str, Any]:
+    """Parse french_names.json into name sets and their tries.
+
+    Args:
+        source: Raw dictionary file content
+
+    Returns:
+        Cacheable payload (see utils.resource_cache)
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    data = json.loads(source.decode("utf-8"))
+    first_names = set(data.get("first_names", []))
+    last_names = set(data.get("last_names", []))
+    return {
+        "first_names": first_names,
+        "last_names": last_names,
+        "first_name_trie": TokenTrie(first_names).to_state(),
+        "last_name_trie": TokenTrie(last_names).to_state(),
+    }
+
+
 class NameDictionary:
     """French name dictionary for pattern-based entity detection.
 
     Loads common French first names and last names from JSON file
-    and provides fast lookup methods for name validation.
+    and provides fast lookup methods for name validation, plus token tries
+    for scanning text for "<first name> <last name>" pairs in one pass.
 
     Attributes:
         first_names: Set of common French first names
@@ -35,6 +67,8 @@ class NameDictionary:
         """
         self.first_names: set[str] = set()
         self.last_names: set[str] = set()
+        self._first_name_trie = TokenTrie()
+        self._last_name_trie = TokenTrie()
         if dictionary_path is None:
             from gdpr_pseudonymizer.resources import FRENCH_NAMES_PATH
 
@@ -58,11 +92,12 @@ class NameDictionary:
             raise FileNotFoundError(f"Name dictionary not found: {path}")
 
         try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
+            payload = load_resource(path, "names", _build_names)
 
-            self.first_names = set(data.get("first_names", []))
-            self.last_names = set(data.get("last_names", []))
+            self.first_names = payload["first_names"]
+            self.last_names = payload["last_names"]
+            self._first_name_trie = TokenTrie.from_state(payload["first_name_trie"])
+            self._last_name_trie = TokenTrie.from_state(payload["last_name_trie"])
 
             logger.info(
                 "name_dictionary_loaded",
@@ -115,6 +150,45 @@ class NameDictionary:
         """
         return self.is_first_name(first_name) and self.is_last_name(last_name)
 
+    def find_full_names(
+        self, tokens: list[Token]
+    ) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+        """Find "<first name> <last name>" pairs in tokenized text.
+
+        Both parts are matched exactly (longest first name first) and may span
+        several tokens, e.g. "Marie Le Gall". Matches are non-overlapping and
+        never start inside a hyphenated compound, so "Jean-Pierre Martin" does
+        not yield "Pierre Martin".
+
+        Args:
+            tokens: Text tokenized with dictionary_trie.tokenize()
+
+        Returns:
+            ((first_start, first_end), (last_start, last_end)) character
+            offsets of each match, in text order
+        """
+        matches: list[tuple[tuple[int, int], tuple[int, int]]] = []
+        index = 0
+        while index < len(tokens):
+            end = None
+            if tokens[index].is_word and not joined_before(tokens, index):
+                for first_end in self._first_name_trie.match_ends(tokens, index):
+                    if first_end < len(tokens) and tokens[first_end].key == WHITESPACE:
+                        last_ends = self._last_name_trie.match_ends(
+                            tokens, first_end + 1
+                        )
+                        if last_ends:
+                            end = last_ends[0]
+                            matches.append(
+                                (
+                                    (tokens[index].start, tokens[first_end - 1].end),
+                                    (tokens[first_end + 1].start, tokens[end - 1].end),
+                                )
+                            )
+                            break
+            index = end if end is not None else index + 1
+        return matches
+
     def get_stats(self) -> dict[str, int]:
         """Get dictionary statistics.
 
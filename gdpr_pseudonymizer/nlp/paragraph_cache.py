@@ -0,0 +1,169 @@
+"""Paragraph-level detection cache for templated documents.
+
+Templated letters and contracts share most of their paragraphs. In paragraph
+mode the hybrid detector splits each document on blank lines, looks every
+paragraph up here by content hash, and only runs spaCy and regex matching on
+paragraphs it has not seen before. Cached entities are stored with offsets
+relative to their paragraph and shifted into place on reuse.
+
+Caches are process-wide (one per detector fingerprint), so consecutive
+documents of a batch share them even when each gets its own DocumentProcessor,
+as parallel batch workers do.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import OrderedDict
+
+from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
+from gdpr_pseudonymizer.utils.cache_stats import CacheStats
+
+# One or more blank lines (possibly holding spaces or tabs) end a paragraph
+PARAGRAPH_SEPARATOR = re.compile(r"\n[ \t\r\f\v]*\n\s*")
+
+# Default number of distinct paragraphs kept per cache (LRU)
+DEFAULT_MAX_PARAGRAPHS = 50_000
+
+# Cached entity fields, with start/end relative to the paragraph
+_Row = tuple[str, str, int, int, float | None, str | None, bool, str, str | None]
+
+
+def split_paragraphs(text: str) -> list[tuple[int, str]]:
+    """Split text into paragraphs separated by blank lines.
+
+    Args:
+        text: Document text
+
+    Returns:
+        (start_offset, paragraph_text) for each non-blank paragraph, in order
+    """
+    paragraphs = []
+    start = 0
+    for separator in PARAGRAPH_SEPARATOR.finditer(text):
+        if text[start : separator.start()].strip():
+            paragraphs.append((start, text[start : separator.start()]))
+        start = separator.end()
+    if text[start:].strip():
+        paragraphs.append((start, text[start:]))
+    return paragraphs
+
+
+class ParagraphCache:
+    """LRU map from paragraph text to the entities detected in it.
+
+    Example:
+        >>> cache = ParagraphCache()
+        >>> cache.put("Madame Marie Dubois,", entities)
+        >>> cache.get("Madame Marie Dubois,", offset=120)  # shifted copies
+    """
+
+    def __init__(self, max_paragraphs: int = DEFAULT_MAX_PARAGRAPHS) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_paragraphs: Distinct paragraphs kept before LRU eviction
+        """
+        self._entries: OrderedDict[bytes, tuple[_Row, ...]] = OrderedDict()
+        self._max_paragraphs = max_paragraphs
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _key(paragraph: str) -> bytes:
+        return hashlib.blake2b(paragraph.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, paragraph: str, offset: int) -> list[DetectedEntity] | None:
+        """Look up a paragraph and count the hit or miss.
+
+        Args:
+            paragraph: Paragraph text
+            offset: Start offset of the paragraph in the current document
+
+        Returns:
+            Fresh entities positioned in the document, or None if unseen
+        """
+        key = self._key(paragraph)
+        rows = self._entries.get(key)
+        if rows is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return [
+            DetectedEntity(
+                text=text,
+                entity_type=entity_type,
+                start_pos=start + offset,
+                end_pos=end + offset,
+                confidence=confidence,
+                gender=gender,
+                is_ambiguous=is_ambiguous,
+                source=source,
+                context_label=context_label,
+            )
+            for (
+                text,
+                entity_type,
+                start,
+                end,
+                confidence,
+                gender,
+                is_ambiguous,
+                source,
+                context_label,
+            ) in rows
+        ]
+
+    def put(self, paragraph: str, entities: list[DetectedEntity]) -> None:
+        """Store entities detected in a paragraph processed on its own.
+
+        Args:
+            paragraph: Paragraph text
+            entities: Entities with offsets relative to the paragraph
+        """
+        key = self._key(paragraph)
+        self._entries[key] = tuple(
+            (
+                e.text,
+                e.entity_type,
+                e.start_pos,
+                e.end_pos,
+                e.confidence,
+                e.gender,
+                e.is_ambiguous,
+                e.source,
+                e.context_label,
+            )
+            for e in entities
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_paragraphs:
+            self._entries.popitem(last=False)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of the hit/miss counters."""
+        return CacheStats(self._hits, self._misses)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_shared_caches: dict[str, ParagraphCache] = {}
+
+
+def shared_paragraph_cache(fingerprint: str) -> ParagraphCache:
+    """Process-wide paragraph cache for one detector configuration.
+
+    Args:
+        fingerprint: Detector fingerprint (HybridDetector.detection_fingerprint())
+
+    Returns:
+        The cache shared by all detectors with this fingerprint
+    """
+    cache = _shared_caches.get(fingerprint)
+    if cache is None:
+        cache = _shared_caches[fingerprint] = ParagraphCache()
+    return cache
@@ -0,0 +1,122 @@
+"""Intra-document parallel detection for single very large documents.
+
+A document long enough to be detected window by window (see
+nlp.text_windows) can have its windows detected in a process pool instead
+of sequentially. Each worker builds and loads its own detector once, in the
+pool initializer, and then detects whole windows; the parent shifts the
+entities into document offsets and keeps each one in the window that owns
+its start. The windows are the ones sequential detection would use, so
+results are identical to ``HybridDetector.detect_entities()``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import partial
+from multiprocessing import Pool
+
+from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
+from gdpr_pseudonymizer.nlp.hybrid_detector import DEFAULT_SPACY_MODEL, HybridDetector
+from gdpr_pseudonymizer.nlp.text_windows import split_windows
+from gdpr_pseudonymizer.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Detector of the current pool worker, built by _init_worker()
+_worker_detector: HybridDetector | None = None
+
+
+def warm_detector(
+    detection_profile: str, model_name: str = DEFAULT_SPACY_MODEL
+) -> HybridDetector:
+    """Build a hybrid detector with its model already loaded.
+
+    Args:
+        detection_profile: spaCy detection profile (accurate/balanced/fast)
+        model_name: spaCy model to load
+
+    Returns:
+        Ready-to-use HybridDetector
+    """
+    detector = HybridDetector(detection_profile=detection_profile)
+    detector.load_model(model_name)
+    return detector
+
+
+def _init_worker(detector_factory: Callable[[], HybridDetector]) -> None:
+    """Pool initializer: build this worker's detector once."""
+    global _worker_detector
+    _worker_detector = detector_factory()
+
+
+def _detect_window(window_text: str) -> list[DetectedEntity]:
+    """Pool task: detect entities in one window (offsets relative to it)."""
+    assert _worker_detector is not None, "Worker detector not initialized"
+    return _worker_detector.detect_entities(window_text)
+
+
+def detect_entities_parallel(
+    detector: HybridDetector,
+    text: str,
+    workers: int,
+    detector_factory: Callable[[], HybridDetector] | None = None,
+) -> list[DetectedEntity]:
+    """Detect entities in a document, spreading its windows over processes.
+
+    Falls back to ``detector.detect_entities(text)`` when a single process
+    is requested, the text fits in one window, or the detector runs in
+    paragraph mode.
+
+    Args:
+        detector: Detector whose settings define the windows (and which runs
+            the sequential fallback)
+        text: Document text
+        workers: Maximum number of worker processes
+        detector_factory: Picklable callable building a loaded detector with
+            the same settings in each worker (default: warm_detector() for
+            the detector's profile and model)
+
+    Returns:
+        Entities in document order, as detector.detect_entities() would
+
+    Raises:
+        ValueError: If text is empty
+    """
+    if workers <= 1 or detector.paragraph_cache:
+        return detector.detect_entities(text)
+
+    spacy_detector = detector.spacy_detector
+    if spacy_detector.window_chars is None or not spacy_detector.uses_windows(text):
+        return detector.detect_entities(text)
+
+    if detector_factory is None:
+        # Workers must load the parent's model, which the fingerprint names
+        detector_factory = partial(
+            warm_detector, spacy_detector.profile, detector._model_name
+        )
+
+    windows = split_windows(
+        text, spacy_detector.window_chars, spacy_detector.window_overlap
+    )
+    processes = min(workers, len(windows))
+    logger.info(
+        "parallel_detection_started",
+        windows=len(windows),
+        workers=processes,
+        text_length=len(text),
+    )
+
+    entities: list[DetectedEntity] = []
+    with Pool(
+        processes=processes, initializer=_init_worker, initargs=(detector_factory,)
+    ) as pool:
+        results = pool.imap(_detect_window, (text[w.start : w.end] for w in windows))
+        for window, window_entities in zip(windows, results):
+            for entity in window_entities:
+                entity.start_pos += window.start
+                entity.end_pos += window.start
+                if window.keeps(entity):
+                    entities.append(entity)
+
+    logger.info("parallel_detection_complete", entities=len(entities))
+    return entities
@@ -0,0 +1,195 @@
+"""
+Literal-Anchor Prefilter for Detection Patterns
+
+Most detection patterns are anchored on a group of literal words: titles and
+location words open the match (``\\b(M\\.|Mme|...)``), legal forms close it
+(``\\s+(SA|SARL|...)\\b``). Before running such a pattern, a cheap scan for
+its anchor group tells where matches can possibly be:
+
+- prefix-anchored patterns run from the first anchor occurrence onward;
+- suffix-anchored patterns run only up to the end of the last occurrence;
+- either kind is skipped entirely when its anchor does not occur.
+
+Anchor scans are plain literal alternations, which ``re`` searches far faster
+than the full patterns, and the results are exactly those of
+``regex.finditer(text)``. Patterns without a usable anchor are scanned as is.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+# Constructs whose meaning changes when an anchor group is compiled on its own
+_UNSAFE_ANCHOR_SYNTAX = re.compile(r"\\[1-9]|\(\?P=")
+
+# Anchor groups must be literal alternations to be any cheaper than the
+# pattern itself: no character classes, repeats, or nested groups
+_ESCAPE = re.compile(r"\\.")
+_NON_LITERAL = re.compile(r"[\[(*+{]")
+
+# Assertions that could peek past ``endpos`` in suffix-bounded scans
+_LOOKAROUND_OR_END = re.compile(r"\(\?<?[=!]|\$|\\Z")
+
+
+@dataclass(frozen=True)
+class _ScanPlan:
+    """How to scan one pattern.
+
+    Attributes:
+        regex: Compiled detection pattern
+        anchor: Compiled anchor scan (None to scan the whole text)
+        kind: "prefix", "suffix" or "none"
+    """
+
+    regex: re.Pattern[str]
+    anchor: re.Pattern[str] | None = None
+    kind: str = "none"
+
+
+def _group_bounds(pattern: str) -> dict[int, int] | None:
+    """Map each opening parenthesis to its closing one.
+
+    Escapes and character classes are skipped. Top-level alternations
+    (``a|b`` outside any group) make anchors optional and return None.
+
+    Args:
+        pattern: Regex source
+
+    Returns:
+        {open_index: close_index}, or None if unbalanced or top-level "|"
+    """
+    bounds: dict[int, int] = {}
+    stack: list[int] = []
+    index = 0
+    in_class = False
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\":
+            index += 2
+            continue
+        if in_class:
+            if char == "]":
+                in_class = False
+        elif char == "[":
+            in_class = True
+            # A leading "]" (or "^]") is a literal member of the class
+            if pattern[index + 1 : index + 2] == "^":
+                index += 1
+            if pattern[index + 1 : index + 2] == "]":
+                index += 1
+        elif char == "(":
+            stack.append(index)
+        elif char == ")":
+            if not stack:
+                return None
+            bounds[stack.pop()] = index
+        elif char == "|" and not stack:
+            return None
+        index += 1
+    return bounds if not stack and not in_class else None
+
+
+def _group_body(pattern: str, start: int, end: int) -> str | None:
+    """Return the inside of a literal capturing or non-capturing group.
+
+    Args:
+        pattern: Regex source
+        start: Index of the opening parenthesis
+        end: Index of the closing parenthesis
+
+    Returns:
+        Group body, or None for lookarounds, named groups, inline flags and
+        non-literal bodies
+    """
+    body = pattern[start + 1 : end]
+    if body.startswith("?:"):
+        body = body[2:]
+    elif body.startswith("?"):
+        return None
+    return None if _NON_LITERAL.search(_ESCAPE.sub("", body)) else body
+
+
+def _plan(regex: re.Pattern[str]) -> _ScanPlan:
+    """Derive the anchor scan for a pattern, if it has one.
+
+    Args:
+        regex: Compiled detection pattern
+
+    Returns:
+        Scan plan for the pattern
+    """
+    pattern = regex.pattern
+    bounds = _group_bounds(pattern)
+    if bounds is None or _UNSAFE_ANCHOR_SYNTAX.search(pattern):
+        return _ScanPlan(regex)
+
+    # Prefix: \b(<literals>) opening the pattern, not made optional
+    if pattern.startswith(r"\b(") and 2 in bounds:
+        end = bounds[2]
+        body = _group_body(pattern, 2, end)
+        if body is not None and pattern[end + 1 : end + 2] not in ("?", "*", "{"):
+            return _ScanPlan(regex, re.compile(rf"\b(?:{body})", regex.flags), "prefix")
+
+    # Suffix: \s+(<literals>)\b closing the pattern
+    if pattern.endswith(r")\b") and not _LOOKAROUND_OR_END.search(pattern):
+        close = len(pattern) - 3
+        start = next((o for o, c in bounds.items() if c == close), None)
+        if start is not None and pattern[:start].endswith(r"\s+"):
+            body = _group_body(pattern, start, close)
+            if body is not None:
+                return _ScanPlan(
+                    regex, re.compile(rf"\s(?:{body})\b", regex.flags), "suffix"
+                )
+
+    return _ScanPlan(regex)
+
+
+class PatternScanner:
+    """Runs detection patterns behind their literal-anchor prefilters.
+
+    Attributes:
+        anchored_count: Number of patterns with a prefix or suffix anchor
+    """
+
+    def __init__(self, regexes: list[re.Pattern[str]]) -> None:
+        """Derive the anchor scan of every pattern.
+
+        Args:
+            regexes: Compiled patterns, in the order results are returned
+        """
+        self._plans = [_plan(regex) for regex in regexes]
+        self.anchored_count = sum(plan.anchor is not None for plan in self._plans)
+
+    def scan(self, text: str) -> list[list[tuple[int, int]]]:
+        """Find the matches of every pattern.
+
+        Args:
+            text: Document text
+
+        Returns:
+            One list per pattern (in constructor order) of (start, end)
+            spans, identical to ``[m.span() for m in regex.finditer(text)]``
+        """
+        results: list[list[tuple[int, int]]] = []
+        for plan in self._plans:
+            if plan.anchor is None:
+                matches = plan.regex.finditer(text)
+            elif plan.kind == "prefix":
+                # Matches start where the anchor group matches
+                first = plan.anchor.search(text)
+                if first is None:
+                    results.append([])
+                    continue
+                matches = plan.regex.finditer(text, first.start())
+            else:
+                # Matches end where the anchor group ends
+                last_end = None
+                for anchor in plan.anchor.finditer(text):
+                    last_end = anchor.end()
+                if last_end is None:
+                    results.append([])
+                    continue
+                matches = plan.regex.finditer(text, 0, last_end)
+            results.append([match.span() for match in matches])
+        return results
@@ -13,14 +13,23 @@ from typing import Any
 
 import yaml
 
+from gdpr_pseudonymizer.nlp.dictionary_trie import Token, tokenize
 from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
 from gdpr_pseudonymizer.nlp.geography_dictionary import GeographyDictionary
 from gdpr_pseudonymizer.nlp.name_dictionary import NameDictionary
+from gdpr_pseudonymizer.nlp.pattern_scanner import PatternScanner
+from gdpr_pseudonymizer.nlp.token_index import TokenOffsetIndex
 from gdpr_pseudonymizer.utils.logger import get_logger
+from gdpr_pseudonymizer.utils.resource_cache import load_resource
 
 logger = get_logger(__name__)
 
 
+def _parse_yaml(source: bytes) -> Any:
+    """Parse the pattern configuration (cached by load_resource)."""
+    return yaml.safe_load(source.decode("utf-8"))
+
+
 class RegexMatcher:
     """Pattern-based entity matcher using regex and French name dictionary.
 
@@ -53,6 +62,8 @@ class RegexMatcher:
         self.name_dictionary: NameDictionary | None = None
         self.geography_dictionary: GeographyDictionary | None = None
         self._config: dict[str, Any] = {}
+        self._scanner = PatternScanner([])
+        self._scanned_patterns: list[dict[str, Any]] = []
 
     def load_patterns(self, config_path: str | None = None) -> None:
         """Load regex patterns from YAML configuration.
@@ -72,8 +83,7 @@ class RegexMatcher:
             raise FileNotFoundError(f"Pattern configuration not found: {path}")
 
         try:
-            with open(path, encoding="utf-8") as f:
-                self._config = yaml.safe_load(f)
+            self._config = load_resource(path, "detection_patterns", _parse_yaml)
 
             # Compile regex patterns
             self._compile_patterns()
@@ -91,6 +101,7 @@ class RegexMatcher:
             logger.info(
                 "patterns_loaded",
                 categories_count=len(self.patterns),
+                anchored_patterns=self._scanner.anchored_count,
                 has_name_dictionary=self.name_dictionary is not None,
                 has_geography_dictionary=self.geography_dictionary is not None,
             )
@@ -100,7 +111,11 @@ class RegexMatcher:
             raise ValueError(f"Malformed pattern configuration YAML: {e}") from e
 
     def _compile_patterns(self) -> None:
-        """Compile regex patterns from configuration."""
+        """Compile regex patterns from configuration.
+
+        The compiled patterns are also handed to a PatternScanner, which runs
+        them behind their literal-anchor prefilters in match_entities().
+        """
         pattern_config = self._config.get("patterns", {})
 
         for category, config in pattern_config.items():
@@ -134,6 +149,15 @@ class RegexMatcher:
             if category_patterns:
                 self.patterns[category] = category_patterns
 
+        self._scanned_patterns = [
+            pattern_def
+            for pattern_list in self.patterns.values()
+            for pattern_def in pattern_list
+        ]
+        self._scanner = PatternScanner(
+            [pattern_def["regex"] for pattern_def in self._scanned_patterns]
+        )
+
     def _needs_name_dictionary(self) -> bool:
         """Check if name dictionary is required by configuration."""
         pattern_config = self._config.get("patterns", {})
@@ -164,33 +188,34 @@ class RegexMatcher:
         """
         entities: list[DetectedEntity] = []
 
-        # Apply regex patterns by category
-        for category, pattern_list in self.patterns.items():
-            for pattern_def in pattern_list:
-                matches = pattern_def["regex"].finditer(text)
-                for match in matches:
-                    # Extract entity text (full match or last capturing group)
-                    entity_text = match.group(0)
-                    start_pos = match.start()
-                    end_pos = match.end()
-
-                    entity = DetectedEntity(
-                        text=entity_text,
-                        entity_type=pattern_def["entity_type"],
-                        start_pos=start_pos,
-                        end_pos=end_pos,
-                        confidence=pattern_def["confidence"],
-                        source="regex",
-                    )
-                    entities.append(entity)
+        # Apply regex patterns by category (anchor-prefiltered)
+        pattern_spans = self._scanner.scan(text)
+        for pattern_def, spans in zip(self._scanned_patterns, pattern_spans):
+            for start_pos, end_pos in spans:
+                entity = DetectedEntity(
+                    text=text[start_pos:end_pos],
+                    entity_type=pattern_def["entity_type"],
+                    start_pos=start_pos,
+                    end_pos=end_pos,
+                    confidence=pattern_def["confidence"],
+                    source="regex",
+                )
+                entities.append(entity)
+
+        # Dictionary matchers share one tokenization of the text
+        use_names = bool(self.name_dictionary) and self._is_full_names_enabled()
+        use_geography = bool(self.geography_dictionary) and self._is_geography_enabled()
+        tokens = tokenize(text) if use_names or use_geography else []
 
         # Apply name dictionary matching if enabled
-        if self.name_dictionary and self._is_full_names_enabled():
-            entities.extend(self._match_full_names(text))
+        if use_names:
+            entities.extend(self._match_full_names(text, tokens=tokens))
 
         # Apply geography dictionary matching if enabled
-        if self.geography_dictionary and self._is_geography_enabled():
-            entities.extend(self._match_geography(text, spacy_doc=spacy_doc))
+        if use_geography:
+            entities.extend(
+                self._match_geography(text, spacy_doc=spacy_doc, tokens=tokens)
+            )
 
         # Remove duplicates (same span)
         entities = self._deduplicate_entities(entities)
@@ -204,14 +229,18 @@ class RegexMatcher:
         full_names_config: dict[str, Any] = pattern_config.get("full_names", {})
         return bool(full_names_config.get("enabled", False))
 
-    def _match_full_names(self, text: str) -> list[DetectedEntity]:
+    def _match_full_names(
+        self, text: str, tokens: list[Token] | None = None
+    ) -> list[DetectedEntity]:
         """Match full names using name dictionary.
 
-        Looks for patterns like "[Firstname] [Lastname]" where both
-        components are in the French name dictionary.
+        Looks for "[Firstname] [Lastname]" sequences where both components
+        are in the French name dictionary, using the dictionary token tries
+        (one pass over the text, independent of dictionary size).
 
         Args:
             text: Document text to process
+            tokens: Pre-computed tokenize(text) result, if available
 
         Returns:
             List of DetectedEntity objects for full names
@@ -221,38 +250,28 @@ class RegexMatcher:
         if not self.name_dictionary:
             return entities
 
-        # Pattern: Capitalized word followed by capitalized word
-        # This is a candidate full name that we'll validate with dictionary
-        name_pattern = re.compile(
-            r"\b([A-ZÀÂÄÉÈÊËÏÎÔÙÛÜ][a-zàâäéèêëïîôöùûü]+(?:-[A-ZÀÂÄÉÈÊËÏÎÔÙÛÜ][a-zàâäéèêëïîôöùûü]+)?)"
-            r"\s+"
-            r"([A-ZÀÂÄÉÈÊËÏÎÔÙÛÜ][a-zàâäéèêëïîôöùûü]+)",
-            re.UNICODE,
-        )
+        if tokens is None:
+            tokens = tokenize(text)
 
-        matches = name_pattern.finditer(text)
         confidence = (
             self._config.get("patterns", {})
             .get("full_names", {})
             .get("confidence", 0.65)
         )
 
-        for match in matches:
-            first_name = match.group(1)
-            last_name = match.group(2)
-
-            # Validate with name dictionary
-            if self.name_dictionary.is_full_name(first_name, last_name):
-                entity_text = f"{first_name} {last_name}"
-                entity = DetectedEntity(
-                    text=entity_text,
-                    entity_type="PERSON",
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=confidence,
-                    source="regex",
-                )
-                entities.append(entity)
+        for (first_start, first_end), (
+            last_start,
+            last_end,
+        ) in self.name_dictionary.find_full_names(tokens):
+            entity = DetectedEntity(
+                text=f"{text[first_start:first_end]} {text[last_start:last_end]}",
+                entity_type="PERSON",
+                start_pos=first_start,
+                end_pos=last_end,
+                confidence=confidence,
+                source="regex",
+            )
+            entities.append(entity)
 
         return entities
 
@@ -263,18 +282,25 @@ class RegexMatcher:
         return bool(geo_config.get("enabled", False))
 
     def _match_geography(
-        self, text: str, spacy_doc: Any | None = None
+        self,
+        text: str,
+        spacy_doc: Any | None = None,
+        tokens: list[Token] | None = None,
     ) -> list[DetectedEntity]:
         """Match locations using geography dictionary with POS-tag disambiguation.
 
-        Scans text for tokens that match known French cities, regions,
-        or departments using O(1) set lookups. When a spaCy Doc is available,
-        filters out matches where the token is not a proper noun (PROPN) and
-        already has another entity assignment from spaCy.
+        Scans text once for known French cities, regions, or departments
+        using the geography dictionary token trie (longest match wins, so
+        "Le Mans" and "Paris et Lyon" are found). When a spaCy Doc with POS tags
+        is available, filters out matches where the token is not a proper noun
+        (PROPN) and already has another entity assignment from spaCy. Docs
+        without POS tags (``fast`` detection profile) skip the filter, so
+        matches are kept as if no Doc had been passed.
 
         Args:
             text: Document text to process
             spacy_doc: Optional spaCy Doc for POS-tag disambiguation
+            tokens: Pre-computed tokenize(text) result, if available
 
         Returns:
             List of DetectedEntity objects for locations
@@ -290,39 +316,74 @@ class RegexMatcher:
             .get("confidence", 0.60)
         )
 
-        # Match multi-word and single-word location names
-        # Pattern: capitalized word(s) potentially with hyphens, apostrophes,
-        # and prepositions (e.g., "Aix-en-Provence", "Val-d'Oise")
-        token_pattern = re.compile(
-            r"\b([A-ZÀÂÄÉÈÊËÏÎÔÙÛÜ][a-zàâäéèêëïîôöùûü]*"
-            r"(?:[-'][A-Za-zàâäéèêëïîôöùûü]+)*"
-            r"(?:\s+(?:de|du|des|d'|en|et|la|le|les|sur)\s+"
-            r"[A-ZÀÂÄÉÈÊËÏÎÔÙÛÜa-zàâäéèêëïîôöùûü]"
-            r"[a-zàâäéèêëïîôöùûü]*(?:[-'][A-Za-zàâäéèêëïîôöùûü]+)*)*)",
-            re.UNICODE,
-        )
+        if tokens is None:
+            tokens = tokenize(text)
+
+        if spacy_doc is not None and not self._has_pos_tags(spacy_doc):
+            logger.debug("pos_disambiguation_skipped", reason="no_pos_tags")
+            spacy_doc = None
+
+        locations = self.geography_dictionary.find_locations(tokens)
+        # POS-tag disambiguation when spaCy Doc is available
+        if spacy_doc is not None and locations:
+            passes = self._pos_disambiguation_mask(spacy_doc, locations)
+            locations = [span for span, ok in zip(locations, passes) if ok]
+
+        for start, end in locations:
+            entity = DetectedEntity(
+                text=text[start:end],
+                entity_type="LOCATION",
+                start_pos=start,
+                end_pos=end,
+                confidence=confidence,
+                source="regex",
+            )
+            entities.append(entity)
 
-        for match in token_pattern.finditer(text):
-            candidate = match.group(0)
-            if self.geography_dictionary.is_location(candidate):
-                # POS-tag disambiguation when spaCy Doc is available
-                if spacy_doc is not None:
-                    if not self._passes_pos_disambiguation(
-                        spacy_doc, match.start(), match.end()
-                    ):
-                        continue
+        return entities
 
-                entity = DetectedEntity(
-                    text=candidate,
-                    entity_type="LOCATION",
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=confidence,
-                    source="regex",
-                )
-                entities.append(entity)
+    @staticmethod
+    def _has_pos_tags(spacy_doc: Any) -> bool:
+        """Check whether a spaCy Doc carries coarse POS tags.
 
-        return entities
+        Pipelines loaded without the morphologizer/tagger leave ``pos_`` empty,
+        which would make every candidate fail the PROPN check.
+
+        Args:
+            spacy_doc: spaCy Doc object
+
+        Returns:
+            True if POS annotation is present (or cannot be determined)
+        """
+        has_annotation = getattr(spacy_doc, "has_annotation", None)
+        if not callable(has_annotation):
+            return True
+        return bool(has_annotation("POS"))
+
+    def _pos_disambiguation_mask(
+        self, spacy_doc: Any, candidates: list[tuple[int, int]]
+    ) -> list[bool]:
+        """Check all geography candidates of a document at once.
+
+        Real spaCy Docs are checked through a TokenOffsetIndex built once
+        from their token arrays; other Doc-like objects fall back to
+        per-candidate _passes_pos_disambiguation().
+
+        Args:
+            spacy_doc: spaCy Doc object
+            candidates: (start, end) character offsets of the candidates
+
+        Returns:
+            One acceptance flag per candidate
+        """
+        from spacy.tokens import Doc
+
+        if not isinstance(spacy_doc, Doc):
+            return [
+                self._passes_pos_disambiguation(spacy_doc, start, end)
+                for start, end in candidates
+            ]
+        return TokenOffsetIndex(spacy_doc).passes_pos_disambiguation(candidates)
 
     def _passes_pos_disambiguation(self, spacy_doc: Any, start: int, end: int) -> bool:
         """Check if a geography candidate passes POS-tag disambiguation.
@@ -7,9 +7,23 @@ with the fr_core_news_lg French language model.
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from itertools import groupby
 from typing import TYPE_CHECKING, Any
 
-from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity, EntityDetector
+from gdpr_pseudonymizer.nlp.entity_detector import (
+    DEFAULT_BATCH_SIZE,
+    DetectedEntity,
+    EntityDetector,
+    require_non_empty,
+    validate_batch_args,
+)
+from gdpr_pseudonymizer.nlp.text_windows import (
+    DEFAULT_WINDOW_CHARS,
+    DEFAULT_WINDOW_OVERLAP,
+    TextWindow,
+    split_windows,
+)
 from gdpr_pseudonymizer.utils.logger import get_logger
 
 if TYPE_CHECKING:
@@ -17,19 +31,84 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Pipeline components excluded at load time for each detection profile.
+# Only "ner" is needed for detection; the morphologizer provides the POS tags
+# used by RegexMatcher geography disambiguation. The parser also sets the
+# sentence boundaries that NER entities may not cross, so "balanced" enables
+# the model's lighter "senter" in its place. Its boundaries can differ from
+# the parser's, so entities are close to, but not guaranteed identical to,
+# those of "accurate".
+DETECTION_PROFILES: dict[str, tuple[str, ...]] = {
+    "accurate": (),
+    "balanced": ("parser", "lemmatizer"),
+    "fast": ("parser", "lemmatizer", "attribute_ruler", "morphologizer"),
+}
+# Components disabled by default in the model that a profile switches on
+PROFILE_ENABLED_COMPONENTS: dict[str, tuple[str, ...]] = {
+    "accurate": (),
+    "balanced": ("senter",),
+    "fast": (),
+}
+DEFAULT_DETECTION_PROFILE = "accurate"
+
 
 class SpaCyDetector(EntityDetector):
     """spaCy-based implementation of EntityDetector interface.
 
     Uses spaCy's fr_core_news_lg model for French named entity recognition.
     Model is loaded lazily on first detect_entities() call.
+
+    The detection profile selects which pipeline components are loaded:
+
+    - ``accurate``: full pipeline (default)
+    - ``balanced``: sentence segmenter instead of parser, no lemmatizer;
+      faster, entities may differ slightly at sentence boundaries
+    - ``fast``: NER only; geography matches skip POS disambiguation
+
+    Texts longer than ``window_chars`` are detected in overlapping windows
+    (see nlp.text_windows), so peak memory depends on the window size rather
+    than on the document size.
     """
 
-    def __init__(self) -> None:
-        """Initialize spaCy detector without loading model."""
+    def __init__(
+        self,
+        profile: str = DEFAULT_DETECTION_PROFILE,
+        window_chars: int | None = DEFAULT_WINDOW_CHARS,
+        window_overlap: int = DEFAULT_WINDOW_OVERLAP,
+    ) -> None:
+        """Initialize spaCy detector without loading model.
+
+        Args:
+            profile: Detection profile (accurate, balanced or fast)
+            window_chars: Texts longer than this are detected window by
+                window (None always processes whole texts)
+            window_overlap: Characters shared by consecutive windows
+
+        Raises:
+            ValueError: If profile is not recognized or the window is not
+                larger than twice the overlap
+        """
+        if profile not in DETECTION_PROFILES:
+            raise ValueError(
+                f"Unknown detection profile '{profile}'. "
+                f"Valid profiles: {', '.join(DETECTION_PROFILES)}"
+            )
+        if window_chars is not None and window_chars <= 2 * window_overlap:
+            raise ValueError(
+                f"window_chars ({window_chars}) must exceed twice "
+                f"the overlap ({window_overlap})"
+            )
         self._nlp: Language | None = None
         self._model_name: str | None = None
         self._last_doc: Any | None = None
+        self._profile = profile
+        self.window_chars = window_chars
+        self.window_overlap = window_overlap
+
+    @property
+    def profile(self) -> str:
+        """Detection profile used when loading the model."""
+        return self._profile
 
     def load_model(self, model_name: str = "fr_core_news_lg") -> None:
         """Load spaCy NLP model into memory.
@@ -70,12 +149,19 @@ class SpaCyDetector(EntityDetector):
                         if subdir.is_dir() and subdir.name.startswith(model_name):
                             data_path = subdir
                             break
-                self._nlp = spacy.load(str(data_path))
+                self._nlp = spacy.load(str(data_path), exclude=self._excluded())
             else:
-                self._nlp = spacy.load(model_name)
+                self._nlp = spacy.load(model_name, exclude=self._excluded())
 
             self._model_name = model_name
-            logger.info("spacy_model_loaded", model=model_name)
+            self._enable_profile_components(self._nlp)
+            self._disable_idle_tok2vec(self._nlp)
+            logger.info(
+                "spacy_model_loaded",
+                model=model_name,
+                profile=self._profile,
+                excluded=self._excluded(),
+            )
         except OSError:
             logger.warning("spacy_model_not_found", model=model_name)
             self._nlp = self._auto_download_model(model_name)
@@ -132,11 +218,55 @@ class SpaCyDetector(EntityDetector):
             ) from e
 
         logger.info("spacy_model_downloaded", model=model_name)
-        nlp = spacy.load(model_name)
+        nlp = spacy.load(model_name, exclude=self._excluded())
         self._model_name = model_name
-        logger.info("spacy_model_loaded", model=model_name)
+        self._enable_profile_components(nlp)
+        self._disable_idle_tok2vec(nlp)
+        logger.info(
+            "spacy_model_loaded",
+            model=model_name,
+            profile=self._profile,
+            excluded=self._excluded(),
+        )
         return nlp
 
+    def _excluded(self) -> list[str]:
+        """Components to exclude from loading for the current profile."""
+        return list(DETECTION_PROFILES[self._profile])
+
+    def _enable_profile_components(self, nlp: Language) -> None:
+        """Enable the disabled-by-default components the profile needs.
+
+        Components missing from the model are skipped (logged), leaving
+        NER without sentence boundaries as in the ``fast`` profile.
+
+        Args:
+            nlp: Loaded spaCy pipeline
+        """
+        for name in PROFILE_ENABLED_COMPONENTS[self._profile]:
+            if name in nlp.disabled:
+                nlp.enable_pipe(name)
+            elif name not in nlp.pipe_names:
+                logger.warning(
+                    "spacy_component_unavailable", component=name, profile=self._profile
+                )
+
+    def _disable_idle_tok2vec(self, nlp: Language) -> None:
+        """Disable the shared tok2vec once no loaded component listens to it.
+
+        In fr_core_news_* pipelines the morphologizer and parser listen to a
+        shared ``tok2vec`` while ``ner`` embeds its own. When every listener
+        has been excluded, running ``tok2vec`` is pure overhead.
+
+        Args:
+            nlp: Loaded spaCy pipeline
+        """
+        if not self._excluded() or "tok2vec" not in nlp.pipe_names:
+            return
+        tok2vec = nlp.get_pipe("tok2vec")
+        if not getattr(tok2vec, "listeners", None):
+            nlp.disable_pipe("tok2vec")
+
     def detect_entities(self, text: str) -> list[DetectedEntity]:
         """Detect named entities in text using spaCy.
 
@@ -153,6 +283,16 @@ class SpaCyDetector(EntityDetector):
         if not text:
             raise ValueError("Text cannot be empty or None")
 
+        if self.uses_windows(text):
+            entities = []
+            for window, window_entities in self.detect_windows(text):
+                for entity in window_entities:
+                    entity.start_pos += window.start
+                    entity.end_pos += window.start
+                    if window.keeps(entity):
+                        entities.append(entity)
+            return entities
+
         # Lazy load model if not already loaded
         if self._nlp is None:
             self.load_model()
@@ -164,25 +304,7 @@ class SpaCyDetector(EntityDetector):
             # Process text with spaCy
             doc = self._nlp(text)
             self._last_doc = doc
-
-            # Extract entities
-            entities = []
-            for ent in doc.ents:
-                # Map spaCy entity labels to our standard types
-                entity_type = self._map_entity_type(ent.label_)
-
-                # Only include PERSON, LOCATION, ORG entities
-                if entity_type:
-                    entities.append(
-                        DetectedEntity(
-                            text=ent.text,
-                            entity_type=entity_type,
-                            start_pos=ent.start_char,
-                            end_pos=ent.end_char,
-                            confidence=None,  # spaCy doesn't provide per-entity confidence
-                            gender=None,  # spaCy doesn't provide gender classification
-                        )
-                    )
+            entities = self._extract_entities(doc)
 
             logger.info("entities_detected", count=len(entities), text_length=len(text))
             return entities
@@ -191,6 +313,182 @@ class SpaCyDetector(EntityDetector):
             logger.error("entity_detection_failed", error=str(e))
             raise RuntimeError(f"Entity detection failed: {str(e)}") from e
 
+    def uses_windows(self, text: str) -> bool:
+        """Whether text is long enough to be detected window by window."""
+        return self.window_chars is not None and len(text) > self.window_chars
+
+    def detect_windows(
+        self, text: str
+    ) -> Iterator[tuple[TextWindow, list[DetectedEntity]]]:
+        """Detect entities in overlapping windows of a long text.
+
+        Windows are streamed through ``nlp.pipe`` one at a time. While a
+        window's result is being consumed, ``last_doc`` is that window's Doc,
+        so POS disambiguation can run per window; it is reset to None at the
+        end so no window Doc outlives detection.
+
+        Args:
+            text: Document text
+
+        Returns:
+            Iterator over (window, entities with offsets relative to
+            window.start); entities outside window.keeps() are included
+
+        Raises:
+            ValueError: If text is empty or windowing is disabled
+            RuntimeError: If model loading or entity detection fails
+        """
+        if not text:
+            raise ValueError("Text cannot be empty or None")
+        if self.window_chars is None:
+            raise ValueError("Windowed detection is disabled (window_chars=None)")
+
+        if self._nlp is None:
+            self.load_model()
+        assert self._nlp is not None, "Model failed to load"
+
+        windows = split_windows(text, self.window_chars, self.window_overlap)
+        return self._iter_windows(self._nlp, text, windows)
+
+    def _iter_windows(
+        self, nlp: Language, text: str, windows: list[TextWindow]
+    ) -> Iterator[tuple[TextWindow, list[DetectedEntity]]]:
+        """Generator behind detect_windows()."""
+        docs = nlp.pipe((text[w.start : w.end] for w in windows), batch_size=1)
+        try:
+            for window in windows:
+                try:
+                    doc = next(docs)
+                except Exception as e:
+                    logger.error("entity_detection_failed", error=str(e))
+                    raise RuntimeError(f"Entity detection failed: {str(e)}") from e
+                self._last_doc = doc
+                yield window, self._extract_entities(doc)
+        finally:
+            self._last_doc = None
+
+        logger.info(
+            "entities_detected_windowed",
+            windows=len(windows),
+            text_length=len(text),
+        )
+
+    def detect_entities_batch(
+        self,
+        texts: Iterable[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        n_process: int = 1,
+    ) -> Iterator[list[DetectedEntity]]:
+        """Detect named entities in many documents using ``nlp.pipe``.
+
+        Documents are streamed through spaCy's batched pipeline (optionally
+        across ``n_process`` worker processes) and results are yielded in
+        input order. ``last_doc`` is updated before each result is yielded,
+        so callers can inspect the Doc of the document just returned. Texts
+        longer than ``window_chars`` are detected window by window (see
+        detect_entities()) and leave ``last_doc`` as None.
+
+        Args:
+            texts: Document texts to process
+            batch_size: Number of documents per ``nlp.pipe`` batch
+            n_process: Number of spaCy worker processes
+
+        Returns:
+            Iterator over one list of DetectedEntity objects per text
+
+        Raises:
+            ValueError: If a text is empty or batch_size/n_process < 1
+            RuntimeError: If model loading or entity detection fails
+        """
+        validate_batch_args(batch_size, n_process)
+
+        # Lazy load model if not already loaded
+        if self._nlp is None:
+            self.load_model()
+
+        # Type guard: load_model() guarantees _nlp is not None
+        assert self._nlp is not None, "Model failed to load"
+
+        return self._iter_batch(self._nlp, texts, batch_size, n_process)
+
+    def _iter_batch(
+        self,
+        nlp: Language,
+        texts: Iterable[str],
+        batch_size: int,
+        n_process: int,
+    ) -> Iterator[list[DetectedEntity]]:
+        """Stream entity lists for texts through ``nlp.pipe``."""
+        processed = 0
+        # Runs of regular texts share one pipe; long texts are windowed
+        for windowed, run in groupby(require_non_empty(texts), key=self.uses_windows):
+            if windowed:
+                for text in run:
+                    processed += 1
+                    yield self.detect_entities(text)
+                continue
+            for entities in self._pipe_texts(nlp, run, batch_size, n_process):
+                processed += 1
+                yield entities
+
+        logger.info(
+            "entities_detected_batch",
+            documents=processed,
+            batch_size=batch_size,
+            n_process=n_process,
+        )
+
+    def _pipe_texts(
+        self,
+        nlp: Language,
+        texts: Iterable[str],
+        batch_size: int,
+        n_process: int,
+    ) -> Iterator[list[DetectedEntity]]:
+        """Stream entity lists for a run of texts through one ``nlp.pipe``."""
+        docs = nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        while True:
+            try:
+                doc = next(docs)
+            except StopIteration:
+                break
+            except ValueError:
+                raise
+            except Exception as e:
+                logger.error("entity_detection_failed", error=str(e))
+                raise RuntimeError(f"Entity detection failed: {str(e)}") from e
+
+            self._last_doc = doc
+            yield self._extract_entities(doc)
+
+    def _extract_entities(self, doc: Any) -> list[DetectedEntity]:
+        """Convert spaCy Doc entities to DetectedEntity objects.
+
+        Args:
+            doc: Processed spaCy Doc
+
+        Returns:
+            PERSON, LOCATION and ORG entities in document order
+        """
+        entities = []
+        for ent in doc.ents:
+            # Map spaCy entity labels to our standard types
+            entity_type = self._map_entity_type(ent.label_)
+
+            # Only include PERSON, LOCATION, ORG entities
+            if entity_type:
+                entities.append(
+                    DetectedEntity(
+                        text=ent.text,
+                        entity_type=entity_type,
+                        start_pos=ent.start_char,
+                        end_pos=ent.end_char,
+                        confidence=None,  # spaCy doesn't provide per-entity confidence
+                        gender=None,  # spaCy doesn't provide gender classification
+                    )
+                )
+        return entities
+
     def _map_entity_type(self, spacy_label: str) -> str | None:
         """Map spaCy entity labels to standard entity types.
 
@@ -224,6 +522,7 @@ class SpaCyDetector(EntityDetector):
                 "version": "unknown",
                 "library": "spacy",
                 "language": "fr",
+                "profile": self._profile,
             }
 
         meta = self._nlp.meta
@@ -232,6 +531,7 @@ class SpaCyDetector(EntityDetector):
             "version": meta.get("version", "unknown"),
             "library": "spacy",
             "language": meta.get("lang", "fr"),
+            "profile": self._profile,
         }
 
     @property
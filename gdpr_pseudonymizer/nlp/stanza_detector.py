@@ -7,9 +7,17 @@ This module implements the EntityDetector interface using the Stanza NLP library
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity, EntityDetector
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+from gdpr_pseudonymizer.nlp.entity_detector import (
+    DEFAULT_BATCH_SIZE,
+    DetectedEntity,
+    EntityDetector,
+    require_non_empty,
+    validate_batch_args,
+)
 from gdpr_pseudonymizer.utils.logger import get_logger
 
 if TYPE_CHECKING:
@@ -84,26 +92,7 @@ class StanzaDetector(EntityDetector):
         try:
             # Process text with Stanza
             doc = self._nlp(text)
-
-            # Extract entities
-            entities = []
-            for sentence in doc.sentences:
-                for ent in sentence.ents:
-                    # Map Stanza entity labels to our standard types
-                    entity_type = self._map_entity_type(ent.type)
-
-                    # Only include PERSON, LOCATION, ORG entities
-                    if entity_type:
-                        entities.append(
-                            DetectedEntity(
-                                text=ent.text,
-                                entity_type=entity_type,
-                                start_pos=ent.start_char,
-                                end_pos=ent.end_char,
-                                confidence=None,  # Stanza doesn't provide per-entity confidence in standard output
-                                gender=None,  # Stanza doesn't provide gender classification
-                            )
-                        )
+            entities = self._extract_entities(doc)
 
             logger.info("entities_detected", count=len(entities), text_length=len(text))
             return entities
@@ -112,6 +101,92 @@ class StanzaDetector(EntityDetector):
             logger.error("entity_detection_failed", error=str(e))
             raise RuntimeError(f"Entity detection failed: {str(e)}") from e
 
+    def detect_entities_batch(
+        self,
+        texts: Iterable[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        n_process: int = 1,
+    ) -> Iterator[list[DetectedEntity]]:
+        """Detect named entities in many documents using ``bulk_process``.
+
+        Texts are grouped into chunks of ``batch_size`` documents and each
+        chunk is run through the Stanza pipeline in one call, which batches
+        sentences across documents. Stanza has no multiprocess mode, so
+        ``n_process`` is accepted for interface compatibility and ignored.
+
+        Args:
+            texts: Document texts to process
+            batch_size: Number of documents per ``bulk_process`` call
+            n_process: Ignored (Stanza runs in-process)
+
+        Returns:
+            Iterator over one list of DetectedEntity objects per text
+
+        Raises:
+            ValueError: If a text is empty or batch_size/n_process < 1
+            RuntimeError: If model loading or entity detection fails
+        """
+        validate_batch_args(batch_size, n_process)
+
+        # Lazy load model if not already loaded
+        if self._nlp is None:
+            self.load_model()
+
+        # Type guard: load_model() guarantees _nlp is not None
+        assert self._nlp is not None, "Model failed to load"
+
+        return self._iter_batch(self._nlp, texts, batch_size)
+
+    def _iter_batch(
+        self, nlp: Pipeline, texts: Iterable[str], batch_size: int
+    ) -> Iterator[list[DetectedEntity]]:
+        """Stream entity lists for texts, one ``bulk_process`` call per chunk."""
+        processed = 0
+        pending = require_non_empty(texts)
+        while chunk := list(islice(pending, batch_size)):
+            try:
+                docs = nlp.bulk_process(chunk)
+            except Exception as e:
+                logger.error("entity_detection_failed", error=str(e))
+                raise RuntimeError(f"Entity detection failed: {str(e)}") from e
+
+            for doc in docs:
+                processed += 1
+                yield self._extract_entities(doc)
+
+        logger.info(
+            "entities_detected_batch", documents=processed, batch_size=batch_size
+        )
+
+    def _extract_entities(self, doc: Any) -> list[DetectedEntity]:
+        """Convert Stanza Document entities to DetectedEntity objects.
+
+        Args:
+            doc: Processed Stanza Document
+
+        Returns:
+            PERSON, LOCATION and ORG entities in document order
+        """
+        entities = []
+        for sentence in doc.sentences:
+            for ent in sentence.ents:
+                # Map Stanza entity labels to our standard types
+                entity_type = self._map_entity_type(ent.type)
+
+                # Only include PERSON, LOCATION, ORG entities
+                if entity_type:
+                    entities.append(
+                        DetectedEntity(
+                            text=ent.text,
+                            entity_type=entity_type,
+                            start_pos=ent.start_char,
+                            end_pos=ent.end_char,
+                            confidence=None,  # Stanza doesn't provide per-entity confidence in standard output
+                            gender=None,  # Stanza doesn't provide gender classification
+                        )
+                    )
+        return entities
+
     def _map_entity_type(self, stanza_label: str) -> str | None:
         """Map Stanza entity labels to standard entity types.
 
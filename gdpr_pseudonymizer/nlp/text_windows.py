@@ -0,0 +1,111 @@
+"""Overlapping text windows for detection on very large documents.
+
+spaCy refuses texts longer than ``nlp.max_length`` and its memory use grows
+with the length of the Doc. Large documents are therefore cut at paragraph
+or sentence boundaries into consecutive *keep ranges*, and each range is
+detected inside a window that extends ``overlap // 2`` characters on both
+sides, so entities (and their context) crossing a cut are seen whole.
+
+An entity is kept by the window whose keep range contains its start. The
+neighbouring window either sees the same entity starting before its keep
+range, or a truncated copy starting after the cut, so each entity shorter
+than ``overlap // 2`` is reported exactly once.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
+
+# Documents longer than this are detected window by window
+DEFAULT_WINDOW_CHARS = 100_000
+
+# Characters shared by consecutive windows (half on each side of a cut)
+DEFAULT_WINDOW_OVERLAP = 2_000
+
+# Preferred cut points, best first: paragraph break, sentence end, line break
+_BOUNDARIES = (
+    re.compile(r"\n[ \t]*\n"),
+    re.compile(r"[.!?…][»\")\]]*\s"),
+    re.compile(r"\n"),
+    re.compile(r"\s"),
+)
+
+
+@dataclass(frozen=True)
+class TextWindow:
+    """One window of a document, in document character offsets.
+
+    Attributes:
+        start: First character of the window text
+        end: End (exclusive) of the window text
+        keep_start: Start of the range whose entities this window reports
+        keep_end: End (exclusive) of that range
+    """
+
+    start: int
+    end: int
+    keep_start: int
+    keep_end: int
+
+    def keeps(self, entity: DetectedEntity) -> bool:
+        """Whether this window reports an entity (document offsets)."""
+        return self.keep_start <= entity.start_pos < self.keep_end
+
+
+def split_windows(
+    text: str,
+    window_chars: int = DEFAULT_WINDOW_CHARS,
+    overlap: int = DEFAULT_WINDOW_OVERLAP,
+) -> list[TextWindow]:
+    """Cut text into overlapping windows aligned on natural boundaries.
+
+    Keep ranges partition the text. Each is cut at the best boundary in the
+    second half of its allowed length (paragraph break, then sentence end,
+    line break, whitespace), and windows never exceed ``window_chars``.
+
+    Args:
+        text: Document text
+        window_chars: Maximum window length in characters
+        overlap: Characters shared by consecutive windows
+
+    Returns:
+        Windows in document order (a single window for short texts)
+
+    Raises:
+        ValueError: If overlap is negative or window_chars <= 2 * overlap
+    """
+    if overlap < 0 or window_chars <= 2 * overlap:
+        raise ValueError(
+            f"window_chars ({window_chars}) must exceed twice the overlap ({overlap})"
+        )
+
+    margin = overlap // 2
+    step = window_chars - 2 * margin
+    cuts = [0]
+    while len(text) - cuts[-1] > step:
+        cuts.append(_find_cut(text, cuts[-1] + step // 2, cuts[-1] + step))
+    cuts.append(len(text))
+
+    return [
+        TextWindow(
+            start=max(keep_start - margin, 0),
+            end=min(keep_end + margin, len(text)),
+            keep_start=keep_start,
+            keep_end=keep_end,
+        )
+        for keep_start, keep_end in zip(cuts, cuts[1:])
+    ]
+
+
+def _find_cut(text: str, low: int, high: int) -> int:
+    """Position right after the best boundary in text[low:high], else high."""
+    for boundary in _BOUNDARIES:
+        last = None
+        for last in boundary.finditer(text, low, high):
+            pass
+        if last is not None:
+            return last.end()
+    return high
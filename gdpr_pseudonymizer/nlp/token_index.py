@@ -0,0 +1,80 @@
+"""Character-to-token offset index over a spaCy Doc.
+
+Geography candidates are checked against the POS and entity-type tags of
+the tokens they cover. Calling ``Doc.char_span()`` per candidate searches
+the token boundaries and allocates a ``Span`` each time; this index reads
+the tags once through ``Doc.to_array()`` and answers every candidate with
+numpy array lookups.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+
+class TokenOffsetIndex:
+    """Token boundaries and disambiguation tags of one Doc.
+
+    Example:
+        >>> index = TokenOffsetIndex(doc)
+        >>> index.passes_pos_disambiguation([(13, 17), (30, 38)])
+        [True, False]
+    """
+
+    def __init__(self, doc: Any) -> None:
+        """Build the index (one ``to_array`` call, O(len(doc.text)) memory).
+
+        Args:
+            doc: spaCy Doc
+        """
+        import numpy as np
+        from spacy.attrs import ENT_TYPE, IDX, LENGTH, POS
+        from spacy.symbols import PROPN
+
+        columns = doc.to_array([IDX, LENGTH, POS, ENT_TYPE]).astype(np.int64)
+        columns = columns.reshape(-1, 4)
+        starts = columns[:, 0]
+        ends = starts + columns[:, 1]
+        token_ids = np.arange(len(columns), dtype=np.int64)
+
+        # Character offset -> index of the token starting / ending there, or -1
+        self._token_at_start = np.full(len(doc.text) + 1, -1, dtype=np.int64)
+        self._token_at_start[starts] = token_ids
+        self._token_at_end = np.full(len(doc.text) + 1, -1, dtype=np.int64)
+        self._token_at_end[ends] = token_ids
+
+        # A token accepts a candidate if it is a proper noun or has no entity
+        accepted = (columns[:, 2] == PROPN) | (columns[:, 3] == 0)
+        self._accepted_before = np.concatenate(
+            ([0], np.cumsum(accepted, dtype=np.int64))
+        )
+
+    def passes_pos_disambiguation(
+        self, candidates: Sequence[tuple[int, int]]
+    ) -> list[bool]:
+        """Check geography candidates against the tags of their tokens.
+
+        Same rule as checking ``doc.char_span(start, end)``: a candidate
+        passes if any covered token is PROPN or has no entity type, or if its
+        offsets do not align with token boundaries.
+
+        Args:
+            candidates: (start, end) character offsets
+
+        Returns:
+            One flag per candidate
+        """
+        import numpy as np
+
+        if not candidates:
+            return []
+        offsets = np.asarray(candidates, dtype=np.int64)
+        first = self._token_at_start[offsets[:, 0]]
+        last = self._token_at_end[offsets[:, 1]]
+        misaligned = (first < 0) | (last < first)
+        accepted = (
+            self._accepted_before[np.where(misaligned, 0, last + 1)]
+            - self._accepted_before[np.where(misaligned, 0, first)]
+        ) > 0
+        return [bool(flag) for flag in misaligned | accepted]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -14,6 +15,7 @@ from gdpr_pseudonymizer.utils.french_patterns import (
 from gdpr_pseudonymizer.utils.logger import get_logger
 
 if TYPE_CHECKING:
+    from gdpr_pseudonymizer.data.models import Entity
     from gdpr_pseudonymizer.data.repositories.mapping_repository import (
         MappingRepository,
     )
@@ -165,6 +167,54 @@ class CompositionalPseudonymEngine:
         self.pseudonym_manager = pseudonym_manager
         self.mapping_repository = mapping_repository
         self.gender_detector = gender_detector
+        # Persisted (component, component_type) -> pseudonym component, None
+        # caching a miss. Complete once warmed from a full mapping load.
+        self._component_cache: dict[tuple[str, str], str | None] = {}
+        self._component_cache_complete = False
+
+    def load_component_cache(self, entities: Iterable[Entity]) -> None:
+        """Warm the component cache from every persisted mapping.
+
+        Called with the entities already loaded for the pseudonym manager, so
+        the cache then answers every persisted lookup (hits and misses)
+        without querying the repository; mappings other processes persist
+        later are picked up at the next load. Replaces any previous content.
+
+        Args:
+            entities: All persisted entities, in repository order
+        """
+        self._component_cache.clear()
+        for entity in entities:
+            if entity.first_name:
+                self._component_cache.setdefault(
+                    (entity.first_name, "first_name"), entity.pseudonym_first
+                )
+            if entity.last_name:
+                self._component_cache.setdefault(
+                    (entity.last_name, "last_name"), entity.pseudonym_last
+                )
+        self._component_cache_complete = True
+        logger.debug("component_cache_loaded", components=len(self._component_cache))
+
+    def record_components(self, entities: Iterable[Entity]) -> None:
+        """Keep the component cache in sync with newly persisted entities.
+
+        Replaces cached misses for the entities' components; an existing
+        match is kept, as the repository would still return it first.
+
+        Args:
+            entities: Entities just saved to the repository
+        """
+        for entity in entities:
+            for component, component_type, pseudonym in (
+                (entity.first_name, "first_name", entity.pseudonym_first),
+                (entity.last_name, "last_name", entity.pseudonym_last),
+            ):
+                if not component:
+                    continue
+                key = (component, component_type)
+                if self._component_cache.get(key) is None:
+                    self._component_cache[key] = pseudonym
 
     def strip_titles(self, text: str) -> str:
         """Remove French honorific titles from entity text.
@@ -343,7 +393,8 @@ class CompositionalPseudonymEngine:
         """Find existing pseudonym for standalone component.
 
         Checks both database (persisted mappings) AND in-memory component mappings
-        (validation preview mappings that haven't been saved yet).
+        (validation preview mappings that haven't been saved yet). Persisted
+        lookups go through the component cache, misses included.
 
         Args:
             component: Name component to search for (e.g., "Marie")
@@ -362,23 +413,20 @@ class CompositionalPseudonymEngine:
         if in_memory is not None:
             return in_memory
 
-        # SECOND: Query repository for existing component mappings (persisted)
-        existing_entities = self.mapping_repository.find_by_component(
-            component, component_type
-        )
-
-        if not existing_entities:
+        # SECOND: Persisted mappings, from the component cache when it holds
+        # (or, once warmed, rules out) the component
+        key = (component, component_type)
+        if key in self._component_cache:
+            return self._component_cache[key]
+        if self._component_cache_complete:
             return None
 
-        # Use first match to maintain consistency
-        first_match = existing_entities[0]
-
-        if component_type == "first_name":
-            pseudonym: str | None = first_match.pseudonym_first
-            return pseudonym
-        else:  # last_name
-            pseudonym_last: str | None = first_match.pseudonym_last
-            return pseudonym_last
+        # THIRD: Query repository (first match, to maintain consistency)
+        pseudonym = self.mapping_repository.find_component_pseudonym(
+            component, component_type
+        )
+        self._component_cache[key] = pseudonym
+        return pseudonym
 
     def _handle_standalone_component(
         self, component: str, gender: str | None
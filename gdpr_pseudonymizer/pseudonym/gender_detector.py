@@ -3,19 +3,55 @@
 Provides heuristic gender detection using a lookup dictionary built from
 INSEE public data (Open License 2.0 / Etalab). Used by the compositional
 pseudonym engine to assign gender-matched pseudonyms.
+
+The lookup JSON is compiled into a single name -> gender table, stored in
+the resource cache (see utils.resource_cache) and loaded at most once per
+process for each lookup file, so its size does not add to per-document
+start-up.
 """
 
 from __future__ import annotations
 
 import json
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
 from pathlib import Path
 
 from gdpr_pseudonymizer.resources import FRENCH_GENDER_LOOKUP_PATH
 from gdpr_pseudonymizer.utils.logger import get_logger
+from gdpr_pseudonymizer.utils.resource_cache import load_resource
 
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class GenderLookup:
+    """Compiled gender lookup table, shared by all detectors in the process.
+
+    Attributes:
+        genders: Normalized first name -> "male", "female", or None for
+            names known to be ambiguous
+        male_count: Male names in the source file
+        female_count: Female names in the source file
+        ambiguous_count: Ambiguous names in the source file
+    """
+
+    genders: dict[str, str | None]
+    male_count: int
+    female_count: int
+    ambiguous_count: int
+
+
+# Process-wide compiled lookups, keyed by file path, modification time and
+# size so an edited file is loaded again
+_loaded_lookups: dict[tuple[str, int, int], GenderLookup] = {}
+_loaded_lookups_lock = threading.Lock()
+
+# Process-wide detectors returned by GenderDetector.shared()
+_shared_detectors: dict[str, GenderDetector] = {}
+
+
 class GenderDetector:
     """Detect gender from French first names using lookup dictionary.
 
@@ -25,9 +61,7 @@ class GenderDetector:
     (preserving current behavior).
 
     Attributes:
-        _male_names: Set of known male first names (normalized)
-        _female_names: Set of known female first names (normalized)
-        _ambiguous_names: Set of known ambiguous first names (normalized)
+        _lookup: Compiled lookup table (None until loaded)
         _loaded: Whether the lookup dictionary has been loaded
     """
 
@@ -41,11 +75,31 @@ class GenderDetector:
         self._lookup_path = (
             Path(lookup_path) if lookup_path else FRENCH_GENDER_LOOKUP_PATH
         )
-        self._male_names: set[str] = set()
-        self._female_names: set[str] = set()
-        self._ambiguous_names: set[str] = set()
+        self._lookup: GenderLookup | None = None
+        self._genders: dict[str, str | None] = {}
         self._loaded: bool = False
 
+    @classmethod
+    def shared(cls, lookup_path: str | None = None) -> GenderDetector:
+        """Return the process-wide detector for a lookup file.
+
+        The detector is not loaded here: the lookup is read on its first
+        detection, so callers that never classify a name never pay for it.
+
+        Args:
+            lookup_path: Path to gender lookup JSON file. If None, uses
+                the bundled package resource.
+
+        Returns:
+            Detector shared by every caller passing the same lookup path
+        """
+        key = str(lookup_path or FRENCH_GENDER_LOOKUP_PATH)
+        with _loaded_lookups_lock:
+            detector = _shared_detectors.get(key)
+            if detector is None:
+                detector = _shared_detectors[key] = cls(lookup_path)
+        return detector
+
     def load(self) -> None:
         """Load gender lookup dictionary from JSON.
 
@@ -58,20 +112,56 @@ class GenderDetector:
                 f"Gender lookup file not found: {self._lookup_path}"
             )
 
-        with open(self._lookup_path, encoding="utf-8") as f:
-            data = json.load(f)
-
-        self._male_names = {self._normalize(n) for n in data.get("male", [])}
-        self._female_names = {self._normalize(n) for n in data.get("female", [])}
-        self._ambiguous_names = {self._normalize(n) for n in data.get("ambiguous", [])}
+        stat = self._lookup_path.stat()
+        key = (str(self._lookup_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+        with _loaded_lookups_lock:
+            lookup = _loaded_lookups.get(key)
+            if lookup is None:
+                genders, counts = load_resource(
+                    self._lookup_path, "gender_table", self._build_lookup
+                )
+                lookup = _loaded_lookups[key] = GenderLookup(genders, *counts)
+
+                logger.info(
+                    "gender_lookup_loaded",
+                    male_count=lookup.male_count,
+                    female_count=lookup.female_count,
+                    ambiguous_count=lookup.ambiguous_count,
+                )
+
+        self._lookup = lookup
+        self._genders = lookup.genders
         self._loaded = True
 
-        logger.info(
-            "gender_lookup_loaded",
-            male_count=len(self._male_names),
-            female_count=len(self._female_names),
-            ambiguous_count=len(self._ambiguous_names),
-        )
+    @classmethod
+    def _build_lookup(
+        cls, source: bytes
+    ) -> tuple[dict[str, str | None], tuple[int, int, int]]:
+        """Compile the lookup JSON into a single normalized name table.
+
+        A name listed as ambiguous maps to None whatever else lists it, and
+        a name listed as both male and female is male, as with the separate
+        name sets checked in that order.
+
+        Args:
+            source: Raw lookup file content
+
+        Returns:
+            Cacheable payload (see utils.resource_cache): the table and the
+            male/female/ambiguous name counts
+        """
+        data = json.loads(source.decode("utf-8"))
+        names = {
+            gender: {cls._normalize(n) for n in data.get(gender, [])}
+            for gender in ("male", "female", "ambiguous")
+        }
+        genders: dict[str, str | None] = {}
+        for gender in ("female", "male"):
+            genders.update(dict.fromkeys(names[gender], gender))
+        genders.update(dict.fromkeys(names["ambiguous"]))
+        counts = (len(names["male"]), len(names["female"]), len(names["ambiguous"]))
+        return genders, counts
 
     def _ensure_loaded(self) -> None:
         """Lazy-load lookup dictionary on first use."""
@@ -100,7 +190,25 @@ class GenderDetector:
             "male", "female", or None (unknown/ambiguous)
         """
         self._ensure_loaded()
+        return self._classify(first_name)
+
+    def detect_genders(self, first_names: Iterable[str]) -> list[str | None]:
+        """Detect the gender of many first names in one pass.
 
+        Loads the lookup once and classifies every name against it, e.g. all
+        PERSON entities of a document at once.
+
+        Args:
+            first_names: First names to look up
+
+        Returns:
+            "male", "female", or None for each name, in input order
+        """
+        self._ensure_loaded()
+        return [self._classify(name) for name in first_names]
+
+    def _classify(self, first_name: str) -> str | None:
+        """Look up one first name in the loaded table."""
         if not first_name or not first_name.strip():
             return None
 
@@ -111,16 +219,7 @@ class GenderDetector:
             if first_component:
                 normalized = self._normalize(first_component)
 
-        if normalized in self._ambiguous_names:
-            return None
-
-        if normalized in self._male_names:
-            return "male"
-
-        if normalized in self._female_names:
-            return "female"
-
-        return None
+        return self._genders.get(normalized)
 
     def detect_gender_from_full_name(
         self, full_name: str, entity_type: str
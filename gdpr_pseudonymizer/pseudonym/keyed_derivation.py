@@ -0,0 +1,94 @@
+"""Keyed derivation of pseudonym components from real name components.
+
+In keyed mode a new first or last name pseudonym is not drawn at random:
+HMAC-SHA256 of the normalized real component, under a key derived from the
+database key, fixes a start index and a step into the library, and
+candidates are probed in that order until one is free. Any process holding
+the same key and the same existing mappings therefore computes the same
+pseudonym for a component without waiting for another process to persist
+it first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import math
+import unicodedata
+from collections.abc import Iterator
+
+# Purpose label passed to EncryptionService.derive_key()
+DERIVATION_KEY_PURPOSE = "pseudonym-derivation"
+
+_MIN_KEY_LENGTH = 16
+
+
+class KeyedComponentDeriver:
+    """Keyed probe order over a candidate list for each real component.
+
+    The order is a full permutation of the candidate indexes (a start plus
+    a step coprime with the list size), so probing visits every candidate
+    exactly once before giving up.
+
+    Example:
+        >>> deriver = KeyedComponentDeriver(service.derive_key(DERIVATION_KEY_PURPOSE))
+        >>> first_choice = next(deriver.probe_order("last_name", "Dubois", 500))
+    """
+
+    def __init__(self, key: bytes) -> None:
+        """Initialize with a secret derivation key.
+
+        Args:
+            key: Secret key (at least 16 bytes), e.g. from
+                EncryptionService.derive_key(DERIVATION_KEY_PURPOSE)
+
+        Raises:
+            ValueError: If the key is too short
+        """
+        if len(key) < _MIN_KEY_LENGTH:
+            raise ValueError(f"Derivation key must be at least {_MIN_KEY_LENGTH} bytes")
+        self._key = key
+
+    @staticmethod
+    def normalize(component: str) -> str:
+        """Normalize a real component before derivation.
+
+        Unicode NFC and surrounding whitespace only: component mappings are
+        case-sensitive, so "Élise" typed precomposed or decomposed derives
+        the same pseudonym but "élise" does not.
+
+        Args:
+            component: Real name component
+
+        Returns:
+            Normalized component
+        """
+        return unicodedata.normalize("NFC", component.strip())
+
+    def probe_order(
+        self, component_type: str, component: str, size: int
+    ) -> Iterator[int]:
+        """Yield candidate indexes in the keyed order for a real component.
+
+        Args:
+            component_type: Component type ("first_name", "last_name", ...)
+            component: Real component value
+            size: Number of candidates
+
+        Yields:
+            Every index in range(size) exactly once
+        """
+        if size <= 0:
+            return
+        message = f"{component_type}\0{self.normalize(component)}".encode()
+        digest = hmac.new(self._key, message, hashlib.sha256).digest()
+
+        start = int.from_bytes(digest[:8], "big") % size
+        step = 1
+        if size > 1:
+            step = 1 + int.from_bytes(digest[8:16], "big") % (size - 1)
+            while math.gcd(step, size) != 1:
+                step = step % (size - 1) + 1
+
+        for probe in range(size):
+            yield (start + probe * step) % size
@@ -4,19 +4,48 @@ from __future__ import annotations
 
 import json
 import secrets
+import threading
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
 from typing import Any, TypedDict
 
 from gdpr_pseudonymizer.pseudonym.assignment_engine import (
     PseudonymAssignment,
     PseudonymManager,
 )
+from gdpr_pseudonymizer.pseudonym.keyed_derivation import KeyedComponentDeriver
 from gdpr_pseudonymizer.pseudonym.neutral_id_generator import (
+    CounterRangeStore,
     NeutralIdPseudonymGenerator,
 )
 from gdpr_pseudonymizer.utils.logger import get_logger
+from gdpr_pseudonymizer.utils.pseudonym_counters import (
+    ENTITY_TYPES,
+    FALLBACK_COUNTER,
+    NEUTRAL_ID_COUNTER,
+    counter_key,
+    extract_counter_values,
+)
+from gdpr_pseudonymizer.utils.resource_cache import load_resource
 
 logger = get_logger(__name__)
 
+# CSPRNG used to shuffle candidate pools
+_system_random = secrets.SystemRandom()
+
+# Usage ratio at which library exhaustion warnings are logged
+EXHAUSTION_WARNING_THRESHOLD = 0.8
+
+# Library name categories consumed by each entity type. A PERSON uses one
+# first name and one last name component per distinct real component.
+LIBRARY_CATEGORIES: dict[str, tuple[str, ...]] = {
+    "PERSON": ("first_name", "last_name"),
+    "LOCATION": ("location",),
+    "ORG": ("organization",),
+}
+
 
 class DataSource(TypedDict):
     """Data source metadata for legal compliance documentation."""
@@ -64,6 +93,115 @@ class PseudonymLibrary(TypedDict):
     organizations: Organizations
 
 
+@dataclass(frozen=True)
+class LoadedLibrary:
+    """Validated pseudonym library shared by every manager in the process.
+
+    All name lists are tuples and all groupings read-only mappings, so
+    managers can reference them directly; usage state stays in each manager.
+
+    Attributes:
+        theme: Library theme
+        first_names: First names by gender (male, female, neutral)
+        last_names: Last names
+        locations: Locations by category (cities, planets/countries, regions)
+        organizations: Organizations by category
+        all_first_names: First names of every gender, in library order
+        all_locations: Flattened location categories
+        all_organizations: Flattened organization categories
+        name_sets: Distinct names per library category (first_name,
+            last_name, location, organization)
+        total_combinations: Distinct full pseudonyms the library can produce
+            (PERSON first/last combinations plus locations and organizations)
+    """
+
+    theme: str
+    first_names: Mapping[str, tuple[str, ...]]
+    last_names: tuple[str, ...]
+    locations: Mapping[str, tuple[str, ...]]
+    organizations: Mapping[str, tuple[str, ...]]
+    all_first_names: tuple[str, ...]
+    all_locations: tuple[str, ...]
+    all_organizations: tuple[str, ...]
+    name_sets: Mapping[str, frozenset[str]]
+    total_combinations: int
+
+    @classmethod
+    def from_data(cls, library_data: Mapping[str, Any]) -> LoadedLibrary:
+        """Freeze validated library JSON data.
+
+        Args:
+            library_data: Parsed library file (already validated)
+
+        Returns:
+            Immutable library with precomputed flattened lists and counts
+        """
+
+        def freeze(groups: Mapping[str, Any]) -> Mapping[str, tuple[str, ...]]:
+            return MappingProxyType(
+                {key: tuple(names or ()) for key, names in groups.items()}
+            )
+
+        first_names = freeze(library_data["first_names"])
+        locations = freeze(library_data["locations"])
+        organizations = freeze(library_data["organizations"])
+        last_names = tuple(library_data["last_names"])
+
+        all_first_names = (
+            first_names["male"] + first_names["female"] + first_names["neutral"]
+        )
+        all_locations = (
+            locations["cities"]
+            + locations.get("planets", locations.get("countries", ()))
+            + locations["regions"]
+        )
+        all_organizations = (
+            organizations["companies"]
+            + organizations["agencies"]
+            + organizations["institutions"]
+        )
+        person_combinations = len(last_names) * (len(all_first_names) or 1)
+
+        return cls(
+            theme=library_data["theme"],
+            first_names=first_names,
+            last_names=last_names,
+            locations=locations,
+            organizations=organizations,
+            all_first_names=all_first_names,
+            all_locations=all_locations,
+            all_organizations=all_organizations,
+            name_sets=MappingProxyType(
+                {
+                    "first_name": frozenset(all_first_names),
+                    "last_name": frozenset(last_names),
+                    "location": frozenset(all_locations),
+                    "organization": frozenset(all_organizations),
+                }
+            ),
+            total_combinations=(
+                person_combinations + len(all_locations) + len(all_organizations)
+            ),
+        )
+
+
+# Library of a manager with nothing loaded (or using neutral_id)
+_EMPTY_LIBRARY = LoadedLibrary.from_data(
+    {
+        "theme": "",
+        "first_names": {"male": [], "female": [], "neutral": []},
+        "last_names": [],
+        "locations": {"cities": [], "planets": [], "regions": []},
+        "organizations": {"companies": [], "agencies": [], "institutions": []},
+    }
+)
+
+# Process-wide cache of loaded libraries, keyed by file path, modification
+# time and size so an edited file is loaded again
+_loaded_libraries: dict[tuple[str, int, int], LoadedLibrary] = {}
+_loaded_libraries_lock = threading.Lock()
+
+
 class LibraryBasedPseudonymManager(PseudonymManager):
     """Concrete implementation of PseudonymManager with JSON library loading.
 
@@ -83,20 +221,34 @@ class LibraryBasedPseudonymManager(PseudonymManager):
         organizations: Organizations grouped by type (companies, agencies, institutions)
         _used_pseudonyms: Set of already assigned full pseudonyms
         _component_mappings: Dict mapping (real_component, component_type) to pseudonym_component
+        _component_owners: Reverse index of _component_mappings, mapping
+            (pseudonym_component, component_type) to the real components using it
+        _candidate_pools: Shuffled pools of unused candidates per category,
+            each stored with the library data it was built from
+        _library_usage: Library names in use per category (see
+            LIBRARY_CATEGORIES), maintained incrementally
+        _deriver: Keyed component derivation (None for random selection)
         _fallback_counters: Counters for fallback naming by entity type
     """
 
-    def __init__(self) -> None:
-        """Initialize pseudonym manager with empty state."""
+    def __init__(
+        self,
+        derivation_key: bytes | None = None,
+        counter_ranges: CounterRangeStore | None = None,
+    ) -> None:
+        """Initialize pseudonym manager with empty state.
+
+        Args:
+            derivation_key: Secret key enabling keyed derivation of new
+                first/last name components (see pseudonym.keyed_derivation).
+                Without it, new components are drawn at random.
+            counter_ranges: Shared store neutral_id identifiers are reserved
+                from in blocks, so concurrent workers never issue the same
+                identifier (None counts locally)
+        """
         self.theme: str | None = None
-        self.first_names: FirstNames = {"male": [], "female": [], "neutral": []}
-        self.last_names: list[str] = []
-        self.locations: Locations = {"cities": [], "planets": [], "regions": []}
-        self.organizations: Organizations = {
-            "companies": [],
-            "agencies": [],
-            "institutions": [],
-        }
+        # Shared, immutable library the name lists are read from
+        self._library = _EMPTY_LIBRARY
         self._used_pseudonyms: set[str] = set()
 
         # Component-level collision prevention (Story 2.8)
@@ -105,12 +257,40 @@ class LibraryBasedPseudonymManager(PseudonymManager):
         # Example: {("Dubois", "last_name"): "Neto", ("Marie", "first_name"): "Alexia"}
         self._component_mappings: dict[tuple[str, str], str] = {}
 
+        # Reverse index kept in sync with _component_mappings so collision
+        # checks do not scan every mapping
+        # Example: {("Neto", "last_name"): {"Dubois"}}
+        self._component_owners: dict[tuple[str, str], set[str]] = {}
+
+        # Without-replacement sampling: each category keeps a shuffled list of
+        # candidates that were unused when it was built and pops from it.
+        # Key: category (e.g. "last_name", "first_name:female", "location")
+        # Value: (library data the pool was built from, remaining candidates)
+        self._candidate_pools: dict[str, tuple[object, list[str]]] = {}
+
+        # Keyed mode: each real component probes the deduplicated candidates
+        # of its category in an order derived from the key
+        # Value: (library data the list was built from, distinct candidates)
+        self._deriver = (
+            KeyedComponentDeriver(derivation_key)
+            if derivation_key is not None
+            else None
+        )
+        self._distinct_candidates: dict[str, tuple[object, tuple[str, ...]]] = {}
+
+        # Per-category usage counters behind check_exhaustion_by_type():
+        # incremented when a pool hands out a name, recounted on load
+        self._library_usage: dict[str, int] = {}
+        self._exhaustion_warned: set[str] = set()
+        self._reset_library_usage()
+
         self._fallback_counters: dict[str, int] = {
             "PERSON": 0,
             "LOCATION": 0,
             "ORG": 0,
         }
 
+        self._counter_ranges = counter_ranges
         self._neutral_id_generator: NeutralIdPseudonymGenerator | None = None
 
     def load_library(self, theme: str) -> None:
@@ -125,9 +305,15 @@ class LibraryBasedPseudonymManager(PseudonymManager):
         """
         if theme == "neutral_id":
             self.theme = "neutral_id"
-            self._neutral_id_generator = NeutralIdPseudonymGenerator()
+            self._library = _EMPTY_LIBRARY
+            self._neutral_id_generator = NeutralIdPseudonymGenerator(
+                self._counter_ranges
+            )
             self._used_pseudonyms.clear()
-            self._component_mappings.clear()
+            self._clear_component_mappings()
+            self._candidate_pools.clear()
+            self._distinct_candidates.clear()
+            self._reset_library_usage()
             self._fallback_counters = {"PERSON": 0, "LOCATION": 0, "ORG": 0}
             logger.info("pseudonym_library_loaded", theme="neutral_id")
             return
@@ -140,57 +326,149 @@ class LibraryBasedPseudonymManager(PseudonymManager):
         if not library_path.exists():
             raise FileNotFoundError(f"Pseudonym library not found: {library_path}")
 
-        # Load and validate JSON structure
-        try:
-            with open(library_path, encoding="utf-8") as f:
-                library_data: dict[Any, Any] = json.load(f)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON format in {library_path}: {e}")
-
-        # Validate required fields
-        self._validate_library_structure(library_data, theme)
+        library = self._load_shared_library(library_path, theme)
 
-        # Store library data
-        self.theme = library_data["theme"]
-        self.first_names = library_data["first_names"]
-        self.last_names = library_data["last_names"]
-        self.locations = library_data["locations"]
-        self.organizations = library_data["organizations"]
+        # Reference the shared library data (no copy)
+        self._library = library
+        self.theme = library.theme
 
         # Reset usage tracking for new library
         self._used_pseudonyms.clear()
-        self._component_mappings.clear()
+        self._clear_component_mappings()
+        self._candidate_pools.clear()
+        self._distinct_candidates.clear()
+        self._reset_library_usage()
         self._fallback_counters = {"PERSON": 0, "LOCATION": 0, "ORG": 0}
 
-        # Calculate location and organization totals
-        # Use planets for themed libraries, countries for neutral
-        planets_or_countries = self.locations.get(
-            "planets", self.locations.get("countries", [])
-        )
-        if planets_or_countries is None:
-            planets_or_countries = []
-        total_locations = (
-            len(self.locations["cities"])
-            + len(planets_or_countries)
-            + len(self.locations["regions"])
-        )
-        total_organizations = (
-            len(self.organizations["companies"])
-            + len(self.organizations["agencies"])
-            + len(self.organizations["institutions"])
-        )
-
         logger.info(
             "pseudonym_library_loaded",
             theme=self.theme,
-            male_first=len(self.first_names["male"]),
-            female_first=len(self.first_names["female"]),
-            neutral_first=len(self.first_names["neutral"]),
-            last=len(self.last_names),
-            locations=total_locations,
-            organizations=total_organizations,
+            keyed=self.keyed_derivation,
+            male_first=len(library.first_names["male"]),
+            female_first=len(library.first_names["female"]),
+            neutral_first=len(library.first_names["neutral"]),
+            last=len(library.last_names),
+            locations=len(library.all_locations),
+            organizations=len(library.all_organizations),
         )
 
+    def _load_shared_library(self, library_path: Path, theme: str) -> LoadedLibrary:
+        """Return the process-wide LoadedLibrary for a library file.
+
+        The file is read, parsed and validated only the first time it is
+        loaded in the process (or after it changed on disk).
+
+        Args:
+            library_path: Library JSON file
+            theme: Expected theme name
+
+        Returns:
+            Shared, immutable library
+
+        Raises:
+            ValueError: If library format is invalid
+        """
+        stat = library_path.stat()
+        key = (str(library_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+        with _loaded_libraries_lock:
+            library = _loaded_libraries.get(key)
+            if library is not None:
+                return library
+
+            def parse_library(source: bytes) -> dict[Any, Any]:
+                # Load and validate JSON structure (skipped on resource cache hits)
+                try:
+                    library_data: dict[Any, Any] = json.loads(source.decode("utf-8"))
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Invalid JSON format in {library_path}: {e}")
+
+                # Validate required fields
+                self._validate_library_structure(library_data, theme)
+                return library_data
+
+            library = LoadedLibrary.from_data(
+                load_resource(library_path, f"library-{theme}", parse_library)
+            )
+            _loaded_libraries[key] = library
+            return library
+
+    @property
+    def first_names(self) -> Mapping[str, Sequence[str]]:
+        """First names by gender (male, female, neutral)."""
+        return self._library.first_names
+
+    @property
+    def last_names(self) -> Sequence[str]:
+        """Last names."""
+        return self._library.last_names
+
+    @property
+    def locations(self) -> Mapping[str, Sequence[str]]:
+        """Locations by category (cities, planets/countries, regions)."""
+        return self._library.locations
+
+    @property
+    def organizations(self) -> Mapping[str, Sequence[str]]:
+        """Organizations by category (companies, agencies, institutions)."""
+        return self._library.organizations
+
+    def _all_first_names(self) -> Sequence[str]:
+        """First names of every gender, in library order."""
+        return self._library.all_first_names
+
+    def _all_locations(self) -> Sequence[str]:
+        """Flattened locations."""
+        return self._library.all_locations
+
+    def _all_organizations(self) -> Sequence[str]:
+        """Flattened organizations."""
+        return self._library.all_organizations
+
+    def _library_names(self, category: str) -> frozenset[str]:
+        """Distinct names of a library category."""
+        return self._library.name_sets[category]
+
+    def _reset_library_usage(self) -> None:
+        """Zero the per-category usage counters and warning state."""
+        self._library_usage = {
+            category: 0
+            for categories in LIBRARY_CATEGORIES.values()
+            for category in categories
+        }
+        self._exhaustion_warned.clear()
+
+    def _recount_library_usage(self) -> None:
+        """Recount library names in use from mappings and used pseudonyms."""
+        components: dict[str, set[str]] = {"first_name": set(), "last_name": set()}
+        for pseudonym_component, component_type in self._component_owners:
+            components[component_type].add(pseudonym_component)
+
+        in_use = {
+            "first_name": components["first_name"],
+            "last_name": components["last_name"],
+            "location": self._used_pseudonyms,
+            "organization": self._used_pseudonyms,
+        }
+        self._library_usage = {
+            category: len(self._library_names(category) & names)
+            for category, names in in_use.items()
+        }
+
+    def _warn_if_type_near_exhaustion(self, entity_type: str) -> None:
+        """Log once per library when an entity type crosses the threshold."""
+        if entity_type in self._exhaustion_warned:
+            return
+        ratio = self.check_exhaustion_by_type()[entity_type]
+        if ratio >= EXHAUSTION_WARNING_THRESHOLD:
+            self._exhaustion_warned.add(entity_type)
+            logger.warning(
+                "library_type_near_exhaustion",
+                theme=self.theme,
+                entity_type=entity_type,
+                exhaustion_pct=round(ratio * 100, 2),
+            )
+
     def reset_preview_state(self) -> None:
         """Reset internal state accumulated during validation preview.
 
@@ -199,7 +477,9 @@ class LibraryBasedPseudonymManager(PseudonymManager):
         during actual processing.
         """
         self._used_pseudonyms.clear()
-        self._component_mappings.clear()
+        self._clear_component_mappings()
+        self._candidate_pools.clear()
+        self._reset_library_usage()
 
     def get_component_mapping(self, component: str, component_type: str) -> str | None:
         """Look up an in-memory component mapping.
@@ -213,9 +493,178 @@ class LibraryBasedPseudonymManager(PseudonymManager):
         """
         return self._component_mappings.get((component, component_type))
 
-    def _flatten_location_list(
-        self, locations: Locations | dict[Any, Any]
-    ) -> list[str]:
+    def _set_component_mapping(
+        self, component: str, component_type: str, pseudonym_component: str
+    ) -> None:
+        """Record a component mapping and update the reverse index.
+
+        Args:
+            component: Real component value (e.g., "Dubois")
+            component_type: Component type ("first_name" or "last_name")
+            pseudonym_component: Pseudonym component (e.g., "Neto")
+        """
+        key = (component, component_type)
+        previous = self._component_mappings.get(key)
+        if previous == pseudonym_component:
+            return
+        if previous is not None:
+            owners = self._component_owners[(previous, component_type)]
+            owners.discard(component)
+            if not owners:
+                del self._component_owners[(previous, component_type)]
+        self._component_mappings[key] = pseudonym_component
+        self._component_owners.setdefault(
+            (pseudonym_component, component_type), set()
+        ).add(component)
+
+    def _clear_component_mappings(self) -> None:
+        """Clear component mappings and their reverse index."""
+        self._component_mappings.clear()
+        self._component_owners.clear()
+
+    def _is_component_collision(
+        self, candidate: str, component_type: str, real_component: str | None
+    ) -> bool:
+        """Check whether a pseudonym component is used by another real component.
+
+        Args:
+            candidate: Candidate pseudonym component
+            component_type: Component type ("first_name" or "last_name")
+            real_component: Real component the candidate would map to (no
+                collision tracking when None)
+
+        Returns:
+            True if the candidate already maps a different real component
+        """
+        if not real_component:
+            return False
+        owners = self._component_owners.get((candidate, component_type))
+        return bool(owners) and owners != {real_component}
+
+    def _draw_unused(
+        self,
+        category: str,
+        source: object,
+        candidates: Callable[[], Sequence[str]],
+        is_unused: Callable[[str], bool],
+    ) -> str | None:
+        """Draw a random unused candidate without replacement.
+
+        The pool for a category is built on first use (and again whenever the
+        library data it came from is replaced) from the candidates that are
+        unused at that point, shuffled with a CSPRNG. Candidates that became
+        used since the pool was built are skipped when popped, so each draw is
+        amortized O(1).
+
+        Args:
+            category: Pool key (e.g. "last_name", "first_name:female")
+            source: Library data the candidates come from (identity-checked)
+            candidates: Builds the candidate list when the pool is (re)built
+            is_unused: Whether a candidate can still be assigned
+
+        Returns:
+            Unused candidate, or None if every candidate is in use
+        """
+        entry = self._candidate_pools.get(category)
+        if entry is None or entry[0] is not source:
+            pool = [candidate for candidate in candidates() if is_unused(candidate)]
+            _system_random.shuffle(pool)
+            entry = (source, pool)
+            self._candidate_pools[category] = entry
+
+        pool = entry[1]
+        while pool:
+            candidate = pool.pop()
+            if is_unused(candidate):
+                return candidate
+        return None
+
+    @property
+    def keyed_derivation(self) -> bool:
+        """Whether new name components are derived from a key."""
+        return self._deriver is not None
+
+    def _derive_candidate(
+        self,
+        category: str,
+        source: object,
+        candidates: Callable[[], Sequence[str]],
+        component_type: str,
+        component: str,
+        is_unused: Callable[[str], bool] = lambda candidate: True,
+    ) -> str | None:
+        """Derive a candidate for a real component by keyed probing.
+
+        Candidates are deduplicated (library order kept) and probed in the
+        deriver's order for the component; the first unused one is returned,
+        so two managers with the same key and mappings agree on it.
+
+        Args:
+            category: Candidate list key (e.g. "last_name", "first_name:female")
+            source: Library data the candidates come from (identity-checked)
+            candidates: Builds the candidate list when it is (re)built
+            component_type: Derivation domain (e.g. "last_name")
+            component: Real component the pseudonym is derived from
+            is_unused: Whether a candidate can still be assigned
+
+        Returns:
+            First unused candidate in probe order, or None if all are in use
+        """
+        assert self._deriver is not None, "Keyed derivation not enabled"
+        entry = self._distinct_candidates.get(category)
+        if entry is None or entry[0] is not source:
+            entry = (source, tuple(dict.fromkeys(candidates())))
+            self._distinct_candidates[category] = entry
+
+        distinct = entry[1]
+        for index in self._deriver.probe_order(
+            component_type, component, len(distinct)
+        ):
+            if is_unused(distinct[index]):
+                return distinct[index]
+        return None
+
+    def _select_component(
+        self,
+        category: str,
+        source: object,
+        candidates: Callable[[], Sequence[str]],
+        component_type: str,
+        real_component: str,
+    ) -> str | None:
+        """Pick a collision-free pseudonym component for a real component.
+
+        Keyed probing when a derivation key is set, otherwise a random draw
+        without replacement.
+
+        Args:
+            category: Candidate pool key
+            source: Library data the candidates come from (identity-checked)
+            candidates: Builds the candidate list
+            component_type: Component type ("first_name" or "last_name")
+            real_component: Real component the pseudonym will map
+
+        Returns:
+            Candidate no other real component uses, or None if none is left
+        """
+
+        def is_unused(name: str) -> bool:
+            return not self._is_component_collision(
+                name, component_type, real_component
+            )
+
+        if self._deriver is not None:
+            return self._derive_candidate(
+                category,
+                source,
+                candidates,
+                component_type,
+                real_component,
+                is_unused,
+            )
+        return self._draw_unused(category, source, candidates, is_unused)
+
+    def _flatten_location_list(self, locations: Mapping[str, Any]) -> list[str]:
         """Flatten location categories into a single list.
 
         Args:
@@ -228,11 +677,9 @@ class LibraryBasedPseudonymManager(PseudonymManager):
         if planets_or_countries is None:
             planets_or_countries = []
 
-        return locations["cities"] + planets_or_countries + locations["regions"]
+        return [*locations["cities"], *planets_or_countries, *locations["regions"]]
 
-    def _flatten_organization_list(
-        self, organizations: Organizations | dict[Any, Any]
-    ) -> list[str]:
+    def _flatten_organization_list(self, organizations: Mapping[str, Any]) -> list[str]:
         """Flatten organization categories into a single list.
 
         Args:
@@ -241,11 +688,11 @@ class LibraryBasedPseudonymManager(PseudonymManager):
         Returns:
             Flattened list of all organization names
         """
-        return (
-            organizations["companies"]
-            + organizations["agencies"]
-            + organizations["institutions"]
-        )
+        return [
+            *organizations["companies"],
+            *organizations["agencies"],
+            *organizations["institutions"],
+        ]
 
     def _validate_library_structure(
         self, library_data: dict[Any, Any], expected_theme: str
@@ -395,7 +842,7 @@ class LibraryBasedPseudonymManager(PseudonymManager):
 
         # Check exhaustion and warn at 80% threshold
         exhaustion = self.check_exhaustion()
-        if exhaustion >= 0.8:
+        if exhaustion >= EXHAUSTION_WARNING_THRESHOLD:
             logger.warning(
                 "library_near_exhaustion",
                 theme=self.theme,
@@ -414,7 +861,9 @@ class LibraryBasedPseudonymManager(PseudonymManager):
                 pseudonym_first_name = self._select_first_name(gender, first_name)
             if pseudonym_last_name is None:
                 # Pass real last name for component collision tracking
-                pseudonym_last_name = self._select_last_name(last_name)
+                pseudonym_last_name = self._select_last_name(
+                    last_name, derive_from=first_name
+                )
 
             pseudonym_full = f"{pseudonym_first_name} {pseudonym_last_name}"
         elif entity_type == "LOCATION":
@@ -471,6 +920,7 @@ class LibraryBasedPseudonymManager(PseudonymManager):
 
         # Mark as used
         self._used_pseudonyms.add(pseudonym_full)
+        self._warn_if_type_near_exhaustion(entity_type)
 
         return PseudonymAssignment(
             pseudonym_full=pseudonym_full,
@@ -515,8 +965,8 @@ class LibraryBasedPseudonymManager(PseudonymManager):
             pseudonym_last = f"{identifier}-N"
 
             # Store component mappings for sub-entity recognition
-            self._component_mappings[(first_name, "first_name")] = pseudonym_first
-            self._component_mappings[(last_name, "last_name")] = pseudonym_last
+            self._set_component_mapping(first_name, "first_name", pseudonym_first)
+            self._set_component_mapping(last_name, "last_name", pseudonym_last)
 
             pseudonym_full = identifier
         elif entity_type == "PERSON":
@@ -562,58 +1012,54 @@ class LibraryBasedPseudonymManager(PseudonymManager):
 
         # Map gender to library categories
         if gender == "male" and self.first_names["male"]:
+            category = "male"
             candidates = self.first_names["male"]
         elif gender == "female" and self.first_names["female"]:
+            category = "female"
             candidates = self.first_names["female"]
         elif gender == "neutral" and self.first_names["neutral"]:
+            category = "neutral"
             candidates = self.first_names["neutral"]
         else:
             # Unknown/None gender or empty category -> use all available names
-            candidates = (
-                self.first_names["male"]
-                + self.first_names["female"]
-                + self.first_names["neutral"]
-            )
+            category = "any"
+            candidates = self._all_first_names()
 
         if not candidates:
             raise RuntimeError(f"No first names available for gender: {gender}")
 
-        # Select with collision prevention
-        max_attempts = 100
-        for attempt in range(max_attempts):
-            candidate = secrets.choice(candidates)
-
-            # Check if this pseudonym component already used for different real component
-            is_collision = False
-            for (
-                real_comp,
-                comp_type,
-            ), pseudo_comp in self._component_mappings.items():
-                if comp_type == "first_name" and pseudo_comp == candidate:
-                    # This pseudonym is already used for a different real first name
-                    if real_first_name and real_comp != real_first_name:
-                        is_collision = True
-                        break
-
-            if not is_collision:
-                # No collision - safe to use this pseudonym component
-                if real_first_name:
-                    self._component_mappings[(real_first_name, "first_name")] = (
-                        candidate
-                    )
-                return candidate
-
-        # Failed to find collision-free component after max attempts
-        raise RuntimeError(
-            f"Unable to find unique first name component for '{real_first_name}' "
-            f"after {max_attempts} attempts. Library may be exhausted."
+        if not real_first_name:
+            # No component tracking - any first name will do
+            return secrets.choice(candidates)
+
+        # Pick a first name no other real first name uses (collision prevention)
+        candidate = self._select_component(
+            f"first_name:{category}",
+            self.first_names,
+            lambda: candidates,
+            "first_name",
+            real_first_name,
         )
+        if candidate is None:
+            raise RuntimeError(
+                f"Unable to find unique first name component for '{real_first_name}': "
+                f"all {len(candidates)} candidates are in use. "
+                "Library may be exhausted."
+            )
+
+        self._set_component_mapping(real_first_name, "first_name", candidate)
+        self._library_usage["first_name"] += 1
+        return candidate
 
-    def _select_last_name(self, real_last_name: str | None = None) -> str:
+    def _select_last_name(
+        self, real_last_name: str | None = None, derive_from: str | None = None
+    ) -> str:
         """Select last name from library with collision prevention.
 
         Args:
             real_last_name: Real last name component (for collision tracking)
+            derive_from: Real first name of a standalone component; in keyed
+                mode its untracked last name is derived from it
 
         Returns:
             Selected last name
@@ -631,31 +1077,38 @@ class LibraryBasedPseudonymManager(PseudonymManager):
                 # Reuse existing mapping for consistency
                 return self._component_mappings[mapping_key]
 
-        # Select new pseudonym component, ensure no collision
-        max_attempts = 100
-        for attempt in range(max_attempts):
-            candidate = secrets.choice(self.last_names)
-
-            # Check if this pseudonym component already used for different real component
-            is_collision = False
-            for (real_comp, comp_type), pseudo_comp in self._component_mappings.items():
-                if comp_type == "last_name" and pseudo_comp == candidate:
-                    # This pseudonym is already used for a different real last name
-                    if real_last_name and real_comp != real_last_name:
-                        is_collision = True
-                        break
-
-            if not is_collision:
-                # No collision - safe to use this pseudonym component
-                if real_last_name:
-                    self._component_mappings[(real_last_name, "last_name")] = candidate
-                return candidate
-
-        # Failed to find collision-free component after max attempts
-        raise RuntimeError(
-            f"Unable to find unique last name component for '{real_last_name}' "
-            f"after {max_attempts} attempts. Library may be exhausted."
+        if not real_last_name:
+            # No component tracking - any last name will do
+            if self._deriver is not None and derive_from:
+                derived = self._derive_candidate(
+                    "last_name",
+                    self.last_names,
+                    lambda: self.last_names,
+                    "standalone_last_name",
+                    derive_from,
+                )
+                if derived is not None:
+                    return derived
+            return secrets.choice(self.last_names)
+
+        # Pick a last name no other real last name uses (collision prevention)
+        candidate = self._select_component(
+            "last_name",
+            self.last_names,
+            lambda: self.last_names,
+            "last_name",
+            real_last_name,
         )
+        if candidate is None:
+            raise RuntimeError(
+                f"Unable to find unique last name component for '{real_last_name}': "
+                f"all {len(self.last_names)} candidates are in use. "
+                "Library may be exhausted."
+            )
+
+        self._set_component_mapping(real_last_name, "last_name", candidate)
+        self._library_usage["last_name"] += 1
+        return candidate
 
     def _select_location(self) -> str:
         """Select location pseudonym from library with collision prevention.
@@ -669,24 +1122,21 @@ class LibraryBasedPseudonymManager(PseudonymManager):
         if not self.locations:
             raise RuntimeError("No locations available in library")
 
-        # Flatten all location categories into single candidate list
-        candidates = self._flatten_location_list(self.locations)
+        candidate = self._draw_unused(
+            "location",
+            self.locations,
+            self._all_locations,
+            lambda name: name not in self._used_pseudonyms,
+        )
+        if candidate is not None:
+            self._library_usage["location"] += 1
+            return candidate
 
-        if not candidates:
+        if not self._all_locations():
             raise RuntimeError("No location candidates available in library")
 
-        # Select with collision prevention
-        max_attempts = 100
-        for attempt in range(max_attempts):
-            candidate = secrets.choice(candidates)
-            if candidate not in self._used_pseudonyms:
-                return candidate
-
         # Library exhausted - use fallback naming (Location-001, Location-002, etc.)
-        logger.warning(
-            "location_library_exhausted",
-            max_attempts=max_attempts,
-        )
+        logger.warning("location_library_exhausted")
         return self._generate_fallback_name("LOCATION")
 
     def _select_organization(self) -> str:
@@ -701,24 +1151,21 @@ class LibraryBasedPseudonymManager(PseudonymManager):
         if not self.organizations:
             raise RuntimeError("No organizations available in library")
 
-        # Flatten all organization categories into single candidate list
-        candidates = self._flatten_organization_list(self.organizations)
+        candidate = self._draw_unused(
+            "organization",
+            self.organizations,
+            self._all_organizations,
+            lambda name: name not in self._used_pseudonyms,
+        )
+        if candidate is not None:
+            self._library_usage["organization"] += 1
+            return candidate
 
-        if not candidates:
+        if not self._all_organizations():
             raise RuntimeError("No organization candidates available in library")
 
-        # Select with collision prevention
-        max_attempts = 100
-        for attempt in range(max_attempts):
-            candidate = secrets.choice(candidates)
-            if candidate not in self._used_pseudonyms:
-                return candidate
-
         # Library exhausted - use fallback naming (Org-001, Org-002, etc.)
-        logger.warning(
-            "org_library_exhausted",
-            max_attempts=max_attempts,
-        )
+        logger.warning("org_library_exhausted")
         return self._generate_fallback_name("ORG")
 
     def _generate_fallback_name(self, entity_type: str) -> str:
@@ -759,75 +1206,54 @@ class LibraryBasedPseudonymManager(PseudonymManager):
         )
 
     def load_existing_mappings(
-        self, existing_entities: list[Any]
+        self,
+        existing_entities: list[Any],
+        counters: Mapping[str, int] | None = None,
     ) -> None:  # pragma: no cover
         """Load existing component mappings from database to prevent collisions.
 
         Reconstructs _component_mappings from existing database entities to ensure
         new assignments don't collide with previously assigned pseudonyms.
 
-        Also restores fallback counters from existing fallback-style pseudonyms
-        (e.g., "Org-001", "Location-002") to ensure new fallback names don't collide.
+        Also restores fallback and neutral_id counters (e.g., "Org-001",
+        "PER-002") so new counter-based names don't collide. When the persisted
+        counters are passed, they are used directly; otherwise they are
+        recovered by scanning every full pseudonym.
 
         Args:
             existing_entities: List of Entity objects from MappingRepository.find_all()
+            counters: Persisted counters from MappingRepository.get_counters()
         """
-        import re
-
         loaded_components = 0
-
-        # Pattern to match fallback-style pseudonyms: "Person-001", "Location-002", "Org-003"
-        fallback_pattern = re.compile(r"^(Person|Location|Org)-(\d+)$")
-
-        # Pattern to match neutral_id pseudonyms: "PER-001", "LOC-002", "ORG-003"
-        neutral_id_pattern = re.compile(r"^(PER|LOC|ORG)-(\d+)$")
-        _neutral_id_prefix_to_type = {"PER": "PERSON", "LOC": "LOCATION", "ORG": "ORG"}
+        # Pools are rebuilt from the loaded state on next use
+        self._candidate_pools.clear()
 
         for entity in existing_entities:
             # Only PERSON entities have component-level tracking
             if entity.entity_type == "PERSON":
                 # Extract real components and pseudonym components
                 if entity.first_name and entity.pseudonym_first:
-                    key = (entity.first_name, "first_name")
-                    self._component_mappings[key] = entity.pseudonym_first
+                    self._set_component_mapping(
+                        entity.first_name, "first_name", entity.pseudonym_first
+                    )
                     loaded_components += 1
 
                 if entity.last_name and entity.pseudonym_last:
-                    key = (entity.last_name, "last_name")
-                    self._component_mappings[key] = entity.pseudonym_last
+                    self._set_component_mapping(
+                        entity.last_name, "last_name", entity.pseudonym_last
+                    )
                     loaded_components += 1
 
             # Track full pseudonym as used
             self._used_pseudonyms.add(entity.pseudonym_full)
 
-            # Check if this is a fallback-style pseudonym and update counter
-            match = fallback_pattern.match(entity.pseudonym_full)
-            if match:
-                entity_type_str = match.group(1).upper()
-                counter_value = int(match.group(2))
-
-                # Update counter to max of current and loaded value
-                if entity_type_str in self._fallback_counters:
-                    if counter_value > self._fallback_counters[entity_type_str]:
-                        self._fallback_counters[entity_type_str] = counter_value
-                        logger.debug(
-                            "fallback_counter_updated",
-                            entity_type=entity_type_str,
-                            counter=counter_value,
-                        )
-
-            # Check if this is a neutral_id pseudonym and update generator counter
-            nid_match = neutral_id_pattern.match(entity.pseudonym_full)
-            if nid_match and self._neutral_id_generator is not None:
-                nid_entity_type = _neutral_id_prefix_to_type[nid_match.group(1)]
-                nid_counter = int(nid_match.group(2))
-                self._neutral_id_generator.set_counter(
-                    nid_entity_type,
-                    max(
-                        nid_counter,
-                        self._neutral_id_generator.get_counter(nid_entity_type),
-                    ),
-                )
+        self._recount_library_usage()
+
+        if counters is None:
+            counters = extract_counter_values(
+                entity.pseudonym_full for entity in existing_entities
+            )
+        self.load_counters(counters)
 
         logger.info(
             "existing_mappings_loaded",
@@ -836,8 +1262,44 @@ class LibraryBasedPseudonymManager(PseudonymManager):
             fallback_person=self._fallback_counters["PERSON"],
             fallback_location=self._fallback_counters["LOCATION"],
             fallback_org=self._fallback_counters["ORG"],
+            exhaustion=self.check_exhaustion_by_type(),
         )
 
+    def load_counters(self, counters: Mapping[str, int]) -> None:
+        """Restore fallback and neutral_id counters from persisted values.
+
+        Counters only move forward: each one is set to the maximum of its
+        current value and the loaded value.
+
+        Args:
+            counters: Mapping of counter key (e.g. "fallback:PERSON") to the
+                highest value already issued
+        """
+        for entity_type in ENTITY_TYPES:
+            fallback_value = counters.get(counter_key(FALLBACK_COUNTER, entity_type))
+            if fallback_value and fallback_value > self._fallback_counters[entity_type]:
+                self._fallback_counters[entity_type] = fallback_value
+                logger.debug(
+                    "fallback_counter_updated",
+                    entity_type=entity_type,
+                    counter=fallback_value,
+                )
+
+            nid_value = counters.get(counter_key(NEUTRAL_ID_COUNTER, entity_type))
+            if nid_value and self._neutral_id_generator is not None:
+                self._neutral_id_generator.set_counter(
+                    entity_type,
+                    max(nid_value, self._neutral_id_generator.get_counter(entity_type)),
+                )
+
+    def release_reserved_ids(self) -> None:
+        """Give back unused reserved neutral_id blocks (no-op for other themes).
+
+        Call once the identifiers issued so far are saved or discarded.
+        """
+        if self._neutral_id_generator is not None:
+            self._neutral_id_generator.release_reservations()
+
     def check_exhaustion(self) -> float:
         """Get library exhaustion percentage.
 
@@ -855,33 +1317,32 @@ class LibraryBasedPseudonymManager(PseudonymManager):
         if self.theme is None or not self.last_names:
             return 0.0
 
-        # Calculate total possible combinations for PERSON entities
-        total_first_names = (
-            len(self.first_names["male"])
-            + len(self.first_names["female"])
-            + len(self.first_names["neutral"])
-        )
-
-        if total_first_names == 0:
-            # Only last names available (edge case)
-            person_combinations = len(self.last_names)
-        else:
-            # PERSON entities use first + last combinations
-            person_combinations = total_first_names * len(self.last_names)
+        # Precomputed when the library was loaded
+        return len(self._used_pseudonyms) / self._library.total_combinations
 
-        # Calculate total available LOCATION pseudonyms
-        location_combinations = len(self._flatten_location_list(self.locations))
+    def check_exhaustion_by_type(self) -> dict[str, float]:
+        """Get library exhaustion per entity type.
 
-        # Calculate total available ORG pseudonyms
-        org_combinations = len(self._flatten_organization_list(self.organizations))
+        Each ratio is the share of the type's library names already in use:
+        distinct first/last name components for PERSON (whichever is higher),
+        locations for LOCATION and organizations for ORG. New PERSON
+        components fail once a ratio reaches 1.0; LOCATION and ORG switch to
+        fallback names (``Location-001``, ...). Counters are maintained
+        incrementally, so this is cheap enough to call per assignment.
 
-        # Total pool includes PERSON, LOCATION, and ORG pseudonyms
-        total_combinations = (
-            person_combinations + location_combinations + org_combinations
-        )
-
-        # Calculate exhaustion percentage
-        if total_combinations == 0:
-            return 1.0  # Fully exhausted
-
-        return len(self._used_pseudonyms) / total_combinations
+        Returns:
+            Mapping of entity type (PERSON, LOCATION, ORG) to a float between
+            0.0 (unused) and 1.0 (fully exhausted)
+        """
+        if self.theme is None or self.theme == "neutral_id":
+            return {entity_type: 0.0 for entity_type in LIBRARY_CATEGORIES}
+
+        ratios: dict[str, float] = {}
+        for entity_type, categories in LIBRARY_CATEGORIES.items():
+            ratio = 0.0
+            for category in categories:
+                capacity = len(self._library_names(category))
+                used = self._library_usage[category]
+                ratio = max(ratio, min(used / capacity, 1.0) if capacity else 1.0)
+            ratios[entity_type] = ratio
+        return ratios
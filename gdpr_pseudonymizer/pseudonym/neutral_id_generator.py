@@ -2,6 +2,16 @@
 
 from __future__ import annotations
 
+from typing import Protocol
+
+from gdpr_pseudonymizer.utils.pseudonym_counters import NEUTRAL_ID_COUNTER, counter_key
+
+# Reserved blocks double from the minimum to the maximum size while an
+# entity type keeps consuming identifiers, so a short document leaves at
+# most a small gap when concurrent workers interleave their reservations
+MIN_RESERVATION_BLOCK = 16
+MAX_RESERVATION_BLOCK = 256
+
 # Mapping from entity type to short prefix
 _ENTITY_PREFIX: dict[str, str] = {
     "PERSON": "PER",
@@ -10,20 +20,57 @@ _ENTITY_PREFIX: dict[str, str] = {
 }
 
 
+class CounterRangeStore(Protocol):
+    """Shared store handing out disjoint blocks of counter values.
+
+    Implemented by MappingRepository (persisted in ``pseudonym_counters``).
+    """
+
+    def reserve_counter_range(self, key: str, size: int) -> int:
+        """Reserve *size* consecutive values of counter *key*; return the first."""
+        ...
+
+    def release_counter_range(self, key: str, first: int, last: int) -> None:
+        """Give back the block [*first*, *last*] if nothing was reserved after it."""
+        ...
+
+
 class NeutralIdPseudonymGenerator:
     """Generate sequential identifiers like PER-001, LOC-001, ORG-001.
 
     Each entity type maintains its own independent counter.
     Counters start at 0; the first call to ``generate()`` returns 001.
+
+    With a ``CounterRangeStore``, identifiers are issued from blocks reserved
+    in the store, so concurrent generators sharing a database never issue
+    the same identifier; call ``release_reservations()`` when done so an
+    unused tail can be handed out again.
     """
 
-    def __init__(self) -> None:
-        """Initialize with all counters at zero."""
+    def __init__(
+        self,
+        ranges: CounterRangeStore | None = None,
+        max_block_size: int = MAX_RESERVATION_BLOCK,
+    ) -> None:
+        """Initialize with all counters at zero.
+
+        Args:
+            ranges: Store to reserve identifier blocks from (None issues
+                identifiers from the local counters only)
+            max_block_size: Largest block reserved at once
+        """
         self._counters: dict[str, int] = {
             "PERSON": 0,
             "LOCATION": 0,
             "ORG": 0,
         }
+        self._ranges = ranges
+        self._max_block_size = max_block_size
+        # Current reserved block per entity type: (first, last)
+        self._blocks: dict[str, tuple[int, int]] = {}
+        self._next_block_size = dict.fromkeys(
+            self._counters, min(MIN_RESERVATION_BLOCK, max_block_size)
+        )
 
     def generate(self, entity_type: str) -> str:
         """Increment counter for *entity_type* and return the next identifier.
@@ -43,14 +90,45 @@ class NeutralIdPseudonymGenerator:
                 f"Valid types: {', '.join(sorted(_ENTITY_PREFIX))}"
             )
 
+        if self._ranges is not None:
+            block = self._blocks.get(entity_type)
+            if block is None or self._counters[entity_type] >= block[1]:
+                self._reserve_block(entity_type)
+
         self._counters[entity_type] += 1
         prefix = _ENTITY_PREFIX[entity_type]
         return f"{prefix}-{self._counters[entity_type]:03d}"
 
+    def _reserve_block(self, entity_type: str) -> None:
+        """Reserve the next block for *entity_type* and continue from its start."""
+        assert self._ranges is not None
+        size = self._next_block_size[entity_type]
+        first = self._ranges.reserve_counter_range(
+            counter_key(NEUTRAL_ID_COUNTER, entity_type), size
+        )
+        self._blocks[entity_type] = (first, first + size - 1)
+        self._counters[entity_type] = first - 1
+        self._next_block_size[entity_type] = min(size * 2, self._max_block_size)
+
+    def release_reservations(self) -> None:
+        """Give back the current blocks to the store.
+
+        Each block is only rewound if no block was reserved after it; either
+        way the next ``generate()`` reserves a new block.
+        """
+        if self._ranges is None:
+            return
+        for entity_type, (first, last) in self._blocks.items():
+            self._ranges.release_counter_range(
+                counter_key(NEUTRAL_ID_COUNTER, entity_type), first, last
+            )
+        self._blocks.clear()
+
     def reset(self) -> None:
         """Reset all counters to zero."""
         for key in self._counters:
             self._counters[key] = 0
+        self._blocks.clear()
 
     def get_counter(self, entity_type: str) -> int:
         """Return the current counter value for *entity_type*.
@@ -0,0 +1,36 @@
+"""Hit/miss counters shared by the in-memory caches."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of a cache's hit and miss counters.
+
+    Used by the paragraph detection cache and the title/preposition
+    normalization cache. Subtracting an earlier snapshot gives the counts
+    for one batch or document.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that had to be computed
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def total(self) -> int:
+        """Lookups made."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction answered from the cache (0.0 when nothing was looked up)."""
+        return self.hits / self.total if self.total else 0.0
+
+    def __sub__(self, other: CacheStats) -> CacheStats:
+        """Counters accumulated since an earlier snapshot."""
+        return CacheStats(self.hits - other.hits, self.misses - other.misses)
@@ -10,6 +10,9 @@ See Story 4.6.1 (R2) for rationale and R2b for preposition pattern analysis.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
+
+from gdpr_pseudonymizer.utils.cache_stats import CacheStats
 
 # French title pattern for entity normalization
 # Matches common French honorifics and professional titles
@@ -26,12 +29,55 @@ FRENCH_TITLE_PATTERN = r"\b(?:Docteur|Professeur|Madame|Monsieur|Mademoiselle|Ma
 # Two groups: (1) d'/l' elisions (no trailing space needed) (2) word prepositions (\s+ required)
 FRENCH_PREPOSITION_PATTERN = r"^[\s]*(?:(?:d'|l')|(?:aux|au|des|du|de|à|en)\s+)"
 
+_TITLE_RE = re.compile(FRENCH_TITLE_PATTERN, flags=re.IGNORECASE)
+_PREPOSITION_RE = re.compile(FRENCH_PREPOSITION_PATTERN, flags=re.IGNORECASE)
+
+# Distinct (text, normalization) pairs memoized process-wide (LRU)
+NORMALIZATION_CACHE_SIZE = 65_536
+
+
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
+def _normalize(text: str, kind: str) -> str:
+    """Memoized normalization shared by detection, grouping and resolution.
+
+    The same entity texts are normalized many times per document (detector
+    deduplication, title-only filtering, grouping, preview, validation and
+    resolution), so results are cached process-wide per (text, kind).
+    """
+    if kind == "prepositions":
+        return _PREPOSITION_RE.sub("", text).strip()
+    normalized = text
+    while True:
+        stripped = _TITLE_RE.sub("", normalized).strip()
+        if stripped == normalized:
+            return normalized
+        normalized = stripped
+
+
+def normalization_cache_stats() -> CacheStats:
+    """Cumulative normalization cache counters for this process.
+
+    Take differences between two snapshots to get the counts for one
+    document or batch.
+
+    Returns:
+        CacheStats snapshot
+    """
+    info = _normalize.cache_info()
+    return CacheStats(info.hits, info.misses)
+
+
+def clear_normalization_cache() -> None:
+    """Drop memoized normalizations and reset the counters."""
+    _normalize.cache_clear()
+
 
 def strip_french_titles(text: str) -> str:
     """Remove French titles/honorifics from entity text.
 
     Strips titles iteratively to handle multiple stacked titles
-    (e.g., "Dr. Pr. Marie Dubois" → "Marie Dubois").
+    (e.g., "Dr. Pr. Marie Dubois" → "Marie Dubois"). Results are memoized
+    (see normalization_cache_stats()).
 
     Args:
         text: Entity text potentially containing titles
@@ -39,21 +85,14 @@ def strip_french_titles(text: str) -> str:
     Returns:
         Text with all leading titles removed
     """
-    normalized = text
-    while True:
-        stripped = re.sub(
-            FRENCH_TITLE_PATTERN, "", normalized, flags=re.IGNORECASE
-        ).strip()
-        if stripped == normalized:
-            break
-        normalized = stripped
-    return normalized
+    return _normalize(text, "titles")
 
 
 def strip_french_prepositions(text: str) -> str:
     """Remove leading French prepositions from location entity text.
 
-    Only strips from the beginning of the text.
+    Only strips from the beginning of the text. Results are memoized
+    (see normalization_cache_stats()).
 
     Examples:
         "à Paris" → "Paris"
@@ -68,5 +107,4 @@ def strip_french_prepositions(text: str) -> str:
     Returns:
         Text with leading prepositions removed
     """
-    stripped = re.sub(FRENCH_PREPOSITION_PATTERN, "", text, flags=re.IGNORECASE).strip()
-    return stripped
+    return _normalize(text, "prepositions")
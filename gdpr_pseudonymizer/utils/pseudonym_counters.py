@@ -0,0 +1,96 @@
+"""Counter-based pseudonym formats and their persisted counter keys.
+
+Two pseudonym families are generated from monotonically increasing counters:
+
+- Fallback names issued when a themed library is exhausted
+  ("Person-001", "Location-002", "Org-003")
+- neutral_id identifiers ("PER-001", "LOC-002", "ORG-003")
+
+The highest value issued per family and entity type is persisted in the
+``pseudonym_counters`` table under keys like ``"fallback:PERSON"`` or
+``"neutral_id:LOCATION"``, so that a new session can resume counting without
+decrypting and scanning every stored mapping.
+
+neutral_id identifiers are additionally handed out in reserved ranges: a
+``"reserved:neutral_id:PERSON"`` row is a cursor that concurrent workers
+advance atomically to claim blocks of values no other worker will issue.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+ENTITY_TYPES = ("PERSON", "LOCATION", "ORG")
+
+FALLBACK_COUNTER = "fallback"
+NEUTRAL_ID_COUNTER = "neutral_id"
+
+# Pattern to match fallback-style pseudonyms: "Person-001", "Location-002", "Org-003"
+FALLBACK_PATTERN = re.compile(r"^(Person|Location|Org)-(\d+)$")
+
+# Pattern to match neutral_id pseudonyms: "PER-001", "LOC-002", "ORG-003"
+NEUTRAL_ID_PATTERN = re.compile(r"^(PER|LOC|ORG)-(\d+)$")
+_NEUTRAL_ID_PREFIX_TO_TYPE = {"PER": "PERSON", "LOC": "LOCATION", "ORG": "ORG"}
+
+
+def counter_key(family: str, entity_type: str) -> str:
+    """Build the persisted counter key for a pseudonym family and entity type.
+
+    Args:
+        family: FALLBACK_COUNTER or NEUTRAL_ID_COUNTER
+        entity_type: PERSON, LOCATION or ORG
+
+    Returns:
+        Counter key, e.g. "fallback:PERSON"
+    """
+    return f"{family}:{entity_type}"
+
+
+def reservation_key(key: str) -> str:
+    """Build the key of the range reservation cursor for a counter.
+
+    Args:
+        key: Counter key, e.g. "neutral_id:PERSON"
+
+    Returns:
+        Reservation cursor key, e.g. "reserved:neutral_id:PERSON"
+    """
+    return f"reserved:{key}"
+
+
+def extract_counter_values(pseudonyms: Iterable[str | None]) -> dict[str, int]:
+    """Compute the highest counter value used by counter-based pseudonyms.
+
+    Args:
+        pseudonyms: Full pseudonyms (non-matching values are ignored)
+
+    Returns:
+        Mapping of counter key to highest value found (only keys seen)
+
+    Example:
+        >>> extract_counter_values(["Person-004", "PER-012", "Leia Organa"])
+        {'fallback:PERSON': 4, 'neutral_id:PERSON': 12}
+    """
+    counters: dict[str, int] = {}
+
+    for pseudonym in pseudonyms:
+        if not pseudonym:
+            continue
+
+        match = FALLBACK_PATTERN.match(pseudonym)
+        if match:
+            key = counter_key(FALLBACK_COUNTER, match.group(1).upper())
+        else:
+            match = NEUTRAL_ID_PATTERN.match(pseudonym)
+            if not match:
+                continue
+            key = counter_key(
+                NEUTRAL_ID_COUNTER, _NEUTRAL_ID_PREFIX_TO_TYPE[match.group(1)]
+            )
+
+        value = int(match.group(2))
+        if value > counters.get(key, 0):
+            counters[key] = value
+
+    return counters
@@ -0,0 +1,137 @@
+"""Precompiled cache of bundled detection and pseudonym resources.
+
+Parsing ``detection_patterns.yaml`` with PyYAML and building the dictionary
+tries dominates detector start-up, and every batch worker repeats it. The
+processed form of each resource (plain dicts, lists and sets) is stored with
+``marshal`` in a per-user cache directory and reused while the source file is
+unchanged.
+
+Cache files are content-addressed: their name is a hash of the resource kind,
+the cache format version, the Python version and the source file bytes, so an
+edited resource (or an upgraded interpreter) simply misses the cache. Any
+unreadable or mismatched entry is rebuilt from the source; a cache directory
+that cannot be written only costs the speed-up.
+
+Environment variables:
+    GDPR_PSEUDO_CACHE_DIR: Cache directory override
+    GDPR_PSEUDO_NO_CACHE: Set to "1" to always parse the source files
+"""
+
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from gdpr_pseudonymizer.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when the payload layout of any resource kind changes
+RESOURCE_CACHE_VERSION = 1
+
+CACHE_DIR_ENV = "GDPR_PSEUDO_CACHE_DIR"
+NO_CACHE_ENV = "GDPR_PSEUDO_NO_CACHE"
+
+
+def resource_cache_dir() -> Path:
+    """Return the directory holding precompiled resources.
+
+    Returns:
+        $GDPR_PSEUDO_CACHE_DIR if set, else the platform user cache directory
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        base = Path(os.environ["LOCALAPPDATA"])
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "gdpr-pseudonymizer" / "resources"
+
+
+def _cache_path(kind: str, source: bytes) -> Path:
+    """Content-addressed cache file for a resource."""
+    digest = hashlib.sha256()
+    for part in (
+        kind.encode("utf-8"),
+        str(RESOURCE_CACHE_VERSION).encode("ascii"),
+        f"{sys.version_info[0]}.{sys.version_info[1]}/{marshal.version}".encode(),
+    ):
+        digest.update(part)
+        digest.update(b"\0")
+    digest.update(source)
+    return resource_cache_dir() / f"{kind}-{digest.hexdigest()[:32]}.marshal"
+
+
+def _read(path: Path, kind: str) -> Any:
+    """Read a cache entry, or return None if missing or invalid."""
+    try:
+        entry = marshal.loads(path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if (
+        not isinstance(entry, tuple)
+        or len(entry) != 3
+        or entry[:2] != (RESOURCE_CACHE_VERSION, kind)
+    ):
+        return None
+    return entry[2]
+
+
+def _write(path: Path, kind: str, payload: Any) -> None:
+    """Atomically write a cache entry (failures are logged and ignored)."""
+    try:
+        data = marshal.dumps((RESOURCE_CACHE_VERSION, kind, payload))
+    except ValueError as e:
+        logger.debug("resource_cache_unserializable", kind=kind, error=str(e))
+        return
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        logger.debug("resource_cache_write_failed", path=str(path), error=str(e))
+
+
+def load_resource(path: Path, kind: str, build: Callable[[bytes], Any]) -> Any:
+    """Load the processed form of a resource file, using the cache if valid.
+
+    Args:
+        path: Source resource file
+        kind: Resource kind, identifying the payload layout (e.g. "names")
+        build: Turns the source file bytes into a marshal-serializable payload;
+            its exceptions propagate and nothing is cached
+
+    Returns:
+        Payload returned by build (from the cache or freshly built)
+
+    Raises:
+        OSError: If the source file cannot be read
+    """
+    source = path.read_bytes()
+    if os.environ.get(NO_CACHE_ENV) == "1":
+        return build(source)
+
+    cache_path = _cache_path(kind, source)
+    payload = _read(cache_path, kind)
+    if payload is not None:
+        logger.debug("resource_cache_hit", kind=kind, path=str(path))
+        return payload
+
+    payload = build(source)
+    _write(cache_path, kind, payload)
+    logger.debug("resource_cache_miss", kind=kind, path=str(path))
+    return payload
@@ -166,6 +166,25 @@ def _load_corpus_documents() -> list[tuple[str, str, list[GroundTruthEntity]]]:
     return docs
 
 
+def run_corpus_detection(detector: HybridDetector) -> list[DocumentResult]:
+    """Run detection on all corpus documents and compute matching results."""
+    results: list[DocumentResult] = []
+    for doc_name, text, ground_truth in _load_corpus_documents():
+        detected = detector.detect_entities(text)
+        tp_pairs, fp_list, fn_list = match_entities(detected, ground_truth)
+        results.append(
+            DocumentResult(
+                doc_name=doc_name,
+                detected=detected,
+                ground_truth=ground_truth,
+                true_positives=tp_pairs,
+                false_positives=fp_list,
+                false_negatives=fn_list,
+            )
+        )
+    return results
+
+
 # ---------------------------------------------------------------------------
 # Session-scoped fixtures (heavy lifting done once per test session)
 # ---------------------------------------------------------------------------
@@ -182,19 +201,15 @@ def hybrid_detector() -> HybridDetector:
 @pytest.fixture(scope="session")
 def corpus_results(hybrid_detector: HybridDetector) -> list[DocumentResult]:
     """Run detection on all 25 documents and compute matching results."""
-    docs = _load_corpus_documents()
-    results: list[DocumentResult] = []
-    for doc_name, text, ground_truth in docs:
-        detected = hybrid_detector.detect_entities(text)
-        tp_pairs, fp_list, fn_list = match_entities(detected, ground_truth)
-        results.append(
-            DocumentResult(
-                doc_name=doc_name,
-                detected=detected,
-                ground_truth=ground_truth,
-                true_positives=tp_pairs,
-                false_positives=fp_list,
-                false_negatives=fn_list,
-            )
-        )
+    return run_corpus_detection(hybrid_detector)
+
+
+@pytest.fixture(scope="session")
+def profile_corpus_results() -> dict[str, list[DocumentResult]]:
+    """Corpus results for the non-default detection profiles."""
+    results: dict[str, list[DocumentResult]] = {}
+    for profile in ("balanced", "fast"):
+        detector = HybridDetector(detection_profile=profile)
+        detector.load_model("fr_core_news_lg")
+        results[profile] = run_corpus_detection(detector)
     return results
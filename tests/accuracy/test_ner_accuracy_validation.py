@@ -378,3 +378,63 @@ class TestPerDocumentBreakdown:
                 f"  {r.doc_name:40s} P={m.precision:.2f} R={m.recall:.2f} "
                 f"F1={m.f1:.2f} TP={tp} FP={fp} FN={fn}"
             )
+
+
+@pytest.mark.accuracy
+@pytest.mark.slow
+class TestDetectionProfiles:
+    """Accuracy of the reduced spaCy pipelines (--detection-profile)."""
+
+    @pytest.mark.xfail(
+        reason="NFR8 is aspirational — see TestOverallMetrics. Reported for "
+        "comparison with the accurate profile.",
+        strict=False,
+    )
+    def test_balanced_profile_metrics(
+        self,
+        corpus_results: list[DocumentResult],
+        profile_corpus_results: dict[str, list[DocumentResult]],
+    ) -> None:
+        """Senter replaces the parser's sentence boundaries; report the delta."""
+        base = _aggregate(corpus_results)
+        balanced = _aggregate(profile_corpus_results["balanced"])
+        changed = [
+            accurate.doc_name
+            for accurate, other in zip(
+                corpus_results, profile_corpus_results["balanced"]
+            )
+            if other.detected != accurate.detected
+        ]
+        print(
+            f"\n[balanced] P={balanced.precision:.4f} R={balanced.recall:.4f} "
+            f"F1={balanced.f1:.4f} FN%={balanced.fn_rate:.2f} "
+            f"FP%={balanced.fp_rate:.2f} (accurate F1={base.f1:.4f}); "
+            f"{len(changed)}/{len(corpus_results)} documents differ"
+        )
+        assert balanced.fn_rate < 10, (
+            f"NFR8 FAIL (balanced profile): FN rate {balanced.fn_rate:.2f}% >= 10% "
+            f"(TP={balanced.tp}, FN={balanced.fn})"
+        )
+
+    @pytest.mark.xfail(
+        reason="NFR8 is aspirational — see TestOverallMetrics. Reported for "
+        "comparison with the accurate profile.",
+        strict=False,
+    )
+    def test_fast_profile_metrics(
+        self,
+        corpus_results: list[DocumentResult],
+        profile_corpus_results: dict[str, list[DocumentResult]],
+    ) -> None:
+        """Fast profile skips POS disambiguation; report the accuracy delta."""
+        base = _aggregate(corpus_results)
+        fast = _aggregate(profile_corpus_results["fast"])
+        print(
+            f"\n[fast] P={fast.precision:.4f} R={fast.recall:.4f} "
+            f"F1={fast.f1:.4f} FN%={fast.fn_rate:.2f} FP%={fast.fp_rate:.2f} "
+            f"(accurate F1={base.f1:.4f})"
+        )
+        assert fast.fn_rate < 10, (
+            f"NFR8 FAIL (fast profile): FN rate {fast.fn_rate:.2f}% >= 10% "
+            f"(TP={fast.tp}, FN={fast.fn})"
+        )
@@ -16,12 +16,16 @@ os.environ.setdefault("GDPR_PSEUDO_LANG", "en")
 
 
 @pytest.fixture(scope="session", autouse=True)
-def configure_environment():
+def configure_environment(tmp_path_factory: pytest.TempPathFactory):
     """
     Set environment variables before any tests run.
 
     OMP_NUM_THREADS=1 helps prevent memory access violations
     in spaCy's underlying Thinc library on Windows systems.
+
+    The precompiled resource cache is kept in a session temp directory so
+    tests never read or write the user's cache.
     """
     os.environ["OMP_NUM_THREADS"] = "1"
+    os.environ["GDPR_PSEUDO_CACHE_DIR"] = str(tmp_path_factory.mktemp("resource_cache"))
     yield
@@ -6,6 +6,12 @@ Common utility functions used across test modules.
 from __future__ import annotations
 
 import re
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from gdpr_pseudonymizer.pseudonym.library_manager import (
+        LibraryBasedPseudonymManager,
+    )
 
 _ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
 
@@ -17,3 +23,26 @@ def strip_ansi(text: str) -> str:
     This helper removes those codes so tests can match plain text.
     """
     return _ANSI_RE.sub("", text)
+
+
+def replace_library(manager: LibraryBasedPseudonymManager, **groups: Any) -> None:
+    """Give a pseudonym manager its loaded library with some groups replaced.
+
+    Managers read their name lists from an immutable ``LoadedLibrary``; this
+    builds a new one from the current library and the given overrides
+    (``first_names``, ``last_names``, ``locations`` or ``organizations``),
+    e.g. to force exhaustion with a tiny list.
+    """
+    from gdpr_pseudonymizer.pseudonym.library_manager import LoadedLibrary
+
+    library = manager._library
+    manager._library = LoadedLibrary.from_data(
+        {
+            "theme": library.theme,
+            "first_names": library.first_names,
+            "last_names": library.last_names,
+            "locations": library.locations,
+            "organizations": library.organizations,
+            **groups,
+        }
+    )
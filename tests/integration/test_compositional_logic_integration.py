@@ -12,6 +12,7 @@ Target: 80% integration path coverage for compositional logic
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from unittest.mock import MagicMock
 
 import pytest
@@ -21,6 +22,22 @@ from gdpr_pseudonymizer.pseudonym.assignment_engine import CompositionalPseudony
 from gdpr_pseudonymizer.pseudonym.library_manager import LibraryBasedPseudonymManager
 
 
+def _component_lookup(
+    assigned_entities: list[Entity],
+) -> Callable[[str, str], str | None]:
+    """Mock repository lookup (pseudonym component of first match)."""
+
+    def find_component_pseudonym(component: str, component_type: str) -> str | None:
+        for e in assigned_entities:
+            if component_type == "first_name" and e.first_name == component:
+                return e.pseudonym_first
+            if component_type == "last_name" and e.last_name == component:
+                return e.pseudonym_last
+        return None
+
+    return find_component_pseudonym
+
+
 class TestCompositionalLogicIntegration:
     """Integration tests for compositional pseudonymization workflow."""
 
@@ -78,17 +95,9 @@ class TestCompositionalLogicIntegration:
         # Track assigned entities for simulating repository state
         assigned_entities: list[Entity] = []
 
-        def mock_find_by_component(component: str, component_type: str) -> list[Entity]:
-            """Mock repository lookup that searches assigned entities."""
-            matches = []
-            for entity in assigned_entities:
-                if component_type == "first_name" and entity.first_name == component:
-                    matches.append(entity)
-                elif component_type == "last_name" and entity.last_name == component:
-                    matches.append(entity)
-            return matches
-
-        mock_mapping_repository.find_by_component.side_effect = mock_find_by_component
+        mock_mapping_repository.find_component_pseudonym.side_effect = (
+            _component_lookup(assigned_entities)
+        )
 
         # Entity 1: "Marie Dubois" (new, no existing components)
         assignment_1 = compositional_engine.assign_compositional_pseudonym(
@@ -197,16 +206,9 @@ class TestCompositionalLogicIntegration:
         # Simulate repository state
         assigned_entities: list[Entity] = []
 
-        def mock_find_by_component(component: str, component_type: str) -> list[Entity]:
-            """Mock repository lookup."""
-            return [
-                e
-                for e in assigned_entities
-                if (component_type == "first_name" and e.first_name == component)
-                or (component_type == "last_name" and e.last_name == component)
-            ]
-
-        mock_mapping_repository.find_by_component.side_effect = mock_find_by_component
+        mock_mapping_repository.find_component_pseudonym.side_effect = (
+            _component_lookup(assigned_entities)
+        )
 
         # Document 1: Process "Pierre Martin"
         assignment_1 = compositional_engine.assign_compositional_pseudonym(
@@ -270,7 +272,7 @@ class TestCompositionalLogicIntegration:
         Verifies neutral, star_wars, and lotr libraries integrate correctly
         with the compositional engine.
         """
-        mock_mapping_repository.find_by_component.return_value = []
+        mock_mapping_repository.find_component_pseudonym.return_value = None
 
         themes = ["neutral", "star_wars", "lotr"]
 
@@ -304,7 +306,7 @@ class TestCompositionalLogicIntegration:
         Verifies that PseudonymAssignment results contain all required fields
         for Entity model persistence, including component-level mappings.
         """
-        mock_mapping_repository.find_by_component.return_value = []
+        mock_mapping_repository.find_component_pseudonym.return_value = None
 
         assignment = compositional_engine.assign_compositional_pseudonym(
             entity_text="Marie Dubois",
@@ -347,16 +349,9 @@ class TestCompositionalLogicIntegration:
         """
         assigned_entities: list[Entity] = []
 
-        def mock_find_by_component(component: str, component_type: str) -> list[Entity]:
-            """Mock repository lookup."""
-            return [
-                e
-                for e in assigned_entities
-                if (component_type == "first_name" and e.first_name == component)
-                or (component_type == "last_name" and e.last_name == component)
-            ]
-
-        mock_mapping_repository.find_by_component.side_effect = mock_find_by_component
+        mock_mapping_repository.find_component_pseudonym.side_effect = (
+            _component_lookup(assigned_entities)
+        )
 
         # Assign multiple pseudonyms
         full_pseudonyms = set()
@@ -419,13 +414,17 @@ class TestCompositionalLogicIntegration:
             theme="star_wars",
         )
 
-        def mock_find_by_component(component: str, component_type: str) -> list[Entity]:
+        def mock_find_component_pseudonym(
+            component: str, component_type: str
+        ) -> str | None:
             """Mock lookup that returns existing Marie mapping."""
             if component == "Marie" and component_type == "first_name":
-                return [existing_entity]
-            return []
+                return existing_entity.pseudonym_first
+            return None
 
-        mock_mapping_repository.find_by_component.side_effect = mock_find_by_component
+        mock_mapping_repository.find_component_pseudonym.side_effect = (
+            mock_find_component_pseudonym
+        )
 
         # Process standalone "Marie"
         assignment = compositional_engine.assign_compositional_pseudonym(
@@ -462,16 +461,9 @@ class TestCompositionalLogicIntegration:
         """
         assigned_entities: list[Entity] = []
 
-        def mock_find_by_component(component: str, component_type: str) -> list[Entity]:
-            """Mock repository lookup."""
-            return [
-                e
-                for e in assigned_entities
-                if (component_type == "first_name" and e.first_name == component)
-                or (component_type == "last_name" and e.last_name == component)
-            ]
-
-        mock_mapping_repository.find_by_component.side_effect = mock_find_by_component
+        mock_mapping_repository.find_component_pseudonym.side_effect = (
+            _component_lookup(assigned_entities)
+        )
 
         # Process entities sequentially
         test_cases = [
@@ -533,16 +525,9 @@ class TestCompositionalLogicIntegration:
         """
         assigned_entities: list[Entity] = []
 
-        def mock_find_by_component(component: str, component_type: str) -> list[Entity]:
-            """Mock repository lookup."""
-            return [
-                e
-                for e in assigned_entities
-                if (component_type == "first_name" and e.first_name == component)
-                or (component_type == "last_name" and e.last_name == component)
-            ]
-
-        mock_mapping_repository.find_by_component.side_effect = mock_find_by_component
+        mock_mapping_repository.find_component_pseudonym.side_effect = (
+            _component_lookup(assigned_entities)
+        )
 
         # First: "Marie Anne Dubois" (three words)
         assignment_1 = compositional_engine.assign_compositional_pseudonym(
@@ -615,7 +600,7 @@ class TestCompositionalLogicIntegration:
         assert org_assignment.pseudonym_full is not None
 
         # Verify repository NOT queried for LOCATION or ORG
-        mock_mapping_repository.find_by_component.assert_not_called()
+        mock_mapping_repository.find_component_pseudonym.assert_not_called()
 
     def test_exhaustion_percentage_propagates_through_compositional_logic(
         self,
@@ -627,7 +612,7 @@ class TestCompositionalLogicIntegration:
         Verifies that as pseudonyms are assigned, exhaustion percentage increases
         and is correctly reflected in PseudonymAssignment results.
         """
-        mock_mapping_repository.find_by_component.return_value = []
+        mock_mapping_repository.find_component_pseudonym.return_value = None
 
         # Assign first pseudonym
         assignment_1 = compositional_engine.assign_compositional_pseudonym(
@@ -667,7 +652,7 @@ class TestCompositionalLogicIntegration:
         Verifies that gender preferences are respected when assigning pseudonyms
         through the compositional engine.
         """
-        mock_mapping_repository.find_by_component.return_value = []
+        mock_mapping_repository.find_component_pseudonym.return_value = None
 
         # Assign with male gender
         male_assignment = compositional_engine.assign_compositional_pseudonym(
@@ -769,16 +754,9 @@ class TestTitleAndCompoundNameIntegration:
         """
         assigned_entities: list[Entity] = []
 
-        def mock_find_by_component(component: str, component_type: str) -> list[Entity]:
-            """Mock repository lookup."""
-            return [
-                e
-                for e in assigned_entities
-                if (component_type == "first_name" and e.first_name == component)
-                or (component_type == "last_name" and e.last_name == component)
-            ]
-
-        mock_mapping_repository.find_by_component.side_effect = mock_find_by_component
+        mock_mapping_repository.find_component_pseudonym.side_effect = (
+            _component_lookup(assigned_entities)
+        )
 
         # First: "Jean-Pierre Martin"
         assignment_1 = compositional_engine.assign_compositional_pseudonym(
@@ -825,16 +803,9 @@ class TestTitleAndCompoundNameIntegration:
         """
         assigned_entities: list[Entity] = []
 
-        def mock_find_by_component(component: str, component_type: str) -> list[Entity]:
-            """Mock repository lookup."""
-            return [
-                e
-                for e in assigned_entities
-                if (component_type == "first_name" and e.first_name == component)
-                or (component_type == "last_name" and e.last_name == component)
-            ]
-
-        mock_mapping_repository.find_by_component.side_effect = mock_find_by_component
+        mock_mapping_repository.find_component_pseudonym.side_effect = (
+            _component_lookup(assigned_entities)
+        )
 
         # First: "Marie Paluel-Marmont"
         assignment_1 = compositional_engine.assign_compositional_pseudonym(
@@ -882,16 +853,9 @@ class TestTitleAndCompoundNameIntegration:
         """
         assigned_entities: list[Entity] = []
 
-        def mock_find_by_component(component: str, component_type: str) -> list[Entity]:
-            """Mock repository lookup."""
-            return [
-                e
-                for e in assigned_entities
-                if (component_type == "first_name" and e.first_name == component)
-                or (component_type == "last_name" and e.last_name == component)
-            ]
-
-        mock_mapping_repository.find_by_component.side_effect = mock_find_by_component
+        mock_mapping_repository.find_component_pseudonym.side_effect = (
+            _component_lookup(assigned_entities)
+        )
 
         # First: "Jean-Pierre Dubois" (compound first name)
         assignment_1 = compositional_engine.assign_compositional_pseudonym(
@@ -939,16 +903,9 @@ class TestTitleAndCompoundNameIntegration:
         """
         assigned_entities: list[Entity] = []
 
-        def mock_find_by_component(component: str, component_type: str) -> list[Entity]:
-            """Mock repository lookup."""
-            return [
-                e
-                for e in assigned_entities
-                if (component_type == "first_name" and e.first_name == component)
-                or (component_type == "last_name" and e.last_name == component)
-            ]
-
-        mock_mapping_repository.find_by_component.side_effect = mock_find_by_component
+        mock_mapping_repository.find_component_pseudonym.side_effect = (
+            _component_lookup(assigned_entities)
+        )
 
         # First: "Dr. Jean-Pierre Dubois"
         assignment_1 = compositional_engine.assign_compositional_pseudonym(
@@ -992,7 +949,7 @@ class TestTitleAndCompoundNameIntegration:
         which is valid - the important thing is that pseudonyms are assigned
         as atomic units.
         """
-        mock_mapping_repository.find_by_component.return_value = []
+        mock_mapping_repository.find_component_pseudonym.return_value = None
 
         themes = ["neutral", "star_wars", "lotr"]
 
@@ -1042,7 +999,7 @@ class TestTitleAndCompoundNameIntegration:
         Note: Pseudonyms may contain hyphens (e.g., "Triple-Zero", "Soo-Tath",
         "Bo-Katan" in Star Wars library) which is valid for character names.
         """
-        mock_mapping_repository.find_by_component.return_value = []
+        mock_mapping_repository.find_component_pseudonym.return_value = None
 
         assignment = compositional_engine.assign_compositional_pseudonym(
             entity_text="Dr. Pr. Jean-Pierre Paluel-Marmont",
@@ -60,7 +60,9 @@ def _create_test_docx(path: Path, text: str = FRENCH_PII_TEXT) -> Path:
 class MockHybridDetector:
     """Mock detector returning predictable entities from French PII text."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self, detection_profile: str = "accurate", paragraph_cache: bool = False
+    ) -> None:
         pass
 
     def load_model(self, model_name: str) -> None:
@@ -140,7 +142,7 @@ def mock_hybrid_detector(monkeypatch: pytest.MonkeyPatch):
     """Use mock detector for deterministic entity detection."""
     monkeypatch.setattr(
         "gdpr_pseudonymizer.core.document_processor.HybridDetector",
-        lambda: MockHybridDetector(),
+        MockHybridDetector,
     )
 
 
@@ -74,7 +74,9 @@ def mock_hybrid_detector_for_deterministic_tests(monkeypatch):
     from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
 
     class MockHybridDetector:
-        def __init__(self):
+        def __init__(
+            self, detection_profile: str = "accurate", paragraph_cache: bool = False
+        ):
             pass
 
         def load_model(self, model_name: str) -> None:
@@ -19,7 +19,11 @@ from gdpr_pseudonymizer.core.document_processor import (
     ProcessingResult,
 )
 from gdpr_pseudonymizer.data.database import init_database
+from gdpr_pseudonymizer.nlp.dictionary_trie import TokenTrie, tokenize
+from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
+from gdpr_pseudonymizer.nlp.geography_dictionary import GeographyDictionary
 from gdpr_pseudonymizer.nlp.hybrid_detector import HybridDetector
+from gdpr_pseudonymizer.nlp.regex_matcher import RegexMatcher
 
 NFR1_THRESHOLD_SECONDS = 30.0
 
@@ -237,3 +241,171 @@ class TestEntityDetectionBenchmark:
             f"Detection-only mean {benchmark.stats['mean']:.2f}s "
             f"exceeds {NFR1_THRESHOLD_SECONDS}s threshold"
         )
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark(group="detection-profiles")
+class TestDetectionProfileBenchmark:
+    """Detection time per spaCy detection profile (accurate/balanced/fast).
+
+    Compare the three results of a single run to measure the speed-up of
+    loading fewer pipeline components.
+    """
+
+    @pytest.mark.parametrize("profile", ["accurate", "balanced", "fast"])
+    def test_entity_detection_by_profile(
+        self,
+        benchmark,  # type: ignore[no-untyped-def]
+        profile: str,
+        performance_test_docs: dict[str, Path],
+    ) -> None:
+        """Benchmark hybrid detection on ~3500-word document per profile."""
+        input_path = performance_test_docs["3500"]
+        assert input_path.exists(), f"Test document not found: {input_path}"
+        text = input_path.read_text(encoding="utf-8")
+
+        detector = HybridDetector(detection_profile=profile)
+        detector.load_model("fr_core_news_lg")
+
+        benchmark.extra_info["document_words"] = "~3500"
+        benchmark.extra_info["detection_profile"] = profile
+
+        entities = benchmark.pedantic(
+            detector.detect_entities,
+            args=(text,),
+            warmup_rounds=1,
+            rounds=10,
+            iterations=1,
+        )
+
+        assert len(entities) > 0, "Detection returned no entities"
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark(group="dictionary-matching")
+class TestDictionaryMatchingBenchmark:
+    """Geography trie scan time versus dictionary size.
+
+    The scan walks the trie from each token for at most the longest entry,
+    so a 35k-entry dictionary (INSEE commune list scale) should cost about
+    the same per document as the bundled one.
+    """
+
+    @pytest.mark.parametrize("dictionary_size", [1_000, 35_000])
+    def test_geography_scan_by_dictionary_size(
+        self,
+        benchmark,  # type: ignore[no-untyped-def]
+        dictionary_size: int,
+        performance_test_docs: dict[str, Path],
+    ) -> None:
+        """Benchmark one geography scan of a ~3500-word document."""
+        input_path = performance_test_docs["3500"]
+        assert input_path.exists(), f"Test document not found: {input_path}"
+        text = input_path.read_text(encoding="utf-8")
+
+        geography = GeographyDictionary()
+        geography.load()
+        names = geography.all_locations | {
+            f"Commune-{i:05d}" for i in range(dictionary_size)
+        }
+        geography._trie = TokenTrie(names)
+        tokens = tokenize(text)
+
+        benchmark.extra_info["document_words"] = "~3500"
+        benchmark.extra_info["dictionary_size"] = len(names)
+
+        spans = benchmark.pedantic(
+            geography.find_locations,
+            args=(tokens,),
+            warmup_rounds=1,
+            rounds=10,
+            iterations=1,
+        )
+
+        assert len(spans) > 0, "Scan returned no locations"
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark(group="regex-patterns")
+class TestPatternScanBenchmark:
+    """Anchor-prefiltered pattern scan versus plain per-pattern finditer."""
+
+    @pytest.mark.parametrize("scan_mode", ["finditer", "anchored"])
+    def test_pattern_scan(
+        self,
+        benchmark,  # type: ignore[no-untyped-def]
+        scan_mode: str,
+        performance_test_docs: dict[str, Path],
+    ) -> None:
+        """Benchmark one scan of the bundled patterns over a ~3500-word document."""
+        input_path = performance_test_docs["3500"]
+        assert input_path.exists(), f"Test document not found: {input_path}"
+        text = input_path.read_text(encoding="utf-8")
+
+        matcher = RegexMatcher()
+        matcher.load_patterns()
+        regexes = [p["regex"] for p in matcher._scanned_patterns]
+
+        def finditer_scan(text: str) -> list[list[tuple[int, int]]]:
+            return [[m.span() for m in regex.finditer(text)] for regex in regexes]
+
+        scan = matcher._scanner.scan if scan_mode == "anchored" else finditer_scan
+        benchmark.extra_info["document_words"] = "~3500"
+        benchmark.extra_info["anchored_patterns"] = matcher._scanner.anchored_count
+
+        spans = benchmark.pedantic(
+            scan,
+            args=(text,),
+            warmup_rounds=1,
+            rounds=10,
+            iterations=1,
+        )
+
+        assert spans == finditer_scan(text)
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark(group="entity-merge")
+class TestEntityMergeBenchmark:
+    """spaCy/regex merge time on very long entity lists."""
+
+    @pytest.mark.parametrize("entity_count", [1_000, 10_000])
+    def test_merge_entities(
+        self,
+        benchmark,  # type: ignore[no-untyped-def]
+        entity_count: int,
+    ) -> None:
+        """Benchmark merging entity_count spaCy and entity_count regex entities."""
+        detector = HybridDetector()
+        texts = ["Marie Dubois", "Dr. Marie Dubois", "Dubois", "Paris"]
+
+        def make_entities() -> tuple[list[DetectedEntity], list[DetectedEntity]]:
+            # Every 20 characters: a spaCy span, and a regex span shifted by
+            # 0-9 characters (exact, partial or no overlap)
+            spacy_entities = [
+                DetectedEntity(texts[i % 4], "PERSON", i * 20, i * 20 + 12)
+                for i in range(entity_count)
+            ]
+            regex_entities = [
+                DetectedEntity(
+                    texts[(i + 1) % 4],
+                    "PERSON",
+                    i * 20 + i % 10,
+                    i * 20 + i % 10 + 12,
+                    source="regex",
+                )
+                for i in range(entity_count)
+            ]
+            return spacy_entities, regex_entities
+
+        benchmark.extra_info["entities_per_source"] = entity_count
+
+        merged = benchmark.pedantic(
+            detector._merge_entities,
+            setup=lambda: (make_entities(), {}),
+            warmup_rounds=1,
+            rounds=5,
+            iterations=1,
+        )
+
+        assert len(merged) >= entity_count
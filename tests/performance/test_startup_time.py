@@ -7,6 +7,7 @@ Story 4.5 - AC3
 
 from __future__ import annotations
 
+import os
 import subprocess
 import sys
 import tempfile
@@ -172,3 +173,59 @@ class TestStartupTime:
                 f"Cold start mean {mean:.3f}s exceeds 60s — "
                 f"possible regression in model loading"
             )
+
+    def test_resource_loading_with_precompiled_cache(self) -> None:
+        """Measure detection/pseudonym resource loading with and without cache.
+
+        Each run is a fresh subprocess timing only the resource loads done by
+        HybridDetector.load_model() and a processing session (patterns,
+        dictionaries, gender lookup, pseudonym library). The first cached run
+        populates the cache; later runs deserialize it.
+        """
+        script = (
+            "import time;"
+            "from gdpr_pseudonymizer.nlp.regex_matcher import RegexMatcher;"
+            "from gdpr_pseudonymizer.pseudonym.gender_detector import GenderDetector;"
+            "from gdpr_pseudonymizer.pseudonym.library_manager import"
+            " LibraryBasedPseudonymManager;"
+            "t0 = time.perf_counter();"
+            "RegexMatcher().load_patterns();"
+            "GenderDetector().load();"
+            "LibraryBasedPseudonymManager().load_library('neutral');"
+            "print(f'{time.perf_counter() - t0:.4f}')"
+        )
+
+        def measure(env: dict[str, str]) -> float:
+            result = subprocess.run(
+                [sys.executable, "-c", script],
+                capture_output=True,
+                text=True,
+                timeout=60,
+                env=env,
+            )
+            return float(result.stdout.strip().splitlines()[-1])
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            base_env = {**os.environ, "GDPR_PSEUDO_CACHE_DIR": cache_dir}
+            uncached = [
+                measure({**base_env, "GDPR_PSEUDO_NO_CACHE": "1"})
+                for _ in range(COLD_START_ITERATIONS)
+            ]
+            measure(base_env)  # populate the cache
+            cached = [measure(base_env) for _ in range(COLD_START_ITERATIONS)]
+
+        uncached_mean = sum(uncached) / len(uncached)
+        cached_mean = sum(cached) / len(cached)
+
+        print(f"\n{'='*60}")
+        print(f"RESOURCE LOADING ({COLD_START_ITERATIONS} iterations)")
+        print(f"{'='*60}")
+        print(f"  Parsed:  {uncached_mean * 1000:.1f}ms")
+        print(f"  Cached:  {cached_mean * 1000:.1f}ms")
+        print(f"  Speedup: {uncached_mean / cached_mean:.2f}x")
+        print(f"{'='*60}")
+
+        assert cached_mean < uncached_mean, (
+            f"Precompiled cache slower than parsing "
+            f"({cached_mean:.4f}s vs {uncached_mean:.4f}s)"
+        )
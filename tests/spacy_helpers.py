@@ -0,0 +1,67 @@
+"""Detectors backed by a blank French spaCy pipeline with an entity ruler.
+
+Detection tests use these instead of fr_core_news_lg, which is not required
+to run the unit tests.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import spacy
+from spacy.language import Language
+
+from gdpr_pseudonymizer.nlp.hybrid_detector import HybridDetector
+from gdpr_pseudonymizer.nlp.spacy_detector import SpaCyDetector
+from gdpr_pseudonymizer.nlp.text_windows import (
+    DEFAULT_WINDOW_CHARS,
+    DEFAULT_WINDOW_OVERLAP,
+)
+
+# (spaCy label, exact phrase) recognized by the entity ruler
+DEFAULT_RULER_PATTERNS: tuple[tuple[str, str], ...] = (
+    ("PER", "Marie Dubois"),
+    ("PER", "Jean Martin"),
+    ("LOC", "Paris"),
+    ("LOC", "Lyon"),
+)
+
+
+def ruler_pipeline(
+    patterns: Sequence[tuple[str, str]] = DEFAULT_RULER_PATTERNS,
+) -> Language:
+    """Blank French pipeline whose only component is an entity ruler."""
+    nlp = spacy.blank("fr")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns(  # type: ignore[attr-defined]
+        [{"label": label, "pattern": phrase} for label, phrase in patterns]
+    )
+    return nlp
+
+
+def ruler_spacy_detector(
+    patterns: Sequence[tuple[str, str]] = DEFAULT_RULER_PATTERNS,
+    window_chars: int | None = DEFAULT_WINDOW_CHARS,
+    window_overlap: int = DEFAULT_WINDOW_OVERLAP,
+) -> SpaCyDetector:
+    """SpaCyDetector with a ruler pipeline already loaded as "blank_fr"."""
+    detector = SpaCyDetector(window_chars=window_chars, window_overlap=window_overlap)
+    detector._nlp = ruler_pipeline(patterns)
+    detector._model_name = "blank_fr"
+    return detector
+
+
+def ruler_hybrid_detector(
+    patterns: Sequence[tuple[str, str]] = DEFAULT_RULER_PATTERNS,
+    window_chars: int | None = DEFAULT_WINDOW_CHARS,
+    window_overlap: int = DEFAULT_WINDOW_OVERLAP,
+    paragraph_cache: bool = False,
+) -> HybridDetector:
+    """Loaded HybridDetector over a ruler pipeline and the bundled regexes."""
+    detector = HybridDetector(paragraph_cache=paragraph_cache)
+    detector.spacy_detector = ruler_spacy_detector(
+        patterns, window_chars, window_overlap
+    )
+    detector.regex_matcher.load_patterns()
+    detector._model_loaded = True
+    return detector
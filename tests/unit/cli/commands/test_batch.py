@@ -11,8 +11,10 @@ Tests cover:
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 from unittest.mock import patch
 
 import typer
@@ -21,6 +23,7 @@ from typer.testing import CliRunner
 
 from gdpr_pseudonymizer.cli.commands.batch import (
     BatchResult,
+    _next_detection,
     _process_single_document_worker,
     batch_command,
     collect_files,
@@ -707,6 +710,10 @@ class TestWorkerFunction:
                     "testpass",
                     "neutral",
                     "spacy",
+                    "accurate",
+                    False,
+                    False,
+                    False,
                     None,
                 )
             )
@@ -744,6 +751,10 @@ class TestWorkerFunction:
                     "testpass",
                     "neutral",
                     "spacy",
+                    "accurate",
+                    False,
+                    False,
+                    False,
                     None,
                 )
             )
@@ -771,6 +782,10 @@ class TestWorkerFunction:
                     "testpass",
                     "neutral",
                     "spacy",
+                    "accurate",
+                    False,
+                    False,
+                    False,
                     None,
                 )
             )
@@ -956,3 +971,24 @@ batch:
 
 # Import pytest for MonkeyPatch type hint
 import pytest  # noqa: E402
+
+
+class TestNextDetection:
+    """Tests for consuming the batch detection stream."""
+
+    def test_returns_detection_for_matching_file(self) -> None:
+        detection = ("text", [])
+        stream = iter([("a.txt", detection)])
+        assert _next_detection(stream, Path("a.txt")) == detection
+
+    def test_exhausted_stream_falls_back(self) -> None:
+        assert _next_detection(iter([]), Path("a.txt")) is None
+
+    def test_failed_stream_falls_back(self) -> None:
+        def _stream() -> Iterator[tuple[str, tuple[str, list[Any]] | None]]:
+            raise RuntimeError("Entity detection failed")
+            yield  # pragma: no cover
+
+        stream = _stream()
+        assert _next_detection(stream, Path("a.txt")) is None
+        assert _next_detection(stream, Path("b.txt")) is None
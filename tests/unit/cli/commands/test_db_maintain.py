@@ -0,0 +1,134 @@
+"""Unit tests for db-maintain CLI command."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import typer
+from helpers import strip_ansi
+from typer.testing import CliRunner
+
+from gdpr_pseudonymizer.cli.commands.db_maintain import db_maintain_command
+from gdpr_pseudonymizer.data.database import init_database
+
+
+def create_test_app() -> typer.Typer:
+    app = typer.Typer()
+
+    @app.callback()
+    def callback() -> None:
+        pass
+
+    app.command(name="db-maintain")(db_maintain_command)
+    return app
+
+
+app = create_test_app()
+runner = CliRunner()
+
+PASSPHRASE = "test_passphrase_123!"
+
+
+class TestDbMaintainCommand:
+    def test_db_maintain_reports_storage_and_indexes(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "test.db"
+        init_database(str(db_path), PASSPHRASE)
+
+        result = runner.invoke(
+            app, ["db-maintain", "--db", str(db_path), "--passphrase", PASSPHRASE]
+        )
+
+        output = strip_ansi(result.output)
+        assert result.exit_code == 0, output
+        assert "Storage" in output
+        assert "Index Usage" in output
+        assert "idx_entities_full_name" in output
+        assert "Integrity check" in output
+
+    def test_db_maintain_busy_checkpoint_warns(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "test.db"
+        init_database(str(db_path), PASSPHRASE)
+        reader = sqlite3.connect(db_path)
+        try:
+            reader.execute("BEGIN")
+            reader.execute("SELECT count(*) FROM metadata").fetchone()
+            result = runner.invoke(
+                app, ["db-maintain", "--db", str(db_path), "--passphrase", PASSPHRASE]
+            )
+        finally:
+            reader.close()
+
+        output = strip_ansi(result.output)
+        assert result.exit_code == 3, output
+        assert "busy/incomplete" in output
+
+    def test_db_maintain_vacuum_into(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "test.db"
+        target = tmp_path / "compact.db"
+        init_database(str(db_path), PASSPHRASE)
+
+        result = runner.invoke(
+            app,
+            [
+                "db-maintain",
+                "--db",
+                str(db_path),
+                "--passphrase",
+                PASSPHRASE,
+                "--vacuum-into",
+                str(target),
+            ],
+        )
+
+        assert result.exit_code == 0, strip_ansi(result.output)
+        assert target.exists()
+
+    def test_db_maintain_missing_database(self, tmp_path: Path) -> None:
+        result = runner.invoke(
+            app,
+            [
+                "db-maintain",
+                "--db",
+                str(tmp_path / "missing.db"),
+                "--passphrase",
+                PASSPHRASE,
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "not found" in strip_ansi(result.output).lower()
+
+    def test_db_maintain_wrong_passphrase(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "test.db"
+        init_database(str(db_path), PASSPHRASE)
+
+        result = runner.invoke(
+            app,
+            ["db-maintain", "--db", str(db_path), "--passphrase", "wrong_pass_123!"],
+        )
+
+        assert result.exit_code == 1
+        assert "passphrase" in strip_ansi(result.output).lower()
+
+    def test_db_maintain_existing_vacuum_target(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "test.db"
+        target = tmp_path / "exists.db"
+        target.write_bytes(b"x")
+        init_database(str(db_path), PASSPHRASE)
+
+        result = runner.invoke(
+            app,
+            [
+                "db-maintain",
+                "--db",
+                str(db_path),
+                "--passphrase",
+                PASSPHRASE,
+                "--vacuum-into",
+                str(target),
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "already exists" in strip_ansi(result.output)
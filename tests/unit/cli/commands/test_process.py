@@ -109,6 +109,7 @@ pseudonymization:
                     "entities_reused": 2,
                     "processing_time_seconds": 1.5,
                     "error_message": None,
+                    "library_exhaustion": None,
                 },
             )()
             mock_processor.return_value.process_document.return_value = mock_result
@@ -166,6 +167,7 @@ pseudonymization:
                     "entities_reused": 2,
                     "processing_time_seconds": 1.5,
                     "error_message": None,
+                    "library_exhaustion": None,
                 },
             )()
             mock_processor.return_value.process_document.return_value = mock_result
@@ -223,6 +225,7 @@ database:
                     "entities_reused": 2,
                     "processing_time_seconds": 1.5,
                     "error_message": None,
+                    "library_exhaustion": None,
                 },
             )()
             mock_processor.return_value.process_document.return_value = mock_result
@@ -280,6 +283,7 @@ pseudonymization:
                     "entities_reused": 2,
                     "processing_time_seconds": 1.5,
                     "error_message": None,
+                    "library_exhaustion": None,
                 },
             )()
             mock_processor.return_value.process_document.return_value = mock_result
@@ -338,6 +342,7 @@ database:
                     "entities_reused": 2,
                     "processing_time_seconds": 1.5,
                     "error_message": None,
+                    "library_exhaustion": None,
                 },
             )()
             mock_processor.return_value.process_document.return_value = mock_result
@@ -352,6 +357,52 @@ database:
         call_kwargs = mock_processor.call_args
         assert call_kwargs[1]["db_path"] == "cli_db.db"
 
+    def test_workers_passed_to_processor(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test --workers sets intra-document detection processes (default 1)."""
+        input_file = tmp_path / "input.txt"
+        input_file.write_text("Test content")
+        home_dir = tmp_path / "home"
+        home_dir.mkdir()
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(Path, "home", lambda: home_dir)
+
+        for args, expected in (([], 1), (["--workers", "4"], 4)):
+            with (
+                patch(
+                    "gdpr_pseudonymizer.cli.commands.process.resolve_passphrase"
+                ) as mock_passphrase,
+                patch(
+                    "gdpr_pseudonymizer.cli.commands.process.DocumentProcessor"
+                ) as mock_processor,
+                patch(
+                    "gdpr_pseudonymizer.cli.commands.process.cpu_count",
+                    return_value=16,
+                ),
+                patch("gdpr_pseudonymizer.cli.validators.init_database"),
+            ):
+                mock_passphrase.return_value = "testpassphrase123!"
+                mock_result = type(
+                    "MockResult",
+                    (),
+                    {
+                        "success": True,
+                        "entities_detected": 0,
+                        "entities_new": 0,
+                        "entities_reused": 0,
+                        "processing_time_seconds": 0.1,
+                        "error_message": None,
+                        "library_exhaustion": None,
+                    },
+                )()
+                mock_processor.return_value.process_document.return_value = mock_result
+
+                result = runner.invoke(app, ["process", str(input_file), *args])
+
+            assert result.exit_code == 0
+            assert mock_processor.call_args[1]["workers"] == expected
+
 
 # Import pytest for MonkeyPatch type hint
 import pytest  # noqa: E402
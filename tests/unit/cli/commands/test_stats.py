@@ -95,3 +95,46 @@ class TestStatsCommand:
 
         assert result.exit_code == 0
         assert "Show database statistics" in result.stdout
+
+    def test_stats_shows_library_exhaustion(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "test.db"
+        db_path.write_bytes(b"test")
+
+        with (
+            patch(
+                "gdpr_pseudonymizer.cli.commands.stats.resolve_passphrase",
+                return_value="testpassphrase123!",
+            ),
+            patch(
+                "gdpr_pseudonymizer.cli.commands.stats.open_database"
+            ) as mock_open_db,
+            patch(
+                "gdpr_pseudonymizer.cli.commands.stats.SQLiteMappingRepository"
+            ) as mock_mapping_repo,
+            patch(
+                "gdpr_pseudonymizer.cli.commands.stats.AuditRepository"
+            ) as mock_audit_repo,
+            patch(
+                "gdpr_pseudonymizer.cli.commands.stats.LibraryBasedPseudonymManager"
+            ) as mock_manager,
+        ):
+            mock_open_db.return_value.__enter__ = MagicMock(return_value=MagicMock())
+            mock_open_db.return_value.__exit__ = MagicMock(return_value=False)
+            mock_mapping_repo.return_value.find_all.return_value = [
+                create_mock_entity(theme="neutral"),
+                create_mock_entity(theme="neutral_id"),
+            ]
+            mock_audit_repo.return_value.find_operations.return_value = []
+            mock_manager.return_value.check_exhaustion_by_type.return_value = {
+                "PERSON": 0.125,
+                "LOCATION": 0.85,
+                "ORG": 0.0,
+            }
+
+            result = runner.invoke(app, ["stats", "--db", str(db_path)])
+
+        assert result.exit_code == 0
+        assert "Library Exhaustion" in result.stdout
+        assert "12.5%" in result.stdout
+        assert "85.0%" in result.stdout
+        mock_manager.return_value.load_library.assert_called_once_with("neutral")
@@ -43,6 +43,10 @@ class TestGetDefaultConfig:
         assert config.database.path == "mappings.db"
         assert config.pseudonymization.theme == "neutral"
         assert config.pseudonymization.model == "spacy"
+        assert config.pseudonymization.detection_profile == "accurate"
+        assert config.pseudonymization.detection_cache is False
+        assert config.pseudonymization.paragraph_cache is False
+        assert config.pseudonymization.keyed_pseudonyms is False
         assert config.logging.level == "INFO"
         assert config.logging.file is None
         assert config.batch.workers == 4
@@ -98,6 +102,43 @@ class TestValidateConfigDict:
         assert "Invalid model" in str(exc_info.value)
         assert "unknown_model" in str(exc_info.value)
 
+    def test_invalid_detection_profile_rejected(self) -> None:
+        """Test that invalid detection profile is rejected."""
+        config_dict = {"pseudonymization": {"detection_profile": "turbo"}}
+
+        with pytest.raises(ConfigValidationError) as exc_info:
+            validate_config_dict(config_dict)
+
+        assert "Invalid detection_profile" in str(exc_info.value)
+        assert "turbo" in str(exc_info.value)
+
+    def test_non_boolean_detection_cache_rejected(self) -> None:
+        """Test that detection_cache must be a boolean."""
+        config_dict = {"pseudonymization": {"detection_cache": "yes please"}}
+
+        with pytest.raises(ConfigValidationError) as exc_info:
+            validate_config_dict(config_dict)
+
+        assert "Invalid detection_cache" in str(exc_info.value)
+
+    def test_non_boolean_paragraph_cache_rejected(self) -> None:
+        """Test that paragraph_cache must be a boolean."""
+        config_dict = {"pseudonymization": {"paragraph_cache": 1}}
+
+        with pytest.raises(ConfigValidationError) as exc_info:
+            validate_config_dict(config_dict)
+
+        assert "Invalid paragraph_cache" in str(exc_info.value)
+
+    def test_non_boolean_keyed_pseudonyms_rejected(self) -> None:
+        """Test that keyed_pseudonyms must be a boolean."""
+        config_dict = {"pseudonymization": {"keyed_pseudonyms": "on"}}
+
+        with pytest.raises(ConfigValidationError) as exc_info:
+            validate_config_dict(config_dict)
+
+        assert "Invalid keyed_pseudonyms" in str(exc_info.value)
+
     def test_invalid_log_level_rejected(self) -> None:
         """Test that invalid log level is rejected."""
         config_dict = {"logging": {"level": "TRACE"}}
@@ -13,6 +13,7 @@ from gdpr_pseudonymizer.cli.validators import (
     VALID_THEMES,
     ensure_database,
     parse_entity_type_filter,
+    validate_detection_profile_or_exit,
     validate_file_path,
     validate_log_level,
     validate_passphrase_strength,
@@ -273,6 +274,28 @@ class TestValidateThemeOrExit:
         assert exc_info.value.code == 1
 
 
+class TestValidateDetectionProfileOrExit:
+    """Tests for validate_detection_profile_or_exit()."""
+
+    @pytest.mark.parametrize("profile", ["accurate", "balanced", "fast"])
+    def test_valid_profile_passes(self, profile: str) -> None:
+        """Valid profiles do not exit."""
+        validate_detection_profile_or_exit(profile)  # should not raise
+
+    def test_invalid_profile_exits(self) -> None:
+        """Invalid profile causes sys.exit(1)."""
+        with pytest.raises(SystemExit) as exc_info:
+            validate_detection_profile_or_exit("turbo")
+        assert exc_info.value.code == 1
+
+    def test_profiles_match_detector(self) -> None:
+        """CLI profile list stays in sync with SpaCyDetector profiles."""
+        from gdpr_pseudonymizer.cli.validators import VALID_DETECTION_PROFILES
+        from gdpr_pseudonymizer.nlp.spacy_detector import DETECTION_PROFILES
+
+        assert VALID_DETECTION_PROFILES == list(DETECTION_PROFILES)
+
+
 class TestEnsureDatabase:
     """Tests for ensure_database()."""
 
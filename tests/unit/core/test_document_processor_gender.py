@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
 from gdpr_pseudonymizer.pseudonym.gender_detector import GenderDetector
@@ -168,3 +168,53 @@ class TestGenderStorageInEntity:
         )
 
         assert entity.gender is None
+
+
+class TestGenderDetectionPass:
+    """Tests for one-pass gender detection in _resolve_pseudonyms()."""
+
+    def test_person_genders_detected_in_one_pass(self) -> None:
+        """All PERSON texts are classified by a single detect_genders() call."""
+        ctx = Mock()
+        ctx.compositional_engine.strip_titles.side_effect = lambda t: t
+        ctx.compositional_engine.strip_prepositions.side_effect = lambda t: t
+        ctx.mapping_repo.find_by_full_name.return_value = None
+        ctx.compositional_engine.gender_detector = GenderDetector()
+        ctx.compositional_engine.assign_compositional_pseudonym.side_effect = (
+            lambda entity_text, entity_type, gender: Mock(
+                pseudonym_full=f"P-{entity_text}",
+                pseudonym_first=None,
+                pseudonym_last=None,
+                is_ambiguous=False,
+                ambiguity_reason=None,
+            )
+        )
+        ctx.compositional_engine.parse_full_name.side_effect = lambda text: (
+            *text.split(),
+            False,
+        )
+        entities = [
+            _make_entity("Marie Dupont", "PERSON", 0),
+            _make_entity("Paris", "LOCATION", 20),
+            _make_entity("Jean Martin", "PERSON", 30),
+            _make_entity("Marie Dupont", "PERSON", 50),
+        ]
+
+        processor = _make_processor()
+        with patch.object(
+            GenderDetector,
+            "detect_genders",
+            autospec=True,
+            return_value=["female", "male"],
+        ) as detect_genders:
+            processor._resolve_pseudonyms(ctx, entities)
+
+        detect_genders.assert_called_once()
+        assert detect_genders.call_args.args[1] == ["Marie", "Jean"]
+        saved = ctx.mapping_repo.save_batch.call_args.args[0]
+        assert [e.gender for e in saved] == ["female", None, "male"]
+        genders = [
+            call.kwargs["gender"]
+            for call in ctx.compositional_engine.assign_compositional_pseudonym.call_args_list
+        ]
+        assert genders == ["female", None, "male"]
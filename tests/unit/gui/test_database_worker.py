@@ -308,6 +308,44 @@ class TestDatabaseWorkerDelete:
         assert len(captured["error"]) == 1
         assert "secrète" in captured["error"][0].lower()
 
+    def test_delete_purges_detection_cache(self, qtbot, tmp_path):
+        """GUI erasure on a real database also drops cached detections."""
+        from gdpr_pseudonymizer.data.database import init_database, open_database
+        from gdpr_pseudonymizer.data.models import DetectionCacheEntry, Entity
+        from gdpr_pseudonymizer.data.repositories.detection_cache_repository import (
+            DetectionCacheRepository,
+        )
+        from gdpr_pseudonymizer.data.repositories.mapping_repository import (
+            SQLiteMappingRepository,
+        )
+        from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
+
+        db_path = str(tmp_path / "test.db")
+        passphrase = "test_passphrase_123!"
+        init_database(db_path, passphrase)
+        with open_database(db_path, passphrase) as db_session:
+            saved = SQLiteMappingRepository(db_session).save(
+                Entity(
+                    entity_type="PERSON",
+                    full_name="Jean Dupont",
+                    pseudonym_full="Luke Skywalker",
+                    theme="star_wars",
+                )
+            )
+            cache = DetectionCacheRepository(db_session)
+            cache.put(
+                cache.make_key("Jean Dupont habite à Lyon", "fp"),
+                [DetectedEntity("Jean Dupont", "PERSON", 0, 11)],
+            )
+
+        worker = DatabaseWorker("delete", db_path, passphrase, entity_ids=[saved.id])
+        captured = _capture_signals(worker)
+        worker.run()
+
+        assert captured["finished"] == [1]
+        with open_database(db_path, passphrase) as db_session:
+            assert db_session.session.query(DetectionCacheEntry).count() == 0
+
     def test_delete_empty_ids(self, qtbot):
         """Empty entity_ids list emits finished(0) immediately."""
         worker = DatabaseWorker("delete", "/fake/db.db", "pass", entity_ids=[])
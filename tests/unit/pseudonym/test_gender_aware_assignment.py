@@ -75,7 +75,7 @@ class TestCompositionalEngineGenderAutoDetect:
         mock_manager = Mock()
         mock_manager.get_component_mapping.return_value = None
         mock_repo = Mock()
-        mock_repo.find_by_component.return_value = []
+        mock_repo.find_component_pseudonym.return_value = None
 
         detector = GenderDetector()
         detector.load()
@@ -112,7 +112,7 @@ class TestCompositionalEngineGenderAutoDetect:
         mock_manager = Mock()
         mock_manager.get_component_mapping.return_value = None
         mock_repo = Mock()
-        mock_repo.find_by_component.return_value = []
+        mock_repo.find_component_pseudonym.return_value = None
 
         mock_manager.assign_pseudonym.return_value = PseudonymAssignment(
             pseudonym_full="Léa Martin",
@@ -145,7 +145,7 @@ class TestCompositionalEngineGenderAutoDetect:
         mock_manager = Mock()
         mock_manager.get_component_mapping.return_value = None
         mock_repo = Mock()
-        mock_repo.find_by_component.return_value = []
+        mock_repo.find_component_pseudonym.return_value = None
 
         detector = GenderDetector()
         detector.load()
@@ -39,16 +39,19 @@ class TestGenderDetectorLoad:
         detector = GenderDetector()
         detector.load()
         assert detector._loaded is True
-        assert len(detector._male_names) > 0
-        assert len(detector._female_names) > 0
+        assert detector._lookup is not None
+        assert detector._lookup.male_count > 0
+        assert detector._lookup.female_count > 0
 
     def test_load_custom_path(self, custom_lookup: Path) -> None:
         detector = GenderDetector(lookup_path=str(custom_lookup))
         detector.load()
         assert detector._loaded is True
-        assert len(detector._male_names) == 3
-        assert len(detector._female_names) == 3
-        assert len(detector._ambiguous_names) == 2
+        assert detector._lookup is not None
+        assert detector._lookup.male_count == 3
+        assert detector._lookup.female_count == 3
+        assert detector._lookup.ambiguous_count == 2
+        assert len(detector._lookup.genders) == 8
 
     def test_load_invalid_path(self, tmp_path: Path) -> None:
         detector = GenderDetector(lookup_path=str(tmp_path / "nonexistent.json"))
@@ -159,3 +162,75 @@ class TestGenderDetectorFullName:
 
     def test_single_name_person(self, detector: GenderDetector) -> None:
         assert detector.detect_gender_from_full_name("Marie", "PERSON") == "female"
+
+
+class TestGenderDetectorBatch:
+    """Tests for detect_genders()."""
+
+    def test_matches_single_detection(self, detector: GenderDetector) -> None:
+        names = ["Jean", "marie", "Camille", "Xyzabc", "", "Jean-Pierre", " Claire "]
+
+        assert detector.detect_genders(names) == [
+            detector.detect_gender(name) for name in names
+        ]
+
+    def test_lazy_load(self, custom_lookup: Path) -> None:
+        detector = GenderDetector(lookup_path=str(custom_lookup))
+
+        assert detector.detect_genders(["Louis", "Sophie"]) == ["male", "female"]
+        assert detector._loaded is True
+
+    def test_empty_input(self, detector: GenderDetector) -> None:
+        assert detector.detect_genders([]) == []
+
+
+class TestGenderLookupTable:
+    """Tests for the compiled, process-wide lookup table."""
+
+    def test_precedence_of_overlapping_lists(self, tmp_path: Path) -> None:
+        path = tmp_path / "overlap.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "male": ["Alex", "Sacha"],
+                    "female": ["alex", "Sacha", "Lou"],
+                    "ambiguous": ["Sacha"],
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        detector = GenderDetector(lookup_path=str(path))
+
+        assert detector.detect_genders(["Alex", "Sacha", "Lou"]) == [
+            "male",
+            None,
+            "female",
+        ]
+
+    def test_lookup_shared_between_detectors(self, custom_lookup: Path) -> None:
+        first = GenderDetector(lookup_path=str(custom_lookup))
+        second = GenderDetector(lookup_path=str(custom_lookup))
+        first.load()
+        second.load()
+
+        assert first._lookup is second._lookup
+
+    def test_edited_file_loaded_again(self, custom_lookup: Path) -> None:
+        detector = GenderDetector(lookup_path=str(custom_lookup))
+        assert detector.detect_gender("Nour") is None
+
+        custom_lookup.write_text(
+            json.dumps({"male": [], "female": ["Nour"], "ambiguous": []}),
+            encoding="utf-8",
+        )
+        edited = GenderDetector(lookup_path=str(custom_lookup))
+
+        assert edited.detect_gender("Nour") == "female"
+
+    def test_shared_detector_is_lazy_and_reused(self, custom_lookup: Path) -> None:
+        shared = GenderDetector.shared(str(custom_lookup))
+
+        assert GenderDetector.shared(str(custom_lookup)) is shared
+        assert shared._loaded is False
+        assert shared.detect_gender("Jean") == "male"
@@ -330,12 +330,16 @@ class TestFindStandaloneComponents:
             pseudonym_full="Leia Organa",
             theme="star_wars",
         )
-        mock_repo.find_by_component.return_value = [existing_entity]
+        mock_repo.find_component_pseudonym.return_value = (
+            existing_entity.pseudonym_first
+        )
 
         result = engine.find_standalone_components("Marie", "first_name")
 
         assert result == "Leia"
-        mock_repo.find_by_component.assert_called_once_with("Marie", "first_name")
+        mock_repo.find_component_pseudonym.assert_called_once_with(
+            "Marie", "first_name"
+        )
 
     def test_find_standalone_component_last_name_found(self) -> None:
         """Test finding existing last name component mapping."""
@@ -355,12 +359,14 @@ class TestFindStandaloneComponents:
             pseudonym_full="Leia Organa",
             theme="star_wars",
         )
-        mock_repo.find_by_component.return_value = [existing_entity]
+        mock_repo.find_component_pseudonym.return_value = existing_entity.pseudonym_last
 
         result = engine.find_standalone_components("Dubois", "last_name")
 
         assert result == "Organa"
-        mock_repo.find_by_component.assert_called_once_with("Dubois", "last_name")
+        mock_repo.find_component_pseudonym.assert_called_once_with(
+            "Dubois", "last_name"
+        )
 
     def test_find_standalone_component_not_found(self) -> None:
         """Test component lookup returns None when no mapping exists."""
@@ -369,12 +375,12 @@ class TestFindStandaloneComponents:
         mock_repo = Mock()
         engine = CompositionalPseudonymEngine(mock_manager, mock_repo)
 
-        mock_repo.find_by_component.return_value = []
+        mock_repo.find_component_pseudonym.return_value = None
 
         result = engine.find_standalone_components("Jean", "first_name")
 
         assert result is None
-        mock_repo.find_by_component.assert_called_once_with("Jean", "first_name")
+        mock_repo.find_component_pseudonym.assert_called_once_with("Jean", "first_name")
 
     def test_find_standalone_component_multiple_matches_uses_first(self) -> None:
         """Test that multiple component matches use first match for consistency."""
@@ -383,7 +389,7 @@ class TestFindStandaloneComponents:
         mock_repo = Mock()
         engine = CompositionalPseudonymEngine(mock_manager, mock_repo)
 
-        # Multiple entities share "Marie"
+        # Multiple entities share "Marie"; the repository answers for the first
         entity1 = Entity(
             entity_type="PERSON",
             first_name="Marie",
@@ -394,17 +400,7 @@ class TestFindStandaloneComponents:
             pseudonym_full="Leia Organa",
             theme="star_wars",
         )
-        entity2 = Entity(
-            entity_type="PERSON",
-            first_name="Marie",
-            last_name="Dupont",
-            full_name="Marie Dupont",
-            pseudonym_first="Leia",  # Same pseudonym for shared component
-            pseudonym_last="Skywalker",
-            pseudonym_full="Leia Skywalker",
-            theme="star_wars",
-        )
-        mock_repo.find_by_component.return_value = [entity1, entity2]
+        mock_repo.find_component_pseudonym.return_value = entity1.pseudonym_first
 
         result = engine.find_standalone_components("Marie", "first_name")
 
@@ -412,6 +408,84 @@ class TestFindStandaloneComponents:
         assert result == "Leia"
 
 
+def _person(first: str, last: str, pseudo_first: str, pseudo_last: str) -> Entity:
+    return Entity(
+        entity_type="PERSON",
+        first_name=first,
+        last_name=last,
+        full_name=f"{first} {last}",
+        pseudonym_first=pseudo_first,
+        pseudonym_last=pseudo_last,
+        pseudonym_full=f"{pseudo_first} {pseudo_last}",
+        theme="star_wars",
+    )
+
+
+class TestComponentCache:
+    """Test suite for the persisted component lookup cache."""
+
+    def _engine(self) -> tuple[CompositionalPseudonymEngine, Mock, Mock]:
+        mock_manager = Mock()
+        mock_manager.get_component_mapping.return_value = None
+        mock_repo = Mock()
+        mock_repo.find_component_pseudonym.return_value = None
+        return (
+            CompositionalPseudonymEngine(mock_manager, mock_repo),
+            mock_manager,
+            mock_repo,
+        )
+
+    def test_lookups_cached_including_misses(self) -> None:
+        engine, _, mock_repo = self._engine()
+        mock_repo.find_component_pseudonym.side_effect = ["Organa", None]
+
+        assert engine.find_standalone_components("Dubois", "last_name") == "Organa"
+        assert engine.find_standalone_components("Jean", "first_name") is None
+        assert engine.find_standalone_components("Dubois", "last_name") == "Organa"
+        assert engine.find_standalone_components("Jean", "first_name") is None
+
+        assert mock_repo.find_component_pseudonym.call_count == 2
+
+    def test_warm_cache_answers_without_queries(self) -> None:
+        engine, _, mock_repo = self._engine()
+        engine.load_component_cache(
+            [
+                _person("Marie", "Dubois", "Leia", "Organa"),
+                _person("Jean", "Dubois", "Luke", "Skywalker"),
+            ]
+        )
+
+        assert engine.find_standalone_components("Dubois", "last_name") == "Organa"
+        assert engine.find_standalone_components("Jean", "first_name") == "Luke"
+        assert engine.find_standalone_components("Paul", "first_name") is None
+        mock_repo.find_component_pseudonym.assert_not_called()
+
+    def test_record_components_replaces_misses(self) -> None:
+        engine, _, mock_repo = self._engine()
+        engine.load_component_cache([_person("Marie", "Dubois", "Leia", "Organa")])
+
+        assert engine.find_standalone_components("Jean", "first_name") is None
+
+        engine.record_components(
+            [
+                _person("Jean", "Dupont", "Luke", "Skywalker"),
+                _person("Marie", "Martin", "Rey", "Solo"),
+            ]
+        )
+
+        assert engine.find_standalone_components("Jean", "first_name") == "Luke"
+        assert engine.find_standalone_components("Dupont", "last_name") == "Skywalker"
+        assert engine.find_standalone_components("Marie", "first_name") == "Leia"
+        mock_repo.find_component_pseudonym.assert_not_called()
+
+    def test_in_memory_mapping_takes_precedence(self) -> None:
+        engine, mock_manager, _ = self._engine()
+        engine.load_component_cache([])
+        mock_manager.get_component_mapping.return_value = "Han"
+
+        assert engine.find_standalone_components("Paul", "first_name") == "Han"
+
+
 class TestCompositionalAssignment:
     """Test suite for compositional pseudonym assignment."""
 
@@ -423,7 +497,7 @@ class TestCompositionalAssignment:
         engine = CompositionalPseudonymEngine(mock_manager, mock_repo)
 
         # No existing components
-        mock_repo.find_by_component.return_value = []
+        mock_repo.find_component_pseudonym.return_value = None
 
         # Mock pseudonym manager to return assignment
         mock_assignment = PseudonymAssignment(
@@ -448,7 +522,7 @@ class TestCompositionalAssignment:
         assert assignment.is_ambiguous is False
 
         # Verify repository was queried for components
-        assert mock_repo.find_by_component.call_count == 2
+        assert mock_repo.find_component_pseudonym.call_count == 2
 
         # Verify manager was called with no existing components
         mock_manager.assign_pseudonym.assert_called_once()
@@ -476,9 +550,9 @@ class TestCompositionalAssignment:
         )
 
         # First query (first_name) returns existing, second (last_name) returns empty
-        mock_repo.find_by_component.side_effect = [
-            [existing_entity],  # "Marie" found
-            [],  # "Dupont" not found
+        mock_repo.find_component_pseudonym.side_effect = [
+            existing_entity.pseudonym_first,  # "Marie" found
+            None,  # "Dupont" not found
         ]
 
         # Mock pseudonym manager to return assignment with reused first name
@@ -527,9 +601,9 @@ class TestCompositionalAssignment:
         )
 
         # First query (first_name) returns empty, second (last_name) returns existing
-        mock_repo.find_by_component.side_effect = [
-            [],  # "Jean" not found
-            [existing_entity],  # "Dubois" found
+        mock_repo.find_component_pseudonym.side_effect = [
+            None,  # "Jean" not found
+            existing_entity.pseudonym_last,  # "Dubois" found
         ]
 
         # Mock pseudonym manager to return assignment with reused last name
@@ -588,9 +662,9 @@ class TestCompositionalAssignment:
         )
 
         # Both components found in existing mappings
-        mock_repo.find_by_component.side_effect = [
-            [entity_marie],  # "Marie" found
-            [entity_jean],  # "Dupont" found (different entity)
+        mock_repo.find_component_pseudonym.side_effect = [
+            entity_marie.pseudonym_first,  # "Marie" found
+            entity_jean.pseudonym_last,  # "Dupont" found (different entity)
         ]
 
         # Mock pseudonym manager to return assignment with both reused components
@@ -644,7 +718,10 @@ class TestStandaloneComponentHandling:
             pseudonym_full="Leia Organa",
             theme="star_wars",
         )
-        mock_repo.find_by_component.return_value = [existing_entity]
+        mock_repo.find_component_pseudonym.side_effect = [
+            existing_entity.pseudonym_first,  # "Marie" as first name
+            None,  # "Marie" as last name
+        ]
 
         assignment = engine.assign_compositional_pseudonym(
             entity_text="Marie",
@@ -673,7 +750,7 @@ class TestStandaloneComponentHandling:
         engine = CompositionalPseudonymEngine(mock_manager, mock_repo)
 
         # No existing mapping for "Jean"
-        mock_repo.find_by_component.return_value = []
+        mock_repo.find_component_pseudonym.return_value = None
 
         # Mock pseudonym manager to assign new pseudonym
         mock_assignment = PseudonymAssignment(
@@ -734,7 +811,7 @@ class TestNonPersonEntities:
         assert assignment.pseudonym_first is None
 
         # Verify repository was NOT queried (no compositional logic)
-        mock_repo.find_by_component.assert_not_called()
+        mock_repo.find_component_pseudonym.assert_not_called()
 
     def test_assign_compositional_pseudonym_org(self) -> None:
         """Test ORG entity uses simple assignment without compositional logic."""
@@ -764,7 +841,7 @@ class TestNonPersonEntities:
         assert assignment.pseudonym_first is None
 
         # Verify repository was NOT queried
-        mock_repo.find_by_component.assert_not_called()
+        mock_repo.find_component_pseudonym.assert_not_called()
 
 
 class TestSharedComponentScenarios:
@@ -778,7 +855,7 @@ class TestSharedComponentScenarios:
         engine = CompositionalPseudonymEngine(mock_manager, mock_repo)
 
         # First entity: "Marie Dubois" (no existing components)
-        mock_repo.find_by_component.side_effect = [[], []]  # Both components new
+        mock_repo.find_component_pseudonym.side_effect = [None, None]  # Both new
         mock_assignment_1 = PseudonymAssignment(
             pseudonym_full="Leia Organa",
             pseudonym_first="Leia",
@@ -811,9 +888,9 @@ class TestSharedComponentScenarios:
             pseudonym_full="Leia Organa",
             theme="star_wars",
         )
-        mock_repo.find_by_component.side_effect = [
-            [entity_marie],  # "Marie" found
-            [],  # "Dupont" not found
+        engine.record_components([entity_marie])  # "Marie Dubois" saved
+        mock_repo.find_component_pseudonym.side_effect = [
+            None,  # "Dupont" not found ("Marie" answered by the cache)
         ]
         mock_assignment_2 = PseudonymAssignment(
             pseudonym_full="Leia Skywalker",
@@ -858,9 +935,9 @@ class TestSharedComponentScenarios:
         )
 
         # Second entity: "Jean Dubois" (Jean is new, Dubois exists)
-        mock_repo.find_by_component.side_effect = [
-            [],  # "Jean" not found
-            [existing_entity],  # "Dubois" found
+        mock_repo.find_component_pseudonym.side_effect = [
+            None,  # "Jean" not found
+            existing_entity.pseudonym_last,  # "Dubois" found
         ]
         mock_assignment = PseudonymAssignment(
             pseudonym_full="Luke Organa",
@@ -898,7 +975,7 @@ class TestAmbiguityDetection:
         engine = CompositionalPseudonymEngine(mock_manager, mock_repo)
 
         # No existing components
-        mock_repo.find_by_component.return_value = []
+        mock_repo.find_component_pseudonym.return_value = None
 
         # Mock pseudonym manager assignment
         mock_assignment = PseudonymAssignment(
@@ -929,7 +1006,7 @@ class TestAmbiguityDetection:
         engine = CompositionalPseudonymEngine(mock_manager, mock_repo)
 
         # No existing components
-        mock_repo.find_by_component.return_value = []
+        mock_repo.find_component_pseudonym.return_value = None
 
         # Mock pseudonym manager assignment
         mock_assignment = PseudonymAssignment(
@@ -954,15 +1031,15 @@ class TestAmbiguityDetection:
 class TestComponentQueryPatterns:
     """Test suite for MappingRepository component query patterns."""
 
-    def test_find_by_component_called_for_first_and_last(self) -> None:
-        """Test that find_by_component is called for both first and last name."""
+    def test_find_component_pseudonym_called_for_first_and_last(self) -> None:
+        """Test that find_component_pseudonym is called for first and last name."""
         mock_manager = Mock()
         mock_manager.get_component_mapping.return_value = None
         mock_repo = Mock()
         engine = CompositionalPseudonymEngine(mock_manager, mock_repo)
 
         # No existing components
-        mock_repo.find_by_component.return_value = []
+        mock_repo.find_component_pseudonym.return_value = None
 
         # Mock pseudonym manager
         mock_assignment = PseudonymAssignment(
@@ -980,20 +1057,20 @@ class TestComponentQueryPatterns:
             gender="female",
         )
 
-        # Verify find_by_component called twice (first_name, last_name)
-        assert mock_repo.find_by_component.call_count == 2
-        calls = mock_repo.find_by_component.call_args_list
+        # Verify find_component_pseudonym called twice (first_name, last_name)
+        assert mock_repo.find_component_pseudonym.call_count == 2
+        calls = mock_repo.find_component_pseudonym.call_args_list
         assert calls[0][0] == ("Marie", "first_name")
         assert calls[1][0] == ("Dubois", "last_name")
 
-    def test_find_by_component_uses_first_match_for_consistency(self) -> None:
+    def test_find_component_pseudonym_uses_first_match_for_consistency(self) -> None:
         """Test that first match is used when multiple entities share component."""
         mock_manager = Mock()
         mock_manager.get_component_mapping.return_value = None
         mock_repo = Mock()
         engine = CompositionalPseudonymEngine(mock_manager, mock_repo)
 
-        # Multiple entities share "Marie" - all should use same pseudonym
+        # Multiple entities share "Marie"; the repository answers for the first
         entity1 = Entity(
             entity_type="PERSON",
             first_name="Marie",
@@ -1004,19 +1081,9 @@ class TestComponentQueryPatterns:
             pseudonym_full="Leia Organa",
             theme="star_wars",
         )
-        entity2 = Entity(
-            entity_type="PERSON",
-            first_name="Marie",
-            last_name="Dupont",
-            full_name="Marie Dupont",
-            pseudonym_first="Leia",
-            pseudonym_last="Skywalker",
-            pseudonym_full="Leia Skywalker",
-            theme="star_wars",
-        )
 
         # Return multiple matches
-        mock_repo.find_by_component.return_value = [entity1, entity2]
+        mock_repo.find_component_pseudonym.return_value = entity1.pseudonym_first
 
         result = engine.find_standalone_components("Marie", "first_name")
 
@@ -1034,7 +1101,7 @@ class TestEdgeCases:
         mock_repo = Mock()
         engine = CompositionalPseudonymEngine(mock_manager, mock_repo)
 
-        mock_repo.find_by_component.return_value = []
+        mock_repo.find_component_pseudonym.return_value = None
         mock_assignment = PseudonymAssignment(
             pseudonym_full="Leia Organa",
             pseudonym_first="Leia",
@@ -1066,7 +1133,7 @@ class TestEdgeCases:
         mock_repo = Mock()
         engine = CompositionalPseudonymEngine(mock_manager, mock_repo)
 
-        mock_repo.find_by_component.return_value = []
+        mock_repo.find_component_pseudonym.return_value = None
         mock_assignment = PseudonymAssignment(
             pseudonym_full="Leia Organa",
             pseudonym_first="Leia",
@@ -21,8 +21,11 @@ from benchmark_nlp import (
     load_annotations,
     load_corpus,
     load_document,
+    run_ner_batch,
 )
 
+from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
+
 
 class TestEntityClass:
     """Tests for Entity dataclass."""
@@ -438,6 +441,26 @@ class TestLoadCorpus:
             shutil.rmtree(temp_dir)
 
 
+class TestRunNerBatch:
+    """Tests for batched NER conversion."""
+
+    def test_one_prediction_list_per_text(self):
+        """Batched detector output is converted per document, in order."""
+        from unittest.mock import MagicMock
+
+        detector = MagicMock()
+        detector.detect_entities_batch.return_value = iter(
+            [[DetectedEntity("Marie", "PERSON", 0, 5)], []]
+        )
+
+        predictions = run_ner_batch(["Marie", "Rien"], detector, 4, 1)
+
+        assert predictions == [[Entity("Marie", "PERSON", 0, 5)], []]
+        detector.detect_entities_batch.assert_called_once_with(
+            ["Marie", "Rien"], batch_size=4, n_process=1
+        )
+
+
 if __name__ == "__main__":
     # Run tests with pytest if available, otherwise print message
     try:
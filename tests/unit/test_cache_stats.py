@@ -0,0 +1,23 @@
+"""Unit tests for shared cache hit/miss counters."""
+
+from __future__ import annotations
+
+from gdpr_pseudonymizer.utils.cache_stats import CacheStats
+
+
+class TestCacheStats:
+    """Tests for CacheStats."""
+
+    def test_total_and_hit_rate(self) -> None:
+        stats = CacheStats(hits=3, misses=1)
+
+        assert stats.total == 4
+        assert stats.hit_rate == 0.75
+
+    def test_empty_hit_rate(self) -> None:
+        assert CacheStats().hit_rate == 0.0
+
+    def test_difference(self) -> None:
+        delta = CacheStats(hits=5, misses=3) - CacheStats(1, 1)
+
+        assert delta == CacheStats(hits=4, misses=2)
@@ -11,6 +11,7 @@ runner = CliRunner()
 EXPECTED_COMMANDS = [
     "batch",
     "config",
+    "db-maintain",
     "destroy-table",
     "export",
     "import-mappings",
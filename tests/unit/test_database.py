@@ -11,6 +11,7 @@ from gdpr_pseudonymizer.data.database import (
     open_database,
 )
 from gdpr_pseudonymizer.data.encryption import EncryptionService
+from gdpr_pseudonymizer.data.migrations import CURRENT_SCHEMA_VERSION
 from gdpr_pseudonymizer.data.models import Metadata
 from gdpr_pseudonymizer.exceptions import CorruptedDatabaseError
 
@@ -59,7 +60,7 @@ class TestDatabaseInitialization:
 
             # Verify values
             schema_version = next(m for m in metadata if m.key == "schema_version")
-            assert schema_version.value == "1.0.0"
+            assert schema_version.value == CURRENT_SCHEMA_VERSION
 
             kdf_iterations = next(m for m in metadata if m.key == "kdf_iterations")
             assert int(kdf_iterations.value) == 100000
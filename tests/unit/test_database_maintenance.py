@@ -0,0 +1,170 @@
+"""Unit tests for database maintenance operations."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from gdpr_pseudonymizer.data.database import init_database, open_database
+from gdpr_pseudonymizer.data.maintenance import (
+    INDEX_PROBE_QUERIES,
+    collect_file_stats,
+    maintain_database,
+)
+from gdpr_pseudonymizer.data.migrations import CURRENT_SCHEMA_VERSION
+from gdpr_pseudonymizer.data.models import Entity
+from gdpr_pseudonymizer.data.repositories.mapping_repository import (
+    SQLiteMappingRepository,
+)
+
+PASSPHRASE = "test_passphrase_123!"
+
+
+@pytest.fixture
+def populated_db(tmp_path: Path) -> str:
+    """Create database with entities, then erase half of them."""
+    db_path = str(tmp_path / "test.db")
+    init_database(db_path, PASSPHRASE)
+
+    with open_database(db_path, PASSPHRASE) as db_session:
+        repo = SQLiteMappingRepository(db_session)
+        repo.save_batch(
+            [
+                Entity(
+                    entity_type="PERSON",
+                    first_name=f"Prenom{i}",
+                    last_name=f"Nom{i}",
+                    full_name=f"Prenom{i} Nom{i}",
+                    pseudonym_first=f"Pseudo{i}",
+                    pseudonym_last=f"Last{i}",
+                    pseudonym_full=f"Pseudo{i} Last{i}",
+                    theme="neutral",
+                )
+                for i in range(200)
+            ]
+        )
+        for i in range(0, 200, 2):
+            repo.delete_entity_by_full_name(f"Prenom{i} Nom{i}")
+
+    return db_path
+
+
+class TestMaintainDatabase:
+    """Test suite for maintain_database()."""
+
+    def test_checkpoint_truncates_wal(self, populated_db: str) -> None:
+        """WAL file is empty after TRUNCATE checkpoint."""
+        with open_database(populated_db, PASSPHRASE) as db_session:
+            report = maintain_database(db_session, populated_db)
+
+        assert report.after.wal_size == 0
+        assert report.before.page_count > 0
+        assert report.checkpoint is not None
+        assert report.checkpoint.complete
+
+    def test_checkpoint_busy_with_open_reader(self, populated_db: str) -> None:
+        """A read transaction on another connection leaves the WAL in place."""
+        reader = sqlite3.connect(populated_db)
+        try:
+            reader.execute("BEGIN")
+            reader.execute("SELECT count(*) FROM entities").fetchone()
+            with open_database(populated_db, PASSPHRASE) as db_session:
+                SQLiteMappingRepository(db_session).delete_entity_by_full_name(
+                    "Prenom1 Nom1"
+                )
+                report = maintain_database(db_session, populated_db)
+        finally:
+            reader.close()
+
+        assert report.checkpoint is not None
+        assert report.checkpoint.busy == 1
+        assert not report.checkpoint.complete
+        assert report.after.wal_size > 0
+
+    def test_analyze_populates_index_stats(self, populated_db: str) -> None:
+        """ANALYZE fills sqlite_stat1 row counts for entity indexes."""
+        with open_database(populated_db, PASSPHRASE) as db_session:
+            report = maintain_database(db_session, populated_db)
+
+        assert report.analyzed is True
+        indexes = {idx.name: idx for idx in report.indexes}
+        assert indexes["idx_entities_full_name"].rows == 100
+        assert indexes["idx_entities_full_name"].table == "entities"
+
+    def test_index_usage_reported(self, populated_db: str) -> None:
+        """Probe queries are attributed to the indexes serving them."""
+        with open_database(populated_db, PASSPHRASE) as db_session:
+            report = maintain_database(db_session, populated_db)
+
+        indexes = {idx.name: idx for idx in report.indexes}
+        assert "find_by_first_name" in indexes["idx_entities_first_name"].used_by
+        assert "find_by_last_name" in indexes["idx_entities_last_name"].used_by
+        assert set(INDEX_PROBE_QUERIES) >= set(
+            label for idx in report.indexes for label in idx.used_by
+        )
+
+    def test_integrity_check_ok(self, populated_db: str) -> None:
+        """Healthy database passes integrity check."""
+        with open_database(populated_db, PASSPHRASE) as db_session:
+            report = maintain_database(db_session, populated_db)
+
+        assert report.integrity_ok is True
+        assert report.integrity_messages == []
+        assert report.schema_version == CURRENT_SCHEMA_VERSION
+
+    def test_skip_analyze_and_integrity(self, populated_db: str) -> None:
+        """Optional steps can be skipped."""
+        with open_database(populated_db, PASSPHRASE) as db_session:
+            report = maintain_database(
+                db_session, populated_db, analyze=False, integrity_check=False
+            )
+
+        assert report.analyzed is False
+        assert report.integrity_ok is None
+
+    def test_vacuum_into_writes_compacted_copy(
+        self, populated_db: str, tmp_path: Path
+    ) -> None:
+        """VACUUM INTO produces an openable copy without free pages."""
+        target = tmp_path / "compact.db"
+
+        with open_database(populated_db, PASSPHRASE) as db_session:
+            report = maintain_database(
+                db_session, populated_db, vacuum_into=str(target)
+            )
+            assert report.after.freelist_count > 0
+
+        assert report.vacuum_path == str(target)
+        assert report.vacuum_size == target.stat().st_size
+        assert report.vacuum_size < report.after.file_size
+
+        with open_database(str(target), PASSPHRASE) as db_session:
+            repo = SQLiteMappingRepository(db_session)
+            assert len(repo.find_all()) == 100
+            assert (
+                collect_file_stats(db_session.engine, str(target)).freelist_count == 0
+            )
+
+    def test_vacuum_into_existing_target_rejected(
+        self, populated_db: str, tmp_path: Path
+    ) -> None:
+        """Existing VACUUM INTO target raises ValueError."""
+        target = tmp_path / "existing.db"
+        target.write_bytes(b"data")
+
+        with open_database(populated_db, PASSPHRASE) as db_session:
+            with pytest.raises(ValueError, match="already exists"):
+                maintain_database(db_session, populated_db, vacuum_into=str(target))
+
+    def test_data_preserved(self, populated_db: str) -> None:
+        """Maintenance does not alter stored mappings."""
+        with open_database(populated_db, PASSPHRASE) as db_session:
+            maintain_database(db_session, populated_db)
+
+        with open_database(populated_db, PASSPHRASE) as db_session:
+            repo = SQLiteMappingRepository(db_session)
+            entity = repo.find_by_full_name("Prenom1 Nom1")
+            assert entity is not None
+            assert entity.pseudonym_full == "Pseudo1 Last1"
@@ -0,0 +1,116 @@
+"""Unit tests for batched multi-document entity detection."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from spacy_helpers import ruler_hybrid_detector, ruler_spacy_detector
+
+from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity, EntityDetector
+from gdpr_pseudonymizer.nlp.hybrid_detector import HybridDetector
+from gdpr_pseudonymizer.nlp.stanza_detector import StanzaDetector
+
+TEXTS = [
+    "Marie Dubois travaille à Paris.",
+    "Le rapport de Jean Martin mentionne Lyon.",
+    "Aucune entité ici.",
+]
+
+
+class _EchoDetector(EntityDetector):
+    """Minimal detector relying on the default batch implementation."""
+
+    def load_model(self, model_name: str) -> None:
+        pass
+
+    def detect_entities(self, text: str) -> list[DetectedEntity]:
+        if not text:
+            raise ValueError("Text cannot be empty or None")
+        return [DetectedEntity(text, "PERSON", 0, len(text))]
+
+    def get_model_info(self) -> dict[str, str]:
+        return {}
+
+    @property
+    def supports_gender_classification(self) -> bool:
+        return False
+
+
+class TestDefaultBatch:
+    def test_one_result_per_text_in_order(self) -> None:
+        results = list(_EchoDetector().detect_entities_batch(["a", "bb"]))
+        assert [r[0].text for r in results] == ["a", "bb"]
+
+    @pytest.mark.parametrize("kwargs", [{"batch_size": 0}, {"n_process": 0}])
+    def test_invalid_arguments_rejected_eagerly(self, kwargs: dict[str, int]) -> None:
+        with pytest.raises(ValueError, match=">= 1"):
+            _EchoDetector().detect_entities_batch(["a"], **kwargs)
+
+
+class TestSpaCyDetectorBatch:
+    def test_matches_single_document_detection(self) -> None:
+        detector = ruler_spacy_detector()
+        expected = [detector.detect_entities(text) for text in TEXTS]
+
+        assert list(detector.detect_entities_batch(TEXTS, batch_size=2)) == expected
+
+    def test_streams_lazy_input(self) -> None:
+        detector = ruler_spacy_detector()
+        consumed: list[str] = []
+
+        def _texts() -> Iterator[str]:
+            for text in TEXTS:
+                consumed.append(text)
+                yield text
+
+        results = detector.detect_entities_batch(_texts(), batch_size=1)
+        assert consumed == []
+
+        first = next(results)
+        assert [e.text for e in first] == ["Marie Dubois", "Paris"]
+        assert len(consumed) < len(TEXTS)
+        assert detector.last_doc is not None
+        assert detector.last_doc.text == TEXTS[0]
+
+    def test_empty_text_raises_value_error(self) -> None:
+        detector = ruler_spacy_detector()
+        with pytest.raises(ValueError, match="empty"):
+            list(detector.detect_entities_batch(["Paris", ""]))
+
+
+class TestHybridDetectorBatch:
+    @pytest.fixture
+    def detector(self) -> HybridDetector:
+        return ruler_hybrid_detector()
+
+    def test_matches_single_document_detection(self, detector: HybridDetector) -> None:
+        expected = [detector.detect_entities(text) for text in TEXTS]
+
+        assert list(detector.detect_entities_batch(iter(TEXTS), batch_size=2)) == (
+            expected
+        )
+
+
+class TestStanzaDetectorBatch:
+    def test_bulk_process_called_per_chunk(self) -> None:
+        def _doc(text: str) -> SimpleNamespace:
+            ent = SimpleNamespace(
+                type="PER", text=text, start_char=0, end_char=len(text)
+            )
+            return SimpleNamespace(sentences=[SimpleNamespace(ents=[ent])])
+
+        pipeline = MagicMock()
+        pipeline.bulk_process.side_effect = lambda texts: [_doc(t) for t in texts]
+        detector = StanzaDetector()
+        detector._nlp = pipeline
+
+        results = list(detector.detect_entities_batch(["A", "B", "C"], batch_size=2))
+
+        assert [r[0].text for r in results] == ["A", "B", "C"]
+        assert [c.args[0] for c in pipeline.bulk_process.call_args_list] == [
+            ["A", "B"],
+            ["C"],
+        ]
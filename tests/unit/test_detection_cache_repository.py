@@ -0,0 +1,239 @@
+"""Unit tests for the encrypted detection cache."""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import text
+
+from gdpr_pseudonymizer.core.document_processor import DocumentProcessor
+from gdpr_pseudonymizer.data.database import (
+    DatabaseSession,
+    init_database,
+    open_database,
+)
+from gdpr_pseudonymizer.data.models import DetectionCacheEntry, Entity
+from gdpr_pseudonymizer.data.repositories.detection_cache_repository import (
+    DetectionCacheRepository,
+)
+from gdpr_pseudonymizer.data.repositories.mapping_repository import (
+    SQLiteMappingRepository,
+)
+from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
+
+PASSPHRASE = "test_passphrase_123!"
+
+
+def _entities() -> list[DetectedEntity]:
+    return [
+        DetectedEntity("Marie Dubois", "PERSON", 0, 12, confidence=0.9),
+        DetectedEntity(
+            "Société Acme", "ORG", 20, 32, is_ambiguous=True, source="regex"
+        ),
+    ]
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> str:
+    path = str(tmp_path / "test.db")
+    init_database(path, PASSPHRASE)
+    return path
+
+
+@pytest.fixture
+def db_session(db_path: str) -> Iterator[DatabaseSession]:
+    with open_database(db_path, PASSPHRASE) as session:
+        yield session
+
+
+class TestDetectionCacheRepository:
+    """Tests for DetectionCacheRepository."""
+
+    def test_round_trip(self, db_session: DatabaseSession) -> None:
+        cache = DetectionCacheRepository(db_session)
+        key = cache.make_key("Marie Dubois travaille chez Société Acme", "fp")
+
+        assert cache.get(key) is None
+        cache.put(key, _entities())
+
+        assert cache.get(key) == _entities()
+
+    def test_key_depends_on_text_and_fingerprint(
+        self, db_session: DatabaseSession
+    ) -> None:
+        cache = DetectionCacheRepository(db_session)
+
+        assert cache.make_key("texte", "fp") == cache.make_key("texte", "fp")
+        assert cache.make_key("texte", "fp") != cache.make_key("texte", "fp2")
+        assert cache.make_key("texte", "fp") != cache.make_key("texte 2", "fp")
+
+    def test_stored_data_is_encrypted(self, db_session: DatabaseSession) -> None:
+        cache = DetectionCacheRepository(db_session)
+        document = "Marie Dubois travaille chez Société Acme"
+        key = cache.make_key(document, "fp")
+        cache.put(key, _entities())
+
+        row = db_session.session.execute(
+            text("SELECT cache_key, entities FROM detection_cache")
+        ).one()
+        assert "Marie" not in row.entities
+        # A plain hash of the document must not be recoverable from the key
+        assert hashlib.sha256(document.encode()).hexdigest() not in row.cache_key
+        assert row.cache_key == key
+
+    def test_evicts_least_recently_used(self, db_session: DatabaseSession) -> None:
+        unbounded = DetectionCacheRepository(db_session)
+        unbounded.put(unbounded.make_key("a", "fp"), _entities())
+        entry_size = db_session.session.query(DetectionCacheEntry).one().size_bytes
+
+        cache = DetectionCacheRepository(db_session, max_bytes=2 * entry_size)
+        key_a, key_b, key_c = (cache.make_key(t, "fp") for t in ("a", "b", "c"))
+        cache.put(key_b, _entities())
+        cache.get(key_a)  # a becomes more recent than b
+        cache.put(key_c, _entities())
+
+        assert cache.get(key_b) is None
+        assert cache.get(key_a) is not None
+        assert cache.get(key_c) is not None
+
+    def test_undecryptable_entry_is_dropped(
+        self, db_session: DatabaseSession, db_path: str
+    ) -> None:
+        cache = DetectionCacheRepository(db_session)
+        key = cache.make_key("texte", "fp")
+        cache.put(key, _entities())
+        db_session.session.execute(
+            text("UPDATE detection_cache SET entities = 'bm90IHZhbGlk'")
+        )
+        db_session.session.commit()
+
+        assert cache.get(key) is None
+        assert db_session.session.query(DetectionCacheEntry).count() == 0
+
+    def test_clear(self, db_session: DatabaseSession) -> None:
+        cache = DetectionCacheRepository(db_session)
+        cache.put(cache.make_key("a", "fp"), _entities())
+        cache.put(cache.make_key("b", "fp"), [])
+
+        assert cache.clear() == 2
+        assert cache.get(cache.make_key("a", "fp")) is None
+
+
+class TestErasurePurgesCache:
+    """Deleting a mapping drops cached detections on every erasure path."""
+
+    @pytest.fixture
+    def entity_id(self, db_session: DatabaseSession) -> str:
+        saved = SQLiteMappingRepository(db_session).save(
+            Entity(
+                entity_type="PERSON",
+                full_name="Marie Dubois",
+                pseudonym_full="Leia Organa",
+                theme="star_wars",
+            )
+        )
+        cache = DetectionCacheRepository(db_session)
+        cache.put(cache.make_key("Marie Dubois travaille", "fp"), _entities())
+        return saved.id
+
+    def test_delete_by_id_purges_cache(
+        self, db_session: DatabaseSession, entity_id: str
+    ) -> None:
+        SQLiteMappingRepository(db_session).delete_entity_by_id(entity_id)
+
+        assert db_session.session.query(DetectionCacheEntry).count() == 0
+
+    def test_delete_by_full_name_purges_cache(
+        self, db_session: DatabaseSession, entity_id: str
+    ) -> None:
+        SQLiteMappingRepository(db_session).delete_entity_by_full_name("Marie Dubois")
+
+        assert db_session.session.query(DetectionCacheEntry).count() == 0
+
+    def test_missing_entity_keeps_cache(
+        self, db_session: DatabaseSession, entity_id: str
+    ) -> None:
+        repo = SQLiteMappingRepository(db_session)
+
+        assert repo.delete_entity_by_id("no-such-id") is None
+        assert db_session.session.query(DetectionCacheEntry).count() == 1
+
+
+class TestDocumentProcessorDetectionCache:
+    """DocumentProcessor consults the cache before running detection."""
+
+    @pytest.fixture
+    def detector(self) -> Iterator[MagicMock]:
+        with patch(
+            "gdpr_pseudonymizer.core.document_processor.HybridDetector"
+        ) as detector_cls:
+            detector = detector_cls.return_value
+            detector.detection_fingerprint.return_value = "fp"
+            detector.detect_entities.side_effect = lambda text: _entities()
+            detector.detect_entities_batch.side_effect = lambda texts, **kw: (
+                _entities() for _ in texts
+            )
+            yield detector
+
+    @pytest.fixture
+    def document(self, tmp_path: Path) -> str:
+        path = tmp_path / "doc.txt"
+        path.write_text(
+            "Marie Dubois travaille chez Société Acme à Paris.", encoding="utf-8"
+        )
+        return str(path)
+
+    def test_second_run_skips_detection(
+        self, db_path: str, document: str, detector: MagicMock
+    ) -> None:
+        processor = DocumentProcessor(db_path, PASSPHRASE, detection_cache=True)
+
+        first = processor.detect_entities(document)
+        second = processor.detect_entities(document, entity_type_filter={"ORG"})
+
+        assert detector.detect_entities.call_count == 1
+        assert first[1] == _entities()
+        assert [e.text for e in second[1]] == ["Société Acme"]
+
+    def test_disabled_by_default(
+        self, db_path: str, document: str, detector: MagicMock
+    ) -> None:
+        processor = DocumentProcessor(db_path, PASSPHRASE)
+
+        processor.detect_entities(document)
+        processor.detect_entities(document)
+
+        assert detector.detect_entities.call_count == 2
+
+    def test_batch_stream_skips_cached_documents(
+        self, db_path: str, document: str, tmp_path: Path, detector: MagicMock
+    ) -> None:
+        other = tmp_path / "other.txt"
+        other.write_text("Jean Martin habite à Lyon.", encoding="utf-8")
+        processor = DocumentProcessor(db_path, PASSPHRASE, detection_cache=True)
+        processor.detect_entities(document)
+
+        detected_texts: list[str] = []
+
+        def _detect_batch(
+            texts: Iterator[str], **kwargs: object
+        ) -> Iterator[list[DetectedEntity]]:
+            for document_text in texts:
+                detected_texts.append(document_text)
+                yield []
+
+        detector.detect_entities_batch.side_effect = _detect_batch
+        paths = [document, str(other), document]
+        results = list(processor.detect_entities_batch(paths))
+
+        assert detected_texts == ["Jean Martin habite à Lyon."]
+        assert [path for path, _ in results] == paths
+        assert [r[1][1] if r[1] else None for r in results] == [
+            _entities(),
+            [],
+            _entities(),
+        ]
@@ -0,0 +1,121 @@
+"""
+Unit tests for the dictionary token trie
+"""
+
+from pathlib import Path
+
+import pytest
+
+from gdpr_pseudonymizer.nlp.dictionary_trie import (
+    TokenTrie,
+    joined_after,
+    joined_before,
+    tokenize,
+)
+from gdpr_pseudonymizer.nlp.geography_dictionary import GeographyDictionary
+from gdpr_pseudonymizer.nlp.name_dictionary import NameDictionary
+
+
+class TestTokenize:
+    """Tests for tokenize()."""
+
+    def test_offsets_cover_text(self) -> None:
+        text = "Val-d'Oise,  Côte\nd'Azur"
+        tokens = tokenize(text)
+
+        assert "".join(text[t.start : t.end] for t in tokens) == text
+        assert [t.key for t in tokens][:5] == ["Val", "-", "d", "'", "Oise"]
+
+    def test_whitespace_runs_share_one_key(self) -> None:
+        keys = {t.key for t in tokenize("a  b\n\tc") if not t.is_word}
+        assert keys == {" "}
+
+
+class TestTokenTrie:
+    """Tests for TokenTrie."""
+
+    @pytest.fixture
+    def trie(self) -> TokenTrie:
+        return TokenTrie(["Provence", "Provence-Alpes-Côte d'Azur", "Le Mans"])
+
+    def test_longest_match_first(self, trie: TokenTrie) -> None:
+        tokens = tokenize("Provence-Alpes-Côte d'Azur")
+        assert trie.match_ends(tokens, 0) == [len(tokens), 1]
+
+    def test_no_match(self, trie: TokenTrie) -> None:
+        assert trie.match_ends(tokenize("Le Havre"), 0) == []
+
+    def test_whitespace_normalized(self, trie: TokenTrie) -> None:
+        assert "Le\nMans" in trie
+        assert "Le" not in trie
+
+    def test_size_and_depth(self, trie: TokenTrie) -> None:
+        trie.add("Le Mans")
+        trie.add("")
+        assert len(trie) == 3
+        assert trie.max_depth == len(tokenize("Provence-Alpes-Côte d'Azur"))
+
+    def test_compound_boundaries(self) -> None:
+        tokens = tokenize("Seine-Saint-Denis")
+        assert joined_before(tokens, 2)
+        assert joined_after(tokens, 1)
+        assert not joined_before(tokens, 0)
+        assert not joined_after(tokens, len(tokens))
+
+
+class TestDictionaryScans:
+    """Tests for the dictionary find_* scans."""
+
+    @pytest.fixture
+    def geography(self, tmp_path: Path) -> GeographyDictionary:
+        path = tmp_path / "geo.json"
+        path.write_text(
+            '{"cities": ["Paris", "Lyon", "Le Mans", "Saint-Denis"], '
+            '"regions": ["Provence", "Provence-Alpes-Côte d\'Azur"]}',
+            encoding="utf-8",
+        )
+        dictionary = GeographyDictionary(str(path))
+        dictionary.load()
+        return dictionary
+
+    def test_adjacent_locations_all_found(self, geography: GeographyDictionary) -> None:
+        text = "Entre Paris et Lyon, puis Le Mans."
+        spans = geography.find_locations(tokenize(text))
+        assert [text[s:e] for s, e in spans] == ["Paris", "Lyon", "Le Mans"]
+
+    def test_longest_location_wins(self, geography: GeographyDictionary) -> None:
+        text = "La région Provence-Alpes-Côte d'Azur."
+        spans = geography.find_locations(tokenize(text))
+        assert [text[s:e] for s, e in spans] == ["Provence-Alpes-Côte d'Azur"]
+
+    def test_location_not_cut_from_compound(
+        self, geography: GeographyDictionary
+    ) -> None:
+        text = "En Seine-Saint-Denis et à Saint-Denis-Nord."
+        assert geography.find_locations(tokenize(text)) == []
+
+    def test_full_names(self, tmp_path: Path) -> None:
+        path = tmp_path / "names.json"
+        path.write_text(
+            '{"first_names": ["Marie", "Pierre"], "last_names": ["Le Gall", "Martin"]}',
+            encoding="utf-8",
+        )
+        names = NameDictionary(str(path))
+        names.load()
+        text = "Marie  Le Gall et Jean-Pierre Martin."
+
+        matches = names.find_full_names(tokenize(text))
+
+        assert [(text[f[0] : f[1]], text[n[0] : n[1]]) for f, n in matches] == [
+            ("Marie", "Le Gall")
+        ]
+
+    def test_scales_to_large_dictionary(self) -> None:
+        trie = TokenTrie(f"Commune-{i:05d}" for i in range(35_000))
+        text = "Arrivée à Commune-34999 puis Commune-00001."
+        tokens = tokenize(text)
+
+        starts = [i for i in range(len(tokens)) if trie.match_ends(tokens, i)]
+
+        assert len(trie) == 35_000
+        assert [tokens[i].key for i in starts] == ["Commune", "Commune"]
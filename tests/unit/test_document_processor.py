@@ -115,6 +115,7 @@ class TestDocumentProcessor:
         # Mock mapping repository (no existing entities)
         mock_mapping_repo = Mock()
         mock_mapping_repo.find_by_full_name.return_value = None
+        mock_mapping_repo.get_counters.return_value = {}
         mock_mapping_repo.find_all.return_value = []  # Story 2.8: No existing mappings
         mock_mapping_repo.save_batch.return_value = [
             Entity(
@@ -166,6 +167,7 @@ class TestDocumentProcessor:
                         mock_engine.strip_titles.side_effect = lambda x: x
                         # Mock strip_prepositions to return input unchanged (no prepositions in test data)
                         mock_engine.strip_prepositions.side_effect = lambda x: x
+                        mock_engine.gender_detector = None
                         # Mock parse_full_name for PERSON entities
                         mock_engine.parse_full_name.side_effect = [
                             ("Marie", "Dubois", False),  # First call for "Marie Dubois"
@@ -301,6 +303,7 @@ class TestDocumentProcessor:
             existing_person,
             existing_location,
         ]
+        mock_mapping_repo.get_counters.return_value = {}
         mock_mapping_repo.find_all.return_value = [
             existing_person,
             existing_location,
@@ -607,6 +610,7 @@ class TestBuildPseudonymPreviews:
 
         mock_mapping_repo = Mock()
         mock_mapping_repo.find_by_full_name.return_value = None
+        mock_mapping_repo.get_counters.return_value = {}
         mock_mapping_repo.find_all.return_value = []
 
         with (
@@ -669,6 +673,7 @@ class TestBuildPseudonymPreviews:
 
         mock_mapping_repo = Mock()
         mock_mapping_repo.find_by_full_name.return_value = existing
+        mock_mapping_repo.get_counters.return_value = {}
         mock_mapping_repo.find_all.return_value = [existing]
 
         with (
@@ -729,6 +734,7 @@ class TestBuildPseudonymPreviews:
 
         mock_mapping_repo = Mock()
         mock_mapping_repo.find_by_full_name.return_value = None
+        mock_mapping_repo.get_counters.return_value = {}
         mock_mapping_repo.find_all.return_value = []
 
         with (
@@ -807,6 +813,7 @@ class TestFinalizeDocument:
 
         mock_mapping_repo = Mock()
         mock_mapping_repo.find_by_full_name.return_value = None
+        mock_mapping_repo.get_counters.return_value = {}
         mock_mapping_repo.find_all.return_value = []
         mock_mapping_repo.save_batch.return_value = []
 
@@ -878,6 +885,7 @@ class TestFinalizeDocument:
         mock_gender_class.return_value = mock_gender
 
         mock_mapping_repo = Mock()
+        mock_mapping_repo.get_counters.return_value = {}
         mock_mapping_repo.find_all.return_value = []
 
         with (
@@ -994,6 +1002,7 @@ class TestErrorCases:
 
         mock_mapping_repo = Mock()
         mock_mapping_repo.find_by_full_name.return_value = None
+        mock_mapping_repo.get_counters.return_value = {}
         mock_mapping_repo.find_all.return_value = []
         mock_mapping_repo.save_batch.side_effect = DatabaseError("disk I/O error")
 
@@ -1061,6 +1070,7 @@ class TestErrorCases:
 
         mock_mapping_repo = Mock()
         mock_mapping_repo.find_by_full_name.return_value = None
+        mock_mapping_repo.get_counters.return_value = {}
         mock_mapping_repo.find_all.return_value = []
 
         mock_validation_workflow.side_effect = KeyboardInterrupt()
@@ -5,6 +5,7 @@ Tests each private method extracted during the process_document() decomposition.
 
 from __future__ import annotations
 
+from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
@@ -113,6 +114,68 @@ class TestDetectAndFilterEntities:
         assert result == []
 
 
+# ===========================================================================
+# detect_entities_batch
+# ===========================================================================
+
+
+class TestDetectEntitiesBatch:
+    """Tests for detect_entities_batch()."""
+
+    @patch("gdpr_pseudonymizer.core.document_processor.HybridDetector")
+    def test_streams_results_in_input_order(
+        self, mock_detector_cls: MagicMock, tmp_path: Path
+    ) -> None:
+        """Text files are detected in one stream; others yield None in place."""
+        base = tmp_path
+        (base / "a.txt").write_text("Marie à Paris", encoding="utf-8")
+        (base / "b.csv").write_text("nom\nMarie", encoding="utf-8")
+        (base / "c.txt").write_text("", encoding="utf-8")
+        (base / "d.txt").write_text("ACME", encoding="utf-8")
+        paths = [str(base / n) for n in ("a.txt", "b.csv", "c.txt", "missing.txt")]
+        paths.append(str(base / "d.txt"))
+
+        mock_detector = MagicMock()
+        mock_detector.detect_entities_batch.side_effect = lambda texts, **kw: (
+            [_make_entity(text.split()[0], "PERSON")] for text in texts
+        )
+        mock_detector_cls.return_value = mock_detector
+
+        processor = _make_processor()
+        results = list(
+            processor.detect_entities_batch(paths, entity_type_filter={"PERSON"})
+        )
+
+        assert [path for path, _ in results] == paths
+        assert results[0][1] is not None
+        assert results[0][1][0] == "Marie à Paris"
+        assert [e.text for e in results[0][1][1]] == ["Marie"]
+        assert [detection for _, detection in results[1:4]] == [None, None, None]
+        assert results[4][1] is not None
+        assert results[4][1][0] == "ACME"
+
+    @patch("gdpr_pseudonymizer.core.document_processor.HybridDetector")
+    def test_process_document_uses_precomputed_detection(
+        self, mock_detector_cls: MagicMock
+    ) -> None:
+        """process_document skips reading and detection when given a detection."""
+        processor = _make_processor()
+        with (
+            patch("gdpr_pseudonymizer.core.document_processor.read_file") as mock_read,
+            patch(
+                "gdpr_pseudonymizer.core.document_processor.open_database",
+                side_effect=RuntimeError("stop"),
+            ),
+        ):
+            result = processor.process_document(
+                "in.txt", "out.txt", detection=("text", [])
+            )
+
+        mock_read.assert_not_called()
+        mock_detector_cls.return_value.detect_entities.assert_not_called()
+        assert result.success is False
+
+
 # ===========================================================================
 # _init_processing_context
 # ===========================================================================
@@ -170,6 +233,7 @@ class TestInitProcessingContext:
         mock_manager.load_existing_mappings.return_value = None
         existing = [Mock(), Mock()]
         mock_sqlite_repo.return_value.find_all.return_value = existing
+        mock_sqlite_repo.return_value.get_counters.return_value = {"fallback:ORG": 2}
 
         processor = DocumentProcessor(
             db_path="test.db", passphrase="test_pass", theme="star_wars"
@@ -177,7 +241,39 @@ class TestInitProcessingContext:
         processor._init_processing_context(mock_db_session)
 
         mock_manager.load_library.assert_called_once_with("star_wars")
-        mock_manager.load_existing_mappings.assert_called_once_with(existing)
+        mock_manager.load_existing_mappings.assert_called_once_with(
+            existing, counters={"fallback:ORG": 2}
+        )
+
+    @patch("gdpr_pseudonymizer.core.document_processor.CompositionalPseudonymEngine")
+    @patch("gdpr_pseudonymizer.core.document_processor.LibraryBasedPseudonymManager")
+    @patch("gdpr_pseudonymizer.core.document_processor.AuditRepository")
+    @patch("gdpr_pseudonymizer.core.document_processor.SQLiteMappingRepository")
+    def test_keyed_pseudonyms_pass_derivation_key(
+        self,
+        mock_sqlite_repo: MagicMock,
+        mock_audit_repo: MagicMock,
+        mock_manager_cls: MagicMock,
+        mock_engine_cls: MagicMock,
+    ) -> None:
+        """Keyed mode hands the manager a subkey of the database key."""
+        from gdpr_pseudonymizer.core.document_processor import DocumentProcessor
+
+        mock_db_session = Mock()
+        mock_db_session.encryption.derive_key.return_value = b"k" * 32
+        mock_sqlite_repo.return_value.find_all.return_value = []
+
+        processor = DocumentProcessor(
+            db_path="test.db", passphrase="test_pass", keyed_pseudonyms=True
+        )
+        processor._init_processing_context(mock_db_session)
+
+        mock_db_session.encryption.derive_key.assert_called_once_with(
+            "pseudonym-derivation"
+        )
+        mock_manager_cls.assert_called_once_with(
+            derivation_key=b"k" * 32, counter_ranges=mock_sqlite_repo.return_value
+        )
 
 
 # ===========================================================================
@@ -367,13 +463,16 @@ class TestResetPseudonymState:
         ctx = Mock()
         existing = [Mock(), Mock()]
         ctx.mapping_repo.find_all.return_value = existing
+        ctx.mapping_repo.get_counters.return_value = {}
 
         processor = _make_processor()
         processor._reset_pseudonym_state(ctx)
 
         ctx.pseudonym_manager.reset_preview_state.assert_called_once()
         ctx.mapping_repo.find_all.assert_called_once()
-        ctx.pseudonym_manager.load_existing_mappings.assert_called_once_with(existing)
+        ctx.pseudonym_manager.load_existing_mappings.assert_called_once_with(
+            existing, counters={}
+        )
 
 
 # ===========================================================================
@@ -523,6 +622,7 @@ class TestResolvePseudonyms:
             "Dubois",
             False,
         )
+        ctx.compositional_engine.gender_detector = None
 
         processor = _make_processor()
         result = processor._resolve_pseudonyms(
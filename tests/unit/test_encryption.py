@@ -298,3 +298,17 @@ class TestEncryptionService:
 
         # Different salts → different derived keys → different ciphertexts
         assert encrypted1 != encrypted2
+
+    def test_derive_key_is_stable_per_purpose(self) -> None:
+        """Test derived subkeys depend on the purpose and the passphrase."""
+        salt = EncryptionService.generate_salt()
+        service = EncryptionService("strong_passphrase_123!", salt)
+        same = EncryptionService("strong_passphrase_123!", salt)
+        other = EncryptionService("other_passphrase_456!", salt)
+
+        key = service.derive_key("pseudonym-derivation")
+
+        assert len(key) == 32
+        assert key == same.derive_key("pseudonym-derivation")
+        assert key != service.derive_key("another-purpose")
+        assert key != other.derive_key("pseudonym-derivation")
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pickle
+
 import pytest
 from pytest_mock import MockerFixture
 
@@ -42,6 +44,26 @@ def test_detected_entity_optional_fields() -> None:
     assert entity.gender is None
 
 
+def test_detected_entity_is_slotted() -> None:
+    """Test DetectedEntity has no per-instance __dict__ and pickles compactly."""
+    entity = DetectedEntity(
+        text="Marie Dubois",
+        entity_type="PERSON",
+        start_pos=0,
+        end_pos=12,
+        source="regex",
+        is_ambiguous=True,
+    )
+
+    restored = pickle.loads(pickle.dumps(entity))
+
+    assert not hasattr(entity, "__dict__")
+    assert restored == entity
+    assert b"start_pos" not in pickle.dumps(entity)
+    with pytest.raises(AttributeError):
+        entity.extra = 1  # type: ignore[attr-defined]
+
+
 def test_entity_detector_is_abstract() -> None:
     """Test that EntityDetector interface cannot be instantiated directly."""
     with pytest.raises(TypeError, match="Can't instantiate abstract class"):
@@ -102,7 +124,7 @@ def test_spacy_detector_load_model_with_mock(mocker: MockerFixture) -> None:
     detector.load_model("fr_core_news_lg")
 
     # Verify model was loaded
-    mock_spacy.load.assert_called_once_with("fr_core_news_lg")
+    mock_spacy.load.assert_called_once_with("fr_core_news_lg", exclude=[])
 
     # Verify model info is correct
     model_info = detector.get_model_info()
@@ -110,6 +132,56 @@ def test_spacy_detector_load_model_with_mock(mocker: MockerFixture) -> None:
     assert model_info["version"] == "3.8.0"
 
 
+@pytest.mark.parametrize(
+    ("profile", "excluded", "enabled"),
+    [
+        ("balanced", ["parser", "lemmatizer"], ["senter"]),
+        ("fast", ["parser", "lemmatizer", "attribute_ruler", "morphologizer"], []),
+    ],
+)
+def test_spacy_detector_profile_excludes_components(
+    mocker: MockerFixture, profile: str, excluded: list[str], enabled: list[str]
+) -> None:
+    """Test detection profiles exclude unneeded pipeline components."""
+    mock_nlp = mocker.MagicMock()
+    mock_nlp.pipe_names = ["tok2vec", "ner"]
+    mock_nlp.disabled = ["senter"]
+    mock_nlp.get_pipe.return_value.listeners = []
+    mock_spacy = mocker.Mock()
+    mock_spacy.load.return_value = mock_nlp
+    mocker.patch.dict("sys.modules", {"spacy": mock_spacy})
+
+    detector = SpaCyDetector(profile=profile)
+    detector.load_model("fr_core_news_lg")
+
+    mock_spacy.load.assert_called_once_with("fr_core_news_lg", exclude=excluded)
+    # The sentence segmenter keeps NER from crossing sentence boundaries
+    assert [c.args[0] for c in mock_nlp.enable_pipe.call_args_list] == enabled
+    # tok2vec without listeners is dead weight once its consumers are excluded
+    mock_nlp.disable_pipe.assert_called_once_with("tok2vec")
+    assert detector.get_model_info()["profile"] == profile
+
+
+def test_spacy_detector_keeps_tok2vec_with_listeners(mocker: MockerFixture) -> None:
+    """Test tok2vec stays enabled while a loaded component listens to it."""
+    mock_nlp = mocker.MagicMock()
+    mock_nlp.pipe_names = ["tok2vec", "morphologizer", "ner"]
+    mock_nlp.get_pipe.return_value.listeners = [mocker.Mock()]
+    mock_spacy = mocker.Mock()
+    mock_spacy.load.return_value = mock_nlp
+    mocker.patch.dict("sys.modules", {"spacy": mock_spacy})
+
+    SpaCyDetector(profile="balanced").load_model("fr_core_news_lg")
+
+    mock_nlp.disable_pipe.assert_not_called()
+
+
+def test_spacy_detector_rejects_unknown_profile() -> None:
+    """Test unknown detection profile raises ValueError."""
+    with pytest.raises(ValueError, match="Unknown detection profile"):
+        SpaCyDetector(profile="turbo")
+
+
 def test_spacy_detector_model_not_found_error(mocker: MockerFixture) -> None:
     """Test error handling when spaCy model is not installed."""
     import subprocess
@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
+import random
+from collections import defaultdict
+from collections.abc import Callable
+
+import pytest
+
 from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
 from gdpr_pseudonymizer.nlp.entity_grouping import (
+    K,
     UnionFind,
     _cluster_by_normalization,
+    _cluster_person_variants,
+    _is_person_variant,
+    _normalize_location,
+    _normalize_person,
     group_entity_variants,
 )
 
@@ -332,3 +343,91 @@ class TestClusterByNormalization:
         keys = [("a", "T"), ("b", "T"), ("c", "T")]
         clusters = _cluster_by_normalization(keys, lambda t: t)
         assert len(clusters) == 3
+
+
+def _reference_cluster_by_normalization(
+    keys: list[K], normalizer: Callable[[str], str]
+) -> list[list[K]]:
+    """Pairwise clustering the bucketed implementation must reproduce."""
+    normalized = {k: normalizer(k[0]) for k in keys}
+    uf = UnionFind(keys)
+    for i in range(len(keys)):
+        for j in range(i + 1, len(keys)):
+            if normalized[keys[i]] == normalized[keys[j]]:
+                uf.union(keys[i], keys[j])
+    return uf.clusters()
+
+
+def _reference_cluster_person_variants(keys: list[K]) -> list[list[K]]:
+    """Pairwise PERSON clustering the bucketed implementation must reproduce."""
+    normalized = {k: _normalize_person(k[0]) for k in keys}
+    last_name_to_full_keys: dict[str, list[K]] = defaultdict(list)
+    for key in keys:
+        parts = normalized[key].split()
+        if len(parts) >= 2:
+            last_name_to_full_keys[parts[-1].lower()].append(key)
+
+    ambiguous_keys: set[K] = set()
+    for key in keys:
+        parts = normalized[key].split()
+        if len(parts) == 1:
+            matching_full_keys = last_name_to_full_keys.get(parts[0].lower(), [])
+            first_names = {normalized[k].split()[0].lower() for k in matching_full_keys}
+            if len(matching_full_keys) >= 2 and len(first_names) >= 2:
+                ambiguous_keys.add(key)
+
+    uf = UnionFind(keys)
+    for i in range(len(keys)):
+        for j in range(i + 1, len(keys)):
+            ka, kb = keys[i], keys[j]
+            if ka in ambiguous_keys or kb in ambiguous_keys:
+                continue
+            if _is_person_variant(normalized[ka], normalized[kb]):
+                uf.union(ka, kb)
+    return uf.clusters()
+
+
+_FIRST_NAMES = ["Marie", "marie", "Jean", "Anne-Sophie", "Li", "MARIE"]
+_LAST_NAMES = ["Dubois", "DUBOIS", "Martin", "Le Gall", "Wu", "Durand"]
+_TITLES = ["", "", "M. ", "Mme ", "Dr. ", "Pr. ", "Maître "]
+
+
+def _random_person_keys(rng: random.Random, count: int) -> list[K]:
+    texts: set[str] = set()
+    while len(texts) < count:
+        shape = rng.random()
+        if shape < 0.35:
+            name = rng.choice(_LAST_NAMES)
+        elif shape < 0.9:
+            name = f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}"
+        elif shape < 0.95:
+            name = f"{rng.choice(_FIRST_NAMES)} {rng.choice(_FIRST_NAMES)} Dubois"
+        else:
+            name = rng.choice(["M.", "Dr.", "Dubois-Martin", "  Wu "])
+        texts.add(rng.choice(_TITLES) + name)
+    keys = [(text, "PERSON") for text in texts]
+    rng.shuffle(keys)
+    return keys
+
+
+class TestBucketedClusteringMatchesPairwise:
+    """Bucketed candidate generation yields the pairwise clusters."""
+
+    @pytest.mark.parametrize("seed", range(40))
+    def test_person_clusters(self, seed: int) -> None:
+        rng = random.Random(seed)
+        keys = _random_person_keys(rng, rng.randint(0, 40))
+
+        assert _cluster_person_variants(keys) == _reference_cluster_person_variants(
+            keys
+        )
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_location_clusters(self, seed: int) -> None:
+        rng = random.Random(seed)
+        places = ["Paris", "paris", "à Paris", "Lyon", "de Lyon", "en Bretagne"]
+        keys = [(text, "LOCATION") for text in rng.sample(places, rng.randint(0, 6))]
+
+        assert _cluster_by_normalization(
+            keys, _normalize_location
+        ) == _reference_cluster_by_normalization(keys, _normalize_location)
@@ -0,0 +1,103 @@
+"""Unit tests for columnar entity span storage."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
+from gdpr_pseudonymizer.nlp.entity_spans import EntitySpans
+
+
+def _entities() -> list[DetectedEntity]:
+    return [
+        DetectedEntity("Paris", "LOCATION", 30, 35, source="spacy"),
+        DetectedEntity("Marie Dubois", "PERSON", 0, 12, source="spacy"),
+        DetectedEntity("Marie", "PERSON", 0, 5, source="regex"),
+        DetectedEntity("Marie Dubois", "PERSON", 0, 12, source="regex"),
+        DetectedEntity("Acme", "ORG", 40, 44, source="spacy"),
+    ]
+
+
+def _brute_force_non_overlapping(spans: EntitySpans) -> list[int]:
+    kept: list[int] = []
+    for row in spans.sorted_rows():
+        start, end = spans.starts[row], spans.ends[row]
+        if all(end <= spans.starts[k] or start >= spans.ends[k] for k in kept):
+            kept.append(row)
+    return kept
+
+
+class TestEntitySpans:
+    """Tests for EntitySpans."""
+
+    def test_from_entities(self) -> None:
+        spans = EntitySpans.from_entities(_entities())
+
+        assert len(spans) == 5
+        assert list(spans.starts) == [30, 0, 0, 0, 40]
+        assert spans.entity_type(1) == "PERSON"
+        assert spans.source(2) == "regex"
+        assert spans.types == ["LOCATION", "PERSON", "ORG"]
+
+    def test_of_types(self) -> None:
+        spans = EntitySpans.from_entities(_entities())
+
+        assert spans.of_types(["PERSON", "ORG"]) == [1, 2, 3, 4]
+        assert spans.of_types(["UNKNOWN"]) == []
+
+    def test_sorted_rows_longest_first_and_stable(self) -> None:
+        spans = EntitySpans.from_entities(_entities())
+
+        assert spans.sorted_rows() == [1, 3, 2, 0, 4]
+
+    def test_unique_rows(self) -> None:
+        spans = EntitySpans.from_entities(_entities())
+
+        assert spans.unique_rows() == [0, 1, 2, 4]
+
+    def test_non_overlapping(self) -> None:
+        spans = EntitySpans.from_entities(_entities())
+
+        assert spans.non_overlapping() == [1, 0, 4]
+
+    def test_non_overlapping_matches_pairwise_rule(self) -> None:
+        rng = random.Random(7)
+        for _ in range(500):
+            spans = EntitySpans()
+            for _ in range(rng.randint(0, 10)):
+                start = rng.randint(0, 20)
+                spans.append(start, start + rng.choice([0, 0, 1, 2, 5]))
+
+            assert spans.non_overlapping() == _brute_force_non_overlapping(spans)
+
+    def test_substitute(self) -> None:
+        text = "Marie Dubois habite à Paris."
+        spans = EntitySpans()
+        spans.append(22, 27)
+        spans.append(0, 12)
+
+        assert (
+            spans.substitute(text, [1, 0], ["Léa Martin", "Lyon"])
+            == "Léa Martin habite à Lyon."
+        )
+
+    def test_substitute_empty_spans_latest_first(self) -> None:
+        spans = EntitySpans()
+        spans.append(2, 2)
+        spans.append(2, 2)
+
+        assert spans.substitute("abcd", [0, 1], ["X", "Y"]) == "abYXcd"
+
+    def test_append_rejects_reversed_span(self) -> None:
+        with pytest.raises(ValueError, match="before start"):
+            EntitySpans().append(5, 3)
+
+    def test_vocabulary_limit(self) -> None:
+        spans = EntitySpans()
+        for i in range(256):
+            spans.append(0, 1, entity_type=f"T{i}")
+
+        with pytest.raises(ValueError, match="at most 256"):
+            spans.append(0, 1, entity_type="T256")
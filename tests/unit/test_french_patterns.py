@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from gdpr_pseudonymizer.utils.cache_stats import CacheStats
 from gdpr_pseudonymizer.utils.french_patterns import (
+    clear_normalization_cache,
+    normalization_cache_stats,
     strip_french_prepositions,
     strip_french_titles,
 )
@@ -120,3 +123,32 @@ class TestStripFrenchPrepositions:
 
     def test_case_insensitive(self) -> None:
         assert strip_french_prepositions("EN France") == "France"
+
+
+class TestNormalizationCache:
+    """Tests for memoized title/preposition normalization."""
+
+    def test_repeated_normalization_counted_as_hits(self) -> None:
+        clear_normalization_cache()
+
+        for _ in range(3):
+            assert strip_french_titles("Dr. Marie Dubois") == "Marie Dubois"
+            assert strip_french_prepositions("à Paris") == "Paris"
+
+        assert normalization_cache_stats() == CacheStats(hits=4, misses=2)
+
+    def test_titles_and_prepositions_cached_separately(self) -> None:
+        clear_normalization_cache()
+
+        assert strip_french_prepositions("M. de Paris") == "M. de Paris"
+        assert strip_french_titles("M. de Paris") == "de Paris"
+        assert normalization_cache_stats().misses == 2
+
+    def test_stats_difference(self) -> None:
+        before = normalization_cache_stats()
+        strip_french_titles("Mme Fontaine")
+        strip_french_titles("Mme Fontaine")
+        delta = normalization_cache_stats() - before
+
+        assert delta.total == 2
+        assert delta.hits >= 1
@@ -8,6 +8,7 @@ import pytest
 
 from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
 from gdpr_pseudonymizer.nlp.hybrid_detector import HybridDetector
+from gdpr_pseudonymizer.utils.french_patterns import strip_french_titles
 
 pytestmark = [
     pytest.mark.spacy,
@@ -98,9 +99,10 @@ class TestHybridDetector:
         overlapping_entities = []
         for i, e1 in enumerate(entities):
             for e2 in entities[i + 1 :]:
-                if detector._has_overlap(e1, e2) and not detector._is_exact_match(
-                    e1, e2
-                ):
+                overlaps = e1.start_pos < e2.end_pos and e2.start_pos < e1.end_pos
+                same_span = (e1.start_pos, e1.end_pos) == (e2.start_pos, e2.end_pos)
+                same_name = strip_french_titles(e1.text) == strip_french_titles(e2.text)
+                if overlaps and not (same_span or same_name):
                     overlapping_entities.extend([e1, e2])
 
         if overlapping_entities:
@@ -122,7 +124,10 @@ class TestHybridDetector:
         if person_entities and location_entities:
             for person in person_entities:
                 for location in location_entities:
-                    assert not detector._has_overlap(person, location)
+                    assert (
+                        person.end_pos <= location.start_pos
+                        or location.end_pos <= person.start_pos
+                    )
 
     def test_confidence_scores_present(self, detector: HybridDetector) -> None:
         """Test that detected entities have confidence scores."""
@@ -0,0 +1,136 @@
+"""
+Unit tests for HybridDetector entity merging (no spaCy model required)
+"""
+
+import copy
+import random
+
+import pytest
+
+from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
+from gdpr_pseudonymizer.nlp.hybrid_detector import HybridDetector
+from gdpr_pseudonymizer.utils.french_patterns import strip_french_titles
+
+_TEXTS = [
+    ("Marie Dubois", "PERSON"),
+    ("Dr. Marie Dubois", "PERSON"),
+    ("Dubois", "PERSON"),
+    ("Maître", "PERSON"),
+    ("Cabinet Mercier", "PERSON"),
+    ("Cabinet Mercier & Associés", "ORG"),
+    ("Société Acme", "ORG"),
+    ("Paris", "LOCATION"),
+    ("Lieu", "LOCATION"),
+]
+
+
+def _reference_merge(
+    detector: HybridDetector,
+    spacy_entities: list[DetectedEntity],
+    regex_entities: list[DetectedEntity],
+) -> list[DetectedEntity]:
+    """Pairwise merge as implemented before the interval sweep."""
+    merged = list(spacy_entities)
+    entities_to_remove = []
+    for regex_entity in regex_entities:
+        overlap_found = False
+        for spacy_entity in spacy_entities:
+            if not (
+                spacy_entity.end_pos <= regex_entity.start_pos
+                or regex_entity.end_pos <= spacy_entity.start_pos
+            ):
+                overlap_found = True
+                same_span = (spacy_entity.start_pos, spacy_entity.end_pos) == (
+                    regex_entity.start_pos,
+                    regex_entity.end_pos,
+                )
+                if same_span or strip_french_titles(
+                    spacy_entity.text
+                ) == strip_french_titles(regex_entity.text):
+                    break
+                elif detector._should_prefer_regex_org(regex_entity, spacy_entity):
+                    entities_to_remove.append(spacy_entity)
+                    merged.append(regex_entity)
+                    break
+                else:
+                    regex_entity.is_ambiguous = True
+                    merged.append(regex_entity)
+                    break
+        if not overlap_found:
+            merged.append(regex_entity)
+    for entity in entities_to_remove:
+        if entity in merged:
+            merged.remove(entity)
+    merged = detector._filter_title_only_entities(merged)
+    merged = detector._filter_label_words(merged)
+    merged.sort(key=lambda e: e.start_pos)
+    return merged
+
+
+def _random_entities(
+    rng: random.Random, count: int, source: str, text_length: int
+) -> list[DetectedEntity]:
+    entities = []
+    for _ in range(count):
+        text, entity_type = rng.choice(_TEXTS)
+        start = rng.randrange(text_length)
+        end = start + rng.randint(0, 30)
+        entities.append(
+            DetectedEntity(
+                text=text,
+                entity_type=entity_type,
+                start_pos=start,
+                end_pos=end,
+                source=source,
+            )
+        )
+    return entities
+
+
+@pytest.fixture
+def detector() -> HybridDetector:
+    return HybridDetector()
+
+
+class TestMergeEntities:
+    """_merge_entities() must make the same decisions as the pairwise merge."""
+
+    def test_first_overlap_follows_list_order(self, detector: HybridDetector) -> None:
+        spacy_entities = [
+            DetectedEntity("Dubois", "PERSON", 6, 12),
+            DetectedEntity("Marie", "PERSON", 0, 5),
+        ]
+        regex_entities = [
+            DetectedEntity("Marie Dubois", "PERSON", 0, 12, source="regex"),
+            DetectedEntity("Paris", "LOCATION", 20, 25, source="regex"),
+        ]
+
+        assert detector._first_overlaps(spacy_entities, regex_entities) == [0, None]
+
+    def test_org_supersedes_person(self, detector: HybridDetector) -> None:
+        spacy_entity = DetectedEntity("Cabinet Mercier", "PERSON", 0, 15)
+        regex_entity = DetectedEntity(
+            "Cabinet Mercier & Associés", "ORG", 0, 26, source="regex"
+        )
+
+        merged = detector._merge_entities([spacy_entity], [regex_entity])
+
+        assert merged == [regex_entity]
+        assert not regex_entity.is_ambiguous
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_pairwise_merge(self, detector: HybridDetector, seed: int) -> None:
+        rng = random.Random(seed)
+        text_length = rng.choice([50, 500, 5000])
+        spacy_entities = _random_entities(rng, rng.randint(0, 60), "spacy", text_length)
+        regex_entities = _random_entities(rng, rng.randint(0, 60), "regex", text_length)
+        if spacy_entities and rng.random() < 0.5:
+            # Equal spaCy duplicates exercise first-occurrence removal
+            spacy_entities.append(copy.copy(rng.choice(spacy_entities)))
+
+        expected = _reference_merge(
+            detector, copy.deepcopy(spacy_entities), copy.deepcopy(regex_entities)
+        )
+        merged = detector._merge_entities(spacy_entities, regex_entities)
+
+        assert merged == expected
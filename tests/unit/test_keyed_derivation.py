@@ -0,0 +1,172 @@
+"""Unit tests for keyed deterministic pseudonym derivation."""
+
+from __future__ import annotations
+
+import unicodedata
+from unittest.mock import Mock
+
+import pytest
+
+from gdpr_pseudonymizer.pseudonym.assignment_engine import (
+    CompositionalPseudonymEngine,
+)
+from gdpr_pseudonymizer.pseudonym.keyed_derivation import KeyedComponentDeriver
+from gdpr_pseudonymizer.pseudonym.library_manager import (
+    LibraryBasedPseudonymManager,
+)
+
+KEY = bytes(range(32))
+OTHER_KEY = bytes(range(1, 33))
+
+PEOPLE = [
+    ("Marie", "Dubois", "female"),
+    ("Pierre", "Lefebvre", "male"),
+    ("Sophie", "Martin", "female"),
+    ("Jean", "Bernard", "male"),
+]
+
+
+def _keyed_manager(key: bytes = KEY) -> LibraryBasedPseudonymManager:
+    manager = LibraryBasedPseudonymManager(derivation_key=key)
+    manager.load_library("neutral")
+    return manager
+
+
+def _assign_all(
+    manager: LibraryBasedPseudonymManager, people: list[tuple[str, str, str]]
+) -> dict[tuple[str, str], str]:
+    return {
+        (first, last): manager.assign_pseudonym(
+            entity_type="PERSON", first_name=first, last_name=last, gender=gender
+        ).pseudonym_full
+        for first, last, gender in people
+    }
+
+
+class TestKeyedComponentDeriver:
+    """Tests for KeyedComponentDeriver.probe_order()."""
+
+    @pytest.mark.parametrize("size", [1, 2, 12, 97, 500])
+    def test_probe_order_is_permutation(self, size: int) -> None:
+        order = list(KeyedComponentDeriver(KEY).probe_order("last_name", "X", size))
+
+        assert sorted(order) == list(range(size))
+
+    def test_probe_order_depends_on_key_and_component(self) -> None:
+        deriver = KeyedComponentDeriver(KEY)
+
+        def first(
+            d: KeyedComponentDeriver, component_type: str, name: str
+        ) -> list[int]:
+            return list(d.probe_order(component_type, name, 1000))[:5]
+
+        assert first(deriver, "last_name", "Dubois") == first(
+            KeyedComponentDeriver(KEY), "last_name", "Dubois"
+        )
+        assert first(deriver, "last_name", "Dubois") != first(
+            KeyedComponentDeriver(OTHER_KEY), "last_name", "Dubois"
+        )
+        assert first(deriver, "last_name", "Dubois") != first(
+            deriver, "first_name", "Dubois"
+        )
+
+    def test_unicode_forms_derive_alike(self) -> None:
+        deriver = KeyedComponentDeriver(KEY)
+        composed = unicodedata.normalize("NFC", "Élise")
+        decomposed = unicodedata.normalize("NFD", "Élise")
+
+        assert list(deriver.probe_order("first_name", composed, 50)) == list(
+            deriver.probe_order("first_name", f" {decomposed} ", 50)
+        )
+
+    def test_empty_candidate_list(self) -> None:
+        assert list(KeyedComponentDeriver(KEY).probe_order("x", "y", 0)) == []
+
+    def test_short_key_rejected(self) -> None:
+        with pytest.raises(ValueError, match="at least 16 bytes"):
+            KeyedComponentDeriver(b"short")
+
+
+class TestKeyedPseudonymManager:
+    """LibraryBasedPseudonymManager with a derivation key."""
+
+    def test_independent_managers_agree(self) -> None:
+        first = _assign_all(_keyed_manager(), PEOPLE)
+        second = _assign_all(_keyed_manager(), list(reversed(PEOPLE)))
+
+        assert first == second
+
+    def test_different_key_changes_pseudonyms(self) -> None:
+        assert _assign_all(_keyed_manager(), PEOPLE) != _assign_all(
+            _keyed_manager(OTHER_KEY), PEOPLE
+        )
+
+    def test_random_mode_unaffected(self) -> None:
+        manager = LibraryBasedPseudonymManager()
+        manager.load_library("neutral")
+
+        assert not manager.keyed_derivation
+        assert _keyed_manager().keyed_derivation
+
+    def test_collision_probes_next_candidate(self) -> None:
+        manager = _keyed_manager()
+        distinct = list(dict.fromkeys(manager.last_names))
+        probes = KeyedComponentDeriver(KEY).probe_order(
+            "last_name", "Dubois", len(distinct)
+        )
+        preferred, fallback = distinct[next(probes)], distinct[next(probes)]
+        manager._set_component_mapping("Lefebvre", "last_name", preferred)
+
+        assignment = manager.assign_pseudonym(
+            entity_type="PERSON", first_name="Marie", last_name="Dubois"
+        )
+
+        assert assignment.pseudonym_last == fallback
+        assert manager.get_component_mapping("Dubois", "last_name") == fallback
+
+    def test_existing_mapping_reused(self) -> None:
+        manager = _keyed_manager()
+        manager._set_component_mapping("Dubois", "last_name", "Zed")
+
+        assignment = manager.assign_pseudonym(
+            entity_type="PERSON", first_name="Marie", last_name="Dubois"
+        )
+
+        assert assignment.pseudonym_last == "Zed"
+
+    def test_standalone_last_name_derived_from_first(self) -> None:
+        first = _keyed_manager().assign_pseudonym(
+            entity_type="PERSON", first_name="Marie", gender="female"
+        )
+        second = _keyed_manager().assign_pseudonym(
+            entity_type="PERSON", first_name="Marie", gender="female"
+        )
+
+        assert first.pseudonym_full == second.pseudonym_full
+
+    def test_usage_counted(self) -> None:
+        manager = _keyed_manager()
+        _assign_all(manager, PEOPLE)
+
+        assert manager._library_usage["first_name"] == len(PEOPLE)
+        assert manager._library_usage["last_name"] == len(PEOPLE)
+
+
+class TestKeyedCompositionalEngine:
+    """CompositionalPseudonymEngine semantics in keyed mode."""
+
+    def test_components_shared_across_entities(self) -> None:
+        repository = Mock()
+        repository.find_component_pseudonym.return_value = None
+        engine = CompositionalPseudonymEngine(
+            pseudonym_manager=_keyed_manager(), mapping_repository=repository
+        )
+
+        full = engine.assign_compositional_pseudonym("Marie Dubois", "PERSON")
+        standalone = engine.assign_compositional_pseudonym("Dubois", "PERSON")
+        relative = engine.assign_compositional_pseudonym("Paul Dubois", "PERSON")
+
+        assert standalone.pseudonym_full == full.pseudonym_last
+        assert standalone.is_ambiguous
+        assert relative.pseudonym_last == full.pseudonym_last
+        assert relative.pseudonym_first != full.pseudonym_first
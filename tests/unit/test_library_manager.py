@@ -15,9 +15,11 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
+from helpers import replace_library
 
 from gdpr_pseudonymizer.pseudonym.assignment_engine import PseudonymAssignment
 from gdpr_pseudonymizer.pseudonym.library_manager import (
@@ -74,18 +76,20 @@ class TestLibraryLoading:
         with pytest.raises(FileNotFoundError, match="Pseudonym library not found"):
             manager.load_library("nonexistent_theme")
 
-    def test_load_library_invalid_json(self) -> None:
+    def test_load_library_invalid_json(self, tmp_path: Path) -> None:
         """Test loading invalid JSON raises ValueError."""
+        broken_path = tmp_path / "pseudonyms" / "broken.json"
+        broken_path.parent.mkdir(parents=True)
+        broken_path.write_text('{"theme": "broken",', encoding="utf-8")
+
         manager = LibraryBasedPseudonymManager()
 
-        # Mock json.load to raise JSONDecodeError
         with patch(
-            "gdpr_pseudonymizer.pseudonym.library_manager.json.load"
-        ) as mock_load:
-            mock_load.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-
+            "gdpr_pseudonymizer.resources.PSEUDONYMS_DIR",
+            tmp_path / "pseudonyms",
+        ):
             with pytest.raises(ValueError, match="Invalid JSON format"):
-                manager.load_library("neutral")  # Use existing file, mock will fail
+                manager.load_library("broken")
 
     def test_load_library_missing_required_fields(self, tmp_path: Path) -> None:
         """Test loading library with missing required fields raises ValueError."""
@@ -889,3 +893,251 @@ class TestLocationOrganizationSupport:
 
         expected_exhaustion = len(manager._used_pseudonyms) / total_combinations
         assert exhaustion_after == pytest.approx(expected_exhaustion)
+
+
+class TestWithoutReplacementSampling:
+    """Test suite for the shuffled pools of unused candidates."""
+
+    def test_every_location_assigned_before_fallback(self) -> None:
+        """Test that fallback naming starts only once all locations are used."""
+        manager = LibraryBasedPseudonymManager()
+        manager.load_library("neutral")
+        all_locations = set(manager._flatten_location_list(manager.locations))
+
+        assigned = [
+            manager.assign_pseudonym(entity_type="LOCATION").pseudonym_full
+            for _ in all_locations
+        ]
+
+        assert set(assigned) == all_locations
+        assert (
+            manager.assign_pseudonym(entity_type="LOCATION").pseudonym_full
+            == "Location-001"
+        )
+
+    def test_every_organization_assigned_before_fallback(self) -> None:
+        """Test that fallback naming starts only once all organizations are used."""
+        manager = LibraryBasedPseudonymManager()
+        manager.load_library("neutral")
+        all_orgs = set(manager._flatten_organization_list(manager.organizations))
+
+        assigned = [
+            manager.assign_pseudonym(entity_type="ORG").pseudonym_full for _ in all_orgs
+        ]
+
+        assert set(assigned) == all_orgs
+        assert manager.assign_pseudonym(entity_type="ORG").pseudonym_full == "Org-001"
+
+    def test_every_last_name_assigned_before_exhaustion(self) -> None:
+        """Test that each last name is handed out once before RuntimeError."""
+        manager = LibraryBasedPseudonymManager()
+        manager.load_library("neutral")
+        last_names = set(manager.last_names)
+
+        assigned = {
+            manager._select_last_name(f"Reel{i}") for i in range(len(last_names))
+        }
+
+        assert assigned == last_names
+        with pytest.raises(RuntimeError, match="Unable to find unique last name"):
+            manager._select_last_name("Reel-final")
+
+    def test_pool_rebuilt_from_loaded_mappings(self) -> None:
+        """Test that names used in the database are not drawn again."""
+        manager = LibraryBasedPseudonymManager()
+        manager.load_library("neutral")
+        manager.assign_pseudonym(entity_type="LOCATION")  # builds the pool
+        used = manager._flatten_location_list(manager.locations)[:-1]
+        existing = [
+            SimpleNamespace(entity_type="LOCATION", pseudonym_full=name)
+            for name in used
+        ]
+
+        manager.reset_preview_state()
+        manager.load_existing_mappings(existing)
+
+        assert (
+            manager.assign_pseudonym(entity_type="LOCATION").pseudonym_full
+            == manager._flatten_location_list(manager.locations)[-1]
+        )
+
+    def test_replaced_library_data_rebuilds_pool(self) -> None:
+        """Test that a pool follows library data replaced after loading."""
+        manager = LibraryBasedPseudonymManager()
+        manager.load_library("neutral")
+        manager._select_last_name("Dubois")
+
+        replace_library(manager, last_names=["Alpha"])
+
+        assert manager._select_last_name("Martin") == "Alpha"
+
+
+class TestSharedLibraryCache:
+    """Test suite for the process-wide loaded-library cache."""
+
+    def test_managers_share_library_data(self) -> None:
+        """Test that managers reference the same immutable library data."""
+        first = LibraryBasedPseudonymManager()
+        first.load_library("neutral")
+        second = LibraryBasedPseudonymManager()
+
+        with patch(
+            "gdpr_pseudonymizer.pseudonym.library_manager.load_resource"
+        ) as load_resource:
+            second.load_library("neutral")
+
+        load_resource.assert_not_called()
+        assert second._library is first._library
+        assert second.last_names is first.last_names
+        assert isinstance(second.last_names, tuple)
+        with pytest.raises(TypeError):
+            second.first_names["male"] = ()  # type: ignore[index]
+
+    def test_usage_state_is_per_manager(self) -> None:
+        """Test that assignments in one manager do not affect another."""
+        first = LibraryBasedPseudonymManager()
+        first.load_library("neutral")
+        second = LibraryBasedPseudonymManager()
+        second.load_library("neutral")
+
+        first.assign_pseudonym("PERSON", "Marie", "Dubois", "female")
+
+        assert second._used_pseudonyms == set()
+        assert second._component_mappings == {}
+        assert second.check_exhaustion() == 0.0
+
+    def test_edited_library_file_is_reloaded(self, tmp_path: Path) -> None:
+        """Test that a library file changed on disk is loaded again."""
+        from gdpr_pseudonymizer.resources import PSEUDONYMS_DIR
+
+        data = json.loads((PSEUDONYMS_DIR / "neutral.json").read_text("utf-8"))
+        library_path = tmp_path / "pseudonyms" / "neutral.json"
+        library_path.parent.mkdir()
+        library_path.write_text(json.dumps(data), encoding="utf-8")
+
+        manager = LibraryBasedPseudonymManager()
+        with patch(
+            "gdpr_pseudonymizer.resources.PSEUDONYMS_DIR", tmp_path / "pseudonyms"
+        ):
+            manager.load_library("neutral")
+            data["last_names"].append("Nouveaunom")
+            library_path.write_text(json.dumps(data), encoding="utf-8")
+            manager.load_library("neutral")
+
+        assert manager.last_names[-1] == "Nouveaunom"
+
+    def test_precomputed_exhaustion_matches_library_lists(self) -> None:
+        """Test that the precomputed total matches counting the name lists."""
+        manager = LibraryBasedPseudonymManager()
+        manager.load_library("star_wars")
+        manager._used_pseudonyms.update(f"Used-{i}" for i in range(1000))
+        first_names = sum(len(names) for names in manager.first_names.values())
+        total = (
+            first_names * len(manager.last_names)
+            + len(manager._flatten_location_list(manager.locations))
+            + len(manager._flatten_organization_list(manager.organizations))
+        )
+
+        assert manager.check_exhaustion() == pytest.approx(1000 / total)
+
+    def test_name_lists_are_read_only(self) -> None:
+        """Test that name lists can only change by replacing the library."""
+        manager = LibraryBasedPseudonymManager()
+        manager.load_library("neutral")
+
+        with pytest.raises(AttributeError):
+            manager.last_names = ["Alpha"]  # type: ignore[misc]
+
+
+class TestExhaustionByType:
+    """Test suite for incremental per-type exhaustion tracking."""
+
+    def test_unused_and_neutral_id_report_zero(self) -> None:
+        """Test that fresh and neutral_id managers report no exhaustion."""
+        manager = LibraryBasedPseudonymManager()
+        assert manager.check_exhaustion_by_type() == {
+            "PERSON": 0.0,
+            "LOCATION": 0.0,
+            "ORG": 0.0,
+        }
+
+        manager.load_library("neutral_id")
+        manager.assign_pseudonym(entity_type="LOCATION")
+        assert manager.check_exhaustion_by_type()["LOCATION"] == 0.0
+
+    def test_ratios_follow_assignments(self) -> None:
+        """Test that each type's ratio counts its own library names."""
+        manager = LibraryBasedPseudonymManager()
+        manager.load_library("neutral")
+        locations = set(manager._flatten_location_list(manager.locations))
+        last_names = set(manager.last_names)
+
+        for _ in range(8):
+            manager.assign_pseudonym(entity_type="LOCATION")
+        for i in range(10):
+            manager.assign_pseudonym("PERSON", f"Prenom{i % 2}", f"Nom{i}", "male")
+
+        ratios = manager.check_exhaustion_by_type()
+        assert ratios["LOCATION"] == pytest.approx(8 / len(locations))
+        assert ratios["PERSON"] == pytest.approx(10 / len(last_names))
+        assert ratios["ORG"] == 0.0
+
+    def test_incremental_counters_match_recount(self) -> None:
+        """Test that counters maintained per assignment equal a full recount."""
+        manager = LibraryBasedPseudonymManager()
+        manager.load_library("star_wars")
+        for i in range(40):
+            manager.assign_pseudonym("PERSON", f"Prenom{i % 13}", f"Nom{i % 29}")
+            manager.assign_pseudonym(entity_type=("LOCATION", "ORG")[i % 2])
+
+        incremental = dict(manager._library_usage)
+        manager._recount_library_usage()
+
+        assert manager._library_usage == incremental
+
+    def test_existing_mappings_counted_on_load(self) -> None:
+        """Test that mappings loaded from the database count as used."""
+        manager = LibraryBasedPseudonymManager()
+        manager.load_library("neutral")
+        orgs = manager._flatten_organization_list(manager.organizations)
+        existing = [
+            SimpleNamespace(entity_type="ORG", pseudonym_full=name)
+            for name in orgs[:10]
+        ]
+
+        manager.load_existing_mappings(existing)
+
+        assert manager.check_exhaustion_by_type()["ORG"] == pytest.approx(
+            10 / len(set(orgs))
+        )
+        manager.reset_preview_state()
+        assert manager.check_exhaustion_by_type()["ORG"] == 0.0
+
+    def test_type_warning_logged_once_at_threshold(self) -> None:
+        """Test that crossing the threshold logs one warning for that type."""
+        manager = LibraryBasedPseudonymManager()
+        manager.load_library("neutral")
+        replace_library(
+            manager,
+            locations={
+                "cities": ["Alpha", "Beta", "Gamma", "Delta", "Epsilon"],
+                "countries": [],
+                "regions": [],
+            },
+        )
+
+        with patch(
+            "gdpr_pseudonymizer.pseudonym.library_manager.logger"
+        ) as mock_logger:
+            for _ in range(6):
+                manager.assign_pseudonym(entity_type="LOCATION")
+
+        warnings = [
+            call
+            for call in mock_logger.warning.call_args_list
+            if call.args[0] == "library_type_near_exhaustion"
+        ]
+        assert len(warnings) == 1
+        assert warnings[0].kwargs["entity_type"] == "LOCATION"
+        assert warnings[0].kwargs["exhaustion_pct"] == 80.0
+        assert manager.check_exhaustion_by_type()["LOCATION"] == 1.0
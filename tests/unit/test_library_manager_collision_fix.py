@@ -15,6 +15,7 @@ from __future__ import annotations
 from unittest.mock import MagicMock
 
 import pytest
+from helpers import replace_library
 
 from gdpr_pseudonymizer.pseudonym.library_manager import (
     LibraryBasedPseudonymManager,
@@ -242,7 +243,7 @@ class TestComponentExhaustion:
         manager.load_library("neutral")
 
         # Override last_names with small list for testing
-        manager.last_names = ["Alpha", "Beta"]
+        replace_library(manager, last_names=["Alpha", "Beta"])
 
         # Assign 2 unique last names (exhaust library)
         assignment1 = manager.assign_pseudonym(
@@ -279,11 +280,14 @@ class TestComponentExhaustion:
         manager.load_library("neutral")
 
         # Override first_names with small list for testing
-        manager.first_names = {
-            "male": ["Charlie", "Delta"],
-            "female": [],
-            "neutral": [],
-        }
+        replace_library(
+            manager,
+            first_names={
+                "male": ["Charlie", "Delta"],
+                "female": [],
+                "neutral": [],
+            },
+        )
 
         # Assign 2 unique first names (exhaust male category)
         assignment1 = manager.assign_pseudonym(
@@ -435,11 +439,14 @@ class TestEdgeCases:
         manager.load_library("neutral")
 
         # Override locations with small list for testing
-        manager.locations = {
-            "cities": ["Alpha", "Beta"],
-            "countries": [],
-            "regions": [],
-        }
+        replace_library(
+            manager,
+            locations={
+                "cities": ["Alpha", "Beta"],
+                "countries": [],
+                "regions": [],
+            },
+        )
 
         # Assign without real_name (LOCATION entity)
         assignment1 = manager.assign_pseudonym(
@@ -521,6 +528,102 @@ class TestEdgeCases:
         )  # At least Marie + Dubois + 10 others
 
 
+def _owners_from_mappings(
+    manager: LibraryBasedPseudonymManager,
+) -> dict[tuple[str, str], set[str]]:
+    """Rebuild the reverse component index from _component_mappings."""
+    owners: dict[tuple[str, str], set[str]] = {}
+    for (real, comp_type), pseudo in manager._component_mappings.items():
+        owners.setdefault((pseudo, comp_type), set()).add(real)
+    return owners
+
+
+def _person_entity(
+    first_name: str, last_name: str, pseudonym_first: str, pseudonym_last: str
+) -> MagicMock:
+    entity = MagicMock()
+    entity.entity_type = "PERSON"
+    entity.first_name = first_name
+    entity.last_name = last_name
+    entity.pseudonym_first = pseudonym_first
+    entity.pseudonym_last = pseudonym_last
+    entity.pseudonym_full = f"{pseudonym_first} {pseudonym_last}"
+    return entity
+
+
+class TestComponentReverseIndex:
+    """Test suite for the reverse component index used in collision checks."""
+
+    def test_index_tracks_assignments(self) -> None:
+        """Test that the reverse index mirrors mappings after assignments."""
+        manager = LibraryBasedPseudonymManager()
+        manager.load_library("neutral")
+
+        for i in range(30):
+            manager.assign_pseudonym(
+                entity_type="PERSON",
+                first_name=f"Prenom{i % 7}",
+                last_name=f"Nom{i}",
+                gender="neutral",
+            )
+
+        assert manager._component_owners == _owners_from_mappings(manager)
+        assert all(len(owners) == 1 for owners in manager._component_owners.values())
+
+    def test_loaded_component_blocks_other_real_name(self) -> None:
+        """Test that a component loaded from the database is not reassigned."""
+        manager = LibraryBasedPseudonymManager()
+        manager.load_library("neutral")
+        replace_library(manager, last_names=["Alpha", "Beta"])
+
+        for i in range(5):
+            manager.reset_preview_state()
+            manager.load_existing_mappings(
+                [_person_entity("Marie", "Dubois", "Alexia", "Alpha")]
+            )
+            assignment = manager.assign_pseudonym(
+                entity_type="PERSON",
+                first_name=f"Pierre{i}",
+                last_name="Lefebvre",
+                gender="male",
+            )
+            assert assignment.pseudonym_last == "Beta"
+
+    def test_reloaded_mapping_replaces_previous_owner(self) -> None:
+        """Test that overwriting a mapping frees its previous pseudonym."""
+        manager = LibraryBasedPseudonymManager()
+        manager.load_library("neutral")
+
+        manager.load_existing_mappings(
+            [
+                _person_entity("Marie", "Dubois", "Alexia", "Neto"),
+                _person_entity("Marie", "Durand", "Alexia", "Silva"),
+                _person_entity("Jean", "Dubois", "Paul", "Costa"),
+            ]
+        )
+
+        assert manager._component_owners[("Costa", "last_name")] == {"Dubois"}
+        assert ("Neto", "last_name") not in manager._component_owners
+        assert manager._component_owners == _owners_from_mappings(manager)
+
+    def test_reset_clears_index(self) -> None:
+        """Test that reset_preview_state() and load_library() clear the index."""
+        manager = LibraryBasedPseudonymManager()
+        manager.load_library("neutral")
+        manager.assign_pseudonym(
+            entity_type="PERSON", first_name="Marie", last_name="Dubois"
+        )
+
+        manager.reset_preview_state()
+        assert manager._component_owners == {}
+
+        manager.assign_pseudonym(
+            entity_type="PERSON", first_name="Marie", last_name="Dubois"
+        )
+        manager.load_library("neutral_id")
+        assert manager._component_owners == {}
+
+
 class TestFallbackCollisionPrevention:
     """Test suite for fallback naming collision prevention (Story 3.2 bug fix).
 
@@ -631,11 +734,14 @@ class TestFallbackCollisionPrevention:
         # Simulate File 1 processing
         manager1 = LibraryBasedPseudonymManager()
         manager1.load_library("neutral")
-        manager1.organizations = {
-            "companies": ["TinyLib"],  # Force early exhaustion
-            "agencies": [],
-            "institutions": [],
-        }
+        replace_library(
+            manager1,
+            organizations={
+                "companies": ["TinyLib"],  # Force early exhaustion
+                "agencies": [],
+                "institutions": [],
+            },
+        )
 
         # First ORG gets library name
         assignment1 = manager1.assign_pseudonym(entity_type="ORG")
@@ -652,11 +758,14 @@ class TestFallbackCollisionPrevention:
         # Simulate File 2 processing - NEW manager instance
         manager2 = LibraryBasedPseudonymManager()
         manager2.load_library("neutral")
-        manager2.organizations = {
-            "companies": ["TinyLib"],  # Same exhausted library
-            "agencies": [],
-            "institutions": [],
-        }
+        replace_library(
+            manager2,
+            organizations={
+                "companies": ["TinyLib"],  # Same exhausted library
+                "agencies": [],
+                "institutions": [],
+            },
+        )
 
         # Simulate loading existing mappings from database
         mock_entities = []
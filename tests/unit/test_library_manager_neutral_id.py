@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from types import SimpleNamespace
 
+from gdpr_pseudonymizer.data.database import init_database, open_database
+from gdpr_pseudonymizer.data.models import Entity
+from gdpr_pseudonymizer.data.repositories.mapping_repository import (
+    SQLiteMappingRepository,
+)
 from gdpr_pseudonymizer.pseudonym.library_manager import (
     LibraryBasedPseudonymManager,
 )
@@ -20,7 +26,7 @@ class TestLoadLibraryNeutralId:
         assert manager.theme == "neutral_id"
         assert manager._neutral_id_generator is not None
         # No JSON library loaded — lists stay empty
-        assert manager.last_names == []
+        assert manager.last_names == ()
 
 
 class TestAssignNeutralIdPseudonym:
@@ -120,6 +126,36 @@ class TestAssignNeutralIdPseudonym:
         result_loc = manager.assign_pseudonym(entity_type="LOCATION")
         assert result_loc.pseudonym_full == "LOC-003"
 
+    def test_neutral_id_persisted_counters_skip_scan(self) -> None:
+        """Persisted counters take precedence over scanning pseudonyms."""
+        manager = self._make_manager()
+
+        existing = [
+            SimpleNamespace(
+                entity_type="ORG",
+                first_name=None,
+                last_name=None,
+                pseudonym_full="ORG-002",
+                pseudonym_first=None,
+                pseudonym_last=None,
+            ),
+        ]
+        manager.load_existing_mappings(
+            existing, counters={"neutral_id:ORG": 9, "fallback:PERSON": 4}
+        )
+
+        assert manager.assign_pseudonym(entity_type="ORG").pseudonym_full == "ORG-010"
+        assert manager._fallback_counters["PERSON"] == 4
+
+    def test_load_counters_never_moves_backwards(self) -> None:
+        """load_counters keeps the higher of current and loaded values."""
+        manager = self._make_manager()
+        manager.load_counters({"neutral_id:LOCATION": 5})
+        manager.load_counters({"neutral_id:LOCATION": 2})
+
+        result = manager.assign_pseudonym(entity_type="LOCATION")
+        assert result.pseudonym_full == "LOC-006"
+
     def test_neutral_id_sequential_multiple(self) -> None:
         """Multiple assignments across types maintain correct counters."""
         manager = self._make_manager()
@@ -140,3 +176,63 @@ class TestAssignNeutralIdPseudonym:
             manager.assign_pseudonym(entity_type="LOCATION").pseudonym_full == "LOC-001"
         )
         assert manager.assign_pseudonym(entity_type="ORG").pseudonym_full == "ORG-002"
+
+
+class TestNeutralIdReservedRanges:
+    """neutral_id identifiers reserved from the mapping database."""
+
+    def test_concurrent_managers_issue_distinct_ids(self, tmp_path: Path) -> None:
+        """Workers starting from the same counters never share an identifier."""
+        db_path = str(tmp_path / "test.db")
+        init_database(db_path, "test_passphrase_123!")
+
+        with (
+            open_database(db_path, "test_passphrase_123!") as first_session,
+            open_database(db_path, "test_passphrase_123!") as second_session,
+        ):
+            managers = []
+            for session in (first_session, second_session):
+                repo = SQLiteMappingRepository(session)
+                manager = LibraryBasedPseudonymManager(counter_ranges=repo)
+                manager.load_library("neutral_id")
+                manager.load_existing_mappings([], counters=repo.get_counters())
+                managers.append(manager)
+
+            issued = [
+                manager.assign_pseudonym(entity_type="PERSON").pseudonym_full
+                for _ in range(20)
+                for manager in managers
+            ]
+
+        assert len(set(issued)) == len(issued)
+
+    def test_released_ids_continue_after_saved_ones(self, tmp_path: Path) -> None:
+        """Sequential sessions number contiguously after releasing blocks."""
+        db_path = str(tmp_path / "test.db")
+        init_database(db_path, "test_passphrase_123!")
+
+        for name in ("Acme", "Globex"):
+            with open_database(db_path, "test_passphrase_123!") as db_session:
+                repo = SQLiteMappingRepository(db_session)
+                manager = LibraryBasedPseudonymManager(counter_ranges=repo)
+                manager.load_library("neutral_id")
+                manager.load_existing_mappings(
+                    repo.find_all(), counters=repo.get_counters()
+                )
+                assignment = manager.assign_pseudonym(entity_type="ORG")
+                repo.save(
+                    Entity(
+                        entity_type="ORG",
+                        full_name=name,
+                        pseudonym_full=assignment.pseudonym_full,
+                        theme="neutral_id",
+                    )
+                )
+                manager.release_reserved_ids()
+
+        with open_database(db_path, "test_passphrase_123!") as db_session:
+            pseudonyms = sorted(
+                e.pseudonym_full for e in SQLiteMappingRepository(db_session).find_all()
+            )
+
+        assert pseudonyms == ["ORG-001", "ORG-002"]
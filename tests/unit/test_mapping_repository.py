@@ -1,6 +1,7 @@
 """Unit tests for SQLiteMappingRepository with encryption."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -197,6 +198,86 @@ class TestSQLiteMappingRepository:
             with pytest.raises(ValueError, match="Invalid component_type"):
                 repo.find_by_component("Test", "invalid_type")
 
+    def test_find_component_pseudonym_returns_first_match(self, tmp_path: Path) -> None:
+        """Test find_component_pseudonym() agrees with find_by_component()[0]."""
+        db_path = tmp_path / "test.db"
+        passphrase = "test_passphrase_123!"
+        init_database(str(db_path), passphrase)
+
+        with open_database(str(db_path), passphrase) as db_session:
+            repo = SQLiteMappingRepository(db_session)
+            for first, last, pseudo_first, pseudo_last in [
+                ("Jean", "Dubois", "Luke", "Skywalker"),
+                ("Marie", "Dubois", "Leia", "Organa"),
+            ]:
+                repo.save(
+                    Entity(
+                        entity_type="PERSON",
+                        first_name=first,
+                        last_name=last,
+                        full_name=f"{first} {last}",
+                        pseudonym_first=pseudo_first,
+                        pseudonym_last=pseudo_last,
+                        pseudonym_full=f"{pseudo_first} {pseudo_last}",
+                        theme="star_wars",
+                    )
+                )
+
+            first_match = repo.find_by_component("Dubois", "last_name")[0]
+
+            assert (
+                repo.find_component_pseudonym("Dubois", "last_name")
+                == first_match.pseudonym_last
+            )
+            assert repo.find_component_pseudonym("Marie", "first_name") == "Leia"
+            assert repo.find_component_pseudonym("Paul", "first_name") is None
+
+    def test_find_component_pseudonym_decrypts_one_value(self, tmp_path: Path) -> None:
+        """Test find_component_pseudonym() decrypts only the selected column."""
+        db_path = tmp_path / "test.db"
+        passphrase = "test_passphrase_123!"
+        init_database(str(db_path), passphrase)
+
+        with open_database(str(db_path), passphrase) as db_session:
+            repo = SQLiteMappingRepository(db_session)
+            repo.save_batch(
+                [
+                    Entity(
+                        entity_type="PERSON",
+                        first_name=f"Prenom{i}",
+                        last_name="Martin",
+                        full_name=f"Prenom{i} Martin",
+                        pseudonym_first=f"Alias{i}",
+                        pseudonym_last="Durand",
+                        pseudonym_full=f"Alias{i} Durand",
+                        theme="neutral",
+                    )
+                    for i in range(20)
+                ]
+            )
+
+            with patch.object(
+                db_session.encryption, "decrypt", wraps=db_session.encryption.decrypt
+            ) as decrypt:
+                result = repo.find_component_pseudonym("Martin", "last_name")
+
+            assert result == "Durand"
+            assert decrypt.call_count == 1
+
+    def test_find_component_pseudonym_invalid_type_raises_error(
+        self, tmp_path: Path
+    ) -> None:
+        """Test find_component_pseudonym() raises ValueError for invalid type."""
+        db_path = tmp_path / "test.db"
+        passphrase = "test_passphrase_123!"
+        init_database(str(db_path), passphrase)
+
+        with open_database(str(db_path), passphrase) as db_session:
+            repo = SQLiteMappingRepository(db_session)
+
+            with pytest.raises(ValueError, match="Invalid component_type"):
+                repo.find_component_pseudonym("Test", "invalid_type")
+
     def test_save_batch_persists_multiple_entities(self, tmp_path: Path) -> None:
         """Test save_batch() persists multiple entities in single transaction."""
         db_path = tmp_path / "test.db"
@@ -466,3 +547,154 @@ class TestSQLiteMappingRepository:
             assert saved.last_name is None
             assert saved.full_name == "Paris"
             assert saved.pseudonym_full == "Coruscant"
+
+    def test_save_batch_persists_pseudonym_counters(self, tmp_path: Path) -> None:
+        """Test counter-based pseudonyms update persisted high-water marks."""
+        db_path = tmp_path / "test.db"
+        passphrase = "test_passphrase_123!"
+        init_database(str(db_path), passphrase)
+
+        with open_database(str(db_path), passphrase) as db_session:
+            repo = SQLiteMappingRepository(db_session)
+            repo.save_batch(
+                [
+                    Entity(
+                        entity_type="ORG",
+                        full_name="Acme",
+                        pseudonym_full="Org-007",
+                        theme="neutral",
+                    ),
+                    Entity(
+                        entity_type="PERSON",
+                        full_name="Marie Dubois",
+                        pseudonym_full="PER-003",
+                        theme="neutral",
+                    ),
+                    Entity(
+                        entity_type="LOCATION",
+                        full_name="Paris",
+                        pseudonym_full="Coruscant",
+                        theme="star_wars",
+                    ),
+                ]
+            )
+            # Lower values never move a counter backwards
+            repo.save(
+                Entity(
+                    entity_type="ORG",
+                    full_name="Globex",
+                    pseudonym_full="Org-002",
+                    theme="neutral",
+                )
+            )
+
+        with open_database(str(db_path), passphrase) as db_session:
+            counters = SQLiteMappingRepository(db_session).get_counters()
+
+        assert counters == {"fallback:ORG": 7, "neutral_id:PERSON": 3}
+
+    def test_failed_save_does_not_persist_counters(self, tmp_path: Path) -> None:
+        """Test counters roll back with the entity insert."""
+        db_path = tmp_path / "test.db"
+        passphrase = "test_passphrase_123!"
+        init_database(str(db_path), passphrase)
+
+        with open_database(str(db_path), passphrase) as db_session:
+            repo = SQLiteMappingRepository(db_session)
+            repo.save(
+                Entity(
+                    entity_type="ORG",
+                    full_name="Acme",
+                    pseudonym_full="Org-001",
+                    theme="neutral",
+                )
+            )
+            with pytest.raises(DuplicateEntityError):
+                repo.save(
+                    Entity(
+                        entity_type="ORG",
+                        full_name="Acme",
+                        pseudonym_full="Org-050",
+                        theme="neutral",
+                    )
+                )
+
+            assert repo.get_counters() == {"fallback:ORG": 1}
+
+    def test_reserve_counter_range_returns_disjoint_blocks(
+        self, tmp_path: Path
+    ) -> None:
+        """Test concurrent sessions reserve non-overlapping blocks."""
+        db_path = tmp_path / "test.db"
+        passphrase = "test_passphrase_123!"
+        init_database(str(db_path), passphrase)
+
+        with (
+            open_database(str(db_path), passphrase) as first_session,
+            open_database(str(db_path), passphrase) as second_session,
+        ):
+            first = SQLiteMappingRepository(first_session)
+            second = SQLiteMappingRepository(second_session)
+
+            starts = [
+                first.reserve_counter_range("neutral_id:PERSON", 16),
+                second.reserve_counter_range("neutral_id:PERSON", 16),
+                first.reserve_counter_range("neutral_id:PERSON", 32),
+            ]
+
+        assert starts == [1, 17, 33]
+
+    def test_reserve_counter_range_starts_after_saved_values(
+        self, tmp_path: Path
+    ) -> None:
+        """Test reservations never reissue identifiers already saved."""
+        db_path = tmp_path / "test.db"
+        passphrase = "test_passphrase_123!"
+        init_database(str(db_path), passphrase)
+
+        with open_database(str(db_path), passphrase) as db_session:
+            repo = SQLiteMappingRepository(db_session)
+            repo.save(
+                Entity(
+                    entity_type="PERSON",
+                    full_name="Marie Dubois",
+                    pseudonym_full="PER-040",
+                    theme="neutral_id",
+                )
+            )
+
+            assert repo.reserve_counter_range("neutral_id:PERSON", 16) == 41
+            assert repo.get_counters()["neutral_id:PERSON"] == 40
+
+    def test_release_counter_range_only_rewinds_latest_block(
+        self, tmp_path: Path
+    ) -> None:
+        """Test a released block is reused unless a later one was reserved."""
+        db_path = tmp_path / "test.db"
+        passphrase = "test_passphrase_123!"
+        init_database(str(db_path), passphrase)
+
+        with open_database(str(db_path), passphrase) as db_session:
+            repo = SQLiteMappingRepository(db_session)
+            key = "neutral_id:ORG"
+
+            repo.release_counter_range(key, 1, 16)  # nothing reserved yet
+            first = repo.reserve_counter_range(key, 16)
+            repo.release_counter_range(key, first, first + 15)
+            assert repo.reserve_counter_range(key, 16) == first
+
+            second = repo.reserve_counter_range(key, 16)
+            repo.release_counter_range(key, first, first + 15)
+            assert repo.reserve_counter_range(key, 16) == second + 16
+
+    def test_reserve_counter_range_rejects_empty_block(self, tmp_path: Path) -> None:
+        """Test reservations need a positive size."""
+        db_path = tmp_path / "test.db"
+        passphrase = "test_passphrase_123!"
+        init_database(str(db_path), passphrase)
+
+        with open_database(str(db_path), passphrase) as db_session:
+            with pytest.raises(ValueError, match="positive"):
+                SQLiteMappingRepository(db_session).reserve_counter_range(
+                    "neutral_id:PERSON", 0
+                )
@@ -0,0 +1,223 @@
+"""Unit tests for schema versioning and migrations."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from gdpr_pseudonymizer.data.database import init_database, open_database
+from gdpr_pseudonymizer.data.migrations import (
+    BASE_SCHEMA_VERSION,
+    CURRENT_SCHEMA_VERSION,
+    MIGRATIONS,
+    Migration,
+    MigrationContext,
+    get_schema_version,
+    iter_row_batches,
+    parse_version,
+    pending_migrations,
+    run_migrations,
+)
+from gdpr_pseudonymizer.data.models import Entity
+from gdpr_pseudonymizer.data.repositories.mapping_repository import (
+    SQLiteMappingRepository,
+)
+from gdpr_pseudonymizer.exceptions import DatabaseError
+
+PASSPHRASE = "test_passphrase_123!"
+
+
+def _downgrade_to_base(db_path: str) -> None:
+    """Simulate a database created before any migration existed."""
+    engine = create_engine(f"sqlite:///{db_path}")
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX IF EXISTS idx_operations_type_timestamp"))
+        conn.execute(text("DROP TABLE IF EXISTS pseudonym_counters"))
+        conn.execute(text("DROP TABLE IF EXISTS detection_cache"))
+        conn.execute(
+            text("UPDATE metadata SET value = :v WHERE key = 'schema_version'"),
+            {"v": BASE_SCHEMA_VERSION},
+        )
+    engine.dispose()
+
+
+def _index_names(db_path: str) -> set[str]:
+    engine = create_engine(f"sqlite:///{db_path}")
+    with engine.connect() as conn:
+        names = {
+            row[0]
+            for row in conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'index'")
+            )
+        }
+    engine.dispose()
+    return names
+
+
+class TestVersionHelpers:
+    def test_parse_version_orders_numerically(self) -> None:
+        assert parse_version("1.10.0") > parse_version("1.9.0")
+
+    def test_parse_version_invalid(self) -> None:
+        with pytest.raises(DatabaseError):
+            parse_version("1.x")
+
+    def test_pending_migrations_from_base(self) -> None:
+        assert pending_migrations(BASE_SCHEMA_VERSION) == MIGRATIONS
+
+    def test_pending_migrations_up_to_date(self) -> None:
+        assert pending_migrations(CURRENT_SCHEMA_VERSION) == []
+
+    def test_migrations_strictly_increasing(self) -> None:
+        versions = [parse_version(m.version) for m in MIGRATIONS]
+        assert versions == sorted(set(versions))
+        assert versions[0] > parse_version(BASE_SCHEMA_VERSION)
+
+
+class TestRunMigrations:
+    def test_new_database_is_current(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "test.db")
+        init_database(db_path, PASSPHRASE)
+
+        engine = create_engine(f"sqlite:///{db_path}")
+        with engine.connect() as conn:
+            assert get_schema_version(conn) == CURRENT_SCHEMA_VERSION
+        engine.dispose()
+        assert "idx_operations_type_timestamp" in _index_names(db_path)
+
+    def test_open_database_upgrades_old_schema(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "test.db")
+        init_database(db_path, PASSPHRASE)
+        _downgrade_to_base(db_path)
+        assert "idx_operations_type_timestamp" not in _index_names(db_path)
+
+        with open_database(db_path, PASSPHRASE):
+            pass
+
+        assert "idx_operations_type_timestamp" in _index_names(db_path)
+        assert "ix_detection_cache_last_used_at" in _index_names(db_path)
+
+    def test_open_database_without_migrate(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "test.db")
+        init_database(db_path, PASSPHRASE)
+        _downgrade_to_base(db_path)
+
+        with open_database(db_path, PASSPHRASE, migrate=False):
+            pass
+
+        assert "idx_operations_type_timestamp" not in _index_names(db_path)
+
+    def test_run_migrations_idempotent(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "test.db")
+        init_database(db_path, PASSPHRASE)
+        engine = create_engine(f"sqlite:///{db_path}")
+
+        assert run_migrations(engine) == []
+        engine.dispose()
+
+    def test_newer_schema_rejected(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "test.db")
+        init_database(db_path, PASSPHRASE)
+        engine = create_engine(f"sqlite:///{db_path}")
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "UPDATE metadata SET value = '99.0.0' WHERE key = 'schema_version'"
+                )
+            )
+
+        with pytest.raises(DatabaseError, match="newer than supported"):
+            run_migrations(engine)
+        engine.dispose()
+
+    def test_failed_migration_rolls_back(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "test.db")
+        init_database(db_path, PASSPHRASE)
+        _downgrade_to_base(db_path)
+
+        def _broken(ctx: MigrationContext) -> None:
+            ctx.conn.execute(text("CREATE INDEX idx_partial ON entities(theme)"))
+            raise RuntimeError("boom")
+
+        broken = [Migration(version="1.1.0", description="broken", apply=_broken)]
+        engine = create_engine(f"sqlite:///{db_path}")
+        with patch("gdpr_pseudonymizer.data.migrations.MIGRATIONS", broken):
+            with pytest.raises(DatabaseError, match="1.1.0"):
+                run_migrations(engine)
+
+        with engine.connect() as conn:
+            assert get_schema_version(conn) == BASE_SCHEMA_VERSION
+        engine.dispose()
+        assert "idx_partial" not in _index_names(db_path)
+
+    def test_counters_backfilled_from_existing_mappings(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "test.db")
+        init_database(db_path, PASSPHRASE)
+        with open_database(db_path, PASSPHRASE) as db_session:
+            SQLiteMappingRepository(db_session).save_batch(
+                [
+                    Entity(
+                        entity_type=entity_type,
+                        full_name=f"Real {pseudonym}",
+                        pseudonym_full=pseudonym,
+                        theme="neutral",
+                    )
+                    for entity_type, pseudonym in [
+                        ("PERSON", "Person-004"),
+                        ("LOCATION", "LOC-012"),
+                        ("LOCATION", "LOC-002"),
+                        ("PERSON", "Leia Organa"),
+                    ]
+                ]
+            )
+        _downgrade_to_base(db_path)
+
+        with open_database(db_path, PASSPHRASE) as db_session:
+            counters = SQLiteMappingRepository(db_session).get_counters()
+
+        assert counters == {"fallback:PERSON": 4, "neutral_id:LOCATION": 12}
+
+    def test_counter_backfill_requires_key(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "test.db")
+        init_database(db_path, PASSPHRASE)
+        with open_database(db_path, PASSPHRASE) as db_session:
+            SQLiteMappingRepository(db_session).save(
+                Entity(
+                    entity_type="ORG",
+                    full_name="Acme",
+                    pseudonym_full="Org-001",
+                    theme="neutral",
+                )
+            )
+        _downgrade_to_base(db_path)
+
+        engine = create_engine(f"sqlite:///{db_path}")
+        with pytest.raises(DatabaseError, match="database key"):
+            run_migrations(engine)
+        engine.dispose()
+
+
+class TestIterRowBatches:
+    def test_batches_cover_all_rows_with_progress(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "test.db")
+        init_database(db_path, PASSPHRASE)
+        engine = create_engine(f"sqlite:///{db_path}")
+        progress: list[tuple[str, int, int]] = []
+
+        with engine.connect() as conn:
+            total = int(conn.execute(text("SELECT COUNT(*) FROM metadata")).scalar())
+            ctx = MigrationContext(
+                conn=conn,
+                version="9.9.9",
+                batch_size=2,
+                progress=lambda v, d, t: progress.append((v, d, t)),
+            )
+            batches = list(iter_row_batches(ctx, "metadata", ["key"]))
+        engine.dispose()
+
+        assert sum(len(b) for b in batches) == total
+        assert all(len(b) <= 2 for b in batches)
+        assert progress[-1] == ("9.9.9", total, total)
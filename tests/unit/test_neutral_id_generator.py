@@ -5,10 +5,29 @@ from __future__ import annotations
 import pytest
 
 from gdpr_pseudonymizer.pseudonym.neutral_id_generator import (
+    MIN_RESERVATION_BLOCK,
     NeutralIdPseudonymGenerator,
 )
 
 
+class _MemoryRanges:
+    """In-memory CounterRangeStore with the repository's semantics."""
+
+    def __init__(self) -> None:
+        self.cursors: dict[str, int] = {}
+        self.reserved: list[tuple[str, int]] = []
+
+    def reserve_counter_range(self, key: str, size: int) -> int:
+        first = self.cursors.get(key, 0) + 1
+        self.cursors[key] = first + size - 1
+        self.reserved.append((key, size))
+        return first
+
+    def release_counter_range(self, key: str, first: int, last: int) -> None:
+        if self.cursors.get(key) == last:
+            self.cursors[key] = first - 1
+
+
 class TestNeutralIdPseudonymGenerator:
     """Tests for counter-based pseudonym generation."""
 
@@ -87,3 +106,56 @@ class TestNeutralIdPseudonymGenerator:
         gen = NeutralIdPseudonymGenerator()
         with pytest.raises(ValueError, match="Unknown entity_type"):
             gen.set_counter("UNKNOWN", 5)
+
+
+class TestReservedRanges:
+    """Identifier blocks reserved from a shared store."""
+
+    def test_generators_sharing_store_never_collide(self) -> None:
+        ranges = _MemoryRanges()
+        first = NeutralIdPseudonymGenerator(ranges)
+        second = NeutralIdPseudonymGenerator(ranges)
+
+        issued = [gen.generate("PERSON") for _ in range(40) for gen in (first, second)]
+
+        assert len(set(issued)) == len(issued)
+        assert first.generate("LOCATION") == "LOC-001"
+
+    def test_block_size_doubles_up_to_maximum(self) -> None:
+        ranges = _MemoryRanges()
+        gen = NeutralIdPseudonymGenerator(ranges, max_block_size=64)
+
+        for _ in range(200):
+            gen.generate("ORG")
+
+        assert [size for _, size in ranges.reserved] == [
+            MIN_RESERVATION_BLOCK,
+            MIN_RESERVATION_BLOCK * 2,
+            64,
+            64,
+            64,
+        ]
+
+    def test_release_lets_next_generator_continue(self) -> None:
+        ranges = _MemoryRanges()
+        gen = NeutralIdPseudonymGenerator(ranges)
+        assert [gen.generate("PERSON") for _ in range(3)] == [
+            "PER-001",
+            "PER-002",
+            "PER-003",
+        ]
+
+        gen.release_reservations()
+        # The saved high-water mark is applied by the store; here nothing
+        # was saved, so the released identifiers are handed out again
+        assert NeutralIdPseudonymGenerator(ranges).generate("PERSON") == "PER-001"
+
+    def test_set_counter_past_block_reserves_again(self) -> None:
+        ranges = _MemoryRanges()
+        gen = NeutralIdPseudonymGenerator(ranges)
+        gen.generate("PERSON")
+
+        gen.set_counter("PERSON", 500)
+        ranges.cursors["neutral_id:PERSON"] = 500
+
+        assert gen.generate("PERSON") == "PER-501"
@@ -0,0 +1,158 @@
+"""Unit tests for paragraph-level incremental detection."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from spacy_helpers import ruler_hybrid_detector
+
+from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
+from gdpr_pseudonymizer.nlp.paragraph_cache import (
+    ParagraphCache,
+    split_paragraphs,
+)
+from gdpr_pseudonymizer.utils.cache_stats import CacheStats
+
+HEADER = "Cabinet Durand, 12 rue de la Paix, Paris."
+FOOTER = "Signé : Jean Martin, directeur."
+PATTERNS = [
+    ("PER", "Marie Dubois"),
+    ("PER", "Claire Petit"),
+    ("PER", "Jean Martin"),
+    ("LOC", "Paris"),
+]
+
+
+def _letter(recipient: str) -> str:
+    return f"{HEADER}\n\nMadame {recipient},\n\nVeuillez agréer...\n\n{FOOTER}\n"
+
+
+@pytest.fixture(autouse=True)
+def _isolated_caches(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("gdpr_pseudonymizer.nlp.paragraph_cache._shared_caches", {})
+
+
+class TestSplitParagraphs:
+    """Tests for split_paragraphs()."""
+
+    def test_offsets_point_into_text(self) -> None:
+        text = "Premier.\n\n  \nDeuxième\nsuite.\n\n\nTroisième."
+
+        paragraphs = split_paragraphs(text)
+
+        assert [p for _, p in paragraphs] == [
+            "Premier.",
+            "Deuxième\nsuite.",
+            "Troisième.",
+        ]
+        for offset, paragraph in paragraphs:
+            assert text[offset : offset + len(paragraph)] == paragraph
+
+    def test_blank_text(self) -> None:
+        assert split_paragraphs("\n\n   \n") == []
+
+
+class TestParagraphCache:
+    """Tests for ParagraphCache."""
+
+    def test_get_shifts_offsets(self) -> None:
+        cache = ParagraphCache()
+        cache.put(
+            "Madame Marie Dubois,", [DetectedEntity("Marie Dubois", "PERSON", 7, 19)]
+        )
+
+        entities = cache.get("Madame Marie Dubois,", offset=100)
+
+        assert entities == [DetectedEntity("Marie Dubois", "PERSON", 107, 119)]
+        # Cached rows are not affected by the returned copies
+        assert cache.get("Madame Marie Dubois,", offset=0) == [
+            DetectedEntity("Marie Dubois", "PERSON", 7, 19)
+        ]
+
+    def test_counts_hits_and_misses(self) -> None:
+        cache = ParagraphCache()
+        assert cache.get("inconnu", 0) is None
+        cache.put("connu", [])
+        assert cache.get("connu", 0) == []
+
+        assert cache.stats == CacheStats(hits=1, misses=1)
+        assert cache.stats.hit_rate == 0.5
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = ParagraphCache(max_paragraphs=2)
+        cache.put("a", [])
+        cache.put("b", [])
+        cache.get("a", 0)
+        cache.put("c", [])
+
+        assert len(cache) == 2
+        assert cache.get("b", 0) is None
+        assert cache.get("a", 0) == []
+
+
+class TestHybridDetectorParagraphMode:
+    """HybridDetector with paragraph_cache=True."""
+
+    def test_matches_whole_document_detection(self) -> None:
+        text = _letter("Marie Dubois")
+
+        whole_document = ruler_hybrid_detector(PATTERNS).detect_entities(text)
+
+        # Only matches spanning a blank line are lost
+        assert ruler_hybrid_detector(PATTERNS, paragraph_cache=True).detect_entities(
+            text
+        ) == [e for e in whole_document if "\n\n" not in e.text]
+
+    def test_only_new_paragraphs_are_detected(self) -> None:
+        detector = ruler_hybrid_detector(PATTERNS, paragraph_cache=True)
+        detector.detect_entities(_letter("Marie Dubois"))
+        before = detector.paragraph_cache_stats
+        assert before is not None
+
+        with patch.object(
+            detector.spacy_detector,
+            "detect_entities_batch",
+            wraps=detector.spacy_detector.detect_entities_batch,
+        ) as spacy_batch:
+            entities = detector.detect_entities(_letter("Claire Petit"))
+
+        spacy_batch.assert_called_once_with(["Madame Claire Petit,"])
+        text = _letter("Claire Petit")
+        for entity in entities:
+            assert text[entity.start_pos : entity.end_pos] == entity.text
+        assert "Jean Martin" in [e.text for e in entities]
+
+        after = detector.paragraph_cache_stats
+        assert after is not None
+        assert after - before == CacheStats(hits=3, misses=1)
+
+    def test_repeated_paragraph_within_document(self) -> None:
+        detector = ruler_hybrid_detector(PATTERNS, paragraph_cache=True)
+        text = f"{FOOTER}\n\nTexte.\n\n{FOOTER}"
+
+        entities = detector.detect_entities(text)
+
+        martin = [e for e in entities if e.text == "Jean Martin"]
+        assert len(martin) == 2
+        assert martin[1].start_pos == text.rindex("Jean Martin")
+
+    def test_batch_stream(self) -> None:
+        detector = ruler_hybrid_detector(PATTERNS, paragraph_cache=True)
+        letters = [_letter("Marie Dubois"), _letter("Claire Petit")]
+
+        results = list(detector.detect_entities_batch(iter(letters)))
+
+        assert results == [detector.detect_entities(t) for t in letters]
+        assert detector.paragraph_cache_stats == CacheStats(hits=11, misses=5)
+
+    def test_disabled_mode_reports_no_stats(self) -> None:
+        assert ruler_hybrid_detector(PATTERNS).paragraph_cache_stats is None
+
+    def test_fingerprint_depends_on_mode(self) -> None:
+        assert (
+            ruler_hybrid_detector(
+                PATTERNS, paragraph_cache=True
+            ).detection_fingerprint()
+            != ruler_hybrid_detector(PATTERNS).detection_fingerprint()
+        )
@@ -0,0 +1,107 @@
+"""Unit tests for intra-document parallel detection."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from spacy_helpers import ruler_hybrid_detector
+
+from gdpr_pseudonymizer.core.document_processor import DocumentProcessor
+from gdpr_pseudonymizer.data.database import init_database
+from gdpr_pseudonymizer.nlp.hybrid_detector import HybridDetector
+from gdpr_pseudonymizer.nlp.parallel_detection import (
+    detect_entities_parallel,
+    warm_detector,
+)
+
+PARAGRAPHS = [
+    "Marie Dubois a rencontré Jean Martin à Paris.",
+    "Le dossier est suivi par la Société Acme depuis Lyon.",
+    "Aucune entité dans ce paragraphe, seulement du texte de remplissage.",
+]
+LONG_TEXT = "\n\n".join(PARAGRAPHS * 12)
+
+
+def _blank_detector() -> HybridDetector:
+    """Picklable detector factory for pool workers."""
+    return ruler_hybrid_detector(window_chars=300, window_overlap=60)
+
+
+class TestDetectEntitiesParallel:
+    """Tests for detect_entities_parallel()."""
+
+    def test_matches_sequential_detection(self) -> None:
+        detector = _blank_detector()
+
+        entities = detect_entities_parallel(
+            detector, LONG_TEXT, workers=2, detector_factory=_blank_detector
+        )
+
+        assert entities == detector.detect_entities(LONG_TEXT)
+        for entity in entities:
+            assert LONG_TEXT[entity.start_pos : entity.end_pos] == entity.text
+
+    def test_single_worker_detects_in_process(self) -> None:
+        detector = _blank_detector()
+
+        with patch("gdpr_pseudonymizer.nlp.parallel_detection.Pool") as pool:
+            detect_entities_parallel(detector, LONG_TEXT, workers=1)
+
+        pool.assert_not_called()
+
+    def test_short_text_detects_in_process(self) -> None:
+        detector = _blank_detector()
+
+        with patch("gdpr_pseudonymizer.nlp.parallel_detection.Pool") as pool:
+            entities = detect_entities_parallel(detector, PARAGRAPHS[0], workers=4)
+
+        pool.assert_not_called()
+        assert entities == detector.detect_entities(PARAGRAPHS[0])
+
+    def test_pool_capped_at_window_count(self) -> None:
+        detector = _blank_detector()
+        text = "\n\n".join(PARAGRAPHS * 2)
+
+        with patch("gdpr_pseudonymizer.nlp.parallel_detection.Pool") as pool:
+            pool.return_value.__enter__.return_value.imap.return_value = iter([])
+            detect_entities_parallel(detector, text, workers=8)
+
+        assert pool.call_args.kwargs["processes"] == 2
+
+    def test_default_factory_uses_parent_model(self) -> None:
+        detector = _blank_detector()
+        detector._model_name = "fr_core_news_md"
+        detector.spacy_detector._profile = "balanced"
+
+        with patch("gdpr_pseudonymizer.nlp.parallel_detection.Pool") as pool:
+            pool.return_value.__enter__.return_value.imap.return_value = iter([])
+            detect_entities_parallel(detector, LONG_TEXT, workers=2)
+
+        (factory,) = pool.call_args.kwargs["initargs"]
+        assert factory.func is warm_detector
+        assert factory.args == ("balanced", "fr_core_news_md")
+
+
+class TestDocumentProcessorWorkers:
+    """DocumentProcessor routes detection through the parallel helper."""
+
+    def test_workers_forwarded(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "test.db")
+        init_database(db_path, "test_passphrase_123!")
+        document = tmp_path / "doc.txt"
+        document.write_text(LONG_TEXT, encoding="utf-8")
+        processor = DocumentProcessor(db_path, "test_passphrase_123!", workers=3)
+
+        with (
+            patch("gdpr_pseudonymizer.core.document_processor.HybridDetector"),
+            patch(
+                "gdpr_pseudonymizer.core.document_processor.detect_entities_parallel",
+                return_value=[],
+            ) as parallel,
+        ):
+            processor.detect_entities(str(document))
+
+        detector, text, workers = parallel.call_args.args
+        assert isinstance(detector, MagicMock)
+        assert (text, workers) == (LONG_TEXT, 3)
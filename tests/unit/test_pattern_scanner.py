@@ -0,0 +1,139 @@
+"""
+Unit tests for the literal-anchor pattern scanner
+"""
+
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from gdpr_pseudonymizer.nlp.pattern_scanner import PatternScanner, _plan
+from gdpr_pseudonymizer.nlp.regex_matcher import RegexMatcher
+
+CORPUS_DIR = Path(__file__).parent.parent / "test_corpus"
+
+# Fragments that exercise every bundled pattern and its near misses
+_FRAGMENTS = [
+    "M.",
+    "Mme",
+    "Dr.",
+    "Maître",
+    "Me",
+    "Marie",
+    "Jean-Pierre",
+    "DUPONT",
+    "Le Gall",
+    "à",
+    "en",
+    "dans",
+    "près de",
+    "Paris",
+    "SA",
+    "SARL",
+    "SAS",
+    "Société",
+    "Cabinet",
+    "Acme",
+    "Conseil",
+    ",",
+    ".",
+    "-",
+    "\n",
+    "et",
+    "le",
+]
+
+
+def _finditer_spans(
+    regexes: list[re.Pattern[str]], text: str
+) -> list[list[tuple[int, int]]]:
+    return [[match.span() for match in regex.finditer(text)] for regex in regexes]
+
+
+@pytest.fixture(scope="module")
+def bundled_regexes() -> list[re.Pattern[str]]:
+    matcher = RegexMatcher()
+    matcher.load_patterns()
+    return [pattern_def["regex"] for pattern_def in matcher._scanned_patterns]
+
+
+class TestPlan:
+    """Tests for anchor derivation."""
+
+    def test_prefix_literal_group(self) -> None:
+        plan = _plan(re.compile(r"\b(Mme|M\.)\s+[A-Z]\w+", re.UNICODE))
+        assert plan.kind == "prefix"
+        assert plan.anchor is not None
+        assert plan.anchor.pattern == r"\b(?:Mme|M\.)"
+
+    def test_suffix_literal_group(self) -> None:
+        plan = _plan(re.compile(r"\b([A-Z]\w+)\s+(SA|SARL)\b", re.UNICODE))
+        assert plan.kind == "suffix"
+        assert plan.anchor is not None
+        assert plan.anchor.pattern == r"\s(?:SA|SARL)\b"
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            r"\b([A-Z]\w+)\s+[A-Z]+\b",  # no literal group
+            r"\b(Mme|M\.)?\s*[A-Z]\w+",  # optional prefix
+            r"\b(Mme)\s+\w+|\w+\s+(SA)\b",  # top-level alternation
+            r"\b([A-Z]\w+)(?=\s)\s+(SA)\b",  # lookahead near endpos
+            r"\b(?i:mme)\s+\w+",  # inline flags
+            r"\b(a)\s+\1",  # backreference
+        ],
+    )
+    def test_unanchorable_patterns(self, pattern: str) -> None:
+        assert _plan(re.compile(pattern, re.UNICODE)).anchor is None
+
+    def test_bundled_patterns_are_anchored(
+        self, bundled_regexes: list[re.Pattern[str]]
+    ) -> None:
+        scanner = PatternScanner(bundled_regexes)
+        assert scanner.anchored_count >= 4
+
+
+class TestScan:
+    """PatternScanner.scan() must return exactly what finditer returns."""
+
+    def test_anchor_absent_skips_pattern(self) -> None:
+        scanner = PatternScanner([re.compile(r"\b(Mme)\s+[A-Z]\w+", re.UNICODE)])
+        assert scanner.scan("Marie Dupont habite à Lyon.") == [[]]
+
+    def test_matches_before_and_after_anchors(self) -> None:
+        regexes = [
+            re.compile(r"\b(Mme)\s+[A-Z]\w+", re.UNICODE),
+            re.compile(r"\b([A-Z]\w+)\s+(SA|SARL)\b", re.UNICODE),
+        ]
+        text = "Acme SA, puis Mme Durand, puis Beta SARL, puis Mme Roux. SAS"
+        assert PatternScanner(regexes).scan(text) == _finditer_spans(regexes, text)
+
+    def test_unanchored_pattern_scans_whole_text(self) -> None:
+        regexes = [re.compile(r"\b[A-Z]{2,}\b", re.UNICODE)]
+        text = "voir DUPONT et MARTIN"
+        assert PatternScanner(regexes).scan(text) == [[(5, 11), (15, 21)]]
+
+    def test_bundled_patterns_on_corpus(
+        self, bundled_regexes: list[re.Pattern[str]]
+    ) -> None:
+        scanner = PatternScanner(bundled_regexes)
+        documents = sorted(CORPUS_DIR.rglob("*.txt"))
+        assert documents, "Test corpus not found"
+
+        for path in documents:
+            text = path.read_text(encoding="utf-8")
+            assert scanner.scan(text) == _finditer_spans(
+                bundled_regexes, text
+            ), path.name
+
+    def test_bundled_patterns_on_random_texts(
+        self, bundled_regexes: list[re.Pattern[str]]
+    ) -> None:
+        scanner = PatternScanner(bundled_regexes)
+        rng = random.Random(32)
+
+        for _ in range(500):
+            words = rng.choices(_FRAGMENTS, k=rng.randint(0, 25))
+            text = "".join(word + rng.choice([" ", "", "  "]) for word in words)
+            assert scanner.scan(text) == _finditer_spans(bundled_regexes, text), text
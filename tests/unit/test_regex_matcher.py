@@ -588,6 +588,25 @@ class TestRegexMatcher:
         ]
         assert len(matching) >= 1, "Lyon (capitalized) should be detected as LOCATION"
 
+    def test_geography_adjacent_and_multiword_locations(
+        self, matcher: RegexMatcher
+    ) -> None:
+        """Test geography: coordinated and article-initial names are all found."""
+        text = "Entre Paris et Lyon, puis Le Mans et La Rochelle."
+        entities = matcher.match_entities(text)
+
+        locations = {e.text for e in entities if e.entity_type == "LOCATION"}
+        assert {"Paris", "Lyon", "Le Mans", "La Rochelle"} <= locations
+
+    def test_full_name_with_multiword_last_name(self, matcher: RegexMatcher) -> None:
+        """Test full names: dictionary last names may span several words."""
+        text = "Le dossier de Marie Le Gall est complet."
+        entities = matcher.match_entities(text)
+
+        matching = [e for e in entities if e.text == "Marie Le Gall"]
+        assert len(matching) == 1
+        assert text[matching[0].start_pos : matching[0].end_pos] == "Marie Le Gall"
+
     def test_geography_lowercase_rejected(self, matcher: RegexMatcher) -> None:
         """Test geography: lowercase 'lyon' not matched (regex enforces caps)."""
         text = "on parle de lyon dans le texte."
@@ -630,6 +649,26 @@ class TestRegexMatcher:
             len(matching) == 0
         ), "Lyon should be filtered when POS is NOUN and has entity assignment"
 
+    def test_geography_doc_without_pos_skips_disambiguation(
+        self, matcher: RegexMatcher
+    ) -> None:
+        """Test geography: Doc from a pipeline without POS tags keeps matches."""
+        import spacy
+        from spacy.tokens import Span
+
+        text = "Le bureau de Lyon est ouvert."
+        doc = spacy.blank("fr")(text)
+        lyon = doc.char_span(text.index("Lyon"), text.index("Lyon") + 4)
+        assert lyon is not None
+        doc.ents = [Span(doc, lyon.start, lyon.end, label="PER")]
+
+        entities = matcher.match_entities(text, spacy_doc=doc)
+
+        matching = [
+            e for e in entities if e.text == "Lyon" and e.entity_type == "LOCATION"
+        ]
+        assert len(matching) == 1, "Lyon should be kept when the Doc has no POS tags"
+
     # Story 7.5: LastName, FirstName with ORG words negative test (AC5)
     def test_last_first_names_rejects_org_words(self, matcher: RegexMatcher) -> None:
         """Test that 'Dubois, Commission' is NOT detected as PERSON."""
@@ -0,0 +1,144 @@
+"""
+Unit tests for the precompiled resource cache
+"""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from gdpr_pseudonymizer.nlp.geography_dictionary import GeographyDictionary
+from gdpr_pseudonymizer.nlp.name_dictionary import NameDictionary
+from gdpr_pseudonymizer.utils.resource_cache import (
+    CACHE_DIR_ENV,
+    NO_CACHE_ENV,
+    load_resource,
+    resource_cache_dir,
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    directory = tmp_path / "cache"
+    monkeypatch.setenv(CACHE_DIR_ENV, str(directory))
+    monkeypatch.delenv(NO_CACHE_ENV, raising=False)
+    return directory
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    path = tmp_path / "resource.txt"
+    path.write_text("a,b,c", encoding="utf-8")
+    return path
+
+
+def _split(source: bytes) -> list[str]:
+    return source.decode("utf-8").split(",")
+
+
+class TestLoadResource:
+    """Tests for load_resource()."""
+
+    def test_second_load_hits_cache(self, cache_dir: Path, source: Path) -> None:
+        build = Mock(side_effect=_split)
+
+        assert load_resource(source, "letters", build) == ["a", "b", "c"]
+        assert load_resource(source, "letters", build) == ["a", "b", "c"]
+
+        assert build.call_count == 1
+        assert len(list(cache_dir.glob("letters-*.marshal"))) == 1
+
+    def test_changed_source_invalidates(self, cache_dir: Path, source: Path) -> None:
+        load_resource(source, "letters", _split)
+        source.write_text("x,y", encoding="utf-8")
+
+        assert load_resource(source, "letters", _split) == ["x", "y"]
+
+    def test_kinds_do_not_collide(self, cache_dir: Path, source: Path) -> None:
+        load_resource(source, "letters", _split)
+
+        assert load_resource(source, "text", lambda s: s.decode("utf-8")) == "a,b,c"
+
+    def test_corrupt_entry_is_rebuilt(self, cache_dir: Path, source: Path) -> None:
+        load_resource(source, "letters", _split)
+        for entry in cache_dir.glob("letters-*.marshal"):
+            entry.write_bytes(b"\x00garbage")
+
+        assert load_resource(source, "letters", _split) == ["a", "b", "c"]
+
+    def test_disabled_cache_always_builds(
+        self, cache_dir: Path, source: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv(NO_CACHE_ENV, "1")
+        build = Mock(side_effect=_split)
+
+        load_resource(source, "letters", build)
+        load_resource(source, "letters", build)
+
+        assert build.call_count == 2
+        assert not cache_dir.exists()
+
+    def test_unwritable_cache_dir_is_ignored(
+        self, tmp_path: Path, source: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("", encoding="utf-8")
+        monkeypatch.setenv(CACHE_DIR_ENV, str(blocker / "cache"))
+
+        assert load_resource(source, "letters", _split) == ["a", "b", "c"]
+
+    def test_build_errors_propagate_uncached(
+        self, cache_dir: Path, source: Path
+    ) -> None:
+        with pytest.raises(ValueError, match="bad resource"):
+            load_resource(
+                source, "letters", Mock(side_effect=ValueError("bad resource"))
+            )
+
+        assert not cache_dir.exists()
+
+    def test_default_dir_without_override(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        monkeypatch.delenv(CACHE_DIR_ENV, raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.setattr("sys.platform", "linux")
+
+        assert resource_cache_dir() == tmp_path / "gdpr-pseudonymizer" / "resources"
+
+
+class TestCachedDictionaries:
+    """Dictionaries loaded from the cache match freshly parsed ones."""
+
+    def test_name_dictionary(
+        self, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv(NO_CACHE_ENV, "1")
+        fresh = NameDictionary()
+        fresh.load()
+        monkeypatch.delenv(NO_CACHE_ENV)
+
+        NameDictionary().load()  # populate the cache
+        cached = NameDictionary()
+        cached.load()
+
+        assert cached.first_names == fresh.first_names
+        assert cached.last_names == fresh.last_names
+        assert cached._first_name_trie.to_state() == fresh._first_name_trie.to_state()
+        assert cached._last_name_trie.to_state() == fresh._last_name_trie.to_state()
+
+    def test_geography_dictionary(
+        self, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv(NO_CACHE_ENV, "1")
+        fresh = GeographyDictionary()
+        fresh.load()
+        monkeypatch.delenv(NO_CACHE_ENV)
+
+        GeographyDictionary().load()  # populate the cache
+        cached = GeographyDictionary()
+        cached.load()
+
+        assert cached.all_locations == fresh.all_locations
+        assert cached.cities == fresh.cities
+        assert cached._trie.to_state() == fresh._trie.to_state()
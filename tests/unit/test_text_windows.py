@@ -0,0 +1,155 @@
+"""Unit tests for windowed detection of very large documents."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from spacy_helpers import ruler_hybrid_detector, ruler_spacy_detector
+
+from gdpr_pseudonymizer.nlp.entity_detector import DetectedEntity
+from gdpr_pseudonymizer.nlp.text_windows import split_windows
+
+PARAGRAPHS = [
+    "Marie Dubois a rencontré Jean Martin à Paris.",
+    "Le dossier est suivi par la Société Acme depuis Lyon.",
+    "Aucune entité dans ce paragraphe, seulement du texte de remplissage.",
+]
+LONG_TEXT = "\n\n".join(PARAGRAPHS * 12)
+
+
+class TestSplitWindows:
+    """Tests for split_windows()."""
+
+    def test_short_text_is_one_window(self) -> None:
+        windows = split_windows("Court.", window_chars=100, overlap=10)
+
+        assert len(windows) == 1
+        assert (windows[0].start, windows[0].end) == (0, 6)
+
+    def test_keep_ranges_partition_text(self) -> None:
+        windows = split_windows(LONG_TEXT, window_chars=300, overlap=60)
+
+        assert windows[0].keep_start == 0
+        assert windows[-1].keep_end == len(LONG_TEXT)
+        for previous, current in zip(windows, windows[1:]):
+            assert previous.keep_end == current.keep_start
+        for window in windows:
+            assert window.end - window.start <= 300
+            assert window.start <= window.keep_start < window.keep_end <= window.end
+
+    def test_cuts_at_paragraph_breaks(self) -> None:
+        windows = split_windows(LONG_TEXT, window_chars=300, overlap=60)
+
+        for window in windows[1:]:
+            assert LONG_TEXT[: window.keep_start].endswith("\n\n")
+
+    def test_falls_back_to_whitespace(self) -> None:
+        text = " ".join(["mot"] * 200)
+
+        for window in split_windows(text, window_chars=100, overlap=20)[1:]:
+            assert text[window.keep_start - 1] == " "
+
+    @pytest.mark.parametrize("window_chars", [0, 40])
+    def test_window_must_exceed_overlap(self, window_chars: int) -> None:
+        with pytest.raises(ValueError, match="overlap"):
+            split_windows(LONG_TEXT, window_chars=window_chars, overlap=20)
+
+    def test_keeps_entity_by_start(self) -> None:
+        window = split_windows(LONG_TEXT, window_chars=300, overlap=60)[1]
+
+        inside = DetectedEntity("x", "PERSON", window.keep_start, window.keep_end + 5)
+        before = DetectedEntity("x", "PERSON", window.keep_start - 1, window.keep_end)
+
+        assert window.keeps(inside)
+        assert not window.keeps(before)
+
+
+class TestSpaCyDetectorWindows:
+    """SpaCyDetector windowed mode."""
+
+    def test_matches_whole_document_detection(self) -> None:
+        windowed = ruler_spacy_detector(window_chars=300, window_overlap=60)
+
+        assert windowed.uses_windows(LONG_TEXT)
+        whole = ruler_spacy_detector(window_chars=None)
+        assert windowed.detect_entities(LONG_TEXT) == whole.detect_entities(LONG_TEXT)
+
+    def test_entity_across_cut_reported_once(self) -> None:
+        detector = ruler_spacy_detector(window_chars=200, window_overlap=60)
+        text = ("x" * 60 + " ") * 2 + "Marie Dubois" + (" " + "y" * 60) * 4
+
+        entities = detector.detect_entities(text)
+
+        assert [(e.text, e.start_pos) for e in entities] == [
+            ("Marie Dubois", text.index("Marie Dubois"))
+        ]
+
+    def test_peak_doc_size_bounded_by_window(self) -> None:
+        detector = ruler_spacy_detector(window_chars=300, window_overlap=60)
+        assert detector._nlp is not None
+        piped: list[str] = []
+        original_pipe = detector._nlp.pipe
+
+        def _pipe(texts: Any, **kwargs: Any) -> Any:
+            for text in texts:
+                piped.append(text)
+                yield from original_pipe([text], **kwargs)
+
+        with patch.object(detector._nlp, "pipe", side_effect=_pipe):
+            detector.detect_entities(LONG_TEXT)
+
+        assert len(piped) > 1
+        assert max(len(text) for text in piped) <= 300
+        assert detector.last_doc is None
+
+    def test_batch_mixes_short_and_long_texts(self) -> None:
+        detector = ruler_spacy_detector(window_chars=300, window_overlap=60)
+        texts = [PARAGRAPHS[0], LONG_TEXT, PARAGRAPHS[1]]
+
+        results = list(detector.detect_entities_batch(texts))
+
+        assert results == [detector.detect_entities(text) for text in texts]
+
+
+class TestHybridDetectorWindows:
+    """HybridDetector windowed mode."""
+
+    def test_matches_whole_document_detection(self) -> None:
+        windowed = ruler_hybrid_detector(window_chars=300, window_overlap=60)
+        whole = ruler_hybrid_detector(window_chars=None)
+
+        assert windowed.detect_entities(LONG_TEXT) == whole.detect_entities(LONG_TEXT)
+
+    def test_pos_disambiguation_uses_window_doc(self) -> None:
+        detector = ruler_hybrid_detector(window_chars=300, window_overlap=60)
+        docs: list[tuple[str, str]] = []
+        original = detector.regex_matcher.match_entities
+
+        def _match(text: str, spacy_doc: Any = None) -> list[DetectedEntity]:
+            docs.append((text, spacy_doc.text))
+            return original(text, spacy_doc=spacy_doc)
+
+        with patch.object(detector.regex_matcher, "match_entities", side_effect=_match):
+            detector.detect_entities(LONG_TEXT)
+
+        assert len(docs) > 1
+        for text, doc_text in docs:
+            assert text == doc_text
+
+    def test_batch_stream(self) -> None:
+        detector = ruler_hybrid_detector(window_chars=300, window_overlap=60)
+        texts = [PARAGRAPHS[0], LONG_TEXT, PARAGRAPHS[2], PARAGRAPHS[1]]
+
+        results = list(detector.detect_entities_batch(iter(texts)))
+
+        assert results == [detector.detect_entities(text) for text in texts]
+
+    def test_fingerprint_depends_on_window(self) -> None:
+        assert (
+            ruler_hybrid_detector(
+                window_chars=300, window_overlap=60
+            ).detection_fingerprint()
+            != ruler_hybrid_detector(window_chars=None).detection_fingerprint()
+        )
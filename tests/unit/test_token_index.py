@@ -0,0 +1,86 @@
+"""Unit tests for the char-to-token offset index used in POS disambiguation."""
+
+from __future__ import annotations
+
+import pytest
+import spacy
+from spacy.tokens import Doc, Span
+
+from gdpr_pseudonymizer.nlp.regex_matcher import RegexMatcher
+from gdpr_pseudonymizer.nlp.token_index import TokenOffsetIndex
+
+TEXT = "Le bureau de Lyon est ouvert, comme celui de Saint-Étienne et Paris."
+
+
+def _tagged_doc() -> Doc:
+    """Blank-pipeline Doc with hand-set POS tags and entities."""
+    doc = spacy.blank("fr")(TEXT)
+    for token in doc:
+        token.pos_ = "PROPN" if token.text in ("Paris", "Saint") else "NOUN"
+    lyon = doc.char_span(TEXT.index("Lyon"), TEXT.index("Lyon") + 4)
+    paris = doc.char_span(TEXT.index("Paris"), TEXT.index("Paris") + 5)
+    assert lyon is not None and paris is not None
+    doc.ents = [
+        Span(doc, lyon.start, lyon.end, label="PER"),
+        Span(doc, paris.start, paris.end, label="PER"),
+    ]
+    return doc
+
+
+def _char_span_rule(doc: Doc, start: int, end: int) -> bool:
+    span = doc.char_span(start, end)
+    if span is None:
+        return True
+    return any(t.pos_ == "PROPN" or t.ent_type_ == "" for t in span)
+
+
+class TestTokenOffsetIndex:
+    """Tests for TokenOffsetIndex."""
+
+    def test_matches_char_span_rule_for_all_offsets(self) -> None:
+        doc = _tagged_doc()
+        candidates = [
+            (start, end)
+            for start in range(len(TEXT))
+            for end in range(start + 1, len(TEXT) + 1)
+        ]
+
+        assert TokenOffsetIndex(doc).passes_pos_disambiguation(candidates) == [
+            _char_span_rule(doc, start, end) for start, end in candidates
+        ]
+
+    @pytest.mark.parametrize(
+        ("word", "expected"),
+        [("Lyon", False), ("Paris", True), ("bureau", True), ("Saint-Étienne", True)],
+    )
+    def test_single_candidates(self, word: str, expected: bool) -> None:
+        start = TEXT.index(word)
+
+        assert TokenOffsetIndex(_tagged_doc()).passes_pos_disambiguation(
+            [(start, start + len(word))]
+        ) == [expected]
+
+    def test_no_candidates(self) -> None:
+        assert TokenOffsetIndex(_tagged_doc()).passes_pos_disambiguation([]) == []
+
+    def test_empty_doc(self) -> None:
+        index = TokenOffsetIndex(spacy.blank("fr")(""))
+
+        assert index.passes_pos_disambiguation([(0, 0)]) == [True]
+
+
+class TestRegexMatcherUsesIndex:
+    """RegexMatcher geography filtering with a real Doc."""
+
+    def test_non_propn_entity_filtered(self) -> None:
+        matcher = RegexMatcher()
+        matcher.load_patterns()
+
+        locations = {
+            e.text
+            for e in matcher.match_entities(TEXT, spacy_doc=_tagged_doc())
+            if e.entity_type == "LOCATION"
+        }
+
+        assert "Lyon" not in locations
+        assert "Paris" in locations